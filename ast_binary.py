@@ -0,0 +1,519 @@
+"""
+Módulo do formato binário compacto da AST.
+
+A AST é gravada como um conjunto de tabelas planas, em vez do grafo de
+objetos serializado pelo pickle:
+
+- cabeçalho: assinatura, versão do formato e, para cada tabela, a
+  quantidade de elementos e o tipo (largura) de seus inteiros
+- tabela de classes: nome de cada classe de nó usada (índices na
+  tabela de strings)
+- tabela de nós, em pré-ordem: classe, posição de início e tamanho no
+  código fonte, fim da subárvore (índice após o último descendente) e
+  primeira posição de seus campos na tabela de valores
+- tabela de valores: uma etiqueta (tipo) e um inteiro por valor; os
+  campos de cada nó e os elementos de cada lista ocupam posições
+  consecutivas
+- tabela de listas: primeira posição e quantidade de elementos
+- tabela de constantes: floats e inteiros que não cabem na tabela de
+  valores, em 64 bits
+- tabela de strings: nomes, tipos, operadores e literais, cada um
+  gravado uma única vez, em UTF-8
+
+Cada tabela usa o menor tipo inteiro sem sinal (1, 2, 4 ou 8 bytes)
+que comporta seus valores. Os inteiros são little-endian e cada tabela
+começa em um deslocamento múltiplo de 8, de modo que o arquivo pode ser
+mapeado em memória (mmap) e as tabelas lidas diretamente, sem cópia,
+como memoryviews. BinaryAST cria os nós somente quando são acessados.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from ast_nodes import ASTNode
+
+
+MAGIC = b'CAST'
+FORMAT_VERSION = 1
+
+# Tabelas do arquivo, na ordem em que são gravadas
+TABLES = (
+    'class_names',
+    'node_class', 'node_start', 'node_size', 'node_end', 'node_slot',
+    'slot_tag', 'slot_value',
+    'list_slot', 'list_len',
+    'constants',
+    'string_offsets', 'string_text',
+)
+
+# Assinatura, versão, flags, quantidade de elementos de cada tabela e
+# tipo de cada tabela (um caractere do módulo array)
+_HEADER = struct.Struct(f"<4sHH{len(TABLES)}I{len(TABLES)}s")
+
+# Tipos inteiros sem sinal, do mais estreito ao mais largo
+_TYPECODES = ('B', 'H', 'I', 'Q')
+
+# Etiquetas dos valores
+TAG_NONE = 0
+TAG_NODE = 1  # índice do nó
+TAG_LIST = 2  # índice na tabela de listas
+TAG_TUPLE = 3  # índice na tabela de listas
+TAG_STR = 4  # índice na tabela de strings
+TAG_INT = 5  # o próprio valor (inteiros de 0 a 2**32 - 1)
+TAG_WIDE_INT = 6  # índice na tabela de constantes
+TAG_FLOAT = 7  # índice na tabela de constantes (bits do double)
+TAG_BOOL = 8  # 0 ou 1
+TAG_BIGINT = 9  # índice na tabela de strings (texto decimal)
+
+_INT_LIMIT = 1 << 32
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_DOUBLE = struct.Struct('<d')
+_INT64 = struct.Struct('<q')
+
+# As tabelas são lidas no formato nativo; em máquinas big-endian elas
+# são copiadas e convertidas
+_NATIVE = sys.byteorder == 'little'
+
+
+def node_classes():
+    """Classes de nós da AST (subclasses de ASTNode), por nome."""
+    classes = {}
+    stack = [ASTNode]
+    while stack:
+        cls = stack.pop()
+        for subclass in cls.__subclasses__():
+            classes[subclass.__name__] = subclass
+            stack.append(subclass)
+    return classes
+
+
+def _pad(size):
+    """Tamanho arredondado para o próximo múltiplo de 8."""
+    return (size + 7) & ~7
+
+
+def _narrowest(table):
+    """Tipo inteiro sem sinal mais estreito que comporta os valores de table."""
+    largest = max(table, default=0)
+    for typecode in _TYPECODES:
+        if largest < 1 << (8 * struct.calcsize(typecode)):
+            return typecode
+    raise OverflowError("Valor grande demais para o formato binário de AST")
+
+
+def _layout(counts, typecodes):
+    """
+    Deslocamento de cada tabela e tamanho total do arquivo.
+    
+    Args:
+        counts: Quantidade de elementos de cada tabela (na ordem de TABLES)
+        typecodes: Tipo de cada tabela (na ordem de TABLES)
+        
+    Returns:
+        Tupla (lista de deslocamentos, tamanho total)
+    """
+    offsets = []
+    offset = _pad(_HEADER.size)
+    for count, typecode in zip(counts, typecodes):
+        offsets.append(offset)
+        offset += _pad(count * struct.calcsize(typecode))
+    return offsets, offset
+
+
+class _Encoder:
+    """Montagem das tabelas de uma AST (veja dumps)."""
+    
+    def __init__(self):
+        self.class_ids = {}
+        self.class_names = array('Q')
+        self.node_class = array('Q')
+        self.node_start = array('Q')  # início + 1 (0 quando desconhecido)
+        self.node_size = array('Q')
+        self.node_end = array('Q')
+        self.node_slot = array('Q')
+        self.slot_tag = array('B')
+        self.slot_value = array('Q')
+        self.list_slot = array('Q')
+        self.list_len = array('Q')
+        self.constants = array('q')
+        self.string_ids = {}
+        self.string_offsets = array('Q', [0])
+        self.string_text = bytearray()
+    
+    def string(self, text):
+        """Índice de uma string na tabela de strings (gravada uma única vez)."""
+        index = self.string_ids.get(text)
+        if index is None:
+            index = self.string_ids[text] = len(self.string_offsets) - 1
+            self.string_text += text.encode('utf-8')
+            self.string_offsets.append(len(self.string_text))
+        return index
+    
+    def constant(self, value):
+        """Índice de um inteiro de 64 bits na tabela de constantes."""
+        self.constants.append(value)
+        return len(self.constants) - 1
+    
+    def allocate(self, count):
+        """Reserva count posições consecutivas na tabela de valores."""
+        first = len(self.slot_tag)
+        self.slot_tag.frombytes(bytes(count))
+        self.slot_value.frombytes(bytes(8 * count))
+        return first
+    
+    def encode(self, ast):
+        """Grava a AST a partir da posição 0 da tabela de valores."""
+        slot_tag = self.slot_tag
+        slot_value = self.slot_value
+        node_class = self.node_class
+        node_start = self.node_start
+        node_size = self.node_size
+        node_end = self.node_end
+        node_slot = self.node_slot
+        class_ids = self.class_ids
+        allocate = self.allocate
+        string = self.string
+        
+        # Pilha de (posição, valor) a gravar; uma posição negativa -(i + 1)
+        # marca o fim da subárvore do nó i
+        stack = [(allocate(1), ast)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            slot, value = pop()
+            if slot < 0:
+                node_end[-slot - 1] = len(node_end)
+                continue
+            cls = type(value)
+            if cls is str:
+                tag, payload = TAG_STR, string(value)
+            elif value is None:
+                tag, payload = TAG_NONE, 0
+            elif isinstance(value, ASTNode):
+                index = len(node_end)
+                class_id = class_ids.get(cls)
+                if class_id is None:
+                    class_id = class_ids[cls] = len(self.class_names)
+                    self.class_names.append(string(cls.__name__))
+                fields = cls._fields
+                first = allocate(len(fields))
+                node_class.append(class_id)
+                if value.start is None:
+                    node_start.append(0)
+                    node_size.append(0)
+                else:
+                    node_start.append(value.start + 1)
+                    node_size.append(value.size)
+                node_end.append(0)
+                node_slot.append(first)
+                push((-index - 1, None))
+                for i in range(len(fields) - 1, -1, -1):
+                    push((first + i, getattr(value, fields[i])))
+                tag, payload = TAG_NODE, index
+            elif cls is list or cls is tuple:
+                first = allocate(len(value))
+                payload = len(self.list_slot)
+                self.list_slot.append(first)
+                self.list_len.append(len(value))
+                for i in range(len(value) - 1, -1, -1):
+                    push((first + i, value[i]))
+                tag = TAG_LIST if cls is list else TAG_TUPLE
+            elif cls is int:
+                if 0 <= value < _INT_LIMIT:
+                    tag, payload = TAG_INT, value
+                elif _INT64_MIN <= value <= _INT64_MAX:
+                    tag, payload = TAG_WIDE_INT, self.constant(value)
+                else:
+                    tag, payload = TAG_BIGINT, string(str(value))
+            elif cls is float:
+                tag, payload = TAG_FLOAT, self.constant(_INT64.unpack(_DOUBLE.pack(value))[0])
+            elif cls is bool:
+                tag, payload = TAG_BOOL, int(value)
+            else:
+                raise TypeError(f"Valor não suportado na AST: {value!r}")
+            slot_tag[slot] = tag
+            slot_value[slot] = payload
+    
+    def tobytes(self):
+        """Arquivo binário completo (cabeçalho e tabelas)."""
+        tables = []
+        for name in TABLES:
+            table = getattr(self, name)
+            if name == 'string_text':
+                table = array('B', table)
+            elif name != 'constants' and name != 'slot_tag':
+                table = array(_narrowest(table), table)
+            tables.append(table)
+        counts = [len(table) for table in tables]
+        typecodes = [table.typecode for table in tables]
+        offsets, total = _layout(counts, typecodes)
+        
+        data = bytearray(total)
+        _HEADER.pack_into(data, 0, MAGIC, FORMAT_VERSION, 0, *counts,
+                          "".join(typecodes).encode('ascii'))
+        for offset, table in zip(offsets, tables):
+            if not _NATIVE:
+                table.byteswap()
+            raw = table.tobytes()
+            data[offset:offset + len(raw)] = raw
+        return bytes(data)
+
+
+def dumps(ast):
+    """
+    Serializa uma AST no formato binário.
+    
+    Args:
+        ast: Nó da AST, lista ou tupla de nós (como devolvido por parse)
+        
+    Returns:
+        Bytes com a AST serializada
+        
+    Raises:
+        TypeError: Se a AST contiver valores de tipo não suportado
+    """
+    encoder = _Encoder()
+    encoder.encode(ast)
+    return encoder.tobytes()
+
+
+def dump(ast, file):
+    """
+    Grava uma AST no formato binário em um arquivo.
+    
+    Args:
+        ast: Nó da AST, lista ou tupla de nós
+        file: Caminho ou arquivo binário aberto para escrita
+    """
+    data = dumps(ast)
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, 'wb') as f:
+            f.write(data)
+    else:
+        file.write(data)
+
+
+def loads(data):
+    """
+    Lê uma AST completa gravada no formato binário.
+    
+    Args:
+        data: Bytes (ou outro objeto com o protocolo de buffer)
+        
+    Returns:
+        A AST, com todos os nós criados
+    """
+    return BinaryAST(data).root()
+
+
+def load(path):
+    """
+    Abre um arquivo no formato binário mapeando-o em memória.
+    
+    Args:
+        path: Caminho do arquivo
+        
+    Returns:
+        BinaryAST que cria os nós sob demanda
+    """
+    return BinaryAST.open(path)
+
+
+class BinaryAST:
+    """
+    AST no formato binário, com os nós criados sob demanda.
+    
+    As tabelas são lidas diretamente do buffer (bytes ou mmap); um nó só
+    é criado quando é acessado (por índice, com ast_file[i], ou pela
+    raiz), junto com sua subárvore, e o mesmo objeto é devolvido nos
+    acessos seguintes. A classe e a posição de cada nó podem ser
+    consultadas sem criá-lo.
+    
+    Os índices dos nós seguem a pré-ordem: o nó 0 é a primeira
+    declaração e os descendentes de um nó i são os nós de i + 1 até
+    subtree_end(i) - 1.
+    """
+    
+    def __init__(self, data, _mmap=None):
+        self._mmap = _mmap
+        buffer = memoryview(data)
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Formato binário de AST inválido: arquivo muito curto")
+        magic, version, _flags, *counts, typecodes = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Formato binário de AST inválido: assinatura incorreta")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão do formato binário de AST não suportada: {version}")
+        typecodes = typecodes.decode('ascii')
+        offsets, total = _layout(counts, typecodes)
+        if len(buffer) < total:
+            raise ValueError("Formato binário de AST inválido: arquivo truncado")
+        
+        self._buffer = buffer
+        self._views = []
+        for name, offset, count, typecode in zip(TABLES, offsets, counts, typecodes):
+            table = buffer[offset:offset + count * struct.calcsize(typecode)]
+            if typecode != 'B':
+                if _NATIVE:
+                    table = table.cast(typecode)
+                else:
+                    table = array(typecode, table.tobytes())
+                    table.byteswap()
+            if isinstance(table, memoryview):
+                self._views.append(table)
+            setattr(self, '_' + name, table)
+        
+        self._strings = [None] * (len(self._string_offsets) - 1)
+        self._nodes = {}
+        classes = node_classes()
+        self._class_list = []
+        for string_id in self._class_names:
+            name = self.string(string_id)
+            cls = classes.get(name)
+            if cls is None:
+                raise ValueError(f"Classe de nó desconhecida no formato binário: {name}")
+            self._class_list.append(cls)
+    
+    @classmethod
+    def open(cls, path):
+        """
+        Mapeia um arquivo em memória (somente leitura).
+        
+        Args:
+            path: Caminho do arquivo
+            
+        Returns:
+            BinaryAST sobre o arquivo mapeado
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped)
+    
+    def close(self):
+        """Libera o buffer (e o mapeamento em memória, se houver)."""
+        for view in self._views:
+            view.release()
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return len(self._node_class)
+    
+    def string(self, index):
+        """String de índice index na tabela de strings."""
+        text = self._strings[index]
+        if text is None:
+            offsets = self._string_offsets
+            text = self._strings[index] = str(self._string_text[offsets[index]:offsets[index + 1]],
+                                              'utf-8')
+        return text
+    
+    def node_class(self, i):
+        """Classe do nó i (sem criá-lo)."""
+        return self._class_list[self._node_class[i]]
+    
+    def span(self, i):
+        """Tupla (início, fim) do nó i no código fonte, ou (None, None)."""
+        start = self._node_start[i]
+        if not start:
+            return None, None
+        return start - 1, start - 1 + self._node_size[i]
+    
+    def subtree_end(self, i):
+        """Índice seguinte ao último descendente do nó i."""
+        return self._node_end[i]
+    
+    def find(self, class_name):
+        """
+        Índices dos nós de uma classe, sem criá-los.
+        
+        Args:
+            class_name: Nome da classe (por exemplo, 'FunctionDecl')
+            
+        Returns:
+            Lista de índices, em pré-ordem
+        """
+        for class_id, cls in enumerate(self._class_list):
+            if cls.__name__ == class_name:
+                break
+        else:
+            return []
+        node_class = self._node_class
+        return [i for i in range(len(node_class)) if node_class[i] == class_id]
+    
+    def __getitem__(self, i):
+        """Nó i, criado (com sua subárvore) no primeiro acesso."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice de nó fora do intervalo")
+        node = self._nodes.get(i)
+        if node is None:
+            node = self._materialize(i)
+        return node
+    
+    def root(self):
+        """A AST completa (como gravada por dumps)."""
+        return self._value(0)
+    
+    def _materialize(self, i):
+        # Em pré-ordem, os descendentes de i têm índices maiores: criando
+        # os nós do último para o primeiro, os filhos de cada nó já
+        # existem quando ele é criado
+        nodes = self._nodes
+        class_list = self._class_list
+        node_class = self._node_class
+        node_start = self._node_start
+        node_size = self._node_size
+        node_slot = self._node_slot
+        value = self._value
+        for j in range(self._node_end[i] - 1, i - 1, -1):
+            if j in nodes:
+                continue
+            cls = class_list[node_class[j]]
+            first = node_slot[j]
+            args = [value(slot) for slot in range(first, first + len(cls._fields))]
+            start = node_start[j]
+            if start:
+                nodes[j] = cls(*args, start - 1, start - 1 + node_size[j])
+            else:
+                nodes[j] = cls(*args)
+        return nodes[i]
+    
+    def _value(self, slot):
+        tag = self._slot_tag[slot]
+        payload = self._slot_value[slot]
+        if tag == TAG_NODE:
+            node = self._nodes.get(payload)
+            return node if node is not None else self._materialize(payload)
+        if tag == TAG_STR:
+            return self.string(payload)
+        if tag == TAG_INT:
+            return payload
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_LIST or tag == TAG_TUPLE:
+            first = self._list_slot[payload]
+            items = [self._value(s) for s in range(first, first + self._list_len[payload])]
+            return items if tag == TAG_LIST else tuple(items)
+        if tag == TAG_WIDE_INT:
+            return self._constants[payload]
+        if tag == TAG_FLOAT:
+            return _DOUBLE.unpack(_INT64.pack(self._constants[payload]))[0]
+        if tag == TAG_BOOL:
+            return bool(payload)
+        if tag == TAG_BIGINT:
+            return int(self.string(payload))
+        raise ValueError(f"Etiqueta de valor inválida no formato binário: {tag}")
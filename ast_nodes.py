@@ -3,189 +3,513 @@ Módulo que define os nós da Árvore de Sintaxe Abstrata (AST).
 
 Cada classe representa um elemento da linguagem C e possui
 um método __repr__ para facilitar a visualização da árvore.
+
+Os nós usam __slots__ (sem __dict__ por instância) para reduzir o
+consumo de memória. Cada classe declara em _fields a lista de seus
+atributos, na ordem do construtor, para que ferramentas possam
+percorrer a árvore sem depender de __dict__, e em _children os campos
+que contêm nós filhos (um nó, uma lista de nós ou None), na ordem em que
+são percorridos (veja iter_nodes e visitor.py).
 """
 
 
 class ASTNode:
-    """Classe base para todos os nós da AST."""
-    pass
+    """
+    Classe base para todos os nós da AST.
+    
+    Todo nó guarda o deslocamento de início no código fonte (start,
+    obtido do lexpos dos tokens) e o tamanho do trecho (size), ou None
+    quando a posição (o início ou o fim) não é conhecida. O fim
+    (exclusivo) é calculado em end. Guardar o tamanho em vez do fim
+    economiza memória, pois os tamanhos pequenos são inteiros
+    compartilhados pelo Python.
+    """
+    
+    __slots__ = ('start', 'size')
+    _fields = ()
+    _children = ()
+    
+    @property
+    def end(self):
+        """Deslocamento de fim (exclusivo) do nó no código fonte."""
+        if self.start is None:
+            return None
+        return self.start + self.size
+    
+    def _repr_items(self):
+        """
+        Partes da representação do nó: strings são escritas como estão e
+        os demais valores (nós, listas, tuplas) são representados em seguida.
+        """
+        return (object.__repr__(self),)
+    
+    def __repr__(self):
+        return "".join(iter_repr(self))
+    
+    def __reduce__(self):
+        # Serializa o nó como (classe, argumentos do construtor), o que é
+        # mais compacto e rápido que o estado padrão baseado em __slots__
+        args = [getattr(self, name) for name in self._fields]
+        args.append(self.start)
+        args.append(self.end)
+        return (self.__class__, tuple(args))
+
+
+def iter_nodes(ast):
+    """
+    Percorre a AST em pré-ordem, sem recursão.
+    
+    Args:
+        ast: Nó da AST, lista ou tupla de nós
+        
+    Yields:
+        Cada nó da árvore (instância de ASTNode)
+    """
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            yield value
+            stack.extend(reversed([getattr(value, name) for name in value._children]))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(reversed(value))
+
+
+def iter_repr(value, chunk_size=1024):
+    """
+    Gera, sem recursão, os trechos de str(value) para nós da AST e listas
+    e tuplas que os contêm, com o mesmo texto que o __repr__ recursivo
+    produziria. Assim, árvores muito profundas (como uma longa cadeia de
+    BinOp) não esgotam o limite de recursão e o texto pode ser escrito
+    aos poucos, sem montar strings intermediárias para cada subárvore.
+    
+    Args:
+        value: Nó da AST, lista, tupla ou outro valor
+        chunk_size: Quantidade aproximada de partes reunidas em cada trecho
+        
+    Yields:
+        Trechos consecutivos da representação
+    """
+    parts = []
+    out = parts.append
+    stack = [value]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        item = pop()
+        cls = type(item)
+        if cls is str:
+            out(item)
+        elif cls is list or cls is tuple:
+            # Elementos de listas e tuplas aparecem com repr() (strings
+            # entre aspas); nós e outras sequências são expandidos depois
+            if cls is list:
+                push("]")
+            else:
+                push(",)" if len(item) == 1 else ")")
+            for i in range(len(item) - 1, -1, -1):
+                element = item[i]
+                if isinstance(element, (ASTNode, list, tuple)):
+                    push(element)
+                else:
+                    push(repr(element))
+                if i:
+                    push(", ")
+            out("[" if cls is list else "(")
+        elif isinstance(item, ASTNode):
+            items = item._repr_items()
+            if len(items) == 1:
+                out(items[0])
+            else:
+                extend(items[::-1])
+        else:
+            out(str(item))
+        if len(parts) >= chunk_size:
+            yield "".join(parts)
+            parts.clear()
+    if parts:
+        yield "".join(parts)
+
+
+def write_repr(value, stream):
+    """
+    Escreve str(value) em um stream, em trechos, sem recursão.
+    
+    Args:
+        value: Nó da AST, lista, tupla ou outro valor
+        stream: Arquivo de texto (de preferência com buffer)
+    """
+    for chunk in iter_repr(value):
+        stream.write(chunk)
 
 
 class BinOp(ASTNode):
     """Representa uma operação binária (+, -, *, /, ==, !=, <, >, <=, >=, &&, ||)."""
     
-    def __init__(self, left, op, right):
+    _fields = ('left', 'op', 'right')
+    __slots__ = _fields
+    _children = ('left', 'right')
+    
+    def __init__(self, left, op, right, start=None, end=None):
         self.left = left
         self.op = op
         self.right = right
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"BinOp({self.left}, '{self.op}', {self.right})"
+    def _repr_items(self):
+        return ("BinOp(", self.left, f", '{self.op}', ", self.right, ")")
 
 
 class UnaryOp(ASTNode):
     """Representa uma operação unária (-, !)."""
     
-    def __init__(self, op, operand):
+    _fields = ('op', 'operand')
+    __slots__ = _fields
+    _children = ('operand',)
+    
+    def __init__(self, op, operand, start=None, end=None):
         self.op = op
         self.operand = operand
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"UnaryOp('{self.op}', {self.operand})"
+    def _repr_items(self):
+        return (f"UnaryOp('{self.op}', ", self.operand, ")")
 
 
 class Number(ASTNode):
     """Representa um literal numérico (int ou float)."""
     
-    def __init__(self, value):
+    _fields = ('value',)
+    __slots__ = _fields
+    _children = ()
+    
+    def __init__(self, value, start=None, end=None):
         self.value = value
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"Number({self.value})"
+    def _repr_items(self):
+        return (f"Number({self.value})",)
 
 
 class String(ASTNode):
     """Representa um literal de string (entre aspas duplas)."""
     
-    def __init__(self, value):
+    _fields = ('value',)
+    __slots__ = _fields
+    _children = ()
+    
+    def __init__(self, value, start=None, end=None):
         self.value = value
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"String('{self.value}')"
+    def _repr_items(self):
+        return (f"String('{self.value}')",)
 
 
 class Char(ASTNode):
     """Representa um literal de caractere (entre aspas simples)."""
     
-    def __init__(self, value):
+    _fields = ('value',)
+    __slots__ = _fields
+    _children = ()
+    
+    def __init__(self, value, start=None, end=None):
         self.value = value
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"Char('{self.value}')"
+    def _repr_items(self):
+        return (f"Char('{self.value}')",)
 
 
 class Identifier(ASTNode):
     """Representa um identificador (nome de variável ou função)."""
     
-    def __init__(self, name):
+    _fields = ('name',)
+    __slots__ = _fields
+    _children = ()
+    
+    def __init__(self, name, start=None, end=None):
         self.name = name
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"Identifier('{self.name}')"
+    def _repr_items(self):
+        return (f"Identifier('{self.name}')",)
 
 
 class VarDecl(ASTNode):
     """Representa uma declaração de variável (tipo + nome)."""
     
-    def __init__(self, var_type, name):
+    _fields = ('var_type', 'name')
+    __slots__ = _fields
+    _children = ()
+    
+    def __init__(self, var_type, name, start=None, end=None):
         self.var_type = var_type
         self.name = name
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"VarDecl('{self.var_type}', '{self.name}')"
+    def _repr_items(self):
+        return (f"VarDecl('{self.var_type}', '{self.name}')",)
 
 
 class Assignment(ASTNode):
     """Representa uma atribuição (var = expr)."""
     
-    def __init__(self, left, right):
+    _fields = ('left', 'right')
+    __slots__ = _fields
+    _children = ('left', 'right')
+    
+    def __init__(self, left, right, start=None, end=None):
         self.left = left
         self.right = right
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"Assignment({self.left}, {self.right})"
+    def _repr_items(self):
+        return ("Assignment(", self.left, ", ", self.right, ")")
 
 
 class IfStatement(ASTNode):
     """Representa uma estrutura condicional (if/else)."""
     
-    def __init__(self, condition, then_block, else_block=None):
+    _fields = ('condition', 'then_block', 'else_block')
+    __slots__ = _fields
+    _children = ('condition', 'then_block', 'else_block')
+    
+    def __init__(self, condition, then_block, else_block=None, start=None, end=None):
         self.condition = condition
         self.then_block = then_block
         self.else_block = else_block
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
+    def _repr_items(self):
         if self.else_block:
-            return f"IfStatement({self.condition}, {self.then_block}, {self.else_block})"
-        return f"IfStatement({self.condition}, {self.then_block})"
+            return ("IfStatement(", self.condition, ", ", self.then_block, ", ", self.else_block, ")")
+        return ("IfStatement(", self.condition, ", ", self.then_block, ")")
 
 
 class WhileStatement(ASTNode):
     """Representa um loop while."""
     
-    def __init__(self, condition, body):
+    _fields = ('condition', 'body')
+    __slots__ = _fields
+    _children = ('condition', 'body')
+    
+    def __init__(self, condition, body, start=None, end=None):
         self.condition = condition
         self.body = body
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"WhileStatement({self.condition}, {self.body})"
+    def _repr_items(self):
+        return ("WhileStatement(", self.condition, ", ", self.body, ")")
 
 
 class ForStatement(ASTNode):
     """Representa um loop for."""
     
-    def __init__(self, init, condition, update, body):
+    _fields = ('init', 'condition', 'update', 'body')
+    __slots__ = _fields
+    _children = ('init', 'condition', 'update', 'body')
+    
+    def __init__(self, init, condition, update, body, start=None, end=None):
         self.init = init  # Pode ser None, VarDecl ou Assignment
         self.condition = condition  # Pode ser None
         self.update = update  # Pode ser None
         self.body = body
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"ForStatement({self.init}, {self.condition}, {self.update}, {self.body})"
+    def _repr_items(self):
+        return ("ForStatement(", self.init, ", ", self.condition, ", ", self.update, ", ", self.body, ")")
 
 
 class ReturnStatement(ASTNode):
     """Representa um return de função."""
     
-    def __init__(self, value=None):
+    _fields = ('value',)
+    __slots__ = _fields
+    _children = ('value',)
+    
+    def __init__(self, value=None, start=None, end=None):
         self.value = value
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
+    def _repr_items(self):
         if self.value:
-            return f"ReturnStatement({self.value})"
-        return "ReturnStatement()"
+            return ("ReturnStatement(", self.value, ")")
+        return ("ReturnStatement()",)
 
 
 class FunctionCall(ASTNode):
     """Representa uma chamada de função."""
     
-    def __init__(self, name, args):
+    _fields = ('name', 'args')
+    __slots__ = _fields
+    _children = ('args',)
+    
+    def __init__(self, name, args, start=None, end=None):
         self.name = name
         self.args = args  # Lista de argumentos
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"FunctionCall('{self.name}', {self.args})"
+    def _repr_items(self):
+        return (f"FunctionCall('{self.name}', ", self.args, ")")
 
 
 class FunctionDecl(ASTNode):
     """Representa uma declaração de função (tipo, nome, parâmetros, corpo)."""
     
-    def __init__(self, return_type, name, params, body):
+    _fields = ('return_type', 'name', 'params', 'body')
+    __slots__ = _fields
+    _children = ('params', 'body')
+    
+    def __init__(self, return_type, name, params, body, start=None, end=None):
         self.return_type = return_type
         self.name = name
         self.params = params  # Lista de parâmetros (VarDecl)
         self.body = body
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"FunctionDecl('{self.return_type}', '{self.name}', {self.params}, {self.body})"
+    def _repr_items(self):
+        return (f"FunctionDecl('{self.return_type}', '{self.name}', ", self.params, ", ", self.body, ")")
 
 
 class Block(ASTNode):
     """Representa um bloco de código (lista de statements)."""
     
-    def __init__(self, statements):
+    _fields = ('statements',)
+    __slots__ = _fields
+    _children = ('statements',)
+    
+    def __init__(self, statements, start=None, end=None):
         self.statements = statements  # Lista de statements
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
     
-    def __repr__(self):
-        return f"Block({self.statements})"
+    def _repr_items(self):
+        return ("Block(", self.statements, ")")
+
+
+class LazyBlock(Block):
+    """
+    Bloco cujos statements são analisados somente no primeiro acesso.
+    
+    Produzido pela análise resumida (ParserSession.skim) para os corpos
+    das funções: loader é chamado sem argumentos no primeiro acesso a
+    statements e a lista devolvida é guardada no lugar dele. Com
+    statements informado (por exemplo, ao desserializar), o bloco já
+    está carregado. Serializado (pickle ou ast_binary), o bloco é
+    carregado e gravado com os seus statements.
+    """
+    
+    __slots__ = ('_loader',)
+    
+    def __init__(self, statements=None, start=None, end=None, loader=None):
+        if statements is None and loader is not None:
+            self._loader = loader
+        else:
+            self.statements = statements
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
+    
+    @property
+    def loaded(self):
+        """Se os statements já foram analisados."""
+        return self._loader is None
+    
+    @property
+    def statements(self):
+        loader = self._loader
+        if loader is not None:
+            _block_statements.__set__(self, loader())
+            self._loader = None
+        return _block_statements.__get__(self)
+    
+    @statements.setter
+    def statements(self, value):
+        self._loader = None
+        _block_statements.__set__(self, value)
+
+
+# Descritor do slot statements de Block, usado por LazyBlock
+_block_statements = Block.__dict__['statements']
 
 
 class ExpressionStatement(ASTNode):
     """Representa uma expressão como statement."""
     
-    def __init__(self, expr):
-        self.expr = expr
+    _fields = ('expr',)
+    __slots__ = _fields
+    _children = ('expr',)
     
-    def __repr__(self):
-        return f"ExpressionStatement({self.expr})"
-
+    def __init__(self, expr, start=None, end=None):
+        self.expr = expr
+        self.start = None if end is None else start
+        self.size = None if self.start is None else end - start
+    
+    def _repr_items(self):
+        return ("ExpressionStatement(", self.expr, ")")
+
+
+
+class LeafTable:
+    """
+    Tabela limitada de folhas compartilhadas.
+    
+    Os literais (Number, Char e String) não são alterados depois de
+    criados, de modo que todas as ocorrências de um mesmo valor podem
+    usar um único nó, sem posição no código fonte. A tabela guarda no
+    máximo limit nós; depois disso, os valores novos recebem nós próprios
+    (também sem posição), e a memória usada pela tabela não cresce com a
+    quantidade de literais distintos da entrada.
+    
+    Attributes:
+        limit: Quantidade máxima de nós guardados
+        hits: Quantidade de nós devolvidos da tabela
+        misses: Quantidade de nós criados
+    """
+    
+    def __init__(self, limit=4096):
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self._nodes = {}
+    
+    def get(self, cls, value):
+        """
+        Nó compartilhado para um literal.
+        
+        Args:
+            cls: Classe do nó (Number, Char ou String)
+            value: Valor do literal
+            
+        Returns:
+            Instância de cls sem posição
+        """
+        # O tipo do valor faz parte da chave, pois 1 == 1.0
+        key = (cls, value.__class__, value)
+        node = self._nodes.get(key)
+        if node is not None:
+            self.hits += 1
+            return node
+        self.misses += 1
+        node = cls(value)
+        if len(self._nodes) < self.limit:
+            self._nodes[key] = node
+        return node
+    
+    def __len__(self):
+        return len(self._nodes)
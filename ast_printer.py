@@ -2,16 +2,25 @@
 Módulo para visualização formatada da AST.
 
 Fornece funções para imprimir a AST de forma mais legível e hierárquica.
+
+A árvore é percorrida com uma pilha explícita (sem recursão), de modo
+que árvores muito profundas podem ser impressas, e as linhas são
+escritas aos poucos no stream de saída.
 """
 
+import sys
+
+from ast_nodes import ASTNode, iter_repr
+
 
-def print_ast(ast, indent=0):
+def print_ast(ast, indent=0, stream=None):
     """
     Imprime a AST de forma formatada e hierárquica.
     
     Args:
         ast: Nó da AST ou lista de nós
         indent: Nível de indentação atual
+        stream: Arquivo de texto de saída (por padrão, sys.stdout)
     """
     if ast is None:
         return
@@ -19,50 +28,91 @@ def print_ast(ast, indent=0):
     indent_str = "  " * indent
     
     if isinstance(ast, list):
+        tasks = []
         for i, node in enumerate(ast):
-            print(f"{indent_str}[{i+1}] {type(node).__name__}")
-            print_ast_node(node, indent + 1)
+            tasks.append(f"{indent_str}[{i+1}] {type(node).__name__}\n")
+            tasks.append((node, indent + 1))
             if i < len(ast) - 1:
-                print()  # Linha em branco entre nós
+                tasks.append("\n")  # Linha em branco entre nós
+        _write_tasks(tasks, stream)
     else:
-        print_ast_node(ast, indent)
+        _write_tasks([(ast, indent)], stream)
 
 
-def print_ast_node(node, indent):
+def print_ast_node(node, indent, stream=None):
     """Imprime um nó da AST de forma formatada."""
-    if node is None:
-        return
-    
-    indent_str = "  " * indent
-    node_type = type(node).__name__
-    
-    # Imprimir informações básicas do nó
-    print(f"{indent_str}Type: {node_type}")
-    
-    # Imprimir atributos do nó
-    if hasattr(node, '__dict__'):
-        for key, value in node.__dict__.items():
-            if value is None:
-                continue
-            elif isinstance(value, (int, float, str, bool)):
-                # Valores primitivos
-                val_str = repr(value)
-                if len(val_str) > 50:
-                    val_str = val_str[:47] + "..."
-                print(f"{indent_str}  {key}: {val_str}")
-            elif isinstance(value, list):
-                # Listas
-                print(f"{indent_str}  {key}: [{len(value)} items]")
-                for i, item in enumerate(value):
-                    if hasattr(item, '__dict__'):
-                        print(f"{indent_str}    [{i}] {type(item).__name__}")
-                        print_ast_node(item, indent + 2)
-                    else:
-                        print(f"{indent_str}    [{i}] {item}")
-            elif hasattr(value, '__dict__'):
-                # Objetos aninhados
-                print(f"{indent_str}  {key}: {type(value).__name__}")
-                print_ast_node(value, indent + 2)
-            else:
-                print(f"{indent_str}  {key}: {value}")
+    _write_tasks([(node, indent)], stream)
+
 
+def _write_tasks(tasks, stream):
+    """
+    Escreve a saída descrita por tasks, em ordem.
+    
+    Cada tarefa é uma string (texto a escrever), uma tupla (nó, indentação)
+    (nó a imprimir) ou uma lista (valor a escrever com str(), em trechos).
+    As tarefas geradas ao imprimir um nó são empilhadas no lugar dele.
+    """
+    write = (stream if stream is not None else sys.stdout).write
+    # As linhas são reunidas e escritas em blocos
+    lines = []
+    append = lines.append
+    stack = tasks[::-1]
+    pop = stack.pop
+    while stack:
+        task = pop()
+        task_type = type(task)
+        if task_type is str:
+            append(task)
+            continue
+        if task_type is list:
+            lines.extend(iter_repr(task[0]))
+            continue
+        
+        node, indent = task
+        if node is None:
+            continue
+        if len(lines) >= 1024:
+            write("".join(lines))
+            lines.clear()
+        
+        indent_str = "  " * indent
+        
+        # Imprimir informações básicas do nó
+        append(f"{indent_str}Type: {type(node).__name__}\n")
+        
+        # Imprimir atributos do nó (declarados em _fields)
+        if isinstance(node, ASTNode):
+            children = []
+            add = children.append
+            for key in node._fields:
+                value = getattr(node, key)
+                if value is None:
+                    continue
+                elif isinstance(value, (int, float, str, bool)):
+                    # Valores primitivos
+                    val_str = repr(value)
+                    if len(val_str) > 50:
+                        val_str = val_str[:47] + "..."
+                    add(f"{indent_str}  {key}: {val_str}\n")
+                elif isinstance(value, list):
+                    # Listas
+                    add(f"{indent_str}  {key}: [{len(value)} items]\n")
+                    for i, item in enumerate(value):
+                        if isinstance(item, ASTNode):
+                            add(f"{indent_str}    [{i}] {type(item).__name__}\n")
+                            add((item, indent + 2))
+                        else:
+                            add(f"{indent_str}    [{i}] ")
+                            add([item])
+                            add("\n")
+                elif isinstance(value, ASTNode):
+                    # Objetos aninhados
+                    add(f"{indent_str}  {key}: {type(value).__name__}\n")
+                    add((value, indent + 2))
+                else:
+                    add(f"{indent_str}  {key}: ")
+                    add([value])
+                    add("\n")
+            children.reverse()
+            stack.extend(children)
+    write("".join(lines))
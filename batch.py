@@ -0,0 +1,204 @@
+"""
+Módulo de análise em lote.
+
+Distribui a análise léxica e sintática de vários arquivos .c entre
+processos de trabalho (ProcessPoolExecutor). Cada processo importa o
+lexer e o parser uma única vez e reutiliza a mesma sessão de análise
+(e, se habilitado, o mesmo cache persistente) para todos os arquivos
+que recebe.
+"""
+
+import glob
+import os
+import time
+import ast_binary
+from ast_nodes import iter_nodes
+
+
+class FileResult:
+    """Resultado da análise de um arquivo."""
+    
+    __slots__ = ('path', 'ok', 'tokens', 'nodes', 'elapsed', 'messages', 'ast', 'cached')
+    
+    def __init__(self, path, ok, tokens, nodes, elapsed, messages, ast=None, cached=False):
+        self.path = path
+        self.ok = ok
+        self.tokens = tokens  # Quantidade de tokens
+        self.nodes = nodes  # Quantidade de nós da AST
+        self.elapsed = elapsed  # Tempo de análise em segundos
+        self.messages = messages  # Mensagens de erro emitidas na análise
+        self.ast = ast
+        self.cached = cached  # True se o resultado veio do cache
+    
+    def __reduce__(self):
+        # A AST segue entre processos no formato binário (ast_binary),
+        # mais compacto que o pickle dos nós e sem limite de profundidade
+        ast_data = ast_binary.dumps(self.ast) if self.ast is not None else None
+        return (_restore_result, (self.path, self.ok, self.tokens, self.nodes,
+                                  self.elapsed, self.messages, ast_data, self.cached))
+
+
+def _restore_result(path, ok, tokens, nodes, elapsed, messages, ast_data, cached):
+    """Recria um FileResult serializado por FileResult.__reduce__."""
+    ast = ast_binary.loads(ast_data) if ast_data is not None else None
+    return FileResult(path, ok, tokens, nodes, elapsed, messages, ast, cached)
+
+
+def expand_paths(args):
+    """
+    Expande os argumentos da linha de comando em uma lista de arquivos.
+    
+    Diretórios são percorridos recursivamente em busca de arquivos .c e
+    padrões glob (*, ?, [...]) são expandidos. Arquivos repetidos são
+    ignorados e a ordem dos argumentos é preservada.
+    
+    Args:
+        args: Lista de arquivos, diretórios e padrões glob
+        
+    Returns:
+        Lista de caminhos de arquivos
+    """
+    paths = []
+    seen = set()
+    for arg in args:
+        if os.path.isdir(arg):
+            found = sorted(glob.glob(os.path.join(arg, '**', '*.c'), recursive=True))
+        elif glob.has_magic(arg):
+            found = sorted(p for p in glob.glob(arg, recursive=True) if os.path.isfile(p))
+        else:
+            found = [arg]
+        for path in found:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+# Sessão de análise e cache do processo de trabalho, criados pelo inicializador
+_session = None
+_cache = None
+
+
+def _init_worker(cache_dir=None, cache_bytes=None, engine='ply'):
+    """Cria a sessão de análise (e o cache) reutilizados pelo processo de trabalho."""
+    global _session, _cache
+    from parser import ParserSession
+    from cache import ASTCache, DEFAULT_MAX_BYTES
+    _session = ParserSession(engine=engine)
+    if cache_dir is not None:
+        _cache = ASTCache(cache_dir, cache_bytes or DEFAULT_MAX_BYTES)
+
+
+def analyze_file(path, keep_ast=False):
+    """
+    Analisa um arquivo e resume o resultado.
+    
+    As mensagens impressas pelo lexer e pelo parser são capturadas e
+    devolvidas no resultado, em vez de aparecerem na saída padrão.
+    
+    Args:
+        path: Caminho do arquivo .c
+        keep_ast: Se True, inclui a AST no resultado
+        
+    Returns:
+        FileResult com a análise do arquivo
+    """
+    from cache import parse_cached
+    if _session is None:
+        _init_worker()
+    
+    start = time.perf_counter()
+    try:
+        with open(path, 'rb') as f:
+            source = f.read()
+        # Somente a quantidade de tokens é usada: registrá-los em colunas
+        tokens_list, ast, messages, cached = parse_cached(source, _cache, _session, columnar=True)
+    except (OSError, UnicodeDecodeError) as e:
+        return FileResult(path, False, 0, 0, time.perf_counter() - start,
+                          [f"Erro ao ler o arquivo: {e}"])
+    elapsed = time.perf_counter() - start
+    
+    ok = ast is not None and not messages
+    nodes = sum(1 for _ in iter_nodes(ast)) if ast is not None else 0
+    return FileResult(path, ok, len(tokens_list), nodes, elapsed, messages,
+                      ast if keep_ast else None, cached)
+
+
+def analyze_files(paths, workers=None, keep_ast=False, cache_dir=None, cache_bytes=None,
+                  engine='ply'):
+    """
+    Analisa vários arquivos em paralelo, em processos de trabalho.
+    
+    Args:
+        paths: Lista de caminhos de arquivos .c
+        workers: Número de processos (por padrão, o número de CPUs)
+        keep_ast: Se True, as ASTs são devolvidas nos resultados
+        cache_dir: Diretório do cache persistente (None para não usar cache)
+        cache_bytes: Tamanho máximo do cache em bytes
+        engine: Motor de análise léxica ('ply' ou 'fast')
+        
+    Returns:
+        Lista de FileResult, na mesma ordem de paths
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    
+    # Com um único processo, evitar o custo de criar processos de trabalho
+    if workers == 1:
+        _init_worker(cache_dir, cache_bytes, engine)
+        return [analyze_file(path, keep_ast) for path in paths]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_dir, cache_bytes, engine)) as executor:
+        return list(executor.map(analyze_file, paths, [keep_ast] * len(paths),
+                                 chunksize=chunksize))
+
+
+def print_summary(out, results, total_time, slowest=10, show_cache=False):
+    """
+    Escreve o resumo agregado de uma análise em lote.
+    
+    Args:
+        out: Arquivo de texto de saída (por exemplo, um OutputBuffer)
+        results: Lista de FileResult
+        total_time: Tempo total de execução (segundos)
+        slowest: Quantidade de arquivos mais lentos a listar
+        show_cache: Se True, inclui os acertos e falhas do cache
+    """
+    write = out.write
+    ok = [r for r in results if r.ok]
+    failed = [r for r in results if not r.ok]
+    
+    write("=" * 70 + "\nANÁLISE EM LOTE\n" + "=" * 70 + "\n")
+    write(f"\n{'Arquivo':<40} {'Status':<6} {'Tokens':>8} {'Nós':>8} {'Tempo (s)':>10}\n")
+    write("-" * 76 + "\n")
+    for r in results:
+        status = "OK" if r.ok else "ERRO"
+        path = r.path if len(r.path) <= 40 else "..." + r.path[-37:]
+        write(f"{path:<40} {status:<6} {r.tokens:>8} {r.nodes:>8} {r.elapsed:>10.4f}\n")
+    
+    write("\n" + "=" * 70 + "\nRESUMO\n" + "=" * 70 + "\n")
+    write(f"Arquivos analisados: {len(results)}\n")
+    write(f"  Sem erros:         {len(ok)}\n")
+    write(f"  Com erros:         {len(failed)}\n")
+    write(f"Tokens:              {sum(r.tokens for r in results)}\n")
+    write(f"Nós da AST:          {sum(r.nodes for r in results)}\n")
+    write(f"Tempo total:         {total_time:.3f}s\n")
+    write(f"Tempo de análise:    {sum(r.elapsed for r in results):.3f}s (soma por arquivo)\n")
+    if show_cache:
+        hits = sum(1 for r in results if r.cached)
+        write(f"Cache:               {hits} acerto(s), {len(results) - hits} falha(s)\n")
+    
+    if results and slowest > 0:
+        write("\nArquivos mais lentos:\n")
+        for r in sorted(results, key=lambda r: r.elapsed, reverse=True)[:slowest]:
+            write(f"  {r.elapsed:>10.4f}s  {r.path}\n")
+    
+    if failed:
+        write("\nArquivos com erro:\n")
+        for r in failed:
+            first = r.messages[0] if r.messages else "Erro durante a analise sintatica."
+            write(f"  {r.path}: {first}\n")
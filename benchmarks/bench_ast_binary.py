@@ -0,0 +1,143 @@
+"""
+Benchmark do formato binário da AST (ast_binary.py).
+
+Primeiro verifica a ida e volta (dumps seguido de loads) sobre a saída
+de parser.parse para os arquivos de exemplo, um programa gerado e uma
+expressão profunda: a AST lida deve ter a mesma representação e as
+mesmas classes e posições (start e size) em todos os nós, e a leitura
+sob demanda de um arquivo mapeado em memória deve devolver os mesmos
+nós.
+
+Em seguida compara, para um programa com N funções, o tamanho e o tempo
+de gravação e leitura do formato binário com os do pickle e do JSON
+(output.iter_json e json.loads, que devolve dicionários, não nós), além
+do tempo de abrir o arquivo binário mapeado em memória e criar somente
+uma função.
+
+Uso: python benchmarks/bench_ast_binary.py [NUM_FUNCOES] [TERMOS]
+"""
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ast_binary
+from ast_nodes import iter_nodes
+from output import iter_json
+from parser import parse
+from bench_ast_memory import make_program
+from bench_ast_output import deep_program
+
+
+def same_tree(expected, actual):
+    """True se as duas ASTs têm a mesma representação, classes e posições."""
+    if repr(expected) != repr(actual):
+        return False
+    shape = lambda ast: [(type(n), n.start, n.size) for n in iter_nodes(ast)]
+    return shape(expected) == shape(actual)
+
+
+def verify(tmp, terms):
+    """Verifica a ida e volta pelo formato binário."""
+    sources = {}
+    for name in ('exemplo_simples.c', 'test_code.c'):
+        with open(os.path.join(ROOT, name), 'r', encoding='utf-8') as f:
+            sources[name] = f.read()
+    sources['gerado (50 funções)'] = make_program(50)
+    sources[f'profunda ({terms} termos)'] = deep_program(terms)
+    
+    path = os.path.join(tmp, 'verificacao.cast')
+    for name, source in sources.items():
+        ast = parse(source)
+        if not same_tree(ast, ast_binary.loads(ast_binary.dumps(ast))):
+            raise SystemExit(f"Ida e volta diverge em {name}")
+        ast_binary.dump(ast, path)
+        with ast_binary.load(path) as lazy:
+            for i in range(len(lazy)):
+                if lazy.span(i) != (lazy[i].start, lazy[i].end):
+                    raise SystemExit(f"Leitura sob demanda diverge em {name}")
+            if not same_tree(ast, lazy.root()):
+                raise SystemExit(f"Leitura sob demanda diverge em {name}")
+    print(f"Verificação: {len(sources)} ASTs idênticas após a ida e volta")
+
+
+def timed(func, repeat=3):
+    """Menor tempo (s) de repeat execuções de func() e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    terms = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        verify(tmp, terms)
+        
+        ast = parse(make_program(functions))
+        nodes = sum(1 for _ in iter_nodes(ast))
+        print(f"\nPrograma com {functions} funções ({nodes} nós):")
+        print(f"  {'Formato':<10} {'Tamanho (KB)':>14} {'Gravação (s)':>14} {'Leitura (s)':>13}")
+        
+        dump_time, data = timed(lambda: ast_binary.dumps(ast))
+        load_time, _ = timed(lambda: ast_binary.loads(data))
+        print(f"  {'binário':<10} {len(data) / 1024:>14.1f} {dump_time:>14.3f} {load_time:>13.3f}")
+        
+        dump_time, data = timed(lambda: pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL))
+        load_time, _ = timed(lambda: pickle.loads(data))
+        print(f"  {'pickle':<10} {len(data) / 1024:>14.1f} {dump_time:>14.3f} {load_time:>13.3f}")
+        
+        dump_time, data = timed(lambda: "".join(iter_json(ast)).encode('utf-8'))
+        load_time, _ = timed(lambda: json.loads(data))
+        print(f"  {'JSON':<10} {len(data) / 1024:>14.1f} {dump_time:>14.3f} {load_time:>13.3f}")
+        
+        # Acesso a uma única função: o binário mapeado em memória cria
+        # somente os nós acessados; o pickle precisa ler a AST inteira
+        path = os.path.join(tmp, 'programa.cast')
+        ast_binary.dump(ast, path)
+        pickle_path = os.path.join(tmp, 'programa.pickle')
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        def binary_one():
+            with ast_binary.load(path) as lazy:
+                return lazy[lazy.find('FunctionDecl')[functions // 2]].name
+        
+        def pickle_one():
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)[functions // 2].name
+        
+        binary_time, binary_name = timed(binary_one)
+        pickle_time, pickle_name = timed(pickle_one)
+        if binary_name != pickle_name:
+            raise SystemExit("Função lida sob demanda diverge")
+        print(f"\nAbrir o arquivo e obter uma função ({binary_name}):")
+        print(f"  binário (mmap)        {binary_time:>10.4f} s")
+        print(f"  pickle                {pickle_time:>10.4f} s")
+        
+        # AST profunda: o pickle esgota o limite de recursão
+        deep = parse(deep_program(terms))
+        binary_time, data = timed(lambda: ast_binary.dumps(deep), repeat=1)
+        try:
+            pickle.dumps(deep, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle_result = "ok"
+        except RecursionError:
+            pickle_result = "RecursionError"
+        print(f"\nExpressão com {terms} termos:")
+        print(f"  binário               {binary_time:>10.3f} s ({len(data) / 1024:.1f} KB)")
+        print(f"  pickle                {pickle_result:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de memória da AST.
+
+Analisa um programa gerado, mede com tracemalloc a memória retida pela
+AST resultante e informa a quantidade de nós, o custo médio em bytes
+por nó (incluindo valores, listas e posições) e o tamanho médio dos
+objetos nó em si (incluindo o __dict__, quando existir).
+
+Uso: python benchmarks/bench_ast_memory.py [NUM_FUNCOES]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ast_nodes import ASTNode
+from parser import parse
+
+
+FUNCTION_TEMPLATE = """
+int f{i}(int a, int b) {{
+    int x = a + b * {i};
+    float y = 2.5;
+    if (x > b && a != 0) {{
+        x = x - 1;
+    }} else {{
+        y = y * 2.0;
+    }}
+    while (x > 0) {{
+        x = x - g(a, b, 'c');
+    }}
+    return x;
+}}
+"""
+
+
+def make_program(n):
+    """Gera um programa com n funções."""
+    return "".join(FUNCTION_TEMPLATE.format(i=i) for i in range(n))
+
+
+def measure_nodes(ast):
+    """
+    Conta os nós da AST percorrendo _fields (ou __dict__, se existir).
+    
+    Returns:
+        Tupla (quantidade de nós, soma dos tamanhos dos objetos nó)
+    """
+    count = 0
+    size = 0
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, ASTNode):
+            count += 1
+            size += sys.getsizeof(value)
+            if hasattr(value, '__dict__'):
+                size += sys.getsizeof(value.__dict__)
+                stack.extend(value.__dict__.values())
+            else:
+                stack.extend(getattr(value, name) for name in value._fields)
+    return count, size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    code = make_program(n)
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ast = parse(code)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    if ast is None:
+        raise SystemExit("Falha na análise do programa gerado")
+    
+    nodes, nodes_size = measure_nodes(ast)
+    print(f"Funções:            {n}")
+    print(f"Nós da AST:         {nodes}")
+    print(f"Memória retida:     {retained / 1024 / 1024:.2f} MiB")
+    print(f"Bytes por nó:       {retained / nodes:.1f}")
+    print(f"Objeto nó (médio):  {nodes_size / nodes:.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
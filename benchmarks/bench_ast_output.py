@@ -0,0 +1,183 @@
+"""
+Benchmark da impressão da AST (print_ast) e de sua representação (repr).
+
+Usa dois tipos de árvore:
+
+- profunda: uma expressão a + b + c + ... com N termos, que gera uma
+  cadeia de BinOp com N níveis
+- larga: um programa gerado com N funções
+
+Primeiro verifica que a saída de print_ast e de write_repr é idêntica,
+byte a byte, à das implementações recursivas anteriores (reproduzidas
+abaixo como referência) em árvores que estas conseguem percorrer. Em
+seguida mede o tempo de cada implementação, escrevendo em /dev/null; as
+recursivas falham com RecursionError nas árvores profundas.
+
+Uso: python benchmarks/bench_ast_output.py [TERMOS] [NUM_FUNCOES]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ast_nodes import ASTNode, write_repr
+from ast_printer import print_ast
+from parser import parse
+from bench_ast_memory import make_program
+
+
+# Implementação recursiva anterior do __repr__ dos nós
+LEGACY_REPR = {
+    'BinOp': lambda n, r: f"BinOp({r(n.left)}, '{n.op}', {r(n.right)})",
+    'UnaryOp': lambda n, r: f"UnaryOp('{n.op}', {r(n.operand)})",
+    'Number': lambda n, r: f"Number({n.value})",
+    'String': lambda n, r: f"String('{n.value}')",
+    'Char': lambda n, r: f"Char('{n.value}')",
+    'Identifier': lambda n, r: f"Identifier('{n.name}')",
+    'VarDecl': lambda n, r: f"VarDecl('{n.var_type}', '{n.name}')",
+    'Assignment': lambda n, r: f"Assignment({r(n.left)}, {r(n.right)})",
+    'IfStatement': lambda n, r: (
+        f"IfStatement({r(n.condition)}, {r(n.then_block)}, {r(n.else_block)})" if n.else_block
+        else f"IfStatement({r(n.condition)}, {r(n.then_block)})"),
+    'WhileStatement': lambda n, r: f"WhileStatement({r(n.condition)}, {r(n.body)})",
+    'ForStatement': lambda n, r: f"ForStatement({r(n.init)}, {r(n.condition)}, {r(n.update)}, {r(n.body)})",
+    'ReturnStatement': lambda n, r: f"ReturnStatement({r(n.value)})" if n.value else "ReturnStatement()",
+    'FunctionCall': lambda n, r: f"FunctionCall('{n.name}', {r(n.args)})",
+    'FunctionDecl': lambda n, r: f"FunctionDecl('{n.return_type}', '{n.name}', {r(n.params)}, {r(n.body)})",
+    'Block': lambda n, r: f"Block({r(n.statements)})",
+    'ExpressionStatement': lambda n, r: f"ExpressionStatement({r(n.expr)})",
+}
+
+
+def legacy_str(value):
+    """str(value) como no __repr__ recursivo anterior."""
+    if isinstance(value, ASTNode):
+        return LEGACY_REPR[type(value).__name__](value, legacy_str)
+    if isinstance(value, list):
+        return "[" + ", ".join(legacy_element(e) for e in value) + "]"
+    if isinstance(value, tuple):
+        if len(value) == 1:
+            return "(" + legacy_element(value[0]) + ",)"
+        return "(" + ", ".join(legacy_element(e) for e in value) + ")"
+    return str(value)
+
+
+def legacy_element(value):
+    """repr() de um elemento de lista ou tupla, como no __repr__ anterior."""
+    if isinstance(value, (ASTNode, list, tuple)):
+        return legacy_str(value)
+    return repr(value)
+
+
+def legacy_print_ast(ast, out, indent=0):
+    """Implementação recursiva anterior de print_ast."""
+    indent_str = "  " * indent
+    if isinstance(ast, list):
+        for i, node in enumerate(ast):
+            out.write(f"{indent_str}[{i+1}] {type(node).__name__}\n")
+            legacy_print_ast_node(node, out, indent + 1)
+            if i < len(ast) - 1:
+                out.write("\n")
+    else:
+        legacy_print_ast_node(ast, out, indent)
+
+
+def legacy_print_ast_node(node, out, indent):
+    """Implementação recursiva anterior de print_ast_node."""
+    if node is None:
+        return
+    indent_str = "  " * indent
+    out.write(f"{indent_str}Type: {type(node).__name__}\n")
+    if isinstance(node, ASTNode):
+        for key in node._fields:
+            value = getattr(node, key)
+            if value is None:
+                continue
+            elif isinstance(value, (int, float, str, bool)):
+                val_str = repr(value)
+                if len(val_str) > 50:
+                    val_str = val_str[:47] + "..."
+                out.write(f"{indent_str}  {key}: {val_str}\n")
+            elif isinstance(value, list):
+                out.write(f"{indent_str}  {key}: [{len(value)} items]\n")
+                for i, item in enumerate(value):
+                    if isinstance(item, ASTNode):
+                        out.write(f"{indent_str}    [{i}] {type(item).__name__}\n")
+                        legacy_print_ast_node(item, out, indent + 2)
+                    else:
+                        out.write(f"{indent_str}    [{i}] {legacy_str(item)}\n")
+            elif isinstance(value, ASTNode):
+                out.write(f"{indent_str}  {key}: {type(value).__name__}\n")
+                legacy_print_ast_node(value, out, indent + 2)
+            else:
+                out.write(f"{indent_str}  {key}: {legacy_str(value)}\n")
+
+
+def deep_program(terms):
+    """Programa com uma expressão de terms termos (cadeia de BinOp)."""
+    expression = " + ".join(f"a{i}" for i in range(terms))
+    return f"int main() {{\n    int x = {expression};\n    return x;\n}}\n"
+
+
+def verify():
+    """Compara as saídas com as implementações recursivas anteriores."""
+    sources = [deep_program(200), make_program(20)]
+    for path in ('exemplo_simples.c', 'test_code.c'):
+        with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), path),
+                  'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    for data in sources:
+        ast = parse(data)
+        expected, actual = io.StringIO(), io.StringIO()
+        legacy_print_ast(ast, expected)
+        print_ast(ast, stream=actual)
+        if expected.getvalue() != actual.getvalue():
+            raise SystemExit("print_ast diverge da implementação anterior")
+        actual = io.StringIO()
+        write_repr(ast, actual)
+        if legacy_str(ast) != actual.getvalue() or repr(ast) != actual.getvalue():
+            raise SystemExit("repr diverge da implementação anterior")
+    print(f"Verificação: {len(sources)} árvores com saída idêntica à anterior")
+
+
+def timed(func, out):
+    """Tempo (s) de func(out), ou None em caso de RecursionError."""
+    start = time.perf_counter()
+    try:
+        func(out)
+    except RecursionError:
+        return None
+    out.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    terms = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    functions = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    verify()
+    
+    trees = (
+        (f"profunda ({terms} termos)", parse(deep_program(terms))),
+        (f"larga ({functions} funções)", parse(make_program(functions))),
+    )
+    cases = (
+        ("print_ast", lambda ast, out: print_ast(ast, stream=out)),
+        ("print_ast recursivo", lambda ast, out: legacy_print_ast(ast, out)),
+        ("repr", lambda ast, out: write_repr(ast, out)),
+        ("repr recursivo", lambda ast, out: out.write(legacy_str(ast))),
+    )
+    
+    with open(os.devnull, 'w', encoding='utf-8') as out:
+        for label, ast in trees:
+            print(f"\nÁrvore {label}:")
+            for name, func in cases:
+                elapsed = timed(lambda o: func(ast, o), out)
+                result = "RecursionError" if elapsed is None else f"{elapsed:.3f} s"
+                print(f"  {name:<22} {result:>16}")
+
+
+if __name__ == "__main__":
+    main()
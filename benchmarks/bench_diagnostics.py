@@ -0,0 +1,173 @@
+"""
+Benchmark dos diagnósticos (diagnostics.py).
+
+Primeiro verifica, nos dois motores léxicos:
+
+- que uma sequência de caracteres inválidos (como um trecho de arquivo
+  binário) gera um único erro léxico;
+- que a recuperação de erros de sintaxe reporta um erro por função de um
+  programa com uma função inválida a cada três, na linha correta;
+- que o limite de mensagens guarda somente as primeiras e conta as
+  demais.
+
+Em seguida compara o tempo e a quantidade de mensagens da tokenização de
+um programa com um trecho binário usando o tratamento de erros anterior
+(uma mensagem impressa por caractere inválido, ignorando um caractere de
+cada vez) e o atual.
+
+Uso: python benchmarks/bench_diagnostics.py [NUM_FUNCOES] [TAMANHO_BINARIO]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fastlex
+from diagnostics import LEXICAL, SYNTAX, LIMIT, Diagnostics
+from lexer import clone_lexer, reset_lexer
+from parser import ParserSession
+from bench_ast_memory import make_program
+
+
+# Caracteres que não iniciam nenhum token, usados no trecho binário
+BINARY_CHARS = '\x00\x01\x02\x7f@#$`~?:.[]^%\\çãé�'
+
+# Função com um erro de sintaxe (operando faltando)
+BROKEN_FUNCTION = "int quebrada{i}(int x) {{\n    x = x + ;\n    return x;\n}}\n"
+
+
+def binary_blob(size, seed=0):
+    """Trecho de size caracteres inválidos, sem espaços nem quebras de linha."""
+    rng = random.Random(seed)
+    return "".join(rng.choice(BINARY_CHARS) for _ in range(size))
+
+
+def broken_program(functions):
+    """
+    Programa em que uma a cada três funções tem um erro de sintaxe.
+    
+    Returns:
+        Tupla (código fonte, linhas em que estão os erros)
+    """
+    parts = []
+    lines = []
+    line = 1
+    for i in range(functions):
+        if i % 3 == 0:
+            part = BROKEN_FUNCTION.format(i=i)
+            lines.append(line + 1)
+        else:
+            part = make_program(1).replace('func0', f'func{i}')
+        parts.append(part)
+        line += part.count("\n")
+    return "".join(parts), lines
+
+
+def legacy_tokens(data):
+    """
+    Tokeniza com o tratamento de erros anterior: cada caractere inválido
+    gera uma mensagem impressa e é ignorado individualmente.
+    """
+    def legacy_error(t):
+        print(f"Erro léxico na linha {t.lineno}, posição {t.lexpos}: caractere inválido '{t.value[0]}'")
+        t.lexer.skip(1)
+    
+    lexer_obj = clone_lexer()
+    lexer_obj.lexstateerrorf = dict(lexer_obj.lexstateerrorf, INITIAL=legacy_error)
+    lexer_obj.lexerrorf = legacy_error
+    reset_lexer(lexer_obj, data)
+    return sum(1 for _ in iter(lexer_obj.token, None))
+
+
+def ply_tokens(data, diagnostics):
+    """Tokeniza com o lexer do PLY, registrando os erros em diagnostics."""
+    lexer_obj = clone_lexer()
+    reset_lexer(lexer_obj, data)
+    lexer_obj.diagnostics = diagnostics
+    return sum(1 for _ in iter(lexer_obj.token, None))
+
+
+def fast_tokens(data, diagnostics):
+    """Tokeniza com o fastlex, registrando os erros em diagnostics."""
+    return sum(1 for _ in fastlex.scan(data, diagnostics))
+
+
+def verify(functions):
+    """Verifica o agrupamento, a recuperação e o limite nos dois motores."""
+    blob = binary_blob(5000)
+    source = make_program(3) + blob + "\n" + make_program(3)
+    broken, expected_lines = broken_program(functions)
+    
+    results = {}
+    for engine in ('ply', 'fast'):
+        session = ParserSession(engine=engine)
+        
+        diagnostics = Diagnostics()
+        session.parse_with_tokens(source, diagnostics=diagnostics)
+        if ([d.kind for d in diagnostics] != [LEXICAL]
+                or f"{len(blob)} caracteres inválidos" not in diagnostics.items[0].message):
+            raise SystemExit(f"O trecho binário não gerou um único erro léxico ({engine})")
+        
+        diagnostics = Diagnostics(limit=None)
+        if session.parse(broken, diagnostics) is not None:
+            raise SystemExit(f"A análise com erros devolveu uma AST ({engine})")
+        if [d.kind for d in diagnostics] != [SYNTAX] * len(expected_lines):
+            raise SystemExit(f"Quantidade de erros de sintaxe diverge ({engine})")
+        if [d.line for d in diagnostics] != expected_lines:
+            raise SystemExit(f"Linhas dos erros de sintaxe divergem ({engine})")
+        
+        limit = len(expected_lines) // 2
+        capped = Diagnostics(limit=limit)
+        session.parse(broken, capped)
+        if (len(capped) != limit + 1 or capped.items[-1].kind != LIMIT
+                or capped.omitted != len(expected_lines) - limit
+                or capped.counts[SYNTAX] != len(expected_lines)
+                or capped.messages()[:limit] != diagnostics.messages()[:limit]):
+            raise SystemExit(f"O limite de mensagens não foi respeitado ({engine})")
+        results[engine] = diagnostics.messages()
+    
+    if results['ply'] != results['fast']:
+        raise SystemExit("As mensagens dos dois motores divergem")
+    print(f"Verificação: trecho binário de {len(blob)} caracteres em um único erro; "
+          f"{len(expected_lines)} erros de sintaxe reportados em {functions} funções")
+
+
+def timed(func, *args):
+    """Tempo (s) de func(*args) e seu resultado."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    blob_size = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    
+    verify(functions)
+    
+    data = make_program(functions // 2) + binary_blob(blob_size) + "\n" + make_program(functions // 2)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        legacy_time, legacy_count = timed(legacy_tokens, data)
+    legacy_messages = output.getvalue().count("\n")
+    
+    print(f"\nTokenização de {len(data) // 1024} KB com um trecho binário de {blob_size} caracteres:")
+    print(f"  {'Tratamento':<22} {'Tempo (s)':>10} {'Tokens':>8} {'Mensagens':>10}")
+    print(f"  {'anterior (1 por char)':<22} {legacy_time:>10.3f} {legacy_count:>8} {legacy_messages:>10}")
+    for engine, tokenize in (('ply', ply_tokens), ('fast', fast_tokens)):
+        diagnostics = Diagnostics()
+        elapsed, count = timed(tokenize, data, diagnostics)
+        if count != legacy_count:
+            raise SystemExit(f"Quantidade de tokens diverge ({engine})")
+        print(f"  {'diagnósticos (' + engine + ')':<22} {elapsed:>10.3f} {count:>8} "
+              f"{len(diagnostics.messages()):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark do lexer rápido (fastlex.py).
+
+Primeiro verifica a equivalência com o lexer do PLY (lexer.py): para os
+arquivos .c de exemplo e para entradas aleatórias (com comentários,
+strings e caracteres não fechados, caracteres inválidos e \\r), os dois
+motores devem produzir os mesmos tokens (tipo, valor, linha, posição e
+fim) e as mesmas mensagens de erro, e a análise sintática com cada motor
+deve produzir a mesma AST e as mesmas mensagens.
+
+Em seguida mede a vazão (tokens por segundo) de cada motor em um
+programa gerado, apenas tokenizando e tokenizando e analisando.
+
+Uso: python benchmarks/bench_fastlex.py [NUM_FUNCOES] [NUM_ENTRADAS_ALEATORIAS]
+"""
+
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fastlex
+from ast_nodes import iter_nodes
+from lexer import clone_lexer, reset_lexer
+from parser import ParserSession
+from bench_ast_memory import make_program
+
+
+# Fragmentos usados na geração das entradas aleatórias
+FUZZ_PIECES = (
+    'int', 'float', 'char', 'if', 'else', 'while', 'for', 'return', 'void',
+    'x', 'abc_1', '_t', 'intx', '0', '42', '3.14', '1.', '.5', '007',
+    '"s"', '"a\\"b"', '"\\n\\t\\\\"', '"', "'c'", "'\\n'", "'\\''", "'", "''",
+    '+', '-', '*', '/', '=', '==', '!=', '<', '>', '<=', '>=', '&&', '||', '!',
+    '&', '|', '{', '}', '(', ')', ';', ',', '//', '/*', '*/', '/**/', '*',
+    ' ', '  ', '\t', '\n', '\n\n', '\r', '\r\n', '\\', '@', '#', '$', 'ç', '\x00',
+)
+
+
+def run_quiet(func, *args):
+    """Executa func capturando o que é impresso; retorna (resultado, saída)."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args)
+    return result, output.getvalue()
+
+
+def ply_tokens(data):
+    """Tokens do lexer do PLY como tuplas (tipo, valor, linha, posição, fim)."""
+    lexer_obj = clone_lexer()
+    reset_lexer(lexer_obj, data)
+    result = []
+    while True:
+        tok = lexer_obj.token()
+        if not tok:
+            break
+        end = getattr(tok, 'endlexpos', tok.lexpos + len(str(tok.value)))
+        result.append((tok.type, tok.value, tok.lineno, tok.lexpos, end))
+    return result
+
+
+def fast_tokens(data):
+    """Tokens do lexer rápido como tuplas (tipo, valor, linha, posição, fim)."""
+    return [tuple(tok) for tok in fastlex.scan(data)]
+
+
+def snapshot(ast):
+    """Representação comparável da AST, incluindo as posições dos nós."""
+    if ast is None:
+        return None
+    return repr(ast), [(type(n).__name__, n.start, n.end) for n in iter_nodes(ast)]
+
+
+def compare(data, ply_session, fast_session):
+    """Retorna a descrição da primeira divergência entre os motores, ou None."""
+    expected = run_quiet(ply_tokens, data)
+    actual = run_quiet(fast_tokens, data)
+    if expected[0] != actual[0]:
+        for i, (a, b) in enumerate(zip(expected[0], actual[0])):
+            if a != b:
+                return f"token {i}: ply={a!r} fast={b!r}"
+        return f"quantidade de tokens: ply={len(expected[0])} fast={len(actual[0])}"
+    if expected[1] != actual[1]:
+        return f"mensagens: ply={expected[1]!r} fast={actual[1]!r}"
+    
+    (ply_result, ply_out) = run_quiet(ply_session.parse_with_tokens, data)
+    (fast_result, fast_out) = run_quiet(fast_session.parse_with_tokens, data)
+    if ply_result[0] != fast_result[0]:
+        return "tokens registrados pelo parser"
+    if snapshot(ply_result[1]) != snapshot(fast_result[1]):
+        return "AST"
+    if ply_out != fast_out:
+        return f"mensagens do parser: ply={ply_out!r} fast={fast_out!r}"
+    return None
+
+
+def verify(cases, seed=1):
+    """Compara os motores nos arquivos de exemplo e em entradas aleatórias."""
+    ply_session = ParserSession()
+    fast_session = ParserSession(engine='fast')
+    
+    inputs = []
+    for path in sorted(glob.glob(os.path.join(ROOT, '*.c'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            inputs.append((os.path.basename(path), f.read()))
+    rng = random.Random(seed)
+    for i in range(cases):
+        pieces = rng.choices(FUZZ_PIECES, k=rng.randrange(1, 60))
+        inputs.append((f"aleatória {i}", "".join(pieces)))
+    # Trechos aleatórios de um programa válido, que cortam strings e comentários
+    program = make_program(3) + '/* fim */ "s" \'c\' // fim\n'
+    for i in range(cases // 4):
+        start = rng.randrange(len(program))
+        inputs.append((f"trecho {i}", program[start:start + rng.randrange(1, 200)]))
+    
+    for name, data in inputs:
+        error = compare(data, ply_session, fast_session)
+        if error is not None:
+            raise SystemExit(f"Divergência em {name} ({data!r}): {error}")
+    print(f"Verificação: {len(inputs)} entradas idênticas nos dois motores")
+
+
+def best_time(func, repeat=5):
+    """Menor tempo de execução de func em repeat execuções."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    cases = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    verify(cases)
+    
+    source = make_program(functions)
+    count = len(fastlex.get_tokens(source))
+    print(f"\nPrograma: {source.count(chr(10))} linhas, {count} tokens")
+    
+    ply_session = ParserSession()
+    fast_session = ParserSession(engine='fast')
+    print(f"\n{'Motor':<8} {'Tokenização (s)':>16} {'Tokens/s':>12} {'Análise (s)':>12} {'Tokens/s':>12}")
+    print("-" * 64)
+    times = {}
+    for name, session in (('ply', ply_session), ('fast', fast_session)):
+        lex_time = best_time(lambda: session.tokens(source))
+        parse_time = best_time(lambda: session.parse(source), repeat=3)
+        times[name] = (lex_time, parse_time)
+        print(f"{name:<8} {lex_time:>16.4f} {count / lex_time:>12.0f} "
+              f"{parse_time:>12.4f} {count / parse_time:>12.0f}")
+    
+    print(f"\nAceleração da tokenização: {times['ply'][0] / times['fast'][0]:.1f}x")
+    print(f"Aceleração da análise:     {times['ply'][1] / times['fast'][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark do tempo de inicialização.
+
+Mede, em processos novos (como nas execuções por arquivo do main.py):
+
+- a importação de main.py, com o tempo acumulado de cada módulo do
+  projeto informado por python -X importtime
+- a importação de parser.py seguida da primeira análise, que carrega as
+  tabelas do lexer e do parser
+- a execução completa de main.py sobre um arquivo pequeno
+
+Cada medição é repetida e a mediana é registrada. Os resultados são
+acrescentados a um histórico em JSON (por padrão,
+benchmarks/import_time_history.json), com a data e o commit, e
+comparados com a execução anterior.
+
+Uso: python benchmarks/bench_import_time.py [REPETICOES] [--history ARQUIVO]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_HISTORY = os.path.join(ROOT, 'benchmarks', 'import_time_history.json')
+
+# Módulos cujo tempo acumulado de importação é registrado
+MODULES = ('main', 'parser', 'lexer', 'cache', 'batch', 'ply.lex', 'ply.yacc', 'parsetab', 'lextab')
+
+FIRST_PARSE_CODE = "import parser; parser.parse('int main() { return 0; }')"
+
+
+def run(args):
+    """Executa o Python em um processo novo; retorna (tempo em ms, stderr)."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode not in (0, 1):
+        raise SystemExit(f"Falha ao executar {args!r}:\n{result.stderr}")
+    return elapsed, result.stderr
+
+
+def import_times():
+    """Tempo acumulado (ms) de importação dos módulos de MODULES."""
+    _, stderr = run(['-X', 'importtime', '-c', 'import main'])
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name in MODULES:
+            times[name] = int(cumulative) / 1000
+    return times
+
+
+def measure(repeat):
+    """Mediana de cada medição em repeat execuções."""
+    samples = {}
+    for _ in range(repeat):
+        for name, value in import_times().items():
+            samples.setdefault('import ' + name, []).append(value)
+        samples.setdefault('import + primeira análise', []).append(run(['-c', FIRST_PARSE_CODE])[0])
+        samples.setdefault('main.py exemplo_simples.c', []).append(run(['main.py', 'exemplo_simples.c'])[0])
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def git_commit():
+    """Commit atual do repositório, se disponível."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark do tempo de inicialização.")
+    arg_parser.add_argument('repeat', nargs='?', type=int, default=10)
+    arg_parser.add_argument('--history', default=DEFAULT_HISTORY)
+    args = arg_parser.parse_args()
+    
+    results = measure(args.repeat)
+    
+    history = []
+    if os.path.exists(args.history):
+        with open(args.history, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    previous = history[-1]['results'] if history else {}
+    
+    print(f"{'Medição':<36} {'Atual (ms)':>12} {'Anterior (ms)':>14} {'Variação':>10}")
+    print("-" * 75)
+    for name, value in results.items():
+        if name in previous:
+            change = (value - previous[name]) / previous[name] * 100 if previous[name] else 0.0
+            print(f"{name:<36} {value:>12.1f} {previous[name]:>14.1f} {change:>+9.1f}%")
+        else:
+            print(f"{name:<36} {value:>12.1f} {'-':>14} {'-':>10}")
+    
+    history.append({
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'results': results,
+    })
+    with open(args.history, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+    print(f"\nHistórico: {args.history} ({len(history)} execuções)")
+
+
+if __name__ == "__main__":
+    main()
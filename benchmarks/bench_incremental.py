@@ -0,0 +1,105 @@
+"""
+Benchmark da análise incremental.
+
+Primeiro verifica, em um programa menor, que a AST mantida pelo
+IncrementalParser após edições aleatórias de um caractere é idêntica
+(estrutura e posições) à obtida por uma análise completa. Em seguida
+mede a latência de edições de um caractere em um arquivo de ~50 mil
+linhas, comparando com o tempo de uma análise completa. A latência é
+medida para a edição em si e para a edição seguida do acesso à AST
+completa (que aplica os deslocamentos de posição pendentes).
+
+Uso: python benchmarks/bench_incremental.py [LINHAS]
+"""
+
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ast_nodes import iter_nodes
+from incremental import IncrementalParser
+from parser import ParserSession
+from bench_ast_memory import FUNCTION_TEMPLATE, make_program
+
+
+EDIT_CHARS = " x1;{}()/*\"'=+\n"
+
+
+def snapshot(ast):
+    """Representação comparável da AST, incluindo as posições dos nós."""
+    if ast is None:
+        return None
+    return repr(ast), [(type(n).__name__, n.start, n.end) for n in iter_nodes(ast)]
+
+
+def random_edit(rng, source):
+    """Gera uma edição aleatória de um caractere (inserção ou remoção)."""
+    offset = rng.randrange(len(source))
+    if rng.random() < 0.5:
+        return offset, 1, ""
+    return offset, 0, rng.choice(EDIT_CHARS)
+
+
+def verify(functions=60, edits=200, seed=1):
+    """Compara a análise incremental com a completa após cada edição."""
+    rng = random.Random(seed)
+    session = ParserSession()
+    doc = IncrementalParser(make_program(functions))
+    incremental = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(edits):
+            offset, removed, inserted = random_edit(rng, doc.source)
+            original = doc.source[offset:offset + removed]
+            for edit in ((offset, removed, inserted), (offset, len(inserted), original)):
+                doc.apply_edit(*edit)
+                incremental += doc.last_incremental
+                if snapshot(doc.ast) != snapshot(session.parse(doc.source)):
+                    raise SystemExit(f"AST incremental diverge após a edição {edit!r}")
+    print(f"Verificação: {edits * 2} edições idênticas à análise completa "
+          f"({incremental} tratadas incrementalmente)")
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    verify()
+    
+    functions = lines // FUNCTION_TEMPLATE.count('\n')
+    source = make_program(functions)
+    print(f"\nArquivo: {source.count(chr(10))} linhas, {functions} funções")
+    
+    start = time.perf_counter()
+    doc = IncrementalParser(source)
+    full = time.perf_counter() - start
+    print(f"Análise completa:        {full * 1000:10.1f} ms")
+    
+    for label, access_ast in (("Edição", False), ("Edição + acesso à AST", True)):
+        rng = random.Random(2)
+        latencies = []
+        for _ in range(100):
+            # Inserir e remover um espaço junto a outro, em uma função aleatória
+            offset = rng.randrange(len(doc.source))
+            while doc.source[offset] != ' ':
+                offset += 1
+            for edit in ((offset, 0, " "), (offset, 1, "")):
+                start = time.perf_counter()
+                if not doc.apply_edit(*edit):
+                    raise SystemExit(f"Edição {edit!r} não foi tratada incrementalmente")
+                if access_ast:
+                    doc.ast
+                latencies.append(time.perf_counter() - start)
+        
+        latencies.sort()
+        print(f"\n{label}:")
+        print(f"  mediana:               {statistics.median(latencies) * 1000:10.2f} ms")
+        print(f"  p95:                   {latencies[int(len(latencies) * 0.95)] * 1000:10.2f} ms")
+        print(f"  máximo:                {latencies[-1] * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
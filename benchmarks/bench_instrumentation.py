@@ -0,0 +1,100 @@
+"""
+Benchmark da instrumentação da análise (instrumentation.py).
+
+Gera um programa com benchmarks/synthetic_c.py (NUM_FUNCOES funções) e
+verifica que:
+
+- a análise instrumentada produz a mesma AST que a não instrumentada,
+  com os dois motores léxicos;
+- os tokens contados por tipo são os mesmos da lista de tokens e as
+  reduções contadas são as mesmas com os dois motores;
+- o tempo das fases aninhadas é descontado da fase externa (a soma das
+  fases fica próxima do tempo total medido por fora).
+
+Em seguida compara o tempo da análise sem instrumentação, com
+Stats(trace_memory=False) (tempo e contadores) e com Stats() (também as
+alocações, com tracemalloc).
+
+Uso: python benchmarks/bench_instrumentation.py [NUM_FUNCOES]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from diagnostics import Diagnostics
+from instrumentation import Stats
+from parser import ParserSession
+from synthetic_c import generate
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def verify(source):
+    """Verifica as ASTs, os contadores e o desconto das fases aninhadas."""
+    reductions = {}
+    for engine in ('ply', 'fast'):
+        expected = repr(ParserSession(engine=engine).parse(source, Diagnostics()))
+        stats = Stats()
+        session = ParserSession(engine=engine, stats=stats)
+        start = time.perf_counter()
+        with stats.phase('parse'):
+            tokens, ast = session.parse_with_tokens(source, diagnostics=Diagnostics())
+        total = time.perf_counter() - start
+        if repr(ast) != expected:
+            raise SystemExit(f"A AST instrumentada diverge da original ({engine})")
+        if stats.tokens != Counter(token[0] for token in tokens):
+            raise SystemExit(f"Contagem de tokens incorreta ({engine})")
+        reductions[engine] = stats.reductions
+        measured = sum(phase.seconds for phase in stats.phases.values())
+        if abs(measured - total) > total * 0.05:
+            raise SystemExit(f"As fases somam {measured:.4f} s de {total:.4f} s ({engine})")
+        if stats.phases['parse'].allocated + stats.phases['lex'].allocated <= 0:
+            raise SystemExit(f"Alocações não registradas ({engine})")
+    if reductions['ply'] != reductions['fast'] or sum(stats.actions.values()) != sum(reductions['ply'].values()):
+        raise SystemExit("As reduções contadas divergem entre os motores")
+    
+    print(f"Verificação: ASTs iguais; {sum(stats.tokens.values())} tokens de "
+          f"{len(stats.tokens)} tipos; {sum(reductions['ply'].values())} reduções em "
+          f"{len(reductions['ply'])} regras; fases somam o tempo total")
+
+
+def instrumented_parse(source, engine, trace_memory):
+    stats = Stats(trace_memory)
+    with stats.phase('parse'):
+        ParserSession(engine=engine, stats=stats).parse(source, Diagnostics())
+    return stats
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    
+    source = generate(functions=functions, statements=40)
+    verify(source)
+    
+    print(f"\nPrograma: {functions} funções, {len(source)} bytes")
+    print(f"\n{'Motor':<6} {'Instrumentação':<22} {'Tempo (s)':>10} {'Custo':>8}")
+    print("-" * 49)
+    for engine in ('ply', 'fast'):
+        plain, _ = timed(lambda: ParserSession(engine=engine).parse(source, Diagnostics()))
+        print(f"{engine:<6} {'nenhuma':<22} {plain:>10.3f} {'-':>8}")
+        for label, trace_memory in (('tempo e contadores', False), ('com alocações', True)):
+            elapsed, _ = timed(instrumented_parse, source, engine, trace_memory)
+            print(f"{engine:<6} {label:<22} {elapsed:>10.3f} {elapsed / plain - 1:>+8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark do compartilhamento de strings e folhas da AST.
+
+Monta um corpus com os arquivos de exemplo válidos (test_code.c e
+exemplo_simples.c) repetidos ESCALA vezes e mede com tracemalloc:
+
+- a memória retida pela lista de tokens, com os nomes e palavras-chave
+  internados pelo lexer e com uma cópia própria do valor de cada token
+  (como antes da internação);
+- a memória retida pela AST, com uma folha por literal (padrão) e com as
+  folhas compartilhadas por uma LeafTable (ParserSession com
+  share_leaves), além da quantidade de literais e de nós distintos.
+
+Antes, verifica que as duas ASTs têm a mesma representação, que a
+tabela respeita o limite com mais literais distintos que ele e que os
+nomes e tipos de todas as ocorrências são a mesma string.
+
+Uso: python benchmarks/bench_interning.py [ESCALA]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fastlex
+from ast_nodes import Char, Identifier, LeafTable, Number, String, VarDecl, iter_nodes
+from diagnostics import Diagnostics
+from parser import ParserSession
+
+
+SAMPLES = ('test_code.c', 'exemplo_simples.c')
+
+LITERALS = (Number, Char, String)
+
+
+def sample_corpus(scale):
+    """Arquivos de exemplo válidos concatenados e repetidos scale vezes."""
+    parts = []
+    for name in SAMPLES:
+        with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+            parts.append(f.read())
+    return "".join(parts) * scale
+
+
+def retained(func, *args):
+    """
+    Executa func(*args) medindo com tracemalloc a memória retida pelo
+    resultado.
+    
+    Returns:
+        Tupla (bytes retidos, tempo em segundos, resultado)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size, elapsed, result
+
+
+def copied_tokens(data):
+    """Tokens com uma cópia própria de cada valor de texto (sem internação)."""
+    return [(kind, value[:1] + value[1:] if isinstance(value, str) else value, line)
+            for kind, value, line in fastlex.get_tokens(data)]
+
+
+def literal_counts(ast):
+    """Quantidade de literais da AST e de objetos distintos entre eles."""
+    literals = [node for node in iter_nodes(ast) if isinstance(node, LITERALS)]
+    return len(literals), len({id(node) for node in literals})
+
+
+def verify():
+    """Verifica a equivalência, o limite da tabela e a internação."""
+    source = sample_corpus(3)
+    plain = ParserSession().parse(source)
+    session = ParserSession(engine='fast', share_leaves=True)
+    shared = session.parse(source)
+    if repr(plain) != repr(shared):
+        raise SystemExit("A AST com folhas compartilhadas diverge da original")
+    
+    names = [node.name for node in iter_nodes(shared) if isinstance(node, (Identifier, VarDecl))]
+    types = [node.var_type for node in iter_nodes(shared) if isinstance(node, VarDecl)]
+    for label, values in (('nomes', names), ('tipos', types)):
+        if len({id(value) for value in values}) != len(set(values)):
+            raise SystemExit(f"Os {label} não foram internados")
+    
+    limit = 64
+    table = LeafTable(limit)
+    source = "int f() {\n" + "".join(f"    x = {i} + 1;\n" for i in range(limit * 4)) + "}\n"
+    session = ParserSession(share_leaves=table)
+    if repr(session.parse(source, Diagnostics())) != repr(ParserSession().parse(source)):
+        raise SystemExit("A AST diverge após atingir o limite da tabela")
+    if len(table) != limit or table.hits + table.misses != limit * 8:
+        raise SystemExit(f"A tabela não respeitou o limite: {len(table)} nós")
+    
+    print(f"Verificação: ASTs equivalentes; tabela limitada a {limit} nós com "
+          f"{limit * 4 + 1} literais distintos; {len(set(names))} nomes distintos internados")
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    
+    verify()
+    
+    source = sample_corpus(scale)
+    print(f"\nCorpus: {len(SAMPLES)} arquivos de exemplo x {scale} "
+          f"({len(source) / 1024 / 1024:.1f} MiB)")
+    
+    interned_size, _, tokens = retained(fastlex.get_tokens, source)
+    copied_size, _, _ = retained(copied_tokens, source)
+    print(f"\nTokens ({len(tokens)}):")
+    print(f"  {'Valores':<24} {'Memória (MiB)':>14} {'Bytes/token':>12}")
+    print(f"  {'cópia por token':<24} {copied_size / 1024 / 1024:>14.2f} {copied_size / len(tokens):>12.1f}")
+    print(f"  {'internados':<24} {interned_size / 1024 / 1024:>14.2f} {interned_size / len(tokens):>12.1f}")
+    del tokens
+    
+    print("\nAST:")
+    print(f"  {'Folhas':<24} {'Memória (MiB)':>14} {'Tempo (s)':>10} {'Literais':>9} {'Distintos':>10}")
+    results = {}
+    for label, share in (('uma por literal', False), ('compartilhadas', True)):
+        session = ParserSession(engine='fast', share_leaves=share)
+        size, elapsed, ast = retained(session.parse, source)
+        literals, distinct = literal_counts(ast)
+        results[share] = size
+        print(f"  {label:<24} {size / 1024 / 1024:>14.2f} {elapsed:>10.3f} {literals:>9} {distinct:>10}")
+        del ast
+    print(f"\nEconomia na AST: {(results[False] - results[True]) / 1024 / 1024:.2f} MiB "
+          f"({1 - results[True] / results[False]:.1%})")
+
+
+if __name__ == "__main__":
+    main()
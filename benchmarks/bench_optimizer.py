@@ -0,0 +1,167 @@
+"""
+Benchmark da otimização da AST (optimizer.py).
+
+Gera um programa como os produzidos por geradores de código: aritmética
+entre literais, condições constantes (if (0), while (0), if (1)) e
+comandos após o return. Primeiro verifica:
+
+- que cada função devolve o mesmo valor na máquina virtual (vm.py)
+  antes e depois da otimização, para vários argumentos;
+- que a quantidade de nós eliminados informada é a diferença entre os
+  tamanhos da AST antes e depois, e que não restam operações entre
+  constantes;
+- que uma expressão constante profunda (cadeia de BinOp) é avaliada sem
+  esgotar a pilha do Python.
+
+Em seguida mede o tempo da otimização para programas de tamanhos
+crescentes (o tempo por nó deve ser aproximadamente constante) e o
+tempo de processar a AST depois (compilação para bytecode e impressão
+hierárquica) sem e com a otimização.
+
+Uso: python benchmarks/bench_optimizer.py [NUM_FUNCOES]
+"""
+
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import BinOp, Char, Number, UnaryOp, iter_nodes
+from ast_printer import print_ast
+from optimizer import optimize
+from parser import parse
+from vm import VM, compile_program
+
+
+FUNCTION_TEMPLATE = """
+int f{i}(int a) {{
+    int x = a * (2 * 8 - 6) + {i} / 3;
+    float y = 1.5 * 4 - 0.25;
+    char c = 'a' + 2;
+    if (0) {{
+        x = x + 1000;
+        y = y / 0.5;
+    }}
+    while (0) {{
+        x = x - 1;
+    }}
+    if (4 > 3 && 'b' == 98) {{
+        x = x + (100 - 99) * 7;
+    }} else {{
+        x = 0;
+    }}
+    if (a > {i} - 1 - {i}) {{
+        x = x + c - -(3 * 3);
+    }}
+    if (!(1 - 1) || a) {{
+        y = y + x;
+    }}
+    return x + y;
+    x = x * 2;
+    y = 0.0;
+}}
+"""
+
+
+def generated_program(functions):
+    """Programa gerado com functions funções."""
+    return "".join(FUNCTION_TEMPLATE.format(i=i) for i in range(functions))
+
+
+def count_nodes(ast):
+    return sum(1 for _ in iter_nodes(ast))
+
+
+def constant_operations(ast):
+    """Quantidade de operações cujos operandos são todos constantes."""
+    constants = (Number, Char)
+    count = 0
+    for node in iter_nodes(ast):
+        if isinstance(node, BinOp):
+            count += isinstance(node.left, constants) and isinstance(node.right, constants)
+        elif isinstance(node, UnaryOp):
+            count += isinstance(node.operand, constants)
+    return count
+
+
+def verify(functions):
+    """Verifica a otimização de um programa gerado e de uma expressão profunda."""
+    source = generated_program(functions)
+    expected_vm = VM(compile_program(parse(source)))
+    
+    ast = parse(source)
+    before = count_nodes(ast)
+    result = optimize(ast)
+    after = count_nodes(result.ast)
+    if result.nodes != before or result.eliminated != before - after:
+        raise SystemExit(f"Contagem de nós divergente: {result.nodes}/{result.eliminated}, "
+                         f"esperado {before}/{before - after}")
+    if constant_operations(result.ast):
+        raise SystemExit("Restaram operações entre constantes após a otimização")
+    
+    vm = VM(compile_program(result.ast))
+    for i in range(functions):
+        for arg in (-3, 0, 1, i, 1000):
+            expected = expected_vm.call(f'f{i}', arg)
+            actual = vm.call(f'f{i}', arg)
+            if expected != actual:
+                raise SystemExit(f"f{i}({arg}) = {actual!r} após a otimização, esperado {expected!r}")
+    
+    terms = 20000
+    deep = parse("int main() {\n    return " + " + ".join(str(i % 7) for i in range(terms)) + ";\n}\n")
+    deep_result = optimize(deep)
+    value = deep_result.ast[0].body.statements[0].value
+    if not isinstance(value, Number) or value.value != sum(i % 7 for i in range(terms)):
+        raise SystemExit("A expressão profunda não foi avaliada corretamente")
+    
+    print(f"Verificação: {functions} funções com os mesmos resultados na VM; "
+          f"{result.eliminated} de {before} nós eliminados; expressão de {terms} termos avaliada")
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    
+    verify(20)
+    
+    print(f"\n{'Funções':>8} {'Nós':>9} {'Eliminados':>11} {'Otimização (s)':>15} {'µs/nó':>8}")
+    print("-" * 55)
+    for scale in (1, 2, 4):
+        source = generated_program(functions * scale)
+        # A AST é alterada no lugar: cada repetição usa uma nova
+        asts = [parse(source) for _ in range(3)]
+        elapsed, result = timed(lambda: optimize(asts.pop()))
+        print(f"{functions * scale:>8} {result.nodes:>9} {result.eliminated:>11} "
+              f"{elapsed:>15.3f} {elapsed / result.nodes * 1e6:>8.2f}")
+    
+    # Custo de processar a AST depois da otimização
+    source = generated_program(functions)
+    original = parse(source)
+    optimized = optimize(parse(source)).ast
+    
+    def print_tree(ast):
+        print_ast(ast, stream=io.StringIO())
+    
+    print(f"\nProcessamento posterior da AST ({functions} funções):")
+    print(f"  {'Etapa':<22} {'Original (s)':>13} {'Otimizada (s)':>14}")
+    for label, func in (('compilação (vm.py)', compile_program), ('impressão hierárquica', print_tree)):
+        original_time, _ = timed(func, original)
+        optimized_time, _ = timed(func, optimized)
+        print(f"  {label:<22} {original_time:>13.3f} {optimized_time:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark dos formatos de saída de main.py.
+
+Gera um programa grande, grava-o em um arquivo temporário e mede o
+tempo total de execução de main.py (em um processo novo, com a saída
+redirecionada para /dev/null) para cada formato (--format) e seção
+(--only), incluindo a análise em fluxo (--stream).
+
+Antes, no mesmo processo, compara a escrita do relatório em tabela por
+meio do OutputBuffer com a escrita anterior, com um print() por linha,
+sobre o mesmo resultado de análise, e verifica que o texto é idêntico.
+
+Uso: python benchmarks/bench_output_formats.py [NUM_FUNCOES] [REPETICOES]
+"""
+
+import contextlib
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import write_repr
+from ast_printer import print_ast
+from output import OutputBuffer, make_report, format_token_row
+from parser import parse_with_tokens
+from bench_ast_memory import make_program
+
+
+CASES = (
+    ("table", []),
+    ("table --only tokens", ['--only', 'tokens']),
+    ("table --only ast", ['--only', 'ast']),
+    ("table --only summary", ['--only', 'summary']),
+    ("jsonl", ['--format', 'jsonl']),
+    ("jsonl --only summary", ['--format', 'jsonl', '--only', 'summary']),
+    ("none", ['--format', 'none']),
+    ("table --stream", ['--stream']),
+    ("jsonl --stream", ['--stream', '--format', 'jsonl']),
+)
+
+
+def legacy_table(tokens_list, ast):
+    """Relatório em tabela como era escrito antes: um print() por linha."""
+    print("=" * 70)
+    print("ANÁLISE LÉXICA")
+    print("=" * 70)
+    print(f"\nTotal de tokens identificados: {len(tokens_list)}\n")
+    print(f"{'Tipo':<20} {'Valor':<30} {'Linha':<10}")
+    print("-" * 70)
+    for token_type, token_value, token_line in tokens_list:
+        print(format_token_row(token_type, token_value, token_line))
+    print("\n" + "=" * 70)
+    print("ANÁLISE SINTÁTICA")
+    print("=" * 70)
+    print("\n[OK] Analise sintatica concluida com sucesso!")
+    print("\nARVORE DE SINTAXE ABSTRATA (AST):")
+    print("=" * 70)
+    print("\nRepresentacao hierarquica:")
+    print("-" * 70)
+    print_ast(ast, stream=sys.stdout)
+    print("\n" + "-" * 70)
+    print("\nRepresentacao completa (__repr__):")
+    print("-" * 70)
+    write_repr(ast, sys.stdout)
+    print()
+
+
+def buffered_table(tokens_list, ast, stream):
+    """Relatório em tabela escrito por meio de um OutputBuffer."""
+    out = OutputBuffer(stream)
+    report = make_report('table', out)
+    report.start()
+    report.begin_tokens(len(tokens_list))
+    report.tokens(tokens_list)
+    report.end_tokens(len(tokens_list))
+    report.syntax(ast)
+    out.flush()
+
+
+def compare_in_process(source):
+    """Compara o relatório em tabela com e sem o OutputBuffer."""
+    tokens_list, ast = parse_with_tokens(source)
+    
+    expected, actual = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(expected):
+        legacy_table(tokens_list, ast)
+    buffered_table(tokens_list, ast, actual)
+    if expected.getvalue() != actual.getvalue():
+        raise SystemExit("O relatório em tabela diverge da escrita anterior")
+    
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(devnull):
+            legacy_table(tokens_list, ast)
+        legacy = time.perf_counter() - start
+        start = time.perf_counter()
+        buffered_table(tokens_list, ast, devnull)
+        buffered = time.perf_counter() - start
+    
+    print(f"Relatório em tabela no mesmo processo ({len(tokens_list)} tokens, saída idêntica):")
+    print(f"  print() por linha   {legacy:>10.3f} s")
+    print(f"  OutputBuffer        {buffered:>10.3f} s")
+
+
+def run_main(path, options, repeat):
+    """Mediana do tempo (s) de main.py com a saída em /dev/null."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), path] + options,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    source = make_program(functions)
+    
+    compare_in_process(source)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'programa.c')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        
+        print(f"\nmain.py com {functions} funções ({len(source) // 1024} KB), "
+              f"saída em /dev/null, mediana de {repeat}:")
+        for label, options in CASES:
+            print(f"  {label:<24} {run_main(path, options, repeat):>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
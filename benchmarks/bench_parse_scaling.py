@@ -0,0 +1,57 @@
+"""
+Benchmark de escalabilidade do analisador sintático.
+
+Gera programas com N declarações globais e funções com N statements
+e mede o tempo de análise sintática, mostrando o custo por elemento.
+Com a construção das listas em O(1) amortizado por elemento, o tempo
+por elemento deve permanecer aproximadamente constante.
+
+Uso: python benchmarks/bench_parse_scaling.py [N1 N2 ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parser import parse
+
+
+DEFAULT_SIZES = (10000, 50000, 100000, 200000)
+
+
+def make_declarations(n):
+    """Gera um programa com n declarações globais."""
+    return "".join(f"int v{i};\n" for i in range(n))
+
+
+def make_statements(n):
+    """Gera uma função cujo corpo tem n statements."""
+    body = "".join(f"    x = x + {i};\n" for i in range(n))
+    return f"int main() {{\n    int x;\n{body}    return x;\n}}\n"
+
+
+def bench(label, make, sizes):
+    """Mede o tempo de análise para cada tamanho e imprime os resultados."""
+    print(f"\n{label}")
+    print(f"{'N':>10} {'Tempo (s)':>12} {'us/elemento':>14}")
+    print("-" * 38)
+    for n in sizes:
+        code = make(n)
+        start = time.perf_counter()
+        ast = parse(code)
+        elapsed = time.perf_counter() - start
+        if ast is None:
+            raise SystemExit(f"Falha na análise do programa com N={n}")
+        print(f"{n:>10} {elapsed:>12.3f} {elapsed / n * 1e6:>14.2f}")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    bench("Declarações globais (p_declarations)", make_declarations, sizes)
+    bench("Statements em um bloco (p_statements)", make_statements, sizes)
+
+
+if __name__ == "__main__":
+    main()
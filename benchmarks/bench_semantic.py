@@ -0,0 +1,220 @@
+"""
+Benchmark da análise semântica (semantic.py).
+
+Gera programas com cerca de NUM_IDENTIFICADORES usos de nomes, em blocos
+aninhados de profundidades diferentes, com uma variável que sombreia a
+de cada escopo externo e usos de variáveis globais, parâmetros e
+funções. Primeiro verifica:
+
+- que cada Identifier e FunctionCall é resolvido para a mesma
+  declaração que um resolvedor de referência encontra;
+- que os nomes foram internados pelos dois motores léxicos (uma única
+  string por nome distinto);
+- que programas com erros semânticos conhecidos geram as mensagens
+  esperadas.
+
+Em seguida mede o tempo da análise (resolução e verificação de tipos)
+para cada profundidade, que deve ficar aproximadamente constante por
+nome, e compara a busca de um nome global na SymbolTable com a busca em
+uma lista de dicionários, do escopo mais interno ao global (como faz o
+resolvedor de referência), cujo custo cresce com a profundidade.
+
+Uso: python benchmarks/bench_semantic.py [NUM_IDENTIFICADORES]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import (ASTNode, Assignment, Block, ForStatement, FunctionCall, FunctionDecl,
+                       Identifier, VarDecl, iter_nodes)
+from diagnostics import SEMANTIC, Diagnostics
+from parser import ParserSession
+from semantic import VARIABLE, Symbol, SymbolTable, analyze
+
+
+GLOBALS = 10
+
+# Programas com erros e um trecho de cada mensagem esperada, na ordem
+ERROR_CASES = (
+    ("int f() { return x; }", ["Variável não declarada: 'x'"]),
+    ("int f() { return g(); }", ["Função não declarada: 'g'"]),
+    ("int f(int a, int a) { int b; int b; return a; }",
+     ["'a' já foi declarado", "'b' já foi declarado"]),
+    ("int f(int a) { return f(1, 2) + f; }",
+     ["espera 1 argumento(s), recebeu 2", "'f' é uma função"]),
+    ("int f(int a) { return a(1); }", ["'a' não é uma função"]),
+    ("void v() { return 1; } int f() { return v() + 1; }",
+     ["Função void não pode retornar um valor", "Operando inválido do tipo void para '+'"]),
+    ('int f() { int x = "texto"; while (x) { float x = 1.5; } return x; }',
+     ["Conversão inválida de string para int"]),
+    ("int f() { for (int i = 0; i < 3; i = i + 1) { } return i; }",
+     ["Variável não declarada: 'i'"]),
+    ("void v(void p) { } int f() { return f(); } int f() { return 0; }",
+     ["Função declarada mais de uma vez: 'f'", "Tipo inválido para a variável 'p': void"]),
+)
+
+
+def nested_function(index, depth):
+    """Função com depth blocos aninhados, cada um sombreando a variável s."""
+    previous = index - 1 if index else 0
+    lines = [f"int f{index}(int p, float q) {{", "    int s = p;", "    int v0 = s + 1;"]
+    for level in range(1, depth + 1):
+        indent = "    " * level
+        g = f"g{level % GLOBALS}"
+        lines.append(f"{indent}{{")
+        lines.append(f"{indent}    int s = s + v{level - 1} * p;")
+        lines.append(f"{indent}    int v{level} = {g} + s;")
+        lines.append(f"{indent}    q = q * v{level} - s / 2;")
+        lines.append(f"{indent}    if (v{level} > p) {{ {g} = f{previous}(s, q); }}")
+    for level in range(depth, 0, -1):
+        lines.append("    " * level + "}")
+    lines.append("    return s + v0;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def nested_program(identifiers, depth):
+    """Programa com aproximadamente identifiers usos de nomes."""
+    header = "".join(f"int g{i};\n" for i in range(GLOBALS))
+    per_function = 6 + 17 * depth
+    functions = max(1, identifiers // per_function)
+    return header + "".join(nested_function(i, depth) for i in range(functions))
+
+
+class ChainResolver:
+    """
+    Resolvedor de referência: percorre a AST recursivamente e procura cada
+    nome em uma lista de dicionários (do escopo mais interno ao global).
+    """
+    
+    def __init__(self, ast):
+        self.resolutions = {}
+        scope = {}
+        for decl in ast:
+            if isinstance(decl, (FunctionDecl, VarDecl)):
+                scope.setdefault(decl.name, decl)
+        self.scopes = [scope]
+        for decl in ast:
+            if isinstance(decl, FunctionDecl):
+                self.scopes.append({param.name: param for param in decl.params})
+                self.visit(decl.body.statements)
+                self.scopes.pop()
+            elif isinstance(decl, Assignment):
+                self.visit(decl)
+    
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+    
+    def visit(self, node):
+        if isinstance(node, (list, tuple)):
+            for item in node:
+                self.visit(item)
+        elif isinstance(node, (Block, ForStatement)):
+            self.scopes.append({})
+            for name in node._fields:
+                self.visit(getattr(node, name))
+            self.scopes.pop()
+        elif isinstance(node, VarDecl):
+            self.scopes[-1][node.name] = node
+        elif isinstance(node, (Identifier, FunctionCall)):
+            decl = self.lookup(node.name)
+            if decl is not None:
+                self.resolutions[id(node)] = decl
+            if isinstance(node, FunctionCall):
+                self.visit(node.args)
+        elif isinstance(node, ASTNode):
+            for name in node._fields:
+                self.visit(getattr(node, name))
+
+
+def verify(identifiers):
+    """Verifica as resoluções, a internação dos nomes e as mensagens de erro."""
+    source = nested_program(identifiers, 8)
+    for engine in ('ply', 'fast'):
+        ast = ParserSession(engine=engine).parse(source)
+        analysis = analyze(ast, Diagnostics())
+        if not analysis.ok:
+            raise SystemExit(f"Erros semânticos no programa gerado ({engine})")
+        expected = ChainResolver(ast).resolutions
+        actual = {key: symbol.decl for key, symbol in analysis.resolutions.items()}
+        if actual != expected:
+            raise SystemExit(f"Resoluções divergem do resolvedor de referência ({engine})")
+        names = [node.name for node in iter_nodes(ast) if isinstance(node, (Identifier, VarDecl))]
+        if len({id(name) for name in names}) != len(set(names)):
+            raise SystemExit(f"Os nomes não foram internados ({engine})")
+    
+    for source, expected in ERROR_CASES:
+        diagnostics = Diagnostics()
+        ast = ParserSession().parse(source, Diagnostics())
+        analysis = analyze(ast, diagnostics, source)
+        messages = diagnostics.messages()
+        if (analysis.errors != len(expected) or not diagnostics.has_errors(SEMANTIC)
+                or any(part not in message for part, message in zip(expected, messages))):
+            raise SystemExit(f"Mensagens inesperadas para {source!r}: {messages}")
+    
+    print(f"Verificação: {len(actual)} nomes resolvidos como na referência, "
+          f"{len(set(names))} strings para {len(names)} ocorrências; "
+          f"{len(ERROR_CASES)} casos de erro")
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    identifiers = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    
+    verify(identifiers // 20)
+    
+    session = ParserSession(engine='fast')
+    print(f"\n{'Profundidade':>12} {'Nomes':>8} {'Análise (s)':>12} {'µs/nome':>8}")
+    print("-" * 43)
+    for depth in (2, 8, 32, 64):
+        ast = session.parse(nested_program(identifiers, depth))
+        elapsed, analysis = timed(analyze, ast, Diagnostics())
+        names = len(analysis.resolutions)
+        print(f"{depth:>12} {names:>8} {elapsed:>12.3f} {elapsed / names * 1e6:>8.2f}")
+    
+    lookups = 200000
+    print(f"\nBusca de um nome global ({lookups} buscas):")
+    print(f"  {'Profundidade':>12} {'Lista de dicionários (ns)':>26} {'SymbolTable (ns)':>17}")
+    for depth in (1, 8, 32, 64):
+        table = SymbolTable()
+        table.declare(Symbol('g0', VARIABLE, 'int'))
+        scopes = [{'g0': None}]
+        for level in range(depth):
+            table.enter()
+            table.declare(Symbol(f'v{level}', VARIABLE, 'int'))
+            scopes.append({f'v{level}': None})
+        
+        def chain_lookups(name='g0'):
+            for _ in range(lookups):
+                for scope in reversed(scopes):
+                    if name in scope:
+                        break
+        
+        def table_lookups(name='g0'):
+            lookup = table.lookup
+            for _ in range(lookups):
+                lookup(name)
+        
+        chain_time, _ = timed(chain_lookups)
+        table_time, _ = timed(table_lookups)
+        print(f"  {depth:>12} {chain_time / lookups * 1e9:>26.0f} {table_time / lookups * 1e9:>17.0f}")
+
+if __name__ == "__main__":
+    main()
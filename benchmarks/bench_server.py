@@ -0,0 +1,221 @@
+"""
+Benchmark do servidor de análise (server.py).
+
+Gera NUM_ARQUIVOS arquivos com benchmarks/synthetic_c.py e, com um
+cliente JSON-RPC assíncrono, verifica que:
+
+- os métodos parse, tokens, ast e diagnostics têm os mesmos resultados
+  que a análise direta (ParserSession) dos arquivos de exemplo;
+- métodos e parâmetros inválidos recebem os códigos de erro esperados;
+- uma requisição cancelada recebe o erro -32800;
+- o servidor também atende por um socket Unix (onde disponível).
+
+Em seguida compara as requisições por segundo do servidor (todas
+enviadas de uma vez, atendidas pelos processos de trabalho) com a
+execução de um processo main.py por arquivo.
+
+Uso: python benchmarks/bench_server.py [NUM_ARQUIVOS]
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import iter_nodes
+from diagnostics import Diagnostics
+from output import iter_json
+from parser import ParserSession
+from server import INVALID_PARAMS, METHOD_NOT_FOUND, REQUEST_CANCELLED, frame, read_message
+from synthetic_c import generate
+
+
+SAMPLES = ('test_code.c', 'exemplo_simples.c', 'test_errors.c', 'exemplo_erros.c')
+
+# Processos main.py executados na comparação (cada um leva centenas de ms)
+SPAWNED = 20
+
+
+class Client:
+    """Cliente JSON-RPC assíncrono com requisições simultâneas."""
+    
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.waiting = {}
+        self.task = asyncio.ensure_future(self._receive())
+    
+    async def _receive(self):
+        while True:
+            message = await read_message(self.reader)
+            if message is None:
+                break
+            reply = json.loads(message)
+            future = self.waiting.pop(reply.get('id'), None)
+            if future is not None:
+                future.set_result(reply)
+    
+    def send(self, method, params=None, notify=False):
+        """Envia uma requisição; devolve (id, futuro da resposta)."""
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        future = None
+        if not notify:
+            self.next_id += 1
+            message["id"] = self.next_id
+            future = self.waiting[self.next_id] = asyncio.get_running_loop().create_future()
+        self.writer.write(frame(json.dumps(message).encode('utf-8')))
+        return message.get("id"), future
+    
+    async def call(self, method, params=None):
+        _, future = self.send(method, params)
+        return await future
+    
+    async def close(self):
+        await self.call('shutdown')
+        self.writer.close()
+
+
+async def start_server(workers, socket_path=None):
+    """Inicia server.py; devolve (processo, Client)."""
+    args = [sys.executable, os.path.join(ROOT, 'server.py'), '-j', str(workers)]
+    if socket_path is None:
+        process = await asyncio.create_subprocess_exec(*args, stdin=subprocess.PIPE,
+                                                       stdout=subprocess.PIPE)
+        return process, Client(process.stdout, process.stdin)
+    process = await asyncio.create_subprocess_exec(*args, '--socket', socket_path)
+    while True:
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # O servidor ainda está iniciando
+            await asyncio.sleep(0.01)
+        else:
+            return process, Client(reader, writer)
+
+
+def expected_results(path):
+    """Resultados de cada método pela análise direta do arquivo."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    diagnostics = Diagnostics()
+    tokens, ast = ParserSession().parse_with_tokens(source, diagnostics=diagnostics)
+    messages = diagnostics.messages()
+    ok = ast is not None and not messages
+    nodes = sum(1 for _ in iter_nodes(ast)) if ast is not None else 0
+    return {
+        'parse': {"ok": ok, "tokens": len(tokens), "nodes": nodes, "errors": len(messages)},
+        'tokens': {"ok": ok, "tokens": json.loads(json.dumps(tokens))},
+        'ast': {"ok": ok, "ast": json.loads("".join(iter_json(ast))) if ast is not None else None},
+        'diagnostics': {"ok": ok, "messages": messages},
+    }
+
+
+async def verify(big_source):
+    process, client = await start_server(1)
+    for name in SAMPLES:
+        path = os.path.join(ROOT, name)
+        for method, expected in expected_results(path).items():
+            reply = await client.call(method, {"path": path})
+            if reply.get('result') != expected:
+                raise SystemExit(f"Resultado divergente: {method} {name}")
+    
+    for method, params, code in (('compile', {"text": ""}, METHOD_NOT_FOUND),
+                                 ('parse', {}, INVALID_PARAMS),
+                                 ('parse', {"text": "", "engine": "x"}, INVALID_PARAMS)):
+        reply = await client.call(method, params)
+        if reply.get('error', {}).get('code') != code:
+            raise SystemExit(f"Erro inesperado para {method} {params}: {reply}")
+    
+    # Com um processo de trabalho, a terceira requisição ainda espera na fila
+    futures = [client.send('ast', {"text": big_source})[1] for _ in range(2)]
+    cancelled_id, cancelled = client.send('ast', {"text": big_source})
+    client.send('$/cancelRequest', {"id": cancelled_id}, notify=True)
+    reply = await cancelled
+    if reply.get('error', {}).get('code') != REQUEST_CANCELLED:
+        raise SystemExit(f"A requisição não foi cancelada: {str(reply)[:80]}")
+    await asyncio.gather(*futures)
+    await client.close()
+    await process.wait()
+    
+    checked = "entrada e saída padrão"
+    if hasattr(socket, 'AF_UNIX'):
+        directory = tempfile.mkdtemp(prefix='bench_server_')
+        try:
+            process, client = await start_server(1, os.path.join(directory, 'server.sock'))
+            reply = await client.call('parse', {"path": os.path.join(ROOT, SAMPLES[0])})
+            if reply.get('result') != expected_results(os.path.join(ROOT, SAMPLES[0]))['parse']:
+                raise SystemExit("Resultado divergente pelo socket")
+            await client.close()
+            await process.wait()
+        finally:
+            shutil.rmtree(directory)
+        checked += " e socket Unix"
+    print(f"Verificação: {len(SAMPLES)} arquivos x 4 métodos, erros, cancelamento ({checked})")
+
+
+async def server_rate(paths, workers):
+    """Requisições por segundo do servidor; devolve (inicialização, tempo)."""
+    start = time.perf_counter()
+    process, client = await start_server(workers)
+    await client.call('parse', {"text": "int x;"})
+    startup = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    replies = await asyncio.gather(*(client.call('parse', {"path": path}) for path in paths))
+    elapsed = time.perf_counter() - start
+    if not all(reply['result']['ok'] for reply in replies):
+        raise SystemExit("Análise com erros no servidor")
+    await client.close()
+    await process.wait()
+    return startup, elapsed
+
+
+def spawn_rate(paths):
+    """Tempo de um processo main.py por arquivo."""
+    start = time.perf_counter()
+    for path in paths:
+        subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), '--format', 'none', path],
+                       check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    
+    directory = tempfile.mkdtemp(prefix='bench_server_')
+    try:
+        paths = []
+        for i in range(files):
+            path = os.path.join(directory, f"arquivo{i}.c")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(generate(functions=5, statements=20, seed=i))
+            paths.append(path)
+        
+        asyncio.run(verify(generate(functions=300, statements=40)))
+        
+        print(f"\n{files} arquivos, {sum(os.path.getsize(p) for p in paths) / 1024:.0f} KiB")
+        print(f"\n{'Modo':<34} {'Início (s)':>10} {'Tempo (s)':>10} {'Req/s':>9}")
+        print("-" * 66)
+        for workers in sorted({1, os.cpu_count() or 1}):
+            startup, elapsed = asyncio.run(server_rate(paths, workers))
+            print(f"{f'servidor ({workers} processo(s))':<34} {startup:>10.3f} {elapsed:>10.3f} "
+                  f"{files / elapsed:>9.1f}")
+        sample = paths[:SPAWNED]
+        elapsed = spawn_rate(sample)
+        print(f"{f'main.py por arquivo ({len(sample)} arquivos)':<34} {'-':>10} {elapsed:>10.3f} "
+              f"{len(sample) / elapsed:>9.1f}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
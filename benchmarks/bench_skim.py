@@ -0,0 +1,153 @@
+"""
+Benchmark da análise resumida (ParserSession.skim).
+
+Gera um programa com benchmarks/synthetic_c.py (NUM_FUNCOES funções,
+com comentários) e verifica que:
+
+- a AST resumida, com todos os corpos carregados, é igual à da análise
+  completa (mesma representação e mesmas posições dos nós);
+- as assinaturas das funções e as variáveis globais são obtidas sem
+  carregar nenhum corpo;
+- os erros de nível superior são os mesmos da análise completa e um
+  erro dentro de um corpo só é reportado (BodySyntaxError) no acesso.
+
+Em seguida compara o tempo e a memória (retida pela AST e pico, com
+tracemalloc) para obter somente as assinaturas com a análise completa
+e com a resumida, e o custo de carregar todos os corpos depois.
+
+Uso: python benchmarks/bench_skim.py [NUM_FUNCOES]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import FunctionDecl, VarDecl, iter_nodes
+from diagnostics import Diagnostics
+from parser import BodySyntaxError, ParserSession
+from synthetic_c import generate
+
+
+SAMPLES = ('test_code.c', 'exemplo_simples.c', 'test_errors.c', 'exemplo_erros.c')
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def signatures(ast):
+    """Assinaturas das funções e variáveis globais de uma AST."""
+    result = []
+    for decl in ast:
+        if type(decl) is FunctionDecl:
+            result.append((decl.return_type, decl.name, repr(decl.params), decl.start, decl.end))
+        elif type(decl) is VarDecl:
+            result.append((decl.var_type, decl.name, decl.start, decl.end))
+    return result
+
+
+def positions(ast):
+    return [(node.start, node.end) for node in iter_nodes(ast)]
+
+
+def verify(source):
+    """Compara a análise resumida com a completa."""
+    sources = {name: open(os.path.join(ROOT, name), encoding='utf-8').read() for name in SAMPLES}
+    sources['sintético'] = source
+    for name, data in sources.items():
+        expected_diagnostics, diagnostics = Diagnostics(), Diagnostics()
+        expected = ParserSession().parse(data, expected_diagnostics)
+        ast = ParserSession().skim(data, diagnostics)
+        if diagnostics.messages() != expected_diagnostics.messages():
+            raise SystemExit(f"Erros divergentes na análise resumida: {name}")
+        if ast is None:
+            if expected is not None:
+                raise SystemExit(f"A análise resumida falhou: {name}")
+            continue
+        if signatures(ast) != signatures(expected):
+            raise SystemExit(f"Assinaturas divergentes: {name}")
+        if any(decl.body.loaded for decl in ast if type(decl) is FunctionDecl):
+            raise SystemExit(f"Corpo carregado sem acesso: {name}")
+        if repr(ast) != repr(expected) or positions(ast) != positions(expected):
+            raise SystemExit(f"AST divergente após carregar os corpos: {name}")
+    
+    data = "int x;\nint f() {\n  x = 1;\n}\nint g() {\n  return x +;\n}\n"
+    ast = ParserSession().skim(data, Diagnostics())
+    ast[1].body.statements
+    try:
+        ast[2].body.statements
+    except BodySyntaxError as e:
+        expected_diagnostics = Diagnostics()
+        ParserSession().parse(data, expected_diagnostics)
+        if e.messages != expected_diagnostics.messages():
+            raise SystemExit(f"Erro divergente no corpo: {e.messages}")
+    else:
+        raise SystemExit("O erro de sintaxe no corpo não foi reportado")
+    print(f"Verificação: {len(sources)} programas, assinaturas sem carregar os corpos, "
+          f"AST e posições iguais após carregar, erros no acesso")
+
+
+def memory(func, *args):
+    """Memória retida pelo resultado de func(*args) e pico (bytes)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained - before, peak - before
+
+
+def full_signatures(source):
+    return signatures(ParserSession(engine='fast').parse(source, Diagnostics()))
+
+
+def skim_signatures(source):
+    return signatures(ParserSession().skim(source, Diagnostics()))
+
+
+def load_bodies(ast):
+    for decl in ast:
+        if type(decl) is FunctionDecl:
+            decl.body.statements
+    return ast
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    
+    source = generate(functions=functions, statements=40, comments=True)
+    verify(source)
+    
+    print(f"\nPrograma: {functions} funções, {len(source)} bytes")
+    print(f"\n{'Análise':<32} {'Tempo (s)':>10} {'Retida (MiB)':>13} {'Pico (MiB)':>11}")
+    print("-" * 69)
+    rows = (
+        ('completa (motor fast)', lambda: ParserSession(engine='fast').parse(source, Diagnostics())),
+        ('resumida', lambda: ParserSession().skim(source, Diagnostics())),
+        ('resumida + todos os corpos',
+         lambda: load_bodies(ParserSession().skim(source, Diagnostics()))),
+    )
+    for label, func in rows:
+        elapsed, _ = timed(func)
+        retained, peak = memory(func)
+        print(f"{label:<32} {elapsed:>10.3f} {retained / 1024 / 1024:>13.2f} {peak / 1024 / 1024:>11.2f}")
+    
+    elapsed, _ = timed(full_signatures, source)
+    skimmed, _ = timed(skim_signatures, source)
+    print(f"\nSomente assinaturas: {elapsed / skimmed:.1f}x mais rápido com a análise resumida")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de memória da tokenização em fluxo.
+
+Gera arquivos de tamanhos crescentes e mede, em um processo separado
+para cada medição, o pico de memória (RSS) ao tokenizar o arquivo:
+
+- lista: lê o arquivo inteiro com f.read() e usa get_tokens()
+- fluxo: usa iter_tokens(), que mapeia o arquivo em memória e gera os
+  tokens sob demanda
+  
+Com iter_tokens, o pico de memória deve permanecer aproximadamente
+constante, independentemente do tamanho da entrada.
+
+Uso: python benchmarks/bench_stream_memory.py [MB1 MB2 ...]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_ast_memory import FUNCTION_TEMPLATE
+
+
+DEFAULT_SIZES_MB = (1, 4, 16)
+
+CHILD_CODE = {
+    'lista': """
+from lexer import get_tokens
+with open(PATH, 'r', encoding='utf-8') as f:
+    count = len(get_tokens(f.read()))
+""",
+    'fluxo': """
+from lexer import iter_tokens
+count = sum(1 for _ in iter_tokens(PATH))
+""",
+}
+
+CHILD_FOOTER = """
+import resource
+print(count, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def make_file(path, size_mb):
+    """Gera um arquivo .c com aproximadamente size_mb megabytes."""
+    target = size_mb * 1024 * 1024
+    written = 0
+    i = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            chunk = FUNCTION_TEMPLATE.format(i=i)
+            f.write(chunk)
+            written += len(chunk)
+            i += 1
+
+
+def measure(mode, path):
+    """Executa a tokenização em um processo novo e retorna (tokens, pico em KiB)."""
+    code = f"import sys\nsys.path.insert(0, {ROOT!r})\nPATH = {path!r}\n"
+    code += CHILD_CODE[mode] + CHILD_FOOTER
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                         text=True, check=True).stdout.split()
+    return int(out[0]), int(out[1])
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES_MB
+    print(f"{'Tamanho':>8} {'Tokens':>10} {'Pico lista (MiB)':>18} {'Pico fluxo (MiB)':>18}")
+    print("-" * 57)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"gerado_{size}mb.c")
+            make_file(path, size)
+            tokens, list_peak = measure('lista', path)
+            stream_tokens, stream_peak = measure('fluxo', path)
+            if stream_tokens != tokens:
+                raise SystemExit(f"Quantidade de tokens diverge em {size} MB")
+            os.remove(path)
+            print(f"{size:>6} MB {tokens:>10} {list_peak / 1024:>18.1f} {stream_peak / 1024:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Conjunto de benchmarks com programas sintéticos e limites de regressão.
+
+Gera programas com benchmarks/synthetic_c.py em cargas de formas
+diferentes (WORKLOADS) e mede em cada uma:
+
+- tokens/s do lexer (ply e fast)
+- reduções/s do parser (análise completa com o motor fast)
+- nós da AST/s (na mesma análise)
+- pico de memória da análise (tracemalloc)
+
+além do tempo de importação de main.py (python -X importtime, como em
+bench_import_time.py). Antes das medições, verifica que cada programa
+gerado é analisado sem erros léxicos, sintáticos ou semânticos.
+
+Os resultados podem ser gravados como referência (--save) em JSON e
+comparados com uma referência gravada (--compare): a execução termina
+com código 1 se alguma medida piorar mais que o limite (--threshold,
+por padrão 15%).
+
+Uso: python benchmarks/bench_suite.py [--scale F] [--repeat N]
+     [--save [ARQUIVO]] [--compare [ARQUIVO]] [--threshold F]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import iter_nodes
+from diagnostics import Diagnostics
+from instrumentation import Stats
+from parser import ParserSession
+from semantic import analyze
+from bench_import_time import git_commit, import_times
+from synthetic_c import generate
+
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'suite_baseline.json')
+
+# Cargas: parâmetros de synthetic_c.generate (functions é multiplicado
+# pela escala)
+WORKLOADS = {
+    'base': dict(functions=200, statements=40, depth=3, width=4, comments=0.1),
+    'largo': dict(functions=100, statements=30, depth=2, width=24, comments=0.0),
+    'profundo': dict(functions=100, statements=60, depth=10, width=3, comments=0.05),
+    'comentado': dict(functions=200, statements=40, depth=3, width=4, comments=0.8),
+}
+
+# Medidas: nome -> (descrição, True se valores maiores são melhores)
+METRICS = {
+    'ply_tokens_s': ("lexer ply (tokens/s)", True),
+    'fast_tokens_s': ("lexer fast (tokens/s)", True),
+    'reductions_s': ("parser (reduções/s)", True),
+    'nodes_s': ("AST (nós/s)", True),
+    'peak_mib': ("pico de memória (MiB)", False),
+    'import_ms': ("importação de main (ms)", False),
+}
+
+
+def count_reductions(source):
+    """
+    Quantidade de reduções feitas pelo parser ao analisar source (é a
+    mesma em toda análise do mesmo código), contada por uma análise
+    instrumentada (instrumentation.Stats).
+    """
+    stats = Stats(trace_memory=False)
+    ParserSession(engine='fast', stats=stats).parse(source, Diagnostics())
+    return sum(stats.reductions.values())
+
+
+def best_time(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def verify(source, name):
+    """Verifica que o programa gerado não tem erros; devolve a AST."""
+    diagnostics = Diagnostics()
+    ast = ParserSession(engine='fast').parse(source, diagnostics)
+    if ast is None or diagnostics.has_errors():
+        raise SystemExit(f"Programa gerado inválido ({name}): {diagnostics.messages()[:3]}")
+    diagnostics = Diagnostics()
+    if not analyze(ast, diagnostics, source).ok:
+        raise SystemExit(f"Erros semânticos no programa gerado ({name}): {diagnostics.messages()[:3]}")
+    return ast
+
+
+def measure_workload(source, name, repeat):
+    """Medidas de uma carga (veja METRICS) e seus tamanhos."""
+    ast = verify(source, name)
+    nodes = sum(1 for _ in iter_nodes(ast))
+    del ast
+    reductions = count_reductions(source)
+    
+    ply_time, tokens = best_time(ParserSession().tokens, source, repeat=repeat)
+    fast_time, _ = best_time(ParserSession(engine='fast').tokens, source, repeat=repeat)
+    session = ParserSession(engine='fast')
+    parse_time, _ = best_time(session.parse, source, Diagnostics(), repeat=repeat)
+    
+    tracemalloc.start()
+    session.parse(source, Diagnostics())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    return {
+        'ply_tokens_s': len(tokens) / ply_time,
+        'fast_tokens_s': len(tokens) / fast_time,
+        'reductions_s': reductions / parse_time,
+        'nodes_s': nodes / parse_time,
+        'peak_mib': peak / 1024 / 1024,
+    }, {'bytes': len(source), 'tokens': len(tokens), 'reductions': reductions, 'nodes': nodes}
+
+
+def measure(scale, repeat):
+    """Executa todas as cargas; devolve (resultados, tamanhos)."""
+    results = {}
+    sizes = {}
+    for name, params in WORKLOADS.items():
+        params = dict(params, functions=max(1, int(params['functions'] * scale)))
+        results[name], sizes[name] = measure_workload(generate(**params), name, repeat)
+    samples = [import_times().get('main') for _ in range(repeat)]
+    results['inicialização'] = {'import_ms': statistics.median(samples)}
+    return results, sizes
+
+
+def regressions(results, baseline):
+    """
+    Compara os resultados com a referência.
+    
+    Returns:
+        Lista de tuplas (carga, medida, atual, referência, variação), com
+        a variação positiva quando a medida piorou
+    """
+    rows = []
+    for workload, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(workload, {}).get(metric)
+            if not reference:
+                continue
+            higher_is_better = METRICS[metric][1]
+            change = (reference - value) / reference if higher_is_better else (value - reference) / reference
+            rows.append((workload, metric, value, reference, change))
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmarks com programas sintéticos.")
+    arg_parser.add_argument('--scale', type=float, default=1.0,
+                            help="multiplica a quantidade de funções de cada carga")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--save', nargs='?', const=DEFAULT_BASELINE, default=None,
+                            metavar='ARQUIVO', help="grava os resultados como referência")
+    arg_parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, default=None,
+                            metavar='ARQUIVO', help="compara os resultados com uma referência")
+    arg_parser.add_argument('--threshold', type=float, default=0.15,
+                            help="piora máxima aceita na comparação (padrão: 0.15)")
+    args = arg_parser.parse_args()
+    
+    results, sizes = measure(args.scale, args.repeat)
+    
+    print(f"{'Carga':<14} {'Bytes':>10} {'Tokens':>9} {'Reduções':>10} {'Nós':>9}")
+    print("-" * 56)
+    for name, size in sizes.items():
+        print(f"{name:<14} {size['bytes']:>10} {size['tokens']:>9} {size['reductions']:>10} {size['nodes']:>9}")
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get('scale') != args.scale:
+            print(f"\nAviso: a referência foi gravada com --scale {saved.get('scale')}")
+        baseline = saved['results']
+    
+    failed = []
+    rows = {(w, m): row for w, m, *row in regressions(results, baseline or {})}
+    print(f"\n{'Carga':<14} {'Medida':<26} {'Atual':>14} {'Referência':>14} {'Variação':>9}")
+    print("-" * 81)
+    for workload, metrics in results.items():
+        for metric, value in metrics.items():
+            label = METRICS[metric][0]
+            row = rows.get((workload, metric))
+            if row is None:
+                print(f"{workload:<14} {label:<26} {value:>14.1f} {'-':>14} {'-':>9}")
+                continue
+            _, reference, change = row
+            status = ""
+            if change > args.threshold:
+                status = "  REGRESSÃO"
+                failed.append((workload, label, change))
+            print(f"{workload:<14} {label:<26} {value:>14.1f} {reference:>14.1f} {-change:>+8.1%}{status}")
+    
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({
+                'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'scale': args.scale,
+                'results': results,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\nReferência gravada em {args.save}")
+    
+    if failed:
+        print(f"\n{len(failed)} medida(s) pioraram mais que {args.threshold:.0%}:")
+        for workload, label, change in failed:
+            print(f"  {workload}: {label} ({change:.1%} pior)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark da representação colunar de tokens (TokenStream).
+
+Primeiro verifica que, para os arquivos .c de exemplo e para um programa
+gerado, o TokenStream produz as mesmas tuplas (tipo, valor, linha) que
+get_tokens() e que a análise sintática alimentada por ele produz a mesma
+AST que a análise do código fonte.
+
+Em seguida compara, para um programa gerado, a memória retida (medida
+com tracemalloc, sem contar o código fonte) e o tempo de construção da
+lista de tuplas e do TokenStream, e o tempo das estatísticas
+(histograma de tipos e densidade de identificadores), com o NumPy quando
+disponível.
+
+Uso: python benchmarks/bench_token_stream.py [NUM_FUNCOES]
+"""
+
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lexer import get_tokens
+from parser import ParserSession
+from tokenstream import TokenStream
+from bench_ast_memory import make_program
+
+
+def verify():
+    """Compara o TokenStream com a lista de tuplas e com a análise do código fonte."""
+    sources = []
+    for path in sorted(glob.glob(os.path.join(ROOT, '*.c'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            sources.append((os.path.basename(path), f.read()))
+    sources.append(("programa gerado", make_program(50)))
+    
+    session = ParserSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, data in sources:
+            stream = TokenStream.from_source(data)
+            if list(stream) != get_tokens(data):
+                raise SystemExit(f"Tokens divergem em {name}")
+            tokens_list, ast = session.parse_with_tokens(data, columnar=True)
+            if list(tokens_list) != get_tokens(data):
+                raise SystemExit(f"Tokens registrados pelo parser divergem em {name}")
+            if repr(session.parse_tokens(stream.iter_tokens())) != repr(session.parse(data)):
+                raise SystemExit(f"AST diverge em {name}")
+    print(f"Verificação: {len(sources)} códigos com tokens e AST idênticos")
+
+
+def measure(build):
+    """Memória retida (bytes) e tempo (s) da construção."""
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    verify()
+    
+    source = make_program(functions)
+    tokens_list, list_size, list_time = measure(lambda: get_tokens(source))
+    count = len(tokens_list)
+    del tokens_list
+    stream, stream_size, stream_time = measure(lambda: TokenStream.from_source(source))
+    
+    print(f"\nPrograma: {source.count(chr(10))} linhas, {count} tokens")
+    print(f"\n{'Representação':<20} {'Memória (MB)':>14} {'Bytes/token':>12} {'Construção (s)':>15}")
+    print("-" * 64)
+    print(f"{'lista de tuplas':<20} {list_size / 1e6:>14.2f} {list_size / count:>12.1f} {list_time:>15.3f}")
+    print(f"{'TokenStream':<20} {stream_size / 1e6:>14.2f} {stream_size / count:>12.1f} {stream_time:>15.3f}")
+    
+    try:
+        import numpy
+        backend = f"NumPy {numpy.__version__}"
+    except ImportError:
+        backend = "sem NumPy"
+    start = time.perf_counter()
+    histogram = stream.histogram()
+    histogram_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fraction, per_line = stream.density('IDENTIFIER')
+    density_time = time.perf_counter() - start
+    
+    print(f"\nEstatísticas ({backend}):")
+    print(f"  histograma de tipos:   {histogram_time * 1000:8.2f} ms ({len(histogram)} tipos)")
+    print(f"  densidade de IDENTIFIER: {density_time * 1000:6.2f} ms "
+          f"({fraction:.1%} dos tokens, {per_line:.2f} por linha)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Benchmark do percurso genérico da AST (visitor.py).
+
+Gera um programa com benchmarks/synthetic_c.py (NUM_FUNCOES funções) e
+verifica que:
+
+- NodeVisitor visita os nós na mesma ordem que iter_nodes (pré-ordem) e
+  chama leave_* em pós-ordem;
+- os métodos são escolhidos pela hierarquia da classe do nó;
+- NodeTransformer substitui nós em campos, listas e tuplas, remove itens
+  de listas e insere listas no lugar de um item;
+- árvores muito profundas são percorridas sem esgotar o limite de
+  recursão.
+
+Em seguida compara o tempo de um percurso completo da árvore pelo
+percurso atual do ast_printer (todos os atributos de _fields,
+classificados com isinstance) com iter_nodes e com os visitantes.
+
+Uso: python benchmarks/bench_visitor.py [NUM_FUNCOES]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import ASTNode, Assignment, Block, Number, ReturnStatement, iter_nodes
+from diagnostics import Diagnostics
+from parser import ParserSession
+from synthetic_c import generate
+from visitor import NodeTransformer, NodeVisitor
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def fields_walk(ast):
+    """
+    Conta os nós com o percurso do ast_printer: cada atributo de _fields
+    é classificado com isinstance (primitivo, lista ou nó).
+    """
+    count = 0
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (list, tuple)):
+            stack.extend(value)
+            continue
+        count += 1
+        for key in value._fields:
+            child = getattr(value, key)
+            if child is None or isinstance(child, (int, float, str, bool)):
+                continue
+            elif isinstance(child, (list, tuple)):
+                stack.extend(item for item in child if isinstance(item, (ASTNode, list, tuple)))
+            elif isinstance(child, ASTNode):
+                stack.append(child)
+    return count
+
+
+class NodeCounter(NodeVisitor):
+    """Conta todos os nós (visit_ASTNode atende qualquer classe)."""
+    
+    def __init__(self):
+        self.count = 0
+    
+    def visit_ASTNode(self, node):
+        self.count += 1
+
+
+class Numbers(NodeVisitor):
+    """Soma os literais numéricos; os demais nós só são percorridos."""
+    
+    def __init__(self):
+        self.total = 0
+    
+    def visit_Number(self, node):
+        self.total += node.value
+
+
+class Order(NodeVisitor):
+    """Registra a ordem de entrada e de saída dos nós."""
+    
+    def __init__(self):
+        self.entered = []
+        self.left = []
+        self.blocks = 0
+    
+    def visit_ASTNode(self, node):
+        self.entered.append(node)
+    
+    def leave_ASTNode(self, node):
+        self.left.append(node)
+    
+    def visit_Block(self, node):
+        self.entered.append(node)
+        self.blocks += 1
+
+
+class Copier(NodeTransformer):
+    """Substitui cada nó por uma cópia (com os filhos já copiados)."""
+    
+    def visit_ASTNode(self, node):
+        return type(node)(*[getattr(node, name) for name in node._fields], node.start, node.end)
+
+
+class Editor(NodeTransformer):
+    """Remove as atribuições e duplica os returns das listas."""
+    
+    def visit_Assignment(self, node):
+        return None
+    
+    def visit_ReturnStatement(self, node):
+        return [node, node]
+
+
+class Negator(NodeTransformer):
+    """Troca o sinal dos literais numéricos."""
+    
+    def visit_Number(self, node):
+        return Number(-node.value, node.start, node.end)
+
+
+def post_order(value, out):
+    """Pós-ordem dos nós (recursiva; somente para a verificação)."""
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            post_order(item, out)
+    elif isinstance(value, ASTNode):
+        for name in value._children:
+            post_order(getattr(value, name), out)
+        out.append(value)
+    return out
+
+
+def verify(source):
+    """Verifica a ordem do percurso e as transformações."""
+    ast = ParserSession(engine='fast').parse(source, Diagnostics())
+    nodes = list(iter_nodes(ast))
+    order = Order()
+    order.visit(ast)
+    if order.entered != nodes or order.left != post_order(ast, []):
+        raise SystemExit("Ordem de percurso divergente")
+    if order.blocks != sum(1 for node in nodes if isinstance(node, Block)):
+        raise SystemExit("visit_Block não escolhido para os blocos")
+    if fields_walk(ast) != len(nodes):
+        raise SystemExit("O percurso por _fields conta outra quantidade de nós")
+    
+    expected = repr(ast)
+    copy = Copier().visit(ast)
+    original = set(map(id, nodes))
+    if repr(copy) != expected or any(id(node) in original for node in iter_nodes(copy)):
+        raise SystemExit("A cópia diverge da árvore original")
+    
+    edited = Editor().visit(copy)
+    returns = sum(1 for node in nodes if type(node) is ReturnStatement)
+    if (any(type(node) is Assignment for node in iter_nodes(edited))
+            or sum(1 for node in iter_nodes(edited) if type(node) is ReturnStatement) != 2 * returns):
+        raise SystemExit("Remoção ou inserção em listas incorreta")
+    
+    # Uma cadeia de 20000 somas: BinOp com 20000 níveis de profundidade
+    deep = ParserSession(engine='fast').parse("int f() { return " + " + ".join(["1"] * 20000) + "; }",
+                                              Diagnostics())
+    numbers = Numbers()
+    numbers.visit(deep)
+    Negator().visit(deep)
+    negated = Numbers()
+    negated.visit(deep)
+    if numbers.total != 20000 or negated.total != -20000:
+        raise SystemExit("Percurso incorreto da árvore profunda")
+    print(f"Verificação: {len(nodes)} nós em pré e pós-ordem, métodos pela hierarquia, "
+          f"substituição, remoção e inserção, árvore com 20000 níveis")
+
+
+def visit_count(visitor_class, ast):
+    visitor = visitor_class()
+    visitor.visit(ast)
+    return visitor
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    
+    source = generate(functions=functions, statements=40)
+    verify(source)
+    
+    ast = ParserSession(engine='fast').parse(source, Diagnostics())
+    nodes = sum(1 for _ in iter_nodes(ast))
+    print(f"\nPrograma: {functions} funções, {nodes} nós")
+    print(f"\n{'Percurso':<36} {'Tempo (s)':>10} {'ns/nó':>8}")
+    print("-" * 56)
+    rows = (
+        ('_fields com isinstance (ast_printer)', fields_walk),
+        ('iter_nodes (_children)', lambda tree: sum(1 for _ in iter_nodes(tree))),
+        ('NodeVisitor (todos os nós)', lambda tree: visit_count(NodeCounter, tree)),
+        ('NodeVisitor (somente Number)', lambda tree: visit_count(Numbers, tree)),
+        ('NodeTransformer (Number)', lambda tree: Negator().visit(tree)),
+    )
+    for label, func in rows:
+        elapsed, _ = timed(func, ast)
+        print(f"{label:<36} {elapsed:>10.3f} {elapsed / nodes * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
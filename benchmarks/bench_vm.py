@@ -0,0 +1,303 @@
+"""
+Benchmark da máquina virtual (vm.py).
+
+Compara a execução pelo bytecode com um interpretador ingênuo que
+percorre a AST recursivamente (um dicionário de variáveis por escopo e
+despacho por isinstance), com a mesma semântica de int, char e float.
+
+Primeiro verifica casos de semântica (estouro de int, divisão, char e
+float de precisão simples) e que os dois executores devolvem os mesmos
+resultados nos programas medidos. Em seguida mede:
+
+- laços: for e while aninhados com aritmética inteira
+- fib: Fibonacci recursivo
+- condicionais: if/else aninhados dentro de um laço
+- float: laço com aritmética de ponto flutuante
+
+Por fim, mostra que a VM executa uma recursão profunda que esgota a
+pilha do interpretador recursivo.
+
+Uso: python benchmarks/bench_vm.py [ESCALA]
+"""
+
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import (Assignment, BinOp, Block, Char, ExpressionStatement, ForStatement,
+                       FunctionCall, FunctionDecl, Identifier, IfStatement, Number,
+                       ReturnStatement, UnaryOp, VarDecl, WhileStatement)
+from parser import parse
+from vm import VM, compile_program, convert, float_div, int_div, to_char, to_float, to_int
+
+
+PROGRAM = r"""
+int counter = 0;
+
+int loops(int n) {
+    int total = 0;
+    for (int i = 0; i < n; i = i + 1) {
+        int j = 0;
+        while (j < 10) {
+            total = total + i * j - (i / 3);
+            j = j + 1;
+        }
+    }
+    return total;
+}
+
+int fib(int n) {
+    if (n < 2)
+        return n;
+    return fib(n - 1) + fib(n - 2);
+}
+
+int classify(int n) {
+    int score = 0;
+    int i = 0;
+    while (i < n) {
+        if (i / 3 * 3 == i) {
+            if (i / 5 * 5 == i) {
+                score = score + 15;
+            } else {
+                score = score + 3;
+            }
+        } else if (i / 5 * 5 == i) {
+            score = score + 5;
+        } else if (i > 100 && i < 200 || i == 7) {
+            score = score - 2;
+        } else {
+            score = score - 1;
+        }
+        counter = counter + 1;
+        i = i + 1;
+    }
+    return score;
+}
+
+float series(int n) {
+    float sum = 0.0;
+    float x = 1.0;
+    for (int i = 1; i <= n; i = i + 1) {
+        sum = sum + x / i;
+        x = -x;
+    }
+    return sum;
+}
+
+int depth(int n) {
+    if (n == 0)
+        return 0;
+    return depth(n - 1) + 1;
+}
+
+int overflow() { int x = 2147483647; return x + 1; }
+int negdiv() { return -7 / 2; }
+char wrapchar() { char c = 200; return c; }
+float single() { float x = 0.1; return x * 3; }
+int truncate(float f) { return f; }
+int charcode() { char c = 'a'; return c + 1; }
+int logic(int a, int b) { return a && b || !a; }
+int mixed(int a, float b) { return a < b; }
+"""
+
+# Casos de semântica: (função, argumentos, resultado esperado)
+SEMANTICS = (
+    ('overflow', (), -2147483648),
+    ('negdiv', (), -3),
+    ('wrapchar', (), -56),
+    ('single', (), 0.30000001192092896),
+    ('truncate', (-3.7,), -3),
+    ('charcode', (), 98),
+    ('logic', (0, 5), 1),
+    ('logic', (2, 0), 0),
+    ('logic', (2, 3), 1),
+    ('mixed', (2, 2.5), 1),
+    ('fib', (15,), 610),
+)
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class TreeWalker:
+    """Interpretador ingênuo: percorre a AST recursivamente a cada execução."""
+    
+    def __init__(self, ast):
+        self.functions = {d.name: d for d in ast if isinstance(d, FunctionDecl)}
+        self.globals = {}
+        for decl in ast:
+            if isinstance(decl, VarDecl):
+                self.globals[decl.name] = [decl.var_type, convert(0, decl.var_type)]
+        for decl in ast:
+            if isinstance(decl, Assignment):
+                self.eval(decl, [self.globals])
+    
+    def call(self, name, *args):
+        function = self.functions[name]
+        scope = {p.name: [p.var_type, convert(a, p.var_type)] for p, a in zip(function.params, args)}
+        try:
+            self.execute(function.body.statements, [self.globals, scope])
+            value = 0
+        except _Return as r:
+            value = r.value
+        if function.return_type == 'void':
+            return None
+        return convert(0 if value is None else value, function.return_type)
+    
+    def lookup(self, name, scopes):
+        for scope in reversed(scopes):
+            if name in scope:
+                return scope[name]
+        raise NameError(name)
+    
+    def execute(self, node, scopes):
+        if node is None:
+            return
+        if isinstance(node, (list, tuple)):
+            for item in node:
+                self.execute(item, scopes)
+        elif isinstance(node, ExpressionStatement):
+            if node.expr is not None:
+                self.eval(node.expr, scopes)
+        elif isinstance(node, Assignment):
+            self.eval(node, scopes)
+        elif isinstance(node, VarDecl):
+            scopes[-1][node.name] = [node.var_type, convert(0, node.var_type)]
+        elif isinstance(node, Block):
+            self.execute(node.statements, scopes + [{}])
+        elif isinstance(node, IfStatement):
+            if self.eval(node.condition, scopes):
+                self.execute(node.then_block, scopes)
+            else:
+                self.execute(node.else_block, scopes)
+        elif isinstance(node, WhileStatement):
+            while self.eval(node.condition, scopes):
+                self.execute(node.body, scopes)
+        elif isinstance(node, ForStatement):
+            scopes = scopes + [{}]
+            if isinstance(node.init, (VarDecl, tuple)):
+                self.execute(node.init, scopes)
+            elif node.init is not None:
+                self.eval(node.init, scopes)
+            while node.condition is None or self.eval(node.condition, scopes):
+                self.execute(node.body, scopes)
+                if node.update is not None:
+                    self.eval(node.update, scopes)
+        elif isinstance(node, ReturnStatement):
+            raise _Return(None if node.value is None else self.eval(node.value, scopes))
+    
+    def eval(self, node, scopes):
+        if isinstance(node, Number):
+            return to_float(node.value) if isinstance(node.value, float) else to_int(node.value)
+        if isinstance(node, Char):
+            return to_char(ord(node.value))
+        if isinstance(node, Identifier):
+            return self.lookup(node.name, scopes)[1]
+        if isinstance(node, Assignment):
+            var = self.lookup(node.left.name, scopes)
+            var[1] = convert(self.eval(node.right, scopes), var[0])
+            return var[1]
+        if isinstance(node, UnaryOp):
+            value = self.eval(node.operand, scopes)
+            if node.op == '!':
+                return 0 if value else 1
+            return -value if isinstance(value, float) else to_int(-value)
+        if isinstance(node, FunctionCall):
+            return self.call(node.name, *[self.eval(arg, scopes) for arg in node.args])
+        if isinstance(node, BinOp):
+            if node.op == '&&':
+                return 1 if self.eval(node.left, scopes) and self.eval(node.right, scopes) else 0
+            if node.op == '||':
+                return 1 if self.eval(node.left, scopes) or self.eval(node.right, scopes) else 0
+            a = self.eval(node.left, scopes)
+            b = self.eval(node.right, scopes)
+            if isinstance(a, float) or isinstance(b, float):
+                a, b = to_float(a), to_float(b)
+                if node.op == '/':
+                    return float_div(a, b)
+                arith = {'+': a + b, '-': a - b, '*': a * b}
+                if node.op in arith:
+                    return to_float(arith[node.op])
+            elif node.op == '/':
+                return int_div(a, b)
+            elif node.op in ('+', '-', '*'):
+                return to_int({'+': a + b, '-': a - b, '*': a * b}[node.op])
+            return 1 if {'<': a < b, '<=': a <= b, '>': a > b, '>=': a >= b,
+                         '==': a == b, '!=': a != b}[node.op] else 0
+        raise TypeError(type(node).__name__)
+
+
+def timed(func, *args, repeat=3):
+    """Menor tempo (s) de repeat execuções de func(*args) e seu resultado."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def same(a, b):
+    """Compara resultados, considerando NaN igual a NaN."""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b and type(a) is type(b)
+
+
+def main():
+    scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    ast = parse(PROGRAM)
+    start = time.perf_counter()
+    program = compile_program(ast)
+    compile_time = time.perf_counter() - start
+    vm = VM(program)
+    walker = TreeWalker(ast)
+    
+    for name, args, expected in SEMANTICS:
+        for label, executor in (('VM', vm), ('AST', walker)):
+            result = executor.call(name, *args)
+            if not same(result, expected):
+                raise SystemExit(f"{name}{args} = {result!r} ({label}), esperado {expected!r}")
+    print(f"Verificação: {len(SEMANTICS)} casos de semântica corretos nos dois executores")
+    print(f"Compilação: {len(program.codes)} funções, "
+          f"{sum(len(c.ops) // 2 for c in program.codes)} instruções em {compile_time * 1000:.2f} ms")
+    
+    cases = (
+        ('laços', 'loops', (int(3000 * scale),)),
+        ('fib', 'fib', (int(20 + math.log2(max(scale, 1e-9))),)),
+        ('condicionais', 'classify', (int(30000 * scale),)),
+        ('float', 'series', (int(20000 * scale),)),
+    )
+    print(f"\n{'Programa':<14} {'Argumento':>10} {'AST (s)':>10} {'VM (s)':>10} {'Aceleração':>11}")
+    print("-" * 59)
+    for label, name, args in cases:
+        walker_time, expected = timed(walker.call, name, *args)
+        vm_time, result = timed(vm.call, name, *args)
+        if not same(result, expected):
+            raise SystemExit(f"Resultado de {name} diverge: VM {result!r}, AST {expected!r}")
+        print(f"{label:<14} {args[0]:>10} {walker_time:>10.3f} {vm_time:>10.3f} "
+              f"{walker_time / vm_time:>10.1f}x")
+    
+    # Recursão profunda: a VM não usa a pilha do Python
+    n = 50000
+    vm_time, result = timed(vm.call, 'depth', n, repeat=1)
+    try:
+        walker.call('depth', n)
+        walker_result = "ok"
+    except RecursionError:
+        walker_result = "RecursionError"
+    print(f"\nRecursão com profundidade {n}:")
+    print(f"  VM                    {vm_time:>10.3f} s (resultado {result})")
+    print(f"  AST                   {walker_result:>12}")
+
+
+if __name__ == "__main__":
+    main()
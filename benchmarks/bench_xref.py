@@ -0,0 +1,159 @@
+"""
+Benchmark do índice de referências cruzadas (xref.py).
+
+Gera NUM_ARQUIVOS arquivos com benchmarks/synthetic_c.py (cada um com
+funções de nomes próprios que chamam funções de outros arquivos, algumas
+com a quantidade errada de argumentos) em um diretório temporário e
+verifica que as consultas callers, callees e mismatches do índice têm
+os mesmos resultados que uma busca direta nas ASTs de todos os arquivos.
+
+Em seguida mede:
+
+- a construção do índice com 1 processo e com o número de CPUs;
+- as atualizações sem mudanças, com arquivos tocados (mesmo conteúdo)
+  e com um arquivo alterado;
+- o tempo de uma consulta de chamadores no índice e com a análise de
+  todos os arquivos.
+
+Uso: python benchmarks/bench_xref.py [NUM_ARQUIVOS]
+"""
+
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ast_nodes import FunctionCall, FunctionDecl, iter_nodes
+from diagnostics import Diagnostics
+from parser import ParserSession
+from synthetic_c import generate
+from xref import CallIndex
+
+
+FUNCTIONS = 12
+
+
+def write_corpus(directory, files):
+    """
+    Grava files arquivos no diretório; as funções do arquivo i se chamam
+    m{i}_f{j} e algumas chamam as funções do arquivo anterior.
+    """
+    rng = random.Random(0)
+    paths = []
+    for i in range(files):
+        source = generate(functions=FUNCTIONS, statements=20, seed=i)
+        source = re.sub(r'\bf(\d+)\(', rf'm{i}_f\1(', source)
+        if i:
+            # Chamadas entre arquivos, uma em cada cinco com um argumento a menos
+            calls = []
+            for j in range(FUNCTIONS):
+                args = "p0" if rng.random() < 0.2 else "p0, p1"
+                calls.append(f"    p0 = m{i - 1}_f{j}({args});\n")
+            source += f"int m{i}_link(int p0, int p1) {{\n{''.join(calls)}    return p0;\n}}\n"
+        path = os.path.join(directory, f"m{i}.c")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        paths.append(path)
+    return paths
+
+
+def direct_calls(paths):
+    """Todas as chamadas (callee, args, caller, path) e as aridades, pelas ASTs."""
+    session = ParserSession(engine='fast')
+    calls = []
+    arities = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            ast = session.parse(f.read(), Diagnostics())
+        for decl in ast:
+            caller = decl.name if isinstance(decl, FunctionDecl) else None
+            if caller is not None:
+                arities.setdefault(caller, set()).add(len(decl.params))
+            for node in iter_nodes(decl):
+                if isinstance(node, FunctionCall):
+                    calls.append((node.name, len(node.args), caller, os.path.abspath(path)))
+    return calls, arities
+
+
+def verify(index, paths):
+    """Compara as consultas do índice com a busca direta nas ASTs."""
+    calls, arities = direct_calls(paths)
+    names = sorted(arities)
+    for name in names:
+        expected = sorted(c for c in calls if c[0] == name)
+        if sorted(c[:4] for c in index.callers(name)) != expected:
+            raise SystemExit(f"Chamadores divergentes para {name}")
+        expected = sorted(c for c in calls if c[2] == name)
+        if sorted(c[:4] for c in index.callees(name)) != expected:
+            raise SystemExit(f"Chamadas divergentes em {name}")
+    expected = sorted(c for c in calls if c[0] in arities and c[1] not in arities[c[0]])
+    found = sorted(m.call[:4] for m in index.mismatches())
+    if found != expected or not found:
+        raise SystemExit(f"Chamadas incompatíveis divergentes: {len(found)} de {len(expected)}")
+    print(f"Verificação: {len(names)} funções, {len(calls)} chamadas e "
+          f"{len(found)} chamadas incompatíveis como na busca direta")
+
+
+def timed_update(index, paths, workers=None):
+    start = time.perf_counter()
+    result = index.update(paths, workers, engine='fast')
+    return time.perf_counter() - start, result
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    
+    directory = tempfile.mkdtemp(prefix='bench_xref_')
+    try:
+        paths = write_corpus(directory, files)
+        db = os.path.join(directory, 'index.db')
+        
+        with CallIndex(db) as index:
+            index.update(paths[:20], engine='fast')
+            verify(index, paths[:20])
+        
+        print(f"\n{files} arquivos, {sum(os.path.getsize(p) for p in paths) / 1024:.0f} KiB")
+        print(f"\n{'Atualização':<34} {'Tempo (s)':>10} {'Analisados':>11}")
+        print("-" * 57)
+        for workers in sorted({1, os.cpu_count() or 1}):
+            os.remove(db)
+            with CallIndex(db) as index:
+                elapsed, result = timed_update(index, paths, workers)
+            print(f"{f'construção ({workers} processo(s))':<34} {elapsed:>10.3f} {result.indexed:>11}")
+        
+        with CallIndex(db) as index:
+            elapsed, result = timed_update(index, paths)
+            print(f"{'sem mudanças':<34} {elapsed:>10.3f} {result.indexed:>11}")
+            for path in paths[::10]:
+                os.utime(path)
+            elapsed, result = timed_update(index, paths)
+            print(f"{f'{result.touched} arquivos tocados':<34} {elapsed:>10.3f} {result.indexed:>11}")
+            with open(paths[0], 'a', encoding='utf-8') as f:
+                f.write("int extra(int a) { return m0_f1(a, a); }\n")
+            elapsed, result = timed_update(index, paths)
+            print(f"{'um arquivo alterado':<34} {elapsed:>10.3f} {result.indexed:>11}")
+            
+            name = 'm0_f1'
+            start = time.perf_counter()
+            found = index.callers(name)
+            query = time.perf_counter() - start
+            start = time.perf_counter()
+            calls, _ = direct_calls(paths)
+            direct = [c for c in calls if c[0] == name]
+            scan = time.perf_counter() - start
+            if len(found) != len(direct):
+                raise SystemExit("Chamadores divergentes após a atualização")
+            print(f"\nChamadores de {name} ({len(found)}): índice {query * 1000:.2f} ms, "
+                  f"análise de todos os arquivos {scan:.3f} s")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
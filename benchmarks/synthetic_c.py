@@ -0,0 +1,263 @@
+"""
+Gerador de programas C sintéticos para os benchmarks.
+
+Gera programas válidos no subconjunto de C reconhecido pelo parser e sem
+erros semânticos (todo nome usado está declarado em um escopo visível e
+as chamadas têm a quantidade de argumentos esperada), com parâmetros
+para o tamanho e a forma do código:
+
+- functions: quantidade de funções
+- statements: quantidade de comandos de cada função, incluindo os
+  aninhados
+- depth: profundidade máxima de aninhamento de if, while, for e blocos
+- width: quantidade de operandos de cada expressão
+- comments: probabilidade de um comentário antes de cada comando
+- seed: semente do gerador pseudoaleatório (o mesmo conjunto de
+  parâmetros gera sempre o mesmo programa)
+
+Os laços têm contadores que não são alterados no corpo e as funções
+chamam apenas funções declaradas antes delas, de modo que não há laços
+infinitos nem recursão.
+
+Uso: python benchmarks/synthetic_c.py [--functions N] [--statements N]
+     [--depth N] [--width N] [--comments P] [--seed N] [-o ARQUIVO]
+"""
+
+import argparse
+import random
+import sys
+
+
+GLOBALS = 8
+
+# Operadores das expressões e das condições
+ARITHMETIC_OPS = ('+', '-', '*', '+', '-', '/')
+RELATIONAL_OPS = ('<', '<=', '>', '>=', '==', '!=')
+LOGICAL_OPS = ('&&', '||')
+
+VALUE_TYPES = ('int', 'int', 'int', 'float', 'char')
+
+
+class _Generator:
+    """Estado da geração de um programa (veja generate)."""
+    
+    def __init__(self, functions, statements, depth, width, comments, seed):
+        self.functions = functions
+        self.statements = statements
+        self.depth = depth
+        self.width = max(1, width)
+        self.comments = comments
+        self.rng = random.Random(seed)
+        self.lines = []
+        # Variáveis visíveis (uma lista por escopo) e contadores de laço,
+        # que podem ser lidos mas não atribuídos
+        self.scopes = []
+        self.counters = set()
+        self.names = 0
+        self.comment_count = 0
+        self.remaining = 0
+        self.callable = 0
+    
+    def program(self):
+        """Código fonte do programa completo."""
+        rng = self.rng
+        emit = self.lines.append
+        emit("// Programa gerado por benchmarks/synthetic_c.py")
+        self.scopes = [[]]
+        for i in range(GLOBALS):
+            if rng.random() < 0.5:
+                emit(f"int g{i} = {rng.randint(0, 99)};")
+            else:
+                emit(f"int g{i};")
+            self.scopes[0].append(f"g{i}")
+        for i in range(self.functions):
+            emit("")
+            self.function(i)
+        return "\n".join(self.lines) + "\n"
+    
+    def function(self, index):
+        return_type = 'float' if self.rng.random() < 0.2 else 'int'
+        self.lines.append(f"{return_type} f{index}(int p0, int p1) {{")
+        self.scopes.append(['p0', 'p1'])
+        self.counters = set()
+        self.callable = index
+        self.remaining = self.statements
+        while self.remaining > 0:
+            self.statement(1)
+        self.lines.append(f"    return {self.expression()};")
+        self.lines.append("}")
+        self.scopes.pop()
+    
+    # Comandos
+    
+    def comment(self, indent):
+        self.comment_count += 1
+        if self.rng.random() < 0.7:
+            self.lines.append(f"{indent}// comentário {self.comment_count}")
+        else:
+            self.lines.append(f"{indent}/* comentário {self.comment_count}:")
+            self.lines.append(f"{indent}   bloco com mais de uma linha */")
+    
+    def new_name(self, prefix='v'):
+        self.names += 1
+        return f"{prefix}{self.names}"
+    
+    def statement(self, level):
+        """Gera um comando (possivelmente composto) com recuo level."""
+        rng = self.rng
+        emit = self.lines.append
+        indent = "    " * level
+        self.remaining -= 1
+        if self.comments and rng.random() < self.comments:
+            self.comment(indent)
+        
+        choice = rng.random()
+        nested = level <= self.depth and self.remaining > 0
+        if nested and choice < 0.15:
+            emit(f"{indent}if ({self.condition()}) {{")
+            self.block(level)
+            if rng.random() < 0.4:
+                emit(f"{indent}}} else {{")
+                self.block(level)
+            emit(f"{indent}}}")
+        elif nested and choice < 0.23:
+            counter = self.new_name('w')
+            emit(f"{indent}int {counter} = 0;")
+            self.scopes[-1].append(counter)
+            self.counters.add(counter)
+            emit(f"{indent}while ({counter} < {rng.randint(2, 5)}) {{")
+            emit(f"{indent}    {counter} = {counter} + 1;")
+            self.block(level)
+            emit(f"{indent}}}")
+        elif nested and choice < 0.31:
+            counter = self.new_name('i')
+            emit(f"{indent}for (int {counter} = 0; {counter} < {rng.randint(2, 5)}; "
+                 f"{counter} = {counter} + 1) {{")
+            self.counters.add(counter)
+            self.block(level, [counter])
+            emit(f"{indent}}}")
+        elif nested and choice < 0.34:
+            emit(f"{indent}{{")
+            self.block(level)
+            emit(f"{indent}}}")
+        elif choice < 0.6:
+            var_type = rng.choice(VALUE_TYPES)
+            name = self.new_name()
+            if rng.random() < 0.8:
+                emit(f"{indent}{var_type} {name} = {self.expression()};")
+            else:
+                emit(f"{indent}{var_type} {name};")
+            self.scopes[-1].append(name)
+        elif choice < 0.95 or not self.callable:
+            emit(f"{indent}{self.target()} = {self.expression()};")
+        else:
+            emit(f"{indent}{self.call()};")
+    
+    def block(self, level, names=()):
+        """Gera o corpo de um comando composto em um novo escopo."""
+        self.scopes.append(list(names))
+        count = self.rng.randint(1, 6)
+        while count and self.remaining > 0:
+            self.statement(level + 1)
+            count -= 1
+        if count:
+            # Sem comandos restantes: um corpo vazio ainda é válido
+            self.lines.append("    " * (level + 1) + ";")
+        self.scopes.pop()
+    
+    # Expressões
+    
+    def target(self):
+        """Variável visível que pode receber uma atribuição."""
+        candidates = [name for scope in self.scopes for name in scope if name not in self.counters]
+        return self.rng.choice(candidates)
+    
+    def variable(self):
+        scope = self.rng.choice(self.scopes)
+        if not scope:
+            scope = self.scopes[0]
+        return self.rng.choice(scope)
+    
+    def operand(self):
+        rng = self.rng
+        choice = rng.random()
+        if choice < 0.55:
+            return self.variable()
+        if choice < 0.8:
+            return str(rng.randint(0, 1000))
+        if choice < 0.86:
+            return f"{rng.randint(0, 99)}.{rng.randint(0, 99)}"
+        if choice < 0.9:
+            return f"'{rng.choice('abcxyz')}'"
+        if choice < 0.94 and self.callable:
+            return self.call()
+        if choice < 0.97:
+            return f"-{self.variable()}"
+        return f"({self.variable()} {rng.choice(ARITHMETIC_OPS[:3])} {rng.randint(1, 9)})"
+    
+    def call(self):
+        callee = self.rng.randrange(self.callable)
+        return f"f{callee}({self.variable()}, {self.rng.randint(0, 9)})"
+    
+    def expression(self, width=None):
+        """Expressão aritmética com width operandos."""
+        rng = self.rng
+        parts = [self.operand()]
+        for _ in range((width or self.width) - 1):
+            op = rng.choice(ARITHMETIC_OPS)
+            parts.append(op)
+            # Divisão somente por constantes diferentes de zero
+            parts.append(str(rng.randint(1, 9)) if op == '/' else self.operand())
+        return " ".join(parts)
+    
+    def condition(self):
+        rng = self.rng
+        width = max(1, self.width // 2)
+        condition = f"{self.expression(width)} {rng.choice(RELATIONAL_OPS)} {self.expression(width)}"
+        if rng.random() < 0.3:
+            condition += f" {rng.choice(LOGICAL_OPS)} {self.variable()} {rng.choice(RELATIONAL_OPS)} {rng.randint(0, 9)}"
+        return condition
+
+
+def generate(functions=10, statements=20, depth=3, width=4, comments=0.1, seed=0):
+    """
+    Gera um programa C sintético.
+    
+    Args:
+        functions: Quantidade de funções
+        statements: Quantidade de comandos de cada função, incluindo os
+            aninhados (além do return final)
+        depth: Profundidade máxima de aninhamento dos comandos compostos
+        width: Quantidade de operandos de cada expressão
+        comments: Probabilidade (0 a 1) de um comentário antes de cada comando
+        seed: Semente do gerador pseudoaleatório
+        
+    Returns:
+        String com o código fonte
+    """
+    return _Generator(functions, statements, depth, width, comments, seed).program()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Gera um programa C sintético.")
+    arg_parser.add_argument('--functions', type=int, default=10)
+    arg_parser.add_argument('--statements', type=int, default=20)
+    arg_parser.add_argument('--depth', type=int, default=3)
+    arg_parser.add_argument('--width', type=int, default=4)
+    arg_parser.add_argument('--comments', type=float, default=0.1)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('-o', '--output', default=None,
+                            help="arquivo de saída (padrão: saída padrão)")
+    args = arg_parser.parse_args()
+    
+    source = generate(args.functions, args.statements, args.depth, args.width,
+                      args.comments, args.seed)
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main()
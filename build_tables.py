@@ -0,0 +1,29 @@
+"""
+Geração das tabelas pré-calculadas do lexer e do parser.
+
+Gera lextab.py (expressões regulares do lexer), parsetab.py (tabelas LR
+do parser) e parser.out (relatório de depuração da gramática). Como a
+importação de lexer.py e parser.py não grava arquivos, este script deve
+ser executado sempre que as regras do lexer ou a gramática mudarem; até
+lá, as tabelas desatualizadas são ignoradas e reconstruídas em memória a
+cada execução, e o parser emite um aviso (parser.StaleTablesWarning).
+
+Uso: python build_tables.py [DIRETÓRIO]
+"""
+
+import os
+import sys
+
+from lexer import write_lextab
+from parser import write_tables
+
+
+def main():
+    outputdir = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__))
+    write_lextab(outputdir)
+    write_tables(outputdir)
+    print(f"Tabelas geradas em {outputdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Módulo de cache persistente de análises.
+
+Guarda em disco o resultado da análise (lista de tokens, AST e mensagens
+de erro) de cada código fonte, endereçado pelo hash do conteúdo do
+arquivo combinado com as assinaturas da gramática e das regras do lexer
+(calculadas a partir do código atual, e não das tabelas pré-geradas) e
+com as opções que alteram o resultado (motor léxico e registro dos
+tokens em colunas). Assim, um arquivo inalterado não precisa ser
+tokenizado nem analisado novamente, e qualquer mudança na gramática ou
+no lexer invalida as entradas antigas.
+
+O tamanho total do cache é limitado; ao ultrapassar o limite, as
+entradas usadas há mais tempo são removidas (LRU, pela data de
+modificação do arquivo, atualizada a cada acerto).
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+import ast_binary
+from diagnostics import Diagnostics
+from lexer import rules_signature
+from parser import grammar_signature, parse_with_tokens
+
+
+# Versão do formato das entradas; deve ser incrementada sempre que a
+# estrutura dos tokens ou dos nós da AST mudar sem alterar a gramática
+CACHE_VERSION = 3
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SUFFIX = '.ast'
+
+
+def grammar_fingerprint():
+    """Impressão digital da gramática, do lexer e do formato das entradas do cache."""
+    data = f"{CACHE_VERSION}:{grammar_signature()}:{rules_signature()}".encode('utf-8')
+    return hashlib.sha256(data).digest()
+
+
+class ASTCache:
+    """
+    Cache em disco de análises, com limite de tamanho e remoção LRU.
+    
+    Attributes:
+        directory: Diretório das entradas
+        max_bytes: Tamanho máximo total das entradas
+        hits: Quantidade de acertos desde a criação
+        misses: Quantidade de falhas desde a criação
+        evictions: Quantidade de entradas removidas pelo limite de tamanho
+    """
+    
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fingerprint = grammar_fingerprint()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+    
+    def _entries(self):
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if entry.name.endswith(_SUFFIX) and entry.is_file()]
+    
+    def key(self, source, variant=''):
+        """
+        Calcula a chave de um código fonte.
+        
+        Args:
+            source: Conteúdo do arquivo (bytes)
+            variant: Identificação das opções de análise que alteram o
+                resultado guardado (veja parse_cached)
+                
+        Returns:
+            Chave hexadecimal da entrada
+        """
+        digest = hashlib.sha256(self._fingerprint)
+        digest.update(variant.encode('utf-8') + b'\0')
+        digest.update(source)
+        return digest.hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+    
+    def get(self, source, variant=''):
+        """
+        Busca a análise de um código fonte no cache.
+        
+        Args:
+            source: Conteúdo do arquivo (bytes)
+            variant: Opções de análise (veja key)
+            
+        Returns:
+            Tupla (tokens, ast, mensagens) ou None se não estiver no cache
+        """
+        path = self._path(self.key(source, variant))
+        try:
+            with open(path, 'rb') as f:
+                tokens, ast_data, messages = pickle.load(f)
+            ast = ast_binary.loads(ast_data) if ast_data is not None else None
+            # Marcar a entrada como usada recentemente
+            os.utime(path)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tokens, ast, messages
+    
+    def put(self, source, tokens, ast, messages=(), variant=''):
+        """
+        Guarda a análise de um código fonte no cache.
+        
+        Args:
+            source: Conteúdo do arquivo (bytes)
+            tokens: Lista de tokens
+            ast: AST (ou None em caso de erro)
+            messages: Mensagens de erro emitidas durante a análise
+            variant: Opções de análise (veja key)
+        """
+        path = self._path(self.key(source, variant))
+        # A AST é gravada no formato binário (ast_binary), mais rápido de
+        # ler que o pickle e sem limite de profundidade
+        ast_data = ast_binary.dumps(ast) if ast is not None else None
+        data = pickle.dumps((tokens, ast_data, list(messages)), protocol=pickle.HIGHEST_PROTOCOL)
+        # Gravar em um arquivo temporário e renomear, para que leitores
+        # concorrentes nunca vejam uma entrada incompleta
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._size += len(data)
+        if self._size > self.max_bytes:
+            self._evict()
+    
+    def _evict(self):
+        """Remove as entradas usadas há mais tempo até respeitar o limite."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+    
+    def clear(self):
+        """Remove todas as entradas do cache."""
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+def decode_source(source):
+    """
+    Decodifica o conteúdo de um arquivo como o open() em modo texto faria:
+    UTF-8, com as quebras de linha (\\r\\n e \\r) convertidas para \\n.
+    """
+    return source.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def parse_cached(source, cache=None, session=None, columnar=False):
+    """
+    Analisa um código fonte, consultando o cache antes.
+    
+    Em caso de acerto, a tokenização e a análise sintática são evitadas.
+    As mensagens de erro da análise são registradas em um Diagnostics
+    (em vez de impressas) e guardadas, para que possam ser exibidas
+    novamente quando a entrada vier do cache. O motor léxico da sessão e
+    columnar fazem parte da chave, pois determinam o tipo dos tokens
+    guardados.
+    
+    Args:
+        source: Conteúdo do arquivo (bytes, codificado em UTF-8)
+        cache: ASTCache a ser usado (None para não usar cache)
+        session: ParserSession usada na análise (por padrão, a sessão
+            padrão do módulo parser)
+        columnar: Se True, os tokens de uma nova análise são registrados
+            em um TokenStream (veja ParserSession.parse_with_tokens)
+            
+    Returns:
+        Tupla (tokens, ast, mensagens, acerto)
+    """
+    # A sessão padrão usa o motor 'ply'
+    engine = session.engine if session is not None else 'ply'
+    variant = f"{engine}:{'columnar' if columnar else 'list'}"
+    if cache is not None:
+        entry = cache.get(source, variant)
+        if entry is not None:
+            tokens, ast, messages = entry
+            return tokens, ast, messages, True
+    
+    code = decode_source(source)
+    diagnostics = Diagnostics()
+    if session is None:
+        tokens, ast = parse_with_tokens(code, columnar, diagnostics)
+    else:
+        tokens, ast = session.parse_with_tokens(code, columnar, diagnostics)
+    messages = diagnostics.messages()
+    
+    if cache is not None:
+        cache.put(source, tokens, ast, messages, variant)
+    return tokens, ast, messages, False
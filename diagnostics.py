@@ -0,0 +1,201 @@
+"""
+Módulo de diagnósticos (mensagens de erro) da análise.
+
+Os erros léxicos, sintáticos e semânticos são registrados como objetos
+Diagnostic em uma coleção Diagnostics, em vez de impressos diretamente.
+A coleção tem um limite de mensagens: ao atingi-lo, registra um único
+aviso e passa a apenas contar os erros seguintes, de modo que uma
+entrada muito corrompida (por exemplo, um arquivo binário) não produz
+milhões de mensagens.
+
+Quando nenhuma coleção é informada (uso direto do lexer ou do parser
+globais), as mensagens continuam sendo impressas na saída padrão.
+"""
+
+
+# Tipos de diagnóstico
+LEXICAL = 'léxico'
+SYNTAX = 'sintático'
+SEMANTIC = 'semântico'
+LIMIT = 'limite'
+
+# Quantidade máxima de diagnósticos guardados por análise
+DEFAULT_LIMIT = 100
+
+# Tamanho máximo do trecho inválido mostrado em uma mensagem
+_PREVIEW_SIZE = 20
+
+
+class Diagnostic:
+    """
+    Um erro encontrado durante a análise.
+    
+    Attributes:
+        kind: Tipo (LEXICAL, SYNTAX, SEMANTIC ou LIMIT)
+        message: Texto completo da mensagem
+        line: Linha do erro (ou None se desconhecida)
+        pos: Posição (deslocamento no código fonte) do erro, ou None
+    """
+    
+    __slots__ = ('kind', 'message', 'line', 'pos')
+    
+    def __init__(self, kind, message, line=None, pos=None):
+        self.kind = kind
+        self.message = message
+        self.line = line
+        self.pos = pos
+    
+    def __str__(self):
+        return self.message
+    
+    def __repr__(self):
+        return f"Diagnostic({self.kind!r}, {self.message!r}, {self.line!r}, {self.pos!r})"
+    
+    def __reduce__(self):
+        return (self.__class__, (self.kind, self.message, self.line, self.pos))
+
+
+class Diagnostics:
+    """
+    Coleção de diagnósticos de uma análise, com limite de tamanho.
+    
+    Attributes:
+        limit: Quantidade máxima de diagnósticos guardados (None: sem limite)
+        callback: Função chamada com cada diagnóstico guardado, no momento
+            em que é registrado (por exemplo, para exibi-lo)
+        items: Diagnósticos guardados, na ordem em que ocorreram
+        counts: Quantidade de erros de cada tipo, incluindo os omitidos
+        omitted: Quantidade de erros omitidos por causa do limite
+    """
+    
+    def __init__(self, limit=DEFAULT_LIMIT, callback=None):
+        self.limit = limit
+        self.callback = callback
+        self.items = []
+        self.counts = {}
+        self.omitted = 0
+    
+    def add(self, kind, message, line=None, pos=None):
+        """
+        Registra um erro.
+        
+        Args:
+            kind: Tipo do erro (LEXICAL, SYNTAX ou SEMANTIC)
+            message: Texto completo da mensagem
+            line: Linha do erro
+            pos: Posição do erro no código fonte
+        """
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if self.limit is not None and len(self.items) >= self.limit:
+            if not self.omitted:
+                self._append(Diagnostic(
+                    LIMIT, f"Limite de {self.limit} mensagens de erro atingido; "
+                           f"os demais erros serão omitidos"))
+            self.omitted += 1
+            return
+        self._append(Diagnostic(kind, message, line, pos))
+    
+    def _append(self, diagnostic):
+        self.items.append(diagnostic)
+        if self.callback is not None:
+            self.callback(diagnostic)
+    
+    def has_errors(self, kind=None):
+        """True se houve algum erro (do tipo kind, se informado)."""
+        if kind is None:
+            return bool(self.counts)
+        return kind in self.counts
+    
+    def messages(self):
+        """
+        Textos das mensagens guardadas.
+        
+        Returns:
+            Lista de strings, com a quantidade de erros omitidos ao final
+            (se o limite foi atingido)
+        """
+        messages = [item.message for item in self.items]
+        if self.omitted:
+            messages.append(f"{self.omitted} erro(s) omitido(s)")
+        return messages
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
+
+
+def print_diagnostic(diagnostic):
+    """Exibe um diagnóstico na saída padrão."""
+    print(diagnostic.message)
+
+
+def report(diagnostics, kind, message, line=None, pos=None):
+    """
+    Registra um erro em diagnostics ou, se for None, imprime a mensagem.
+    
+    Args:
+        diagnostics: Diagnostics em que o erro é registrado (ou None)
+        kind: Tipo do erro (LEXICAL, SYNTAX ou SEMANTIC)
+        message: Texto completo da mensagem
+        line: Linha do erro
+        pos: Posição do erro no código fonte
+    """
+    if diagnostics is None:
+        print(message)
+    else:
+        diagnostics.add(kind, message, line, pos)
+
+
+def lexical_error(diagnostics, line, pos, text):
+    """
+    Registra um erro léxico: um caractere inválido ou uma sequência deles.
+    
+    Args:
+        diagnostics: Diagnostics em que o erro é registrado (None: imprimir)
+        line: Linha do erro
+        pos: Posição do primeiro caractere inválido
+        text: Caractere(s) inválido(s)
+    """
+    if len(text) == 1:
+        detail = f"caractere inválido '{text}'"
+    else:
+        preview = text if len(text) <= _PREVIEW_SIZE else text[:_PREVIEW_SIZE - 3] + "..."
+        detail = f"{len(text)} caracteres inválidos '{preview}'"
+    report(diagnostics, LEXICAL, f"Erro léxico na linha {line}, posição {pos}: {detail}", line, pos)
+
+
+def syntax_error(diagnostics, tok):
+    """
+    Registra um erro de sintaxe.
+    
+    Args:
+        diagnostics: Diagnostics em que o erro é registrado (None: imprimir)
+        tok: Token inesperado (ou None no fim do arquivo)
+    """
+    if tok is not None:
+        report(diagnostics, SYNTAX,
+               f"Erro de sintaxe na linha {tok.lineno}, posição {tok.lexpos}: token inesperado '{tok.value}'",
+               tok.lineno, tok.lexpos)
+    else:
+        report(diagnostics, SYNTAX, "Erro de sintaxe: fim de arquivo inesperado")
+
+
+def semantic_error(diagnostics, line, pos, detail):
+    """
+    Registra um erro semântico.
+    
+    Args:
+        diagnostics: Diagnostics em que o erro é registrado (None: imprimir)
+        line: Linha do erro (ou None se desconhecida)
+        pos: Posição do erro no código fonte (ou None)
+        detail: Descrição do erro
+    """
+    if line is not None:
+        where = f" na linha {line}, posição {pos}"
+    elif pos is not None:
+        where = f" na posição {pos}"
+    else:
+        where = ""
+    report(diagnostics, SEMANTIC, f"Erro semântico{where}: {detail}", line, pos)
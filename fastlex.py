@@ -0,0 +1,205 @@
+"""
+Módulo do Analisador Léxico rápido.
+
+Implementação alternativa do analisador léxico, equivalente ao lexer.py
+(mesmos tipos, valores, linhas e mensagens de erro), mas sem o ply.lex:
+todos os tokens são reconhecidos por uma única expressão regular
+compilada, as palavras-chave e os operadores são resolvidos por consulta
+a tabelas e cada token é uma tupla (FastToken), em vez de um LexToken
+criado e preenchido por uma função t_* do PLY.
+
+Os tokens podem ser fornecidos ao parser por meio de tokenfunc (veja
+ParserSession com engine='fast'). skim() fornece somente os tokens fora
+dos corpos das funções, para a análise resumida (ParserSession.skim).
+"""
+
+import re
+import sys
+from collections import namedtuple
+
+import lexer as ply_lexer
+from diagnostics import lexical_error
+from lexer import keywords, INVALID_CHARS
+
+
+class FastToken(namedtuple('FastToken', 'type value lineno lexpos endlexpos')):
+    """
+    Token produzido pelo lexer rápido.
+    
+    Tem os mesmos atributos usados pelo parser em um LexToken (type, value,
+    lineno e lexpos, além de endlexpos, o deslocamento de fim do texto).
+    """
+    
+    __slots__ = ()
+    
+    # O ply.yacc atribui errtoken.lexer ao token de um erro de sintaxe caso
+    # o atributo não exista; como tuplas não aceitam novos atributos, ele
+    # é definido aqui
+    lexer = None
+
+
+def _operator_table():
+    """
+    Obtém os operadores e delimitadores do lexer.py (regras t_* definidas
+    por strings), como um dicionário texto -> tipo do token.
+    """
+    table = {}
+    for name in ply_lexer.tokens:
+        regex = getattr(ply_lexer, 't_' + name, None)
+        if isinstance(regex, str):
+            table[re.sub(r'\\(.)', r'\1', regex)] = name
+    return table
+
+
+OPERATORS = _operator_table()
+
+
+# Expressão regular única com um grupo por categoria de token, na mesma
+# ordem de prioridade do ply.lex: regras definidas por funções, na ordem
+# em que aparecem no lexer.py, e depois os operadores, dos mais longos
+# para os mais curtos. Os espaços e tabs que precedem o token são
+# consumidos junto com ele, os comentários de bloco são reconhecidos por
+# inteiro e o último grupo aceita qualquer caractere restante (erro
+# léxico), de modo que as ocorrências cobrem toda a entrada e podem ser
+# obtidas com finditer, sem reposicionar a busca
+_NEWLINE, _IDENTIFIER, _FLOAT, _INTEGER, _STRING, _CHAR, _COMMENT_LINE, _COMMENT_BLOCK, _OPERATOR, _ERROR = range(1, 11)
+
+_token_re = re.compile(r'[ \t]*(?:' + '|'.join([
+    r'(\n+)',
+    r'([a-zA-Z_][a-zA-Z0-9_]*)',
+    r'(\d+\.\d+)',
+    r'(\d+)',
+    r'("(?:[^"\\]|\\.)*")',
+    r"('(?:[^'\\]|\\.)')",
+    r'(//.*)',
+    # Como no lexer.py, um comentário não fechado vai até o fim do arquivo
+    r'(/\*[\s\S]*?(?:\*/|\Z))',
+    '(' + '|'.join(re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True)) + ')',
+    '(' + INVALID_CHARS + r'+|[^ \t])',
+]) + ')')
+
+
+def scan(data, diagnostics=None, pos=0, endpos=None, lineno=1):
+    """
+    Gera os tokens do código fonte sob demanda.
+    
+    Os erros léxicos são registrados (ou, sem diagnostics, impressos) no
+    momento em que são encontrados, com as mesmas mensagens do lexer.py,
+    e os caracteres inválidos são ignorados.
+    
+    Args:
+        data: String com o código fonte
+        diagnostics: Diagnostics em que os erros são registrados
+        pos: Deslocamento em que a análise começa
+        endpos: Deslocamento em que a análise termina (padrão: fim do texto)
+        lineno: Linha do deslocamento pos
+        
+    Yields:
+        FastToken para cada token identificado
+    """
+    new_token = tuple.__new__
+    get_keyword = keywords.get
+    intern = sys.intern
+    operators = OPERATORS
+    string_value = ply_lexer.string_value
+    char_value = ply_lexer.char_value
+    
+    if endpos is None:
+        endpos = len(data)
+    for m in _token_re.finditer(data, pos, endpos):
+        kind = m.lastindex
+        text = m.group(kind)
+        end = m.end()
+        if kind == _OPERATOR:
+            yield new_token(FastToken, (operators[text], text, lineno, end - len(text), end))
+        elif kind == _IDENTIFIER:
+            yield new_token(FastToken, (get_keyword(text, 'IDENTIFIER'), intern(text), lineno, end - len(text), end))
+        elif kind == _NEWLINE:
+            lineno += len(text)
+        elif kind == _INTEGER:
+            yield new_token(FastToken, ('INTEGER', int(text), lineno, end - len(text), end))
+        elif kind == _FLOAT:
+            yield new_token(FastToken, ('FLOAT_NUMBER', float(text), lineno, end - len(text), end))
+        elif kind == _STRING:
+            yield new_token(FastToken, ('STRING', string_value(text), lineno, end - len(text), end))
+        elif kind == _CHAR:
+            yield new_token(FastToken, ('CHAR', char_value(text), lineno, end - len(text), end))
+        elif kind == _ERROR:
+            lexical_error(diagnostics, lineno, end - len(text), text)
+        # Comentários: ignorar (as quebras de linha dentro de um comentário
+        # de bloco não são contadas, como no lexer.py)
+
+
+# Trechos que podem conter chaves sem abrir ou fechar blocos (strings,
+# caracteres e comentários, com as mesmas expressões do _token_re) e as
+# chaves; as quebras de linha dentro desses trechos não são contadas
+_skim_re = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)\'|//.*|/\*[\s\S]*?(?:\*/|\Z)|([{}])')
+
+
+def skim(data, diagnostics=None, bodies=None):
+    """
+    Gera os tokens do código fonte omitindo o conteúdo dos blocos de
+    nível superior (os corpos das funções).
+    
+    Cada bloco é percorrido apenas contando as chaves (fora de strings e
+    comentários) até a que o fecha, sem ser tokenizado, e é substituído
+    por um par de tokens LBRACE e RBRACE nas posições e linhas originais.
+    Os erros léxicos dentro dos blocos não são reportados. Um bloco que
+    não é fechado é tokenizado por inteiro, para que o erro de sintaxe
+    seja o mesmo da análise completa.
+    
+    Args:
+        data: String com o código fonte
+        diagnostics: Diagnostics em que os erros são registrados
+        bodies: Dicionário em que é registrada, para cada bloco omitido, a
+            tupla (fim, linha) indexada pelo deslocamento do '{'
+            
+    Yields:
+        FastToken para cada token identificado
+    """
+    new_token = tuple.__new__
+    count = data.count
+    segment = 0         # Início do trecho ainda não tokenizado
+    segment_line = 1
+    lineno = 1
+    last = 0
+    depth = 0
+    for m in _skim_re.finditer(data):
+        start = m.start()
+        lineno += count('\n', last, start)
+        last = m.end()
+        brace = m.group(1)
+        if brace is None:
+            continue
+        if brace == '{':
+            if not depth:
+                yield from scan(data, diagnostics, segment, start, segment_line)
+                open_pos = start
+                open_line = lineno
+            depth += 1
+        elif depth:
+            depth -= 1
+            if not depth:
+                if bodies is not None:
+                    bodies[open_pos] = (start + 1, open_line)
+                yield new_token(FastToken, ('LBRACE', '{', open_line, open_pos, open_pos + 1))
+                yield new_token(FastToken, ('RBRACE', '}', lineno, start, start + 1))
+                segment = start + 1
+                segment_line = lineno
+    if depth:
+        yield from scan(data, diagnostics, open_pos, None, open_line)
+    else:
+        yield from scan(data, diagnostics, segment, None, segment_line)
+
+
+def get_tokens(data):
+    """
+    Gera uma lista de tokens a partir do código fonte.
+    
+    Args:
+        data: String com o código fonte
+        
+    Returns:
+        Lista de tuplas (tipo, valor, linha) para cada token identificado
+    """
+    return [tok[:3] for tok in scan(data)]
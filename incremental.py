@@ -0,0 +1,235 @@
+"""
+Módulo de análise incremental.
+
+Mantém a AST de um documento entre edições de texto. A cada edição,
+apenas o trecho afetado é analisado novamente: o código é re-tokenizado
+a partir do fim da última declaração de nível superior intacta até o
+início da próxima, e somente as declarações (FunctionDecl, VarDecl...)
+desse trecho são reconstruídas. As demais subárvores são reaproveitadas;
+as posições das que ficam após a edição são deslocadas de forma adiada,
+somente quando a AST é acessada, para que cada edição custe apenas o
+trecho reanalisado.
+
+Se o trecho não puder ser analisado isoladamente (erro léxico ou
+sintático, ou a tokenização não voltar a coincidir com a anterior, como
+ao abrir um comentário ou string), o documento inteiro é reanalisado,
+assim como nas edições seguintes enquanto ele tiver erros. As mensagens
+de erro dessas análises ficam em IncrementalParser.messages, sem serem
+exibidas.
+"""
+
+import copy
+from bisect import bisect_left, bisect_right
+
+from ast_nodes import Assignment, iter_nodes
+from diagnostics import Diagnostics
+from parser import ParserSession
+
+
+class _Resync(Exception):
+    """Indica que o trecho editado não pode ser reanalisado isoladamente."""
+
+
+def _abort(tok):
+    raise _Resync()
+
+
+class IncrementalParser:
+    """
+    Documento com AST mantida incrementalmente.
+    
+    Attributes:
+        source: Código fonte atual
+        ast: AST atual (lista de declarações) ou None em caso de erro
+        last_incremental: True se a última edição foi tratada sem
+            reanalisar o documento inteiro
+        messages: Mensagens de erro do documento atual, registradas em um
+            Diagnostics em vez de exibidas (enquanto houver erros, cada
+            edição reanalisa o documento inteiro)
+    """
+    
+    def __init__(self, source, ast=None, session=None):
+        self.session = session if session is not None else ParserSession()
+        
+        # Lexer e parser auxiliares que abortam no primeiro erro, usados
+        # na reanálise dos trechos editados
+        self._lexer = self.session.lexer.clone()
+        self._lexer.lexstatestack = []
+        self._lexer.lexstateerrorf = {state: _abort for state in self._lexer.lexstateerrorf}
+        self._lexer.lexerrorf = _abort
+        self._parser = copy.copy(self.session.parser)
+        self._parser.errorfunc = _abort
+        
+        self.source = source
+        self.last_incremental = False
+        self.messages = []
+        self._index(ast if ast is not None else self._parse(source))
+    
+    def _parse(self, source):
+        """Analisa o documento inteiro, guardando as mensagens de erro."""
+        diagnostics = Diagnostics()
+        ast = self.session.parse(source, diagnostics)
+        self.messages = diagnostics.messages()
+        return ast
+    
+    def _index(self, ast):
+        """Calcula as extensões das declarações de nível superior."""
+        self._ast = ast
+        self._decls = []  # Listas de nós de cada declaração
+        self._starts = []
+        self._ends = []
+        # Com erros, as próximas edições também reanalisam o documento
+        # inteiro, para que as mensagens se mantenham atualizadas
+        if ast is not None and not self.messages:
+            try:
+                self._add_decls(ast, self.source, self._decls, self._starts, self._ends)
+            except _Resync:
+                # Extensões indeterminadas: a AST é mantida, e a próxima
+                # edição reanalisa o documento inteiro
+                self._decls, self._starts, self._ends = [], [], []
+        # Deslocamentos de posição ainda não aplicados aos nós de cada declaração
+        self._pending = [0] * len(self._decls)
+    
+    @property
+    def ast(self):
+        """AST atual (lista de declarações) ou None em caso de erro."""
+        if self._ast is None and self._decls:
+            pending = self._pending
+            for i, delta in enumerate(pending):
+                if delta:
+                    for node in iter_nodes(self._decls[i]):
+                        # Nós sem posição (folhas compartilhadas, veja
+                        # ParserSession com share_leaves) não são deslocados
+                        if node.start is not None:
+                            node.start += delta
+                    pending[i] = 0
+            self._ast = [node for decl in self._decls for node in decl]
+        return self._ast
+    
+    def _add_decls(self, nodes, source, decls, starts, ends):
+        """
+        Agrupa os nós de nível superior em declarações e registra suas
+        extensões, incluindo o ponto e vírgula das declarações de variável.
+        
+        Raises:
+            _Resync: Se o ponto e vírgula de uma declaração não for encontrado
+        """
+        lexer_obj = self._lexer
+        first = len(decls)
+        for node in nodes:
+            if isinstance(node, Assignment):
+                # Inicialização de uma declaração de variável (int x = 1;)
+                decls[-1].append(node)
+            else:
+                decls.append([node])
+                starts.append(node.start)
+        
+        for i in range(first, len(decls)):
+            end = decls[i][-1].end
+            if end is None:
+                # Inicialização terminada em uma folha compartilhada, sem
+                # posição: procurar o ponto e vírgula desde o início
+                lexer_obj.begin('INITIAL')
+                lexer_obj.input(source)
+                lexer_obj.lexpos = starts[i]
+                tok = lexer_obj.token()
+                while tok is not None and tok.type != 'SEMICOLON':
+                    tok = lexer_obj.token()
+            elif source[end - 1:end] != '}':
+                # Declaração de variável: incluir o ponto e vírgula (o
+                # lexer pode ter ficado em um comentário não fechado)
+                lexer_obj.begin('INITIAL')
+                lexer_obj.input(source)
+                lexer_obj.lexpos = end
+                tok = lexer_obj.token()
+            else:
+                ends.append(end)
+                continue
+            if tok is None:
+                raise _Resync()
+            ends.append(tok.lexpos + 1)
+    
+    def apply_edit(self, offset, removed, inserted):
+        """
+        Aplica uma edição de texto e atualiza a AST.
+        
+        Args:
+            offset: Posição da edição no código fonte atual
+            removed: Quantidade de caracteres removidos a partir de offset
+            inserted: Texto inserido em offset
+            
+        Returns:
+            True se a edição foi tratada incrementalmente, False se o
+            documento inteiro foi reanalisado. A nova AST fica em ast.
+        """
+        old = self.source
+        if offset < 0 or removed < 0 or offset + removed > len(old):
+            raise ValueError("Edição fora dos limites do código fonte")
+        source = old[:offset] + inserted + old[offset + removed:]
+        delta = len(inserted) - removed
+        
+        if self._decls:
+            try:
+                self._reparse_region(source, offset, offset + removed, delta)
+                self.source = source
+                self.last_incremental = True
+                return True
+            except _Resync:
+                pass
+        
+        # Reanalisar o documento inteiro
+        self.source = source
+        self.last_incremental = False
+        self._index(self._parse(source))
+        return False
+    
+    def _reparse_region(self, source, edit_start, edit_end, delta):
+        """Reanalisa apenas as declarações afetadas por uma edição."""
+        starts, ends = self._starts, self._ends
+        # Declarações intactas: as que terminam antes da edição e as que
+        # começam depois dela (as que apenas tocam a edição são refeitas)
+        first = bisect_left(ends, edit_start)
+        last = bisect_right(starts, edit_end)
+        region_start = ends[first - 1] if first > 0 else 0
+        region_end = (starts[last] if last < len(starts) else len(self.source)) + delta
+        
+        # Re-tokenizar o trecho até reencontrar o início da próxima declaração
+        lexer_obj = self._lexer
+        lexer_obj.input(source)
+        lexer_obj.lexpos = region_start
+        lexer_obj.lineno = source.count('\n', 0, region_start) + 1
+        lexer_obj.begin('INITIAL')
+        region_tokens = []
+        while True:
+            tok = lexer_obj.token()
+            if tok is None:
+                if region_end != len(source):
+                    raise _Resync()
+                break
+            if tok.lexpos >= region_end:
+                if tok.lexpos != region_end:
+                    raise _Resync()
+                break
+            region_tokens.append(tok)
+        
+        nodes = []
+        if region_tokens:
+            token_iter = iter(region_tokens)
+            nodes = self._parser.parse(lexer=lexer_obj,
+                                       tokenfunc=lambda: next(token_iter, None))
+        
+        new_decls, new_starts, new_ends = [], [], []
+        self._add_decls(nodes, source, new_decls, new_starts, new_ends)
+        
+        # Registrar o deslocamento das declarações posteriores à edição
+        tail_pending = self._pending[last:]
+        if delta:
+            starts[last:] = [s + delta for s in starts[last:]]
+            ends[last:] = [e + delta for e in ends[last:]]
+            tail_pending = [d + delta for d in tail_pending]
+        
+        self._decls[first:last] = new_decls
+        self._starts[first:last] = new_starts
+        self._ends[first:last] = new_ends
+        self._pending[first:] = [0] * len(new_decls) + tail_pending
+        self._ast = None
@@ -0,0 +1,355 @@
+"""
+Instrumentação da análise: tempo e alocações por fase e contadores.
+
+Um objeto Stats registra, para cada fase da análise (por exemplo, read,
+lex, parse, check, optimize e print), o tempo de parede e, com
+trace_memory, a memória alocada (líquida) e o pico de memória medidos
+com tracemalloc. Também conta os tokens de cada tipo e as reduções de
+cada regra da gramática (e de cada função p_* de parser.py).
+
+A instrumentação fica desligada por padrão: uma ParserSession só é
+instrumentada quando recebe um Stats (parâmetro stats), e measure()
+com stats None devolve um gerenciador de contexto vazio. Com um Stats,
+a sessão usa uma cópia do parser com as ações das regras envolvidas por
+contadores e mede o tempo gasto no motor léxico a cada token; esse
+tempo é registrado na fase lex e descontado da fase em que ocorreu
+(em geral, parse), pois as duas análises acontecem em uma única
+passagem.
+
+profiled() grava um perfil do cProfile (legível com o módulo pstats) e
+um snapshot do tracemalloc (legível com tracemalloc.Snapshot.load) para
+anexar a relatórios de problemas.
+
+Uso:
+    stats = collect_stats(source)
+    print(stats.format())
+"""
+
+import contextlib
+import copy
+import cProfile
+import time
+import tracemalloc
+from collections import Counter
+
+
+# Quantidade de quadros guardados em cada alocação pelo profiled()
+TRACEMALLOC_FRAMES = 10
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+class Phase:
+    """
+    Medidas acumuladas de uma fase.
+    
+    Attributes:
+        seconds: Tempo de parede (s), sem o tempo das fases internas
+        allocated: Memória alocada e não liberada durante a fase (bytes),
+            ou None sem trace_memory
+        peak: Maior memória usada acima do início da fase (bytes), ou None
+            se não medida (sem trace_memory ou na fase lex)
+        count: Quantidade de vezes que a fase foi executada
+    """
+    
+    __slots__ = ('seconds', 'allocated', 'peak', 'count')
+    
+    def __init__(self):
+        self.seconds = 0.0
+        self.allocated = None
+        self.peak = None
+        self.count = 0
+    
+    def to_dict(self):
+        return {"seconds": self.seconds, "allocated": self.allocated, "peak": self.peak,
+                "count": self.count}
+
+
+class _Frame:
+    """Fase em execução (veja Stats.phase)."""
+    
+    __slots__ = ('name', 'start', 'memory', 'peak', 'inner_seconds', 'inner_bytes')
+    
+    def __init__(self, name, start, memory):
+        self.name = name
+        self.start = start
+        self.memory = memory
+        self.peak = memory
+        self.inner_seconds = 0.0
+        self.inner_bytes = 0
+
+
+class Stats:
+    """
+    Estatísticas de uma análise.
+    
+    Attributes:
+        trace_memory: Se as alocações são medidas (com tracemalloc, que é
+            iniciado durante as fases se ainda não estiver ativo)
+        phases: Dicionário nome -> Phase, na ordem da primeira execução
+        tokens: Counter com a quantidade de tokens de cada tipo
+    """
+    
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.tokens = Counter()
+        # Produções do parser instrumentado e a quantidade de reduções de
+        # cada uma (no mesmo índice)
+        self._productions = []
+        self._reductions = []
+        self._frames = []
+        self._tracing = False
+    
+    # Fases
+    
+    def _phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase()
+            if self.trace_memory:
+                phase.allocated = 0
+        return phase
+    
+    def _add(self, name, seconds, allocated=None):
+        """Registra uma execução de uma fase medida fora de phase()."""
+        phase = self._phase(name)
+        phase.seconds += seconds
+        phase.count += 1
+        if allocated is not None:
+            phase.allocated += allocated
+        if self._frames:
+            frame = self._frames[-1]
+            frame.inner_seconds += seconds
+            frame.inner_bytes += allocated or 0
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Mede o bloco with como uma execução da fase name.
+        
+        As fases podem ser aninhadas; o tempo e as alocações das fases
+        internas são descontados da fase externa.
+        """
+        trace = self.trace_memory
+        if trace and not self._frames and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        memory = 0
+        if trace:
+            memory, peak = tracemalloc.get_traced_memory()
+            if self._frames:
+                parent = self._frames[-1]
+                parent.peak = max(parent.peak, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(name, time.perf_counter(), memory)
+        self._frames.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            self._frames.pop()
+            phase = self._phase(name)
+            phase.seconds += elapsed - frame.inner_seconds
+            phase.count += 1
+            allocated = 0
+            if trace:
+                current, peak = tracemalloc.get_traced_memory()
+                allocated = current - frame.memory
+                phase.allocated += allocated - frame.inner_bytes
+                peak = max(frame.peak, peak) - frame.memory
+                phase.peak = peak if phase.peak is None else max(phase.peak, peak)
+            if self._frames:
+                parent = self._frames[-1]
+                parent.inner_seconds += elapsed
+                parent.inner_bytes += allocated
+                if trace:
+                    parent.peak = max(parent.peak, frame.memory + peak)
+            elif self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+    
+    # Tokens e reduções
+    
+    def timed_tokens(self, next_token):
+        """
+        Envolve uma função que fornece o próximo token, contando os tokens
+        de cada tipo e registrando o tempo (e as alocações) na fase lex.
+        
+        Args:
+            next_token: Função sem argumentos que devolve o próximo token
+                (com atributo type) ou None no fim
+                
+        Returns:
+            Função equivalente instrumentada
+        """
+        tokens = self.tokens
+        clock = time.perf_counter
+        add = self._add
+        
+        if not self.trace_memory:
+            def timed():
+                start = clock()
+                tok = next_token()
+                add('lex', clock() - start)
+                if tok:
+                    tokens[tok.type] += 1
+                return tok
+            return timed
+        
+        traced = tracemalloc.get_traced_memory
+        
+        def traced_timed():
+            memory = traced()[0]
+            start = clock()
+            tok = next_token()
+            add('lex', clock() - start, traced()[0] - memory)
+            if tok:
+                tokens[tok.type] += 1
+            return tok
+        return traced_timed
+    
+    def instrument(self, parser_obj):
+        """
+        Cria uma cópia do parser com a ação de cada regra envolvida por um
+        contador de reduções.
+        
+        Args:
+            parser_obj: Parser LR (ply.yacc)
+            
+        Returns:
+            Cópia do parser, que compartilha as tabelas com o original
+        """
+        parser_obj = copy.copy(parser_obj)
+        self._productions = parser_obj.productions
+        self._reductions = counts = [0] * len(parser_obj.productions)
+        
+        def counted(index, action):
+            def wrapper(p):
+                counts[index] += 1
+                action(p)
+            return wrapper
+        
+        productions = []
+        for index, production in enumerate(parser_obj.productions):
+            production = copy.copy(production)
+            if production.callable is not None:
+                production.callable = counted(index, production.callable)
+            productions.append(production)
+        parser_obj.productions = productions
+        return parser_obj
+    
+    @property
+    def reductions(self):
+        """Counter com a quantidade de reduções de cada regra da gramática."""
+        return Counter({production.str: count
+                        for production, count in zip(self._productions, self._reductions)
+                        if count})
+    
+    @property
+    def actions(self):
+        """Counter com a quantidade de reduções de cada função p_*."""
+        actions = Counter()
+        for production, count in zip(self._productions, self._reductions):
+            if count:
+                actions[production.func] += count
+        return actions
+    
+    # Saída
+    
+    def to_dict(self):
+        """Estatísticas como um dicionário serializável em JSON."""
+        return {
+            "phases": {name: phase.to_dict() for name, phase in self.phases.items()},
+            "tokens": dict(self.tokens.most_common()),
+            "reductions": dict(self.reductions.most_common()),
+            "actions": dict(self.actions.most_common()),
+        }
+    
+    def format(self, top=10):
+        """
+        Formata as estatísticas como tabelas legíveis.
+        
+        Args:
+            top: Quantidade de tipos de token e de regras exibidos
+            
+        Returns:
+            String com as tabelas
+        """
+        lines = ["Estatísticas:", f"  {'Fase':<10} {'Tempo (ms)':>11} {'Alocado (KiB)':>14} "
+                                  f"{'Pico (KiB)':>11}"]
+        for name, phase in self.phases.items():
+            allocated = f"{phase.allocated / 1024:.1f}" if phase.allocated is not None else "-"
+            peak = f"{phase.peak / 1024:.1f}" if phase.peak is not None else "-"
+            lines.append(f"  {name:<10} {phase.seconds * 1000:>11.3f} {allocated:>14} {peak:>11}")
+        
+        lines.append(f"\n  Tokens por tipo ({sum(self.tokens.values())}):")
+        for token_type, count in self.tokens.most_common(top):
+            lines.append(f"    {token_type:<20} {count:>9}")
+        
+        reductions = self.reductions
+        lines.append(f"\n  Reduções por regra ({sum(reductions.values())}):")
+        functions = {production.str: production.func for production in self._productions}
+        for rule, count in reductions.most_common(top):
+            lines.append(f"    {count:>9}  {functions[rule]}: {rule}")
+        return "\n".join(lines) + "\n"
+
+
+def measure(stats, name):
+    """
+    Mede o bloco with como a fase name de stats, ou não faz nada se stats
+    for None.
+    """
+    if stats is None:
+        return _NO_PHASE
+    return stats.phase(name)
+
+
+def collect_stats(data, engine='ply', trace_memory=True, columnar=False):
+    """
+    Analisa um código fonte registrando as estatísticas da análise.
+    
+    Args:
+        data: String com o código fonte (ou bytes em UTF-8, decodificados
+            na fase read)
+        engine: Motor de análise léxica (veja parser.LEXER_ENGINES)
+        trace_memory: Se as alocações são medidas
+        columnar: Se os tokens são registrados em um TokenStream
+        
+    Returns:
+        Stats com as fases read (somente para bytes), lex e parse
+    """
+    from cache import decode_source
+    from diagnostics import Diagnostics
+    from parser import ParserSession
+    
+    stats = Stats(trace_memory)
+    if isinstance(data, bytes):
+        with stats.phase('read'):
+            data = decode_source(data)
+    session = ParserSession(engine=engine, stats=stats)
+    with stats.phase('parse'):
+        session.parse_with_tokens(data, columnar, Diagnostics())
+    return stats
+
+
+@contextlib.contextmanager
+def profiled(path):
+    """
+    Executa o bloco with com o cProfile e o tracemalloc ativos e grava o
+    perfil em path e um snapshot das alocações em path + '.tracemalloc'.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        # O snapshot vem antes da gravação do perfil, que também aloca
+        tracemalloc.take_snapshot().dump(path + '.tracemalloc')
+        profiler.dump_stats(path)
+        if started:
+            tracemalloc.stop()
@@ -6,8 +6,17 @@ tokens do código fonte C, incluindo palavras-chave, identificadores,
 literais, operadores, delimitadores e tratamento de comentários.
 """
 
+import contextlib
+import hashlib
+import importlib
+import mmap
+import os
+import re
+import sys
+
 import ply.lex as lex
 from ast_nodes import *
+from diagnostics import LEXICAL, lexical_error, report
 
 
 # Lista de tokens reconhecidos pelo lexer
@@ -82,48 +91,65 @@ states = (
 t_ignore = ' \t'
 
 
+def string_value(text):
+    """Valor de um literal de string: remove as aspas e processa escapes básicos."""
+    return text[1:-1].replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
+
+
+def char_value(text):
+    """Valor de um literal de caractere: remove as aspas e processa escapes básicos."""
+    char = text[1:-1]
+    if len(char) == 1:
+        return char
+    elif char == '\\n':
+        return '\n'
+    elif char == '\\t':
+        return '\t'
+    elif char == "\\'":
+        return "'"
+    elif char == '\\\\':
+        return '\\'
+    return char
+
+
+# Os tokens cujo valor é convertido (números, strings e caracteres)
+# registram em endlexpos o deslocamento de fim do texto reconhecido,
+# usado para calcular as posições dos nós da AST.
 def t_IDENTIFIER(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
     # Verificar se é uma palavra-chave
     t.type = keywords.get(t.value, 'IDENTIFIER')
+    # Nomes internados: todas as ocorrências compartilham a mesma string,
+    # e as tabelas de símbolos as comparam pela identidade
+    t.value = sys.intern(t.value)
     return t
 
 
 def t_FLOAT_NUMBER(t):
     r'\d+\.\d+'
     t.value = float(t.value)
+    t.endlexpos = t.lexer.lexpos
     return t
 
 
 def t_INTEGER(t):
     r'\d+'
     t.value = int(t.value)
+    t.endlexpos = t.lexer.lexpos
     return t
 
 
 def t_STRING(t):
     r'"([^"\\]|\\.)*"'
-    # Remove as aspas e processa escapes básicos
-    t.value = t.value[1:-1].replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
+    t.value = string_value(t.value)
+    t.endlexpos = t.lexer.lexpos
     return t
 
 
 def t_CHAR(t):
     r"'([^'\\]|\\.)'"
-    # Remove as aspas e processa escapes básicos
-    char_value = t.value[1:-1]
-    if len(char_value) == 1:
-        t.value = char_value
-    elif char_value == '\\n':
-        t.value = '\n'
-    elif char_value == '\\t':
-        t.value = '\t'
-    elif char_value == "\\'":
-        t.value = "'"
-    elif char_value == '\\\\':
-        t.value = '\\'
-    else:
-        t.value = char_value
+    t.value = char_value(t.value)
+    t.endlexpos = t.lexer.lexpos
     return t
 
 
@@ -165,20 +191,148 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 
+# Caracteres que não iniciam nenhum token (nem espaço ou quebra de linha);
+# uma sequência deles é um único erro léxico
+INVALID_CHARS = r"""[^ \t\na-zA-Z0-9_+\-*/=!<>&|{}();,"']"""
+
+_invalid_run = re.compile(INVALID_CHARS + '+')
+
+
 # Tratamento de erros léxicos
+#
+# Os erros são registrados nos diagnósticos do lexer (atributo
+# diagnostics, definido pela sessão de análise) ou, na falta deles,
+# impressos. Uma sequência de caracteres inválidos é reportada e
+# ignorada de uma só vez.
 def t_error(t):
-    print(f"Erro léxico na linha {t.lineno}, posição {t.lexpos}: caractere inválido '{t.value[0]}'")
-    t.lexer.skip(1)
+    match = _invalid_run.match(t.value)
+    text = match.group() if match else t.value[0]
+    lexical_error(getattr(t.lexer, 'diagnostics', None), t.lineno, t.lexpos, text)
+    t.lexer.skip(len(text))
 
 
 # Tratamento de erros no estado de comentário
 def t_comment_error(t):
-    print(f"Erro léxico na linha {t.lineno}, posição {t.lexpos}: comentário não fechado")
+    report(getattr(t.lexer, 'diagnostics', None), LEXICAL,
+           f"Erro léxico na linha {t.lineno}, posição {t.lexpos}: comentário não fechado",
+           t.lineno, t.lexpos)
     t.lexer.skip(1)
 
 
-# Criar o lexer
-lexer = lex.lex()
+# Criação do lexer
+#
+# O lexer global é criado somente no primeiro uso (get_lexer() ou acesso a
+# lexer.lexer). Se existir uma tabela pré-gerada (lextab.py, gerada por
+# build_tables.py) correspondente às regras atuais, as expressões regulares
+# são carregadas dela, sem validar as regras; caso contrário, o lexer é
+# construído a partir das regras, sem gravar arquivos.
+LEXTAB = 'lextab'
+
+_lexer = None
+
+
+def rules_signature():
+    """
+    Calcula a assinatura das regras do lexer (tokens, estados e regras t_*),
+    usada para verificar se a tabela pré-gerada está atualizada.
+    
+    Returns:
+        Assinatura hexadecimal das regras
+    """
+    module = sys.modules[__name__]
+    functions = []
+    strings = []
+    for name, value in vars(module).items():
+        if not name.startswith('t_'):
+            continue
+        if callable(value):
+            functions.append((value.__code__.co_firstlineno, name, value.__doc__))
+        else:
+            strings.append((name, value))
+    # A ordem das funções (e não a linha em que estão) define a prioridade
+    functions = [(name, doc) for _, name, doc in sorted(functions)]
+    data = repr((tokens, states, functions, sorted(strings)))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _load_lextab():
+    """Retorna o módulo da tabela pré-gerada, ou None se ausente ou desatualizada."""
+    try:
+        lextab = importlib.import_module(LEXTAB)
+    except ImportError:
+        return None
+    if getattr(lextab, '_signature', None) != rules_signature():
+        return None
+    return lextab
+
+
+def get_lexer():
+    """
+    Obtém o lexer global, criando-o no primeiro uso.
+    
+    Returns:
+        Lexer global
+    """
+    global _lexer
+    if _lexer is None:
+        module = sys.modules[__name__]
+        lextab = _load_lextab()
+        if lextab is not None:
+            _lexer = lex.lex(module=module, optimize=True, lextab=lextab)
+        else:
+            _lexer = lex.lex(module=module)
+    return _lexer
+
+
+def write_lextab(outputdir):
+    """
+    Gera a tabela do lexer (lextab.py) a partir das regras atuais.
+    
+    Args:
+        outputdir: Diretório em que a tabela é gravada
+    """
+    lexer_obj = lex.lex(module=sys.modules[__name__])
+    lexer_obj.writetab(LEXTAB, outputdir)
+    with open(os.path.join(outputdir, LEXTAB + '.py'), 'a') as f:
+        f.write(f"_signature = {rules_signature()!r}\n")
+
+
+def __getattr__(name):
+    # Compatibilidade: lexer.lexer continua disponível, criado sob demanda
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def reset_lexer(lexer_obj, data):
+    """
+    Prepara um lexer para analisar um novo código fonte.
+    
+    Além de fornecer a entrada, reinicia o contador de linhas e o estado
+    (comentário de bloco), que o PLY preserva entre chamadas a input().
+    
+    Args:
+        lexer_obj: Lexer a ser preparado
+        data: String com o código fonte
+    """
+    lexer_obj.input(data)
+    lexer_obj.lineno = 1
+    lexer_obj.begin('INITIAL')
+
+
+def clone_lexer():
+    """
+    Cria um lexer independente do lexer global.
+    
+    O clone compartilha as expressões regulares já compiladas, mas tem
+    posição, linha e estado próprios, podendo ser usado em outra thread.
+    
+    Returns:
+        Novo lexer
+    """
+    clone = get_lexer().clone()
+    clone.lexstatestack = []
+    return clone
 
 
 def get_tokens(data):
@@ -191,10 +345,11 @@ def get_tokens(data):
     Returns:
         Lista de tuplas (tipo, valor, linha) para cada token identificado
     """
-    lexer.input(data)
+    lexer_obj = get_lexer()
+    reset_lexer(lexer_obj, data)
     tokens_list = []
     while True:
-        tok = lexer.token()
+        tok = lexer_obj.token()
         if not tok:
             break
         tokens_list.append((tok.type, tok.value, tok.lineno))
@@ -211,6 +366,126 @@ def tokenize(data):
     Returns:
         Lexer configurado com o código fonte
     """
-    lexer.input(data)
-    return lexer
+    lexer_obj = get_lexer()
+    reset_lexer(lexer_obj, data)
+    return lexer_obj
+
+
+# Tamanho aproximado (em bytes) dos blocos lidos por iter_tokens
+STREAM_CHUNK_SIZE = 1 << 20
 
+
+class _NeedMoreInput(Exception):
+    """Um literal pode continuar no próximo bloco da entrada."""
+
+
+@contextlib.contextmanager
+def _open_buffer(source):
+    """
+    Obtém um buffer de bytes para a entrada de iter_tokens.
+    
+    Caminhos e arquivos abertos são mapeados em memória (mmap), de modo
+    que o conteúdo é lido sob demanda pelo sistema operacional.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            with _open_buffer(f) as buf:
+                yield buf
+    elif hasattr(source, 'fileno'):
+        if os.fstat(source.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                yield buf
+    else:
+        yield source
+
+
+def iter_tokens(source, chunk_size=STREAM_CHUNK_SIZE, diagnostics=None):
+    """
+    Gera os tokens de um arquivo sob demanda, sem carregá-lo inteiro.
+    
+    O arquivo é mapeado em memória e tokenizado em blocos de linhas
+    completas, decodificados um de cada vez; o estado do lexer (linha e
+    comentário de bloco) é mantido entre os blocos. Um literal de string
+    ou caractere que continue após o fim de um bloco é tokenizado junto
+    com o bloco seguinte.
+    
+    As quebras de linha \\r\\n e \\r são convertidas para \\n, como na leitura
+    do arquivo em modo texto (e em cache.decode_source), e as posições
+    (lexpos) são relativas ao início desse texto, em caracteres: são as
+    mesmas de uma tokenização do arquivo inteiro lido com open(), mas, em
+    um arquivo com quebras \\r\\n, ficam atrás dos deslocamentos no arquivo
+    original em um caractere por quebra anterior.
+    
+    Args:
+        source: Caminho do arquivo, arquivo binário aberto ou buffer de
+            bytes (bytes, bytearray, mmap) em UTF-8
+        chunk_size: Tamanho aproximado dos blocos em bytes
+        diagnostics: Diagnostics em que os erros léxicos são registrados
+            (None: imprimir)
+            
+    Yields:
+        Tokens (LexToken) na ordem em que aparecem no código fonte
+    """
+    lexer_obj = clone_lexer()
+    lexer_obj.lineno = 1
+    lexer_obj.diagnostics = diagnostics
+    state = {'base': 0, 'last': False}
+    
+    def on_error(t):
+        # Aspas sem fechamento no bloco: o literal pode terminar no próximo
+        if t.value[0] in '"\'' and not state['last']:
+            raise _NeedMoreInput()
+        t.lexpos += state['base']
+        t_error(t)
+    
+    def on_comment_error(t):
+        t.lexpos += state['base']
+        t_comment_error(t)
+    
+    lexer_obj.lexstateerrorf = {'INITIAL': on_error, 'comment': on_comment_error}
+    lexer_obj.lexerrorf = on_error
+    
+    with _open_buffer(source) as buf:
+        # Páginas já tokenizadas do mapeamento são devolvidas ao sistema,
+        # para que não se acumulem na memória residente do processo
+        release = hasattr(mmap, 'MADV_DONTNEED') and isinstance(buf, mmap.mmap)
+        released = 0
+        size = len(buf)
+        pos = 0
+        pending = ''
+        while pos < size or pending:
+            # Ler um bloco terminado em quebra de linha (ou o restante do arquivo)
+            end = min(pos + chunk_size, size)
+            if end < size:
+                newline = buf.find(b'\n', end)
+                end = size if newline < 0 else newline + 1
+            data = bytes(buf[pos:end]).decode('utf-8')
+            text = pending + data.replace('\r\n', '\n').replace('\r', '\n')
+            pos = end
+            pending = ''
+            state['last'] = pos >= size
+            if release:
+                boundary = pos - pos % mmap.PAGESIZE
+                if boundary > released:
+                    buf.madvise(mmap.MADV_DONTNEED, released, boundary - released)
+                    released = boundary
+            
+            lexer_obj.input(text)
+            base = state['base']
+            while True:
+                try:
+                    tok = lexer_obj.token()
+                except _NeedMoreInput:
+                    # Retomar a partir das aspas junto com o próximo bloco
+                    pending = text[lexer_obj.lexpos:]
+                    state['base'] = base + lexer_obj.lexpos
+                    break
+                if tok is None:
+                    state['base'] = base + len(text)
+                    break
+                tok.lexpos += base
+                if hasattr(tok, 'endlexpos'):
+                    tok.endlexpos += base
+                yield tok
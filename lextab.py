@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN', 'CHAR', 'CHAR_TYPE', 'COMMA', 'DIVIDE', 'ELSE', 'EQ', 'FLOAT', 'FLOAT_NUMBER', 'FOR', 'GE', 'GT', 'IDENTIFIER', 'IF', 'INT', 'INTEGER', 'LBRACE', 'LE', 'LPAREN', 'LT', 'MINUS', 'MULTIPLY', 'NE', 'NOT', 'OR', 'PLUS', 'RBRACE', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'comment': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_FLOAT_NUMBER>\\d+\\.\\d+)|(?P<t_INTEGER>\\d+)|(?P<t_STRING>"([^"\\\\]|\\\\.)*")|(?P<t_CHAR>\'([^\'\\\\]|\\\\.)\')|(?P<t_COMMENT_LINE>//.*)|(?P<t_COMMENT_START>/\\*)|(?P<t_newline>\\n+)|(?P<t_OR>\\|\\|)|(?P<t_AND>&&)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_LBRACE>\\{)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_NE>!=)|(?P<t_PLUS>\\+)|(?P<t_RBRACE>\\})|(?P<t_RPAREN>\\))|(?P<t_ASSIGN>=)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_MINUS>-)|(?P<t_NOT>!)|(?P<t_SEMICOLON>;)', [None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_FLOAT_NUMBER', 'FLOAT_NUMBER'), ('t_INTEGER', 'INTEGER'), ('t_STRING', 'STRING'), None, ('t_CHAR', 'CHAR'), None, ('t_COMMENT_LINE', 'COMMENT_LINE'), ('t_COMMENT_START', 'COMMENT_START'), ('t_newline', 'newline'), (None, 'OR'), (None, 'AND'), (None, 'EQ'), (None, 'GE'), (None, 'LBRACE'), (None, 'LE'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'NE'), (None, 'PLUS'), (None, 'RBRACE'), (None, 'RPAREN'), (None, 'ASSIGN'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GT'), (None, 'LT'), (None, 'MINUS'), (None, 'NOT'), (None, 'SEMICOLON')])], 'comment': [('(?P<t_comment_COMMENT_END>\\*/)|(?P<t_comment_COMMENT_CONTENT>[^*]+)|(?P<t_comment_COMMENT_STAR>\\*)', [None, ('t_comment_COMMENT_END', 'COMMENT_END'), ('t_comment_COMMENT_CONTENT', 'COMMENT_CONTENT'), ('t_comment_COMMENT_STAR', 'COMMENT_STAR')])]}
+_lexstateignore = {'comment': ' \t\n', 'INITIAL': ' \t'}
+_lexstateerrorf = {'comment': 't_comment_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature = 'a2c52c76fbf5e30810829e0d4f28bdb07a4a09fd95fdaa5364b390be3fbe7e6b'
@@ -2,89 +2,264 @@
 Ponto de entrada do Analisador Léxico e Sintático para C.
 
 Este módulo lê um arquivo .c, executa a análise léxica e sintática,
-e exibe os resultados (lista de tokens e AST ou mensagens de erro).
+em uma única passagem sobre o código fonte e exibe os resultados
+(lista de tokens e AST ou mensagens de erro).
+
+Quando recebe vários arquivos, diretórios ou padrões glob, analisa os
+arquivos em paralelo (modo em lote) e exibe um resumo agregado.
 """
 
+import argparse
+import contextlib
+import glob
+import os
 import sys
-from lexer import get_tokens, tokenize
-from parser import parse
-from ast_printer import print_ast
+import time
+from batch import expand_paths, analyze_files, print_summary
+from cache import ASTCache, decode_source, parse_cached
+from diagnostics import Diagnostics
+from instrumentation import Stats, measure, profiled
+from lexer import iter_tokens
+import optimizer
+import semantic
+from output import (OUTPUT_FORMATS, OUTPUT_SECTIONS, OutputBuffer,
+                    make_report, write_batch_jsonl)
+from parser import ParserSession, LEXER_ENGINES
+
+
+def parse_args(argv):
+    """Interpreta os argumentos da linha de comando."""
+    arg_parser = argparse.ArgumentParser(
+        description="Analisador léxico e sintático para um subconjunto de C.")
+    arg_parser.add_argument('paths', nargs='*', metavar='arquivo.c',
+                            help="arquivos, diretórios ou padrões glob a analisar")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="processos usados no modo em lote (padrão: número de CPUs)")
+    arg_parser.add_argument('--slowest', type=int, default=10,
+                            help="quantidade de arquivos mais lentos no resumo (padrão: 10)")
+    arg_parser.add_argument('--stream', action='store_true',
+                            help="analisa um único arquivo em fluxo, sem carregá-lo inteiro na memória")
+    arg_parser.add_argument('--cache', metavar='DIR', default=None,
+                            help="diretório do cache persistente de análises")
+    arg_parser.add_argument('--cache-size', type=int, default=256, metavar='MB',
+                            help="tamanho máximo do cache em MB (padrão: 256)")
+    arg_parser.add_argument('--columnar', action='store_true',
+                            help="guarda os tokens em colunas compactas (TokenStream) em vez de tuplas")
+    arg_parser.add_argument('--lexer', choices=LEXER_ENGINES, default='ply',
+                            help="motor de análise léxica: ply (lexer.py) ou fast (fastlex.py); "
+                                 "o modo em fluxo sempre usa o ply (padrão: ply)")
+    arg_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='table',
+                            help="formato da saída: table (tabelas legíveis), jsonl (um objeto "
+                                 "JSON por linha) ou none (somente o código de saída) (padrão: table)")
+    arg_parser.add_argument('--only', choices=OUTPUT_SECTIONS, action='append', default=None,
+                            help="seção da saída de um arquivo a exibir; pode ser repetida "
+                                 "(padrão: tokens e ast)")
+    arg_parser.add_argument('--optimize', action='store_true',
+                            help="avalia as expressões constantes e elimina o código morto da AST "
+                                 "antes de exibi-la (somente para um único arquivo)")
+    arg_parser.add_argument('--check', action='store_true',
+                            help="executa a análise semântica (resolução de nomes e verificação "
+                                 "de tipos) após a análise sintática (somente para um único arquivo)")
+    arg_parser.add_argument('--stats', action='store_true',
+                            help="exibe o tempo e as alocações de cada fase, os tokens de cada tipo "
+                                 "e as reduções de cada regra (somente para um único arquivo)")
+    arg_parser.add_argument('--stats-time', action='store_true',
+                            help="como --stats, mas sem medir as alocações (menor custo)")
+    arg_parser.add_argument('--profile', metavar='ARQUIVO', default=None,
+                            help="grava um perfil do cProfile em ARQUIVO e um snapshot do "
+                                 "tracemalloc em ARQUIVO.tracemalloc")
+    return arg_parser.parse_args(argv)
 
 
 def main():
     """Função principal que orquestra a análise léxica e sintática."""
+    args = parse_args(sys.argv[1:])
     
     # Verificar se foi fornecido um arquivo como argumento
-    if len(sys.argv) < 2:
-        print("Uso: python main.py <arquivo.c>")
+    if not args.paths:
+        print("Uso: python main.py <arquivo.c> [arquivo.c | diretório | padrão ...]")
+        sys.exit(1)
+    
+    # Toda a saída passa por um único buffer, escrito em blocos
+    out = OutputBuffer(sys.stdout)
+    try:
+        with profiled(args.profile) if args.profile else contextlib.nullcontext():
+            run(args, out)
+    finally:
+        out.flush()
+
+
+def run(args, out):
+    """Executa a análise pedida na linha de comando, escrevendo em out."""
+    # Um único arquivo: exibir a análise detalhada
+    if len(args.paths) == 1:
+        path = args.paths[0]
+        if args.stream:
+            analyze_stream(path, args, out)
+            return
+        if not os.path.isdir(path) and not glob.has_magic(path):
+            analyze_single(path, args, out)
+            return
+    
+    paths = expand_paths(args.paths)
+    if not paths:
+        out.write("Erro: nenhum arquivo .c encontrado.\n")
         sys.exit(1)
     
-    filename = sys.argv[1]
+    start = time.perf_counter()
+    results = analyze_files(paths, workers=args.workers, cache_dir=args.cache,
+                            cache_bytes=args.cache_size * 1024 * 1024, engine=args.lexer)
+    if args.format == 'table':
+        print_summary(out, results, time.perf_counter() - start, args.slowest,
+                      show_cache=args.cache is not None)
+    elif args.format == 'jsonl':
+        write_batch_jsonl(out, results, time.perf_counter() - start)
+    
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+
+def analyze_single(filename, args, out):
+    """Analisa um único arquivo, exibindo tokens e AST."""
+    stats = make_stats(args)
     
     # Ler o arquivo fonte
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            code = f.read()
+        with measure(stats, 'read'), open(filename, 'rb') as f:
+            source = f.read()
     except FileNotFoundError:
-        print(f"Erro: Arquivo '{filename}' não encontrado.")
+        out.write(f"Erro: Arquivo '{filename}' não encontrado.\n")
         sys.exit(1)
     except Exception as e:
-        print(f"Erro ao ler o arquivo: {e}")
+        out.write(f"Erro ao ler o arquivo: {e}\n")
         sys.exit(1)
     
-    print("=" * 70)
-    print("ANÁLISE LÉXICA")
-    print("=" * 70)
-    
-    # Executar análise léxica e gerar lista de tokens
+    # Executar análises léxica e sintática em uma única passagem
+    # (ou obter o resultado do cache, se habilitado)
+    cache = None
+    if args.cache:
+        cache = ASTCache(args.cache, args.cache_size * 1024 * 1024)
     try:
-        tokens_list = get_tokens(code)
-        
-        if not tokens_list:
-            print("Nenhum token identificado.")
-        else:
-            print(f"\nTotal de tokens identificados: {len(tokens_list)}\n")
-            print(f"{'Tipo':<20} {'Valor':<30} {'Linha':<10}")
-            print("-" * 70)
-            for token_type, token_value, token_line in tokens_list:
-                # Formatar o valor para exibição
-                if isinstance(token_value, str):
-                    # Limitar tamanho de strings longas
-                    display_value = token_value if len(token_value) <= 30 else token_value[:27] + "..."
-                else:
-                    display_value = str(token_value)
-                print(f"{token_type:<20} {display_value:<30} {token_line:<10}")
+        with measure(stats, 'parse'):
+            tokens_list, ast, messages, cached = parse_cached(
+                source, cache, ParserSession(engine=args.lexer, stats=stats),
+                columnar=args.columnar)
+    except UnicodeDecodeError as e:
+        out.write(f"Erro ao ler o arquivo: {e}\n")
+        sys.exit(1)
     except Exception as e:
-        print(f"Erro durante a análise léxica: {e}")
+        out.write(f"Erro durante a análise: {e}\n")
         sys.exit(1)
+    if cache is None:
+        cached = None
     
-    print("\n" + "=" * 70)
-    print("ANÁLISE SINTÁTICA")
-    print("=" * 70)
+    report = make_report(args.format, out, args.only)
+    with measure(stats, 'print'):
+        report.start(cached, cache.directory if cache is not None else None)
+        
+        # Exibir as mensagens de erro emitidas durante a análise
+        for message in messages:
+            report.message(message)
+        
+        # Exibir a lista de tokens
+        try:
+            report.begin_tokens(len(tokens_list))
+            report.tokens(tokens_list)
+            report.end_tokens(len(tokens_list))
+        except Exception as e:
+            out.write(f"Erro durante a análise léxica: {e}\n")
+            sys.exit(1)
+    
+    report_syntax_result(report, out, filename, len(tokens_list), ast, len(messages), cached,
+                         args.optimize, args.check, source, stats)
+
+
+def analyze_stream(filename, args, out):
+    """
+    Analisa um único arquivo em fluxo, exibindo os tokens à medida que
+    são lidos e consumidos pelo parser, sem carregar o arquivo inteiro.
+    """
+    if not os.path.isfile(filename):
+        out.write(f"Erro: Arquivo '{filename}' não encontrado.\n")
+        sys.exit(1)
+    
+    stats = make_stats(args)
+    report = make_report(args.format, out, args.only, stream=True)
+    report.start()
+    report.begin_tokens()
+    
+    count = 0
+    # As mensagens de erro aparecem junto aos tokens em que ocorreram
+    diagnostics = Diagnostics(callback=lambda d: report.message(d.message))
+    
+    def reported_tokens():
+        nonlocal count
+        token = report.token if report.show_tokens else None
+        for tok in iter_tokens(filename, diagnostics=diagnostics):
+            if token is not None:
+                token(tok.type, tok.value, tok.lineno)
+            count += 1
+            yield tok
     
-    # Executar análise sintática
     try:
-        ast = parse(code)
-        
-        if ast is not None:
-            print("\n[OK] Analise sintatica concluida com sucesso!")
-            print("\nARVORE DE SINTAXE ABSTRATA (AST):")
-            print("=" * 70)
-            print("\nRepresentacao hierarquica:")
-            print("-" * 70)
-            print_ast(ast)
-            print("\n" + "-" * 70)
-            print("\nRepresentacao completa (__repr__):")
-            print("-" * 70)
-            print(ast)
-        else:
-            print("\n[ERRO] Erro durante a analise sintatica.")
+        with measure(stats, 'parse'):
+            ast = ParserSession(stats=stats).parse_tokens(reported_tokens(), diagnostics)
+    except (OSError, UnicodeDecodeError) as e:
+        out.write(f"Erro ao ler o arquivo: {e}\n")
+        sys.exit(1)
+    
+    messages = diagnostics.messages()
+    if diagnostics.omitted:
+        report.message(messages[-1])
+    report.end_tokens(count)
+    report_syntax_result(report, out, filename, count, ast, len(messages), optimize=args.optimize,
+                         check=args.check, stats=stats)
+
+
+def make_stats(args):
+    """Stats (instrumentation.py) pedido por --stats, ou None."""
+    if not args.stats and not args.stats_time:
+        return None
+    return Stats(trace_memory=not args.stats_time)
+
+
+def report_syntax_result(report, out, filename, tokens, ast, errors, cached=None, optimize=False,
+                         check=False, source=None, stats=None):
+    """
+    Exibe o resultado da análise sintática (AST ou mensagem de erro) e o
+    resumo; termina com código 1 se a análise sintática falhou. Com
+    check, a análise semântica (semantic.py) é executada antes e também
+    termina com código 1 se encontrar erros; source (o conteúdo do arquivo,
+    se disponível) permite informar a linha de cada erro. Com optimize, a
+    AST é otimizada (optimizer.py) antes de ser exibida. Com stats, cada
+    fase é medida e as estatísticas são exibidas ao final.
+    """
+    semantic_errors = 0
+    if check and ast is not None:
+        diagnostics = Diagnostics()
+        with measure(stats, 'check'):
+            text = decode_source(source) if source is not None else None
+            analysis = semantic.analyze(ast, diagnostics, text)
+        report.semantic(analysis, diagnostics.messages())
+        semantic_errors = analysis.errors
+        errors += semantic_errors
+    if optimize and ast is not None:
+        with measure(stats, 'optimize'):
+            result = optimizer.optimize(ast)
+        ast = result.ast
+        report.optimization(result)
+    with measure(stats, 'print'):
+        try:
+            report.syntax(ast)
+        except Exception as e:
+            out.write(f"\n[ERRO] Erro durante a analise sintatica: {e}\n")
             sys.exit(1)
-    except Exception as e:
-        print(f"\n[ERRO] Erro durante a analise sintatica: {e}")
+        report.summary(filename, tokens, ast, errors, cached)
+    if stats is not None:
+        report.stats(stats)
+    if ast is None or semantic_errors:
         sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,252 @@
+"""
+Módulo de otimização da AST.
+
+Aplica, em um único percurso da AST (em pós-ordem e sem recursão):
+
+- avaliação de expressões constantes: BinOp e UnaryOp cujos operandos
+  são Number ou Char (inclusive os resultantes de avaliações anteriores)
+  são substituídos por um Number, com a semântica de C usada pela
+  máquina virtual (vm.py): int de 32 bits com divisão truncada, char
+  promovido a int e float de precisão simples. Divisões inteiras por
+  zero não são avaliadas;
+- eliminação de código morto: IfStatement com condição constante é
+  substituído pelo ramo executado, WhileStatement com condição falsa é
+  removido e os comandos após um ReturnStatement em um Block são
+  descartados.
+
+A AST é alterada no lugar. O resultado informa quantos nós foram
+eliminados (a diferença entre os tamanhos da AST antes e depois).
+"""
+
+from collections import namedtuple
+
+from ast_nodes import (ASTNode, BinOp, Block, Char, IfStatement, Number, ReturnStatement,
+                       UnaryOp, WhileStatement)
+from vm import char_code, float_div, int_div, to_char, to_float, to_int
+
+
+class OptimizationResult(namedtuple('OptimizationResult', 'ast nodes eliminated folded pruned')):
+    """
+    Resultado da otimização.
+    
+    Attributes:
+        ast: AST otimizada
+        nodes: Quantidade de nós da AST antes da otimização
+        eliminated: Quantidade de nós eliminados
+        folded: Quantidade de expressões constantes avaliadas
+        pruned: Quantidade de comandos ou ramos removidos
+    """
+    
+    __slots__ = ()
+
+
+# Etapas do percurso
+_ENTER = 0
+_EXIT = 1
+_EXIT_STATEMENTS = 2  # lista de comandos de um Block
+
+
+def _constant(node):
+    """Valor (int ou float) de um Number ou Char, ou None se não for constante."""
+    node_type = type(node)
+    if node_type is Number:
+        value = node.value
+        return to_float(value) if isinstance(value, float) else to_int(value)
+    if node_type is Char:
+        code = char_code(node.value)
+        return None if code is None else to_char(code)
+    return None
+
+
+def _fold_binary(op, a, b):
+    """Resultado de a op b, ou None se não puder ser avaliado."""
+    if op == '&&':
+        return 1 if a and b else 0
+    if op == '||':
+        return 1 if a or b else 0
+    if isinstance(a, float) or isinstance(b, float):
+        a = to_float(a)
+        b = to_float(b)
+        if op == '+':
+            return to_float(a + b)
+        if op == '-':
+            return to_float(a - b)
+        if op == '*':
+            return to_float(a * b)
+        if op == '/':
+            return float_div(a, b)
+    elif op == '+':
+        return to_int(a + b)
+    elif op == '-':
+        return to_int(a - b)
+    elif op == '*':
+        return to_int(a * b)
+    elif op == '/':
+        # A divisão por zero fica para a execução
+        return int_div(a, b) if b else None
+    if op == '<':
+        return 1 if a < b else 0
+    if op == '<=':
+        return 1 if a <= b else 0
+    if op == '>':
+        return 1 if a > b else 0
+    if op == '>=':
+        return 1 if a >= b else 0
+    if op == '==':
+        return 1 if a == b else 0
+    if op == '!=':
+        return 1 if a != b else 0
+    return None
+
+
+class _Optimizer:
+    """Estado de uma otimização (veja optimize)."""
+    
+    def __init__(self):
+        self.nodes = 0
+        self.folded = 0
+        self.pruned = 0
+        # Blocos vazios que substituem comandos removidos, por id; são
+        # descartados das listas de comandos (e mantidos aqui para que seus
+        # ids não sejam reaproveitados durante o percurso)
+        self.removed = {}
+    
+    def run(self, ast):
+        """
+        Percorre a AST em pós-ordem, reconstruindo cada nó após seus filhos.
+        
+        Returns:
+            Tupla (AST otimizada, quantidade de nós dela)
+        """
+        # Valores já processados e a quantidade de nós de cada um
+        results = []
+        stack = [(ast, _ENTER)]
+        while stack:
+            value, step = stack.pop()
+            if step == _ENTER:
+                if isinstance(value, ASTNode):
+                    self.nodes += 1
+                    stack.append((value, _EXIT))
+                    if isinstance(value, Block):
+                        stack.append((value.statements, _EXIT_STATEMENTS))
+                        stack.extend((item, _ENTER) for item in reversed(value.statements))
+                    else:
+                        stack.extend((getattr(value, name), _ENTER) for name in reversed(value._fields))
+                elif isinstance(value, (list, tuple)):
+                    stack.append((value, _EXIT))
+                    stack.extend((item, _ENTER) for item in reversed(value))
+                else:
+                    results.append((value, 0))
+            elif step == _EXIT_STATEMENTS:
+                results.append(self._statements(results, len(value)))
+            elif isinstance(value, ASTNode):
+                fields = value._fields
+                sizes = ()
+                if fields:
+                    children = results[-len(fields):]
+                    del results[-len(fields):]
+                    for name, (child, _) in zip(fields, children):
+                        setattr(value, name, child)
+                    sizes = [child_size for _, child_size in children]
+                results.append(self._node(value, sizes))
+            else:
+                count = len(value)
+                items = results[len(results) - count:]
+                del results[len(results) - count:]
+                items_value = [item for item, _ in items]
+                results.append((items_value if isinstance(value, list) else tuple(items_value),
+                                sum(item_size for _, item_size in items)))
+        return results.pop()
+    
+    def _statements(self, results, count):
+        """
+        Lista de comandos de um Block: descarta os comandos removidos e os
+        que seguem um return.
+        """
+        items = results[len(results) - count:]
+        del results[len(results) - count:]
+        statements = []
+        size = 0
+        for index, (statement, statement_size) in enumerate(items):
+            if id(statement) in self.removed:
+                continue
+            statements.append(statement)
+            size += statement_size
+            if type(statement) is ReturnStatement:
+                self.pruned += len(items) - index - 1
+                break
+        return statements, size
+    
+    def _node(self, node, sizes):
+        """
+        Nó otimizado (com os filhos já otimizados) e seu tamanho.
+        
+        Args:
+            node: Nó cujos campos já foram otimizados
+            sizes: Tamanho de cada campo, na ordem de _fields
+        """
+        node_type = type(node)
+        if node_type is BinOp:
+            left = _constant(node.left)
+            if left is not None:
+                right = _constant(node.right)
+                if right is not None:
+                    value = _fold_binary(node.op, left, right)
+                elif node.op == '&&' and not left:
+                    value = 0
+                elif node.op == '||' and left:
+                    value = 1
+                else:
+                    value = None
+                if value is not None:
+                    self.folded += 1
+                    return Number(value, node.start, node.end), 1
+        elif node_type is UnaryOp:
+            operand = _constant(node.operand)
+            if operand is not None:
+                if node.op == '!':
+                    value = 0 if operand else 1
+                else:
+                    value = -operand if isinstance(operand, float) else to_int(-operand)
+                self.folded += 1
+                return Number(value, node.start, node.end), 1
+        elif node_type is IfStatement:
+            condition = _constant(node.condition)
+            if condition is not None:
+                self.pruned += 1
+                # Campos: condition, then_block, else_block
+                if condition:
+                    branch, branch_size = node.then_block, sizes[1]
+                else:
+                    branch, branch_size = node.else_block, sizes[2]
+                if branch is not None:
+                    return branch, branch_size
+                return self._removed(node), 1
+        elif node_type is WhileStatement:
+            condition = _constant(node.condition)
+            if condition is not None and not condition:
+                self.pruned += 1
+                return self._removed(node), 1
+        return node, 1 + sum(sizes)
+    
+    def _removed(self, node):
+        """Bloco vazio que ocupa o lugar de um comando removido."""
+        block = Block([], node.start, node.end)
+        self.removed[id(block)] = block
+        return block
+
+
+def optimize(ast):
+    """
+    Avalia as expressões constantes e elimina o código morto de uma AST.
+    
+    Args:
+        ast: AST (lista de declarações devolvida por parser.parse) ou nó
+        
+    Returns:
+        OptimizationResult com a AST otimizada e as contagens
+    """
+    optimizer = _Optimizer()
+    result, size = optimizer.run(ast)
+    return OptimizationResult(result, optimizer.nodes, optimizer.nodes - size,
+                              optimizer.folded, optimizer.pruned)
@@ -0,0 +1,422 @@
+"""
+Módulo de saída dos resultados da análise.
+
+Toda a saída de main.py passa por um único OutputBuffer, que acumula o
+texto e o envia ao stream de saída em blocos grandes, em vez de uma
+chamada de print() (e uma escrita no terminal ou pipe) por linha.
+
+Os relatórios formatam os resultados:
+
+- TableReport: tabela de tokens e AST, o formato legível original
+- JsonlReport: JSON Lines, um objeto JSON por linha, escrito à medida
+  que os tokens e os nós são produzidos, para consumo incremental
+- Report: não escreve nada (somente o código de saída importa)
+
+Cada relatório escreve apenas as seções escolhidas (tokens, ast e
+summary).
+"""
+
+import json
+
+from ast_nodes import ASTNode, iter_nodes, write_repr
+from ast_printer import print_ast
+
+
+OUTPUT_FORMATS = ('table', 'jsonl', 'none')
+OUTPUT_SECTIONS = ('tokens', 'ast', 'summary')
+DEFAULT_SECTIONS = ('tokens', 'ast')
+
+# Tamanho (em caracteres) acumulado antes de cada escrita no stream
+BUFFER_SIZE = 64 * 1024
+
+
+class OutputBuffer:
+    """
+    Buffer de texto com a interface de escrita de um arquivo.
+    
+    Attributes:
+        stream: Arquivo de texto de destino
+        limit: Quantidade de caracteres acumulados antes de escrever
+    """
+    
+    __slots__ = ('stream', 'limit', '_parts', '_size')
+    
+    def __init__(self, stream, limit=BUFFER_SIZE):
+        self.stream = stream
+        self.limit = limit
+        self._parts = []
+        self._size = 0
+    
+    def write(self, text):
+        """Acrescenta texto ao buffer, escrevendo-o quando atinge o limite."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.limit:
+            self._drain()
+        return len(text)
+    
+    def _drain(self):
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+    
+    def flush(self):
+        """Escreve o texto acumulado e esvazia o buffer do stream."""
+        self._drain()
+        self.stream.flush()
+
+
+def iter_json(value, chunk_size=1024):
+    """
+    Gera, sem recursão, os trechos do JSON de um valor da AST.
+    
+    Cada nó é um objeto com o nome da classe em "node" e um membro por
+    campo de _fields; listas e tuplas são arrays e os demais valores
+    são convertidos por json.dumps.
+    
+    Args:
+        value: Nó da AST, lista, tupla ou valor simples
+        chunk_size: Quantidade aproximada de partes reunidas em cada trecho
+        
+    Yields:
+        Trechos consecutivos do JSON
+    """
+    parts = []
+    out = parts.append
+    stack = [_json_item(value)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        item = pop()
+        if type(item) is str:
+            # Texto JSON pronto (valores simples já convertidos)
+            out(item)
+        elif isinstance(item, ASTNode):
+            push("}")
+            fields = item._fields
+            for i in range(len(fields) - 1, -1, -1):
+                push(_json_item(getattr(item, fields[i])))
+                push(f', "{fields[i]}": ')
+            out(f'{{"node": "{type(item).__name__}"')
+        else:
+            push("]")
+            for i in range(len(item) - 1, -1, -1):
+                push(_json_item(item[i]))
+                if i:
+                    push(", ")
+            out("[")
+        if len(parts) >= chunk_size:
+            yield "".join(parts)
+            parts.clear()
+    if parts:
+        yield "".join(parts)
+
+
+def _json_item(value):
+    """Item da pilha de iter_json: nós e sequências, ou o JSON de value."""
+    if isinstance(value, (ASTNode, list, tuple)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_json_line(stream, record):
+    """Escreve um objeto JSON (dicionário simples) em uma linha."""
+    stream.write(json.dumps(record, ensure_ascii=False))
+    stream.write("\n")
+
+
+class Report:
+    """
+    Relatório dos resultados de um arquivo; esta classe base não
+    escreve nada (formato none).
+    
+    Os métodos são chamados na ordem: start, message (a qualquer
+    momento), begin_tokens, token (para cada token), end_tokens,
+    semantic (somente com --check), optimization (somente com
+    --optimize), syntax, summary e stats (somente com --stats).
+    
+    Attributes:
+        out: Arquivo de texto de saída (em geral, um OutputBuffer)
+        sections: Seções a escrever (subconjunto de OUTPUT_SECTIONS)
+    """
+    
+    def __init__(self, out, sections=DEFAULT_SECTIONS):
+        self.out = out
+        self.sections = frozenset(sections)
+        self.show_tokens = 'tokens' in self.sections
+    
+    def start(self, cached=None, cache_dir=None):
+        """
+        Início do relatório.
+        
+        Args:
+            cached: Se o resultado veio do cache (None sem cache)
+            cache_dir: Diretório do cache
+        """
+    
+    def message(self, text):
+        """Mensagem de erro emitida durante a análise."""
+    
+    def begin_tokens(self, count=None):
+        """Início da lista de tokens (count é None se ainda desconhecido)."""
+    
+    def token(self, token_type, token_value, token_line):
+        """Um token da lista."""
+    
+    def tokens(self, tokens_list):
+        """Todos os tokens de uma lista de tuplas (tipo, valor, linha)."""
+        if self.show_tokens:
+            token = self.token
+            for token_type, token_value, token_line in tokens_list:
+                token(token_type, token_value, token_line)
+    
+    def end_tokens(self, count):
+        """Fim da lista de tokens, com a quantidade total."""
+    
+    def semantic(self, analysis, messages):
+        """
+        Resultado da análise semântica (semantic.Analysis) e as mensagens
+        de erro dela.
+        """
+        for text in messages:
+            self.message(text)
+    
+    def optimization(self, result):
+        """Resultado da otimização da AST (optimizer.OptimizationResult)."""
+    
+    def syntax(self, ast):
+        """Resultado da análise sintática (AST ou None em caso de erro)."""
+    
+    def summary(self, filename, tokens, ast, errors, cached=None):
+        """Resumo da análise do arquivo."""
+    
+    def stats(self, stats):
+        """Estatísticas da análise (instrumentation.Stats), com --stats."""
+
+
+class TableReport(Report):
+    """Relatório em tabela, no formato legível original."""
+    
+    def start(self, cached=None, cache_dir=None):
+        out = self.out
+        if cached is not None:
+            out.write(f"Cache: {'acerto' if cached else 'falha'} ({cache_dir})\n")
+        if self.show_tokens:
+            out.write("=" * 70 + "\nANÁLISE LÉXICA\n" + "=" * 70 + "\n")
+    
+    def message(self, text):
+        self.out.write(text + "\n")
+    
+    def begin_tokens(self, count=None):
+        if not self.show_tokens:
+            return
+        out = self.out
+        if count is None:
+            out.write("\n")
+        elif not count:
+            out.write("Nenhum token identificado.\n")
+            return
+        else:
+            out.write(f"\nTotal de tokens identificados: {count}\n\n")
+        out.write(f"{'Tipo':<20} {'Valor':<30} {'Linha':<10}\n")
+        out.write("-" * 70 + "\n")
+    
+    def token(self, token_type, token_value, token_line):
+        self.out.write(format_token_row(token_type, token_value, token_line) + "\n")
+    
+    def tokens(self, tokens_list):
+        if self.show_tokens:
+            write = self.out.write
+            for token_type, token_value, token_line in tokens_list:
+                write(format_token_row(token_type, token_value, token_line) + "\n")
+    
+    def end_tokens(self, count):
+        # Na análise em fluxo, o total só é conhecido no fim
+        pass
+    
+    def semantic(self, analysis, messages):
+        self.out.write(f"\nAnálise semântica: {len(analysis.resolutions)} nomes resolvidos, "
+                       f"{analysis.errors} erro(s)\n")
+        super().semantic(analysis, messages)
+    
+    def optimization(self, result):
+        if 'ast' in self.sections or 'summary' in self.sections:
+            self.out.write(f"\nOtimização: {result.eliminated} de {result.nodes} nós eliminados "
+                           f"({result.folded} expressões constantes avaliadas, "
+                           f"{result.pruned} comandos removidos)\n")
+    
+    def syntax(self, ast):
+        if 'ast' not in self.sections:
+            return
+        out = self.out
+        out.write("\n" + "=" * 70 + "\nANÁLISE SINTÁTICA\n" + "=" * 70 + "\n")
+        if ast is None:
+            out.write("\n[ERRO] Erro durante a analise sintatica.\n")
+            return
+        out.write("\n[OK] Analise sintatica concluida com sucesso!\n")
+        out.write("\nARVORE DE SINTAXE ABSTRATA (AST):\n")
+        out.write("=" * 70 + "\n")
+        out.write("\nRepresentacao hierarquica:\n")
+        out.write("-" * 70 + "\n")
+        print_ast(ast, stream=out)
+        out.write("\n" + "-" * 70 + "\n")
+        out.write("\nRepresentacao completa (__repr__):\n")
+        out.write("-" * 70 + "\n")
+        write_repr(ast, out)
+        out.write("\n")
+    
+    def summary(self, filename, tokens, ast, errors, cached=None):
+        if 'summary' not in self.sections:
+            return
+        nodes = sum(1 for _ in iter_nodes(ast)) if ast is not None else 0
+        out = self.out
+        out.write("\n" + "=" * 70 + "\nRESUMO\n" + "=" * 70 + "\n")
+        out.write(f"Arquivo:             {filename}\n")
+        out.write(f"Resultado:           {'OK' if ast is not None and not errors else 'ERRO'}\n")
+        out.write(f"Tokens:              {tokens}\n")
+        out.write(f"Nós da AST:          {nodes}\n")
+        out.write(f"Mensagens de erro:   {errors}\n")
+    
+    def stats(self, stats):
+        self.out.write("\n" + stats.format())
+
+
+class StreamTableReport(TableReport):
+    """
+    Relatório em tabela da análise em fluxo: o cabeçalho da lista de
+    tokens vem antes dos tokens e o total, no fim.
+    """
+    
+    def end_tokens(self, count):
+        if not self.show_tokens:
+            return
+        if count:
+            self.out.write(f"\nTotal de tokens identificados: {count}\n")
+        else:
+            self.out.write("Nenhum token identificado.\n")
+
+
+class JsonlReport(Report):
+    """
+    Relatório em JSON Lines. Cada linha é um objeto com o membro "type":
+    
+    - message: {"type": "message", "text": ...}
+    - token: {"type": "token", "token": ..., "value": ..., "line": ...}
+    - node: {"type": "node", "index": ..., "node": {...}}, um para cada
+      declaração de primeiro nível da AST
+    - semantic: {"type": "semantic", "resolved": ..., "errors": ...},
+      somente com --check (precedido das mensagens de erro)
+    - optimize: {"type": "optimize", "nodes": ..., "eliminated": ...,
+      "folded": ..., "pruned": ...}, somente com --optimize
+    - syntax: {"type": "syntax", "ok": ...}
+    - summary: {"type": "summary", "file": ..., "ok": ..., "tokens": ...,
+      "nodes": ..., "errors": ..., "cached": ...}
+    """
+    
+    def message(self, text):
+        write_json_line(self.out, {"type": "message", "text": text})
+    
+    def token(self, token_type, token_value, token_line):
+        self.out.write(f'{{"type": "token", "token": "{token_type}", '
+                       f'"value": {json.dumps(token_value, ensure_ascii=False)}, '
+                       f'"line": {token_line}}}\n')
+    
+    def tokens(self, tokens_list):
+        if self.show_tokens:
+            write = self.out.write
+            dumps = json.dumps
+            for token_type, token_value, token_line in tokens_list:
+                write(f'{{"type": "token", "token": "{token_type}", '
+                      f'"value": {dumps(token_value, ensure_ascii=False)}, "line": {token_line}}}\n')
+    
+    def semantic(self, analysis, messages):
+        super().semantic(analysis, messages)
+        write_json_line(self.out, {"type": "semantic", "resolved": len(analysis.resolutions),
+                                   "errors": analysis.errors})
+    
+    def optimization(self, result):
+        if 'ast' in self.sections or 'summary' in self.sections:
+            write_json_line(self.out, {
+                "type": "optimize", "nodes": result.nodes, "eliminated": result.eliminated,
+                "folded": result.folded, "pruned": result.pruned,
+            })
+    
+    def syntax(self, ast):
+        if 'ast' not in self.sections:
+            return
+        out = self.out
+        if ast is not None:
+            for i, node in enumerate(ast if isinstance(ast, list) else [ast]):
+                out.write(f'{{"type": "node", "index": {i}, "node": ')
+                for chunk in iter_json(node):
+                    out.write(chunk)
+                out.write("}\n")
+        out.write(f'{{"type": "syntax", "ok": {"true" if ast is not None else "false"}}}\n')
+    
+    def summary(self, filename, tokens, ast, errors, cached=None):
+        if 'summary' not in self.sections:
+            return
+        nodes = sum(1 for _ in iter_nodes(ast)) if ast is not None else 0
+        write_json_line(self.out, {
+            "type": "summary", "file": filename, "ok": ast is not None and not errors,
+            "tokens": tokens, "nodes": nodes, "errors": errors, "cached": cached,
+        })
+    
+    def stats(self, stats):
+        write_json_line(self.out, dict(type="stats", **stats.to_dict()))
+
+
+def make_report(output_format, out, sections=None, stream=False):
+    """
+    Cria o relatório de um formato de saída.
+    
+    Args:
+        output_format: Formato (um de OUTPUT_FORMATS)
+        out: Arquivo de texto de saída
+        sections: Seções a escrever (por padrão, DEFAULT_SECTIONS)
+        stream: Se True, o relatório é da análise em fluxo
+        
+    Returns:
+        Instância de Report
+    """
+    if sections is None:
+        sections = DEFAULT_SECTIONS
+    if output_format == 'table':
+        return (StreamTableReport if stream else TableReport)(out, sections)
+    if output_format == 'jsonl':
+        return JsonlReport(out, sections)
+    return Report(out, sections)
+
+
+def format_token_row(token_type, token_value, token_line):
+    """Formata uma linha da tabela de tokens."""
+    # Formatar o valor para exibição
+    if isinstance(token_value, str):
+        # Limitar tamanho de strings longas
+        display_value = token_value if len(token_value) <= 30 else token_value[:27] + "..."
+    else:
+        display_value = str(token_value)
+    return f"{token_type:<20} {display_value:<30} {token_line:<10}"
+
+
+def write_batch_jsonl(out, results, total_time):
+    """
+    Escreve os resultados de uma análise em lote em JSON Lines: um
+    objeto "file" por arquivo e um objeto "batch" com os totais.
+    
+    Args:
+        out: Arquivo de texto de saída
+        results: Lista de FileResult
+        total_time: Tempo total de execução (segundos)
+    """
+    for r in results:
+        write_json_line(out, {
+            "type": "file", "file": r.path, "ok": r.ok, "tokens": r.tokens, "nodes": r.nodes,
+            "elapsed": round(r.elapsed, 6), "cached": r.cached, "messages": r.messages,
+        })
+    write_json_line(out, {
+        "type": "batch", "files": len(results), "ok": sum(1 for r in results if r.ok),
+        "tokens": sum(r.tokens for r in results), "nodes": sum(r.nodes for r in results),
+        "elapsed": round(total_time, 6),
+    })
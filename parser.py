@@ -6,8 +6,21 @@ a estrutura do código fonte conforme as regras gramaticais da linguagem C
 e construir uma Árvore de Sintaxe Abstrata (AST).
 """
 
+import contextlib
+import copy
+import functools
+import itertools
+import queue
+import sys
+import threading
+import warnings
+
 import ply.yacc as yacc
-from lexer import tokens, lexer
+from lexer import tokens, clone_lexer, reset_lexer
+import fastlex
+from fastlex import FastToken
+from diagnostics import SYNTAX, Diagnostics, print_diagnostic, report, syntax_error
+from tokenstream import TokenStream
 from ast_nodes import *
 
 
@@ -24,6 +37,32 @@ precedence = (
 )
 
 
+# Posições no código fonte
+#
+# Os nós da AST recebem os deslocamentos de início e fim (exclusivo) a
+# partir do lexpos dos tokens. Para símbolos não terminais, o início e o
+# fim são obtidos dos nós filhos ou registrados explicitamente no símbolo.
+def _start(p, n):
+    """Deslocamento de início do símbolo p[n]."""
+    value = p[n]
+    if isinstance(value, ASTNode):
+        return value.start
+    return p.lexpos(n)
+
+
+def _end(p, n):
+    """Deslocamento de fim (exclusivo) do símbolo p[n]."""
+    sym = p.slice[n]
+    end = getattr(sym, 'endlexpos', None)
+    if end is not None:
+        return end
+    value = sym.value
+    if isinstance(value, ASTNode):
+        return value.end
+    # Token cujo valor é o próprio texto reconhecido
+    return sym.lexpos + len(value)
+
+
 # Regra inicial: programa é uma lista de declarações
 def p_program(p):
     """program : declarations"""
@@ -33,43 +72,61 @@ def p_program(p):
 def p_declarations(p):
     """declarations : declarations declaration
                     | declaration"""
+    # A lista é estendida no lugar (O(1) amortizado por elemento)
     if len(p) == 3:
-        # Se declaration é uma lista (declaração com inicialização), expandir
-        if isinstance(p[2], list):
-            p[0] = p[1] + p[2]
-        else:
-            p[0] = p[1] + [p[2]]
+        declarations = p[1]
+        declaration = p[2]
     else:
-        # Se declaration é uma lista, retornar como está
-        if isinstance(p[1], list):
-            p[0] = p[1]
-        else:
-            p[0] = [p[1]]
+        declarations = []
+        declaration = p[1]
+    # Se declaration é uma tupla (declaração com inicialização), expandir;
+    # declarações com erro de sintaxe (None) são descartadas
+    if declaration is None:
+        pass
+    elif isinstance(declaration, tuple):
+        declarations.extend(declaration)
+    else:
+        declarations.append(declaration)
+    p[0] = declarations
 
 
 def p_declaration(p):
     """declaration : var_decl SEMICOLON
                    | function_decl"""
-    if len(p) == 3:
-        # Se var_decl retornou uma tupla (declaração, atribuição), expandir
-        if isinstance(p[1], tuple):
-            p[0] = list(p[1])
-        else:
-            p[0] = p[1]
-    else:
-        p[0] = p[1]
+    # Se var_decl retornou uma tupla (declaração, atribuição), ela é
+    # repassada como está e expandida por p_declarations
+    p[0] = p[1]
+
+
+# Recuperação de erros de sintaxe
+#
+# Após um erro, o parser descarta os tokens até o fim da declaração ou do
+# comando em que ele ocorreu (ponto e vírgula ou fecha chave) e continua a
+# análise, de modo que uma única análise reporta todos os erros do
+# arquivo. O símbolo recuperado vale None e é descartado das listas.
+def p_declaration_error(p):
+    """declaration : error SEMICOLON
+                   | error RBRACE"""
+    p[0] = None
+
+
+def p_statement_error(p):
+    """statement : error SEMICOLON"""
+    p[0] = None
+    p.slice[0].endlexpos = _end(p, 2)
 
 
 def p_var_decl(p):
     """var_decl : type IDENTIFIER
                 | type IDENTIFIER ASSIGN expression"""
+    var_decl = VarDecl(p[1], p[2], p.lexpos(1), _end(p, 2))
     if len(p) == 3:
-        p[0] = VarDecl(p[1], p[2])
+        p[0] = var_decl
     else:
         # Declaração com inicialização: criar VarDecl e Assignment
-        var_decl = VarDecl(p[1], p[2])
-        # Retornar uma lista com declaração e atribuição
-        p[0] = (var_decl, Assignment(Identifier(p[2]), p[4]))
+        name = Identifier(p[2], p.lexpos(2), var_decl.end)
+        # Retornar uma tupla com declaração e atribuição
+        p[0] = (var_decl, Assignment(name, p[4], name.start, p[4].end))
 
 
 def p_type(p):
@@ -77,12 +134,15 @@ def p_type(p):
             | FLOAT
             | CHAR_TYPE
             | VOID"""
-    p[0] = p[1].lower().replace('_type', '')
+    # Os nomes dos tipos são internados: todas as declarações compartilham
+    # as mesmas strings
+    p[0] = sys.intern(p[1].lower().replace('_type', ''))
+    p.set_lexpos(0, p.lexpos(1))
 
 
 def p_function_decl(p):
     """function_decl : type IDENTIFIER LPAREN params RPAREN block"""
-    p[0] = FunctionDecl(p[1].lower(), p[2], p[4], p[6])
+    p[0] = FunctionDecl(p[1], p[2], p[4], p[6], p.lexpos(1), p[6].end)
 
 
 def p_params(p):
@@ -98,34 +158,33 @@ def p_param_list(p):
     """param_list : param_list COMMA param
                    | param"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
 
 def p_param(p):
     """param : type IDENTIFIER"""
-    p[0] = VarDecl(p[1].lower(), p[2])
+    p[0] = VarDecl(p[1], p[2], p.lexpos(1), _end(p, 2))
 
 
 def p_block(p):
     """block : LBRACE statements RBRACE"""
-    p[0] = Block(p[2])
+    p[0] = Block(p[2], p.lexpos(1), _end(p, 3))
 
 
 def p_statements(p):
     """statements : statements statement
                   | empty"""
     if len(p) == 3:
-        # Se statement é uma lista (declaração com inicialização), expandir
-        if isinstance(p[2], list):
-            p[0] = p[1] + p[2]
-        else:
-            p[0] = p[1] + [p[2]]
-    elif p[1] is None:
-        p[0] = []
+        # A lista é estendida no lugar (O(1) amortizado por elemento);
+        # comandos com erro de sintaxe (None) são descartados
+        if p[2] is not None:
+            p[1].append(p[2])
+        p[0] = p[1]
     else:
-        p[0] = [p[1]]
+        p[0] = []
 
 
 def p_statement(p):
@@ -137,34 +196,37 @@ def p_statement(p):
                  | return_statement
                  | block"""
     p[0] = p[1]
+    if len(p) == 3:
+        # Declaração como statement: o fim inclui o ponto e vírgula
+        p.slice[0].endlexpos = _end(p, 2)
 
 
 def p_expression_statement(p):
     """expression_statement : expression SEMICOLON
                             | SEMICOLON"""
     if len(p) == 3:
-        p[0] = ExpressionStatement(p[1])
+        p[0] = ExpressionStatement(p[1], p[1].start, _end(p, 2))
     else:
-        p[0] = ExpressionStatement(None)
+        p[0] = ExpressionStatement(None, p.lexpos(1), _end(p, 1))
 
 
 def p_if_statement(p):
     """if_statement : IF LPAREN expression RPAREN statement
                     | IF LPAREN expression RPAREN statement ELSE statement"""
     if len(p) == 6:
-        p[0] = IfStatement(p[3], p[5])
+        p[0] = IfStatement(p[3], p[5], None, p.lexpos(1), _end(p, 5))
     else:
-        p[0] = IfStatement(p[3], p[5], p[7])
+        p[0] = IfStatement(p[3], p[5], p[7], p.lexpos(1), _end(p, 7))
 
 
 def p_while_statement(p):
     """while_statement : WHILE LPAREN expression RPAREN statement"""
-    p[0] = WhileStatement(p[3], p[5])
+    p[0] = WhileStatement(p[3], p[5], p.lexpos(1), _end(p, 5))
 
 
 def p_for_statement(p):
     """for_statement : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_update RPAREN statement"""
-    p[0] = ForStatement(p[3], p[5], p[7], p[9])
+    p[0] = ForStatement(p[3], p[5], p[7], p[9], p.lexpos(1), _end(p, 9))
 
 
 def p_for_init(p):
@@ -190,9 +252,9 @@ def p_return_statement(p):
     """return_statement : RETURN expression SEMICOLON
                         | RETURN SEMICOLON"""
     if len(p) == 4:
-        p[0] = ReturnStatement(p[2])
+        p[0] = ReturnStatement(p[2], p.lexpos(1), _end(p, 3))
     else:
-        p[0] = ReturnStatement(None)
+        p[0] = ReturnStatement(None, p.lexpos(1), _end(p, 2))
 
 
 def p_expression(p):
@@ -208,13 +270,13 @@ def p_expression(p):
                   | expression GE expression
                   | expression AND expression
                   | expression OR expression"""
-    p[0] = BinOp(p[1], p[2], p[3])
+    p[0] = BinOp(p[1], sys.intern(p[2]), p[3], p[1].start, p[3].end)
 
 
 def p_expression_unary(p):
     """expression : NOT expression
                   | MINUS expression %prec UMINUS"""
-    p[0] = UnaryOp(p[1], p[2])
+    p[0] = UnaryOp(p[1], p[2], p.lexpos(1), p[2].end)
 
 
 def p_expression_group(p):
@@ -224,7 +286,8 @@ def p_expression_group(p):
 
 def p_expression_assign(p):
     """expression : IDENTIFIER ASSIGN expression"""
-    p[0] = Assignment(Identifier(p[1]), p[3])
+    name = Identifier(p[1], p.lexpos(1), _end(p, 1))
+    p[0] = Assignment(name, p[3], name.start, p[3].end)
 
 
 def p_expression_primary(p):
@@ -232,29 +295,40 @@ def p_expression_primary(p):
     p[0] = p[1]
 
 
+def _literal(p, cls):
+    """
+    Nó do literal p[1]: com a tabela de folhas da sessão (veja
+    ParserSession com share_leaves), um nó compartilhado e sem posição.
+    """
+    leaves = getattr(p.parser, 'leaves', None)
+    if leaves is not None:
+        return leaves.get(cls, p[1])
+    return cls(p[1], p.lexpos(1), _end(p, 1))
+
+
 def p_primary_integer(p):
     """primary : INTEGER"""
-    p[0] = Number(p[1])
+    p[0] = _literal(p, Number)
 
 
 def p_primary_float(p):
     """primary : FLOAT_NUMBER"""
-    p[0] = Number(p[1])
+    p[0] = _literal(p, Number)
 
 
 def p_primary_string(p):
     """primary : STRING"""
-    p[0] = String(p[1])
+    p[0] = _literal(p, String)
 
 
 def p_primary_char(p):
     """primary : CHAR"""
-    p[0] = Char(p[1])
+    p[0] = _literal(p, Char)
 
 
 def p_primary_identifier(p):
     """primary : IDENTIFIER"""
-    p[0] = Identifier(p[1])
+    p[0] = Identifier(p[1], p.lexpos(1), _end(p, 1))
 
 
 def p_primary_function_call(p):
@@ -264,7 +338,7 @@ def p_primary_function_call(p):
 
 def p_function_call(p):
     """function_call : IDENTIFIER LPAREN args RPAREN"""
-    p[0] = FunctionCall(p[1], p[3])
+    p[0] = FunctionCall(p[1], p[3], p.lexpos(1), _end(p, 4))
 
 
 def p_args(p):
@@ -280,7 +354,8 @@ def p_arg_list(p):
     """arg_list : arg_list COMMA expression
                  | expression"""
     if len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = [p[1]]
 
@@ -291,31 +366,541 @@ def p_empty(p):
 
 
 # Tratamento de erros sintáticos
+#
+# O parser global imprime as mensagens; as sessões (ParserSession)
+# substituem esta função para registrá-las em seus diagnósticos.
 def p_error(p):
-    if p:
-        print(f"Erro de sintaxe na linha {p.lineno}, posição {p.lexpos}: token inesperado '{p.value}'")
-    else:
-        print("Erro de sintaxe: fim de arquivo inesperado")
+    syntax_error(None, p)
+
+
+# Criação do parser
+#
+# O parser global é criado somente no primeiro uso (get_parser() ou acesso
+# a parser.parser). As tabelas LR são lidas do parsetab.py pré-gerado
+# quando a assinatura da gramática coincide; caso contrário, são geradas
+# em memória, com um aviso (StaleTablesWarning). Em nenhum dos casos
+# arquivos são gravados (use build_tables.py para atualizar parsetab.py e
+# parser.out).
+_parser = None
+_signature = None
+
+
+class StaleTablesWarning(UserWarning):
+    """O parsetab.py não corresponde à gramática atual."""
+
+
+def grammar_signature():
+    """
+    Assinatura da gramática atual (regras, precedência e tokens), calculada
+    como o ply.yacc a calcula para validar o parsetab.py.
+    
+    Deve ser usada, em vez do _lr_signature do parsetab.py, para identificar
+    a gramática (por exemplo, em chaves de cache), pois o parsetab.py só é
+    atualizado pelo build_tables.py.
+    
+    Returns:
+        String com a assinatura
+    """
+    global _signature
+    if _signature is None:
+        module = sys.modules[__name__]
+        pinfo = yacc.ParserReflect({name: getattr(module, name) for name in dir(module)},
+                                   log=yacc.NullLogger())
+        pinfo.get_all()
+        _signature = pinfo.signature()
+    return _signature
+
+
+def tables_signature():
+    """Assinatura gravada no parsetab.py, ou None se ele não existir."""
+    try:
+        import parsetab
+    except ImportError:
+        return None
+    return getattr(parsetab, '_lr_signature', None)
+
+
+def get_parser():
+    """
+    Obtém o parser global, criando-o no primeiro uso.
+    
+    Returns:
+        Parser LR global
+    """
+    global _parser
+    if _parser is None:
+        if tables_signature() != grammar_signature():
+            warnings.warn("parsetab.py não corresponde à gramática atual; as tabelas LR "
+                          "serão geradas em memória (execute build_tables.py)",
+                          StaleTablesWarning, stacklevel=2)
+        _parser = yacc.yacc(module=sys.modules[__name__], debug=False, write_tables=False)
+    return _parser
+
+
+def write_tables(outputdir):
+    """
+    Gera as tabelas LR (parsetab.py) e o relatório da gramática (parser.out).
+    
+    Args:
+        outputdir: Diretório em que os arquivos são gravados
+    """
+    # Um valor None em sys.modules faz a importação de parsetab falhar,
+    # obrigando o yacc a gerar as tabelas em vez de lê-las
+    saved = sys.modules.get('parsetab')
+    sys.modules['parsetab'] = None
+    try:
+        yacc.yacc(module=sys.modules[__name__], debug=True, write_tables=True,
+                  outputdir=outputdir)
+    finally:
+        if saved is not None:
+            sys.modules['parsetab'] = saved
+        else:
+            sys.modules.pop('parsetab', None)
+
+
+def __getattr__(name):
+    # Compatibilidade: parser.parser continua disponível, criado sob demanda
+    if name == 'parser':
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Motores de análise léxica disponíveis para as sessões
+LEXER_ENGINES = ('ply', 'fast')
+
+
+class BodySyntaxError(Exception):
+    """
+    Erro ao analisar sob demanda o corpo de uma função (veja
+    ParserSession.skim); messages tem as mensagens de erro.
+    """
+    
+    def __init__(self, messages):
+        super().__init__("\n".join(messages))
+        self.messages = messages
+
+
+class ParserSession:
+    """
+    Sessão de análise com lexer e parser próprios.
+    
+    Cada sessão usa um clone do lexer global e uma cópia do parser LR que
+    compartilha as tabelas (somente leitura) com o parser global, mas tem
+    suas próprias pilhas. Sessões diferentes podem ser usadas em threads
+    diferentes ao mesmo tempo; uma mesma sessão não deve ser usada por
+    duas threads simultaneamente.
+    
+    O lexer e o parser da sessão são criados no primeiro uso.
+    
+    O motor de análise léxica é escolhido por engine: 'ply' (lexer.py) ou
+    'fast' (fastlex.py, equivalente e mais rápido).
+    
+    Com share_leaves, quando as posições no código fonte não são
+    necessárias, os literais (Number, Char e String) de mesmo valor
+    compartilham um único nó, obtido de uma LeafTable da sessão (em
+    leaves; share_leaves também pode ser a própria tabela) que é mantida
+    entre as análises. Esses nós não têm posição,
+    assim como os nós que começam ou terminam neles (por exemplo, x + 1).
+    
+    Com stats (um instrumentation.Stats), a sessão conta os tokens de cada
+    tipo e as reduções de cada regra e mede o tempo gasto no motor léxico
+    (veja instrumentation.py); sem ele, a análise não é instrumentada.
+    
+    Os erros léxicos e sintáticos de cada análise são registrados em um
+    objeto Diagnostics (diagnostics.py), informado pelo chamador ou, por
+    padrão, um que exibe cada mensagem na saída padrão no momento em que
+    ela ocorre. Após um erro de sintaxe, a análise continua (veja as
+    regras de recuperação) para que os erros seguintes também sejam
+    reportados, mas a AST resultante é None.
+    """
+    
+    def __init__(self, lexer_obj=None, parser_obj=None, engine='ply', share_leaves=False,
+                 stats=None):
+        if engine not in LEXER_ENGINES:
+            raise ValueError(f"Motor léxico desconhecido: {engine}")
+        self._lexer = lexer_obj
+        self._parser = None
+        if isinstance(share_leaves, LeafTable):
+            self.leaves = share_leaves
+        else:
+            self.leaves = LeafTable() if share_leaves else None
+        self.stats = stats
+        if parser_obj is not None:
+            self._set_parser(parser_obj)
+        self.engine = engine
+        # Diagnósticos da análise em andamento
+        self.diagnostics = None
+    
+    @property
+    def lexer(self):
+        """Lexer (ply.lex) da sessão."""
+        if self._lexer is None:
+            self._lexer = clone_lexer()
+        return self._lexer
+    
+    @property
+    def parser(self):
+        """Parser LR da sessão."""
+        if self._parser is None:
+            self._set_parser(get_parser())
+        return self._parser
+    
+    def _set_parser(self, parser_obj):
+        # Uma cópia própria, cuja função de erro registra os erros de
+        # sintaxe nos diagnósticos da sessão
+        if self.stats is not None:
+            parser_obj = self.stats.instrument(parser_obj)
+        self._parser = copy.copy(parser_obj)
+        self._parser.errorfunc = self._syntax_error
+        self._parser.leaves = self.leaves
+    
+    def _syntax_error(self, tok):
+        syntax_error(self.diagnostics, tok)
+    
+    def _token_source(self, data, diagnostics=None):
+        """
+        Prepara o motor léxico para o código fonte.
+        
+        Args:
+            data: String com o código fonte
+            diagnostics: Diagnostics em que os erros léxicos são registrados
+                (None: imprimir)
+                
+        Returns:
+            Tupla (lexer, função que fornece o próximo token)
+        """
+        if self.engine == 'fast':
+            # O ply.yacc exige um objeto lexer, mas só o repassa às regras
+            # (p.lexer); com o motor rápido, o módulo fastlex faz esse papel
+            # e o lexer do PLY não precisa ser criado
+            lexer_obj = fastlex
+            next_token = functools.partial(next, fastlex.scan(data, diagnostics), None)
+        else:
+            lexer_obj = self.lexer
+            reset_lexer(lexer_obj, data)
+            lexer_obj.diagnostics = diagnostics
+            next_token = lexer_obj.token
+        if self.stats is not None:
+            next_token = self.stats.timed_tokens(next_token)
+        return lexer_obj, next_token
+    
+    def _run(self, lexer_obj, next_token, diagnostics):
+        """
+        Executa o parser, registrando os erros em diagnostics.
+        
+        Returns:
+            AST raiz do programa ou None em caso de erro de sintaxe
+        """
+        self.diagnostics = diagnostics
+        try:
+            result = self.parser.parse(lexer=lexer_obj, tokenfunc=next_token)
+        except Exception as e:
+            report(diagnostics, SYNTAX, f"Erro durante a análise sintática: {e}")
+            result = None
+        finally:
+            self.diagnostics = None
+        # A recuperação de erros produz uma AST parcial, que não é devolvida
+        if diagnostics.has_errors(SYNTAX):
+            return None
+        return result
+    
+    def tokens(self, data):
+        """
+        Gera a lista de tokens do código fonte.
+        
+        Args:
+            data: String com o código fonte
+            
+        Returns:
+            Lista de tuplas (tipo, valor, linha) para cada token identificado
+        """
+        if self.engine == 'fast':
+            return fastlex.get_tokens(data)
+        _, next_token = self._token_source(data)
+        tokens_list = []
+        while True:
+            tok = next_token()
+            if not tok:
+                break
+            tokens_list.append((tok.type, tok.value, tok.lineno))
+        return tokens_list
+    
+    def parse(self, data, diagnostics=None):
+        """
+        Realiza a análise sintática do código fonte.
+        
+        Args:
+            data: String com o código fonte
+            diagnostics: Diagnostics em que os erros são registrados (por
+                padrão, os erros são impressos)
+                
+        Returns:
+            AST raiz do programa ou None em caso de erro
+        """
+        if diagnostics is None:
+            diagnostics = Diagnostics(callback=print_diagnostic)
+        lexer_obj, next_token = self._token_source(data, diagnostics)
+        return self._run(lexer_obj, next_token, diagnostics)
+    
+    def skim(self, data, diagnostics=None):
+        """
+        Realiza a análise sintática resumida do código fonte.
+        
+        Somente as declarações de nível superior são analisadas: o corpo
+        de cada função é pulado contando as chaves (veja fastlex.skim) e
+        fica em um LazyBlock, analisado por esta sessão no primeiro acesso
+        aos seus statements. Um corpo com erro léxico ou sintático só é
+        detectado nesse acesso, que levanta BodySyntaxError. Os tokens vêm
+        sempre do motor rápido, e os nós têm as mesmas posições e linhas
+        da análise completa.
+        
+        Args:
+            data: String com o código fonte
+            diagnostics: Diagnostics em que os erros são registrados (por
+                padrão, os erros são impressos)
+                
+        Returns:
+            AST raiz do programa ou None em caso de erro
+        """
+        if diagnostics is None:
+            diagnostics = Diagnostics(callback=print_diagnostic)
+        bodies = {}
+        next_token = functools.partial(next, fastlex.skim(data, diagnostics, bodies), None)
+        if self.stats is not None:
+            next_token = self.stats.timed_tokens(next_token)
+        result = self._run(fastlex, next_token, diagnostics)
+        if result is None:
+            return None
+        for decl in result:
+            if type(decl) is FunctionDecl:
+                start = decl.body.start
+                end, lineno = bodies[start]
+                decl.body = LazyBlock(None, start, end,
+                                      functools.partial(self._parse_body, data, start, end, lineno))
+        return result
+    
+    def _parse_body(self, data, start, end, lineno):
+        """
+        Analisa o corpo de uma função omitido por skim().
+        
+        Returns:
+            Lista de statements do bloco
+        """
+        diagnostics = Diagnostics()
+        # O bloco é analisado como o corpo de uma função sem parâmetros,
+        # com os tokens nas posições originais
+        header = [FastToken('VOID', 'void', lineno, start, start),
+                  FastToken('IDENTIFIER', '_', lineno, start, start),
+                  FastToken('LPAREN', '(', lineno, start, start),
+                  FastToken('RPAREN', ')', lineno, start, start)]
+        tokens_iter = itertools.chain(header, fastlex.scan(data, diagnostics, start, end, lineno))
+        next_token = functools.partial(next, tokens_iter, None)
+        if self.stats is not None:
+            next_token = self.stats.timed_tokens(next_token)
+        result = self._run(fastlex, next_token, diagnostics)
+        if result is None or diagnostics.has_errors():
+            raise BodySyntaxError(diagnostics.messages())
+        return result[0].body.statements
+    
+    def parse_with_tokens(self, data, columnar=False, diagnostics=None):
+        """
+        Realiza as análises léxica e sintática em uma única passagem.
+        
+        Os tokens são registrados à medida que o parser os consome, evitando
+        tokenizar o código fonte duas vezes (uma para a tabela de tokens e
+        outra para a análise sintática).
+        
+        Args:
+            data: String com o código fonte
+            columnar: Se True, os tokens são registrados em um TokenStream
+                (colunas compactas) em vez de uma lista de tuplas
+            diagnostics: Diagnostics em que os erros são registrados (por
+                padrão, os erros são impressos)
+                
+        Returns:
+            Tupla (tokens, ast), onde tokens é a lista de tuplas
+            (tipo, valor, linha), ou um TokenStream que produz essas tuplas,
+            e ast é a raiz do programa ou None em caso de erro
+        """
+        if diagnostics is None:
+            diagnostics = Diagnostics(callback=print_diagnostic)
+        lexer_obj, get_token = self._token_source(data, diagnostics)
+        if columnar:
+            tokens_list = TokenStream(data)
+            
+            def next_token():
+                tok = get_token()
+                if tok:
+                    tokens_list.append(tok)
+                return tok
+        else:
+            tokens_list = []
+            
+            def next_token():
+                tok = get_token()
+                if tok:
+                    tokens_list.append((tok.type, tok.value, tok.lineno))
+                return tok
+        
+        result = self._run(lexer_obj, next_token, diagnostics)
+        
+        # O parser pode parar antes do fim da entrada; completar a lista de tokens
+        while next_token():
+            pass
+        
+        return tokens_list, result
+    
+    def parse_tokens(self, tokens_iter, diagnostics=None):
+        """
+        Realiza a análise sintática a partir de um fluxo de tokens.
+        
+        Permite analisar tokens produzidos sob demanda (por exemplo, por
+        lexer.iter_tokens), sem materializar a lista de tokens. O fluxo é
+        consumido até o fim, mesmo que o parser pare antes.
+        
+        Args:
+            tokens_iter: Iterável de tokens (LexToken ou FastToken, como os
+                produzidos por TokenStream.iter_tokens)
+            diagnostics: Diagnostics em que os erros de sintaxe são
+                registrados (por padrão, os erros são impressos); os erros
+                léxicos são reportados por quem produz os tokens
+                
+        Returns:
+            AST raiz do programa ou None em caso de erro
+        """
+        if diagnostics is None:
+            diagnostics = Diagnostics(callback=print_diagnostic)
+        next_token = functools.partial(next, iter(tokens_iter), None)
+        if self.stats is not None:
+            next_token = self.stats.timed_tokens(next_token)
+        result = self._run(self.lexer, next_token, diagnostics)
+        while next_token():
+            pass
+        return result
 
 
-# Criar o parser
-parser = yacc.yacc()
+class SessionPool:
+    """
+    Conjunto limitado de sessões de análise reutilizáveis.
+    
+    As sessões são criadas sob demanda até o limite informado e devolvidas
+    ao conjunto após o uso, evitando recriar lexers e parsers a cada
+    análise. Quando todas estão em uso, session() aguarda uma ser liberada.
+    """
+    
+    def __init__(self, size=4, warm=False, engine='ply'):
+        if size < 1:
+            raise ValueError("O tamanho do conjunto de sessões deve ser positivo")
+        self.size = size
+        self.engine = engine
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        if warm:
+            for _ in range(size):
+                self._idle.put(ParserSession(engine=engine))
+            self._created = size
+    
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return ParserSession(engine=self.engine)
+        return self._idle.get()
+    
+    @contextlib.contextmanager
+    def session(self):
+        """Obtém uma sessão do conjunto pelo tempo do bloco with."""
+        session = self._acquire()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
 
 
-def parse(data):
+def parse_many(sources, workers=4, pool=None):
+    """
+    Analisa vários códigos fonte em paralelo usando um conjunto de threads.
+    
+    Args:
+        sources: Iterável de strings com códigos fonte
+        workers: Número de threads de trabalho
+        pool: SessionPool a ser usado (por padrão, um novo com workers sessões)
+        
+    Returns:
+        Lista com a AST (ou None em caso de erro) de cada código, na ordem
+        em que foram fornecidos
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    if pool is None:
+        pool = SessionPool(workers)
+    
+    def parse_one(data):
+        with pool.session() as session:
+            return session.parse(data)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_one, sources))
+
+
+# Sessão padrão, usada pelas funções do módulo (não deve ser usada por
+# várias threads ao mesmo tempo). Ela tem lexer e parser próprios, de modo
+# que o lexer e o parser globais continuam imprimindo os erros.
+_default_session = None
+
+
+def _get_default_session():
+    global _default_session
+    if _default_session is None:
+        _default_session = ParserSession()
+    return _default_session
+
+
+def parse(data, diagnostics=None):
     """
     Realiza a análise sintática do código fonte.
     
     Args:
         data: String com o código fonte
-        
+        diagnostics: Diagnostics em que os erros são registrados (por
+            padrão, os erros são impressos)
+            
     Returns:
         AST raiz do programa ou None em caso de erro
     """
-    try:
-        result = parser.parse(data, lexer=lexer)
-        return result
-    except Exception as e:
-        print(f"Erro durante a análise sintática: {e}")
-        return None
+    return _get_default_session().parse(data, diagnostics)
+
+
+def skim(data, diagnostics=None):
+    """
+    Realiza a análise sintática resumida do código fonte, com os corpos
+    das funções analisados sob demanda (veja ParserSession.skim).
+    
+    Args:
+        data: String com o código fonte
+        diagnostics: Diagnostics em que os erros são registrados (por
+            padrão, os erros são impressos)
+            
+    Returns:
+        AST raiz do programa ou None em caso de erro
+    """
+    return _get_default_session().skim(data, diagnostics)
+
 
+def parse_with_tokens(data, columnar=False, diagnostics=None):
+    """
+    Realiza as análises léxica e sintática em uma única passagem.
+    
+    Args:
+        data: String com o código fonte
+        columnar: Se True, os tokens são registrados em um TokenStream
+        diagnostics: Diagnostics em que os erros são registrados
+        
+    Returns:
+        Tupla (tokens, ast); veja ParserSession.parse_with_tokens
+    """
+    return _get_default_session().parse_with_tokens(data, columnar, diagnostics)
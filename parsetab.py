@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDleftEQNEleftLTGTLEGEleftPLUSMINUSleftMULTIPLYDIVIDErightNOTrightUMINUSAND ASSIGN CHAR CHAR_TYPE COMMA DIVIDE ELSE EQ FLOAT FLOAT_NUMBER FOR GE GT IDENTIFIER IF INT INTEGER LBRACE LE LPAREN LT MINUS MULTIPLY NE NOT OR PLUS RBRACE RETURN RPAREN SEMICOLON STRING VOID WHILEprogram : declarationsdeclarations : declarations declaration\n                    | declarationdeclaration : var_decl SEMICOLON\n                   | function_declvar_decl : type IDENTIFIER\n                | type IDENTIFIER ASSIGN expressiontype : INT\n            | FLOAT\n            | CHAR_TYPE\n            | VOIDfunction_decl : type IDENTIFIER LPAREN params RPAREN blockparams : param_list\n               | emptyparam_list : param_list COMMA param\n                   | paramparam : type IDENTIFIERblock : LBRACE statements RBRACEstatements : statements statement\n                  | emptystatement : expression_statement\n                 | var_decl SEMICOLON\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | return_statement\n                 | blockexpression_statement : expression SEMICOLON\n                            | SEMICOLONif_statement : IF LPAREN expression RPAREN statement\n                    | IF LPAREN expression RPAREN statement ELSE statementwhile_statement : WHILE LPAREN expression RPAREN statementfor_statement : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_update RPAREN statementfor_init : var_decl\n                | expression\n                | emptyfor_cond : expression\n                | emptyfor_update : expression\n                  | emptyreturn_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression MULTIPLY expression\n                  | expression DIVIDE expression\n                  | expression EQ expression\n                  | expression NE expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression LE expression\n                  | expression GE expression\n                  | expression AND expression\n                  | expression OR expressionexpression : NOT expression\n                  | MINUS expression %prec UMINUSexpression : LPAREN expression RPARENexpression : IDENTIFIER ASSIGN expressionexpression : primaryprimary : INTEGERprimary : FLOAT_NUMBERprimary : STRINGprimary : CHARprimary : IDENTIFIERprimary : function_callfunction_call : IDENTIFIER LPAREN args RPARENargs : arg_list\n            | emptyarg_list : arg_list COMMA expression\n                 | expressionempty :'
+_lr_signature = 'leftORleftANDleftEQNEleftLTGTLEGEleftPLUSMINUSleftMULTIPLYDIVIDErightNOTrightUMINUSAND ASSIGN CHAR CHAR_TYPE COMMA DIVIDE ELSE EQ FLOAT FLOAT_NUMBER FOR GE GT IDENTIFIER IF INT INTEGER LBRACE LE LPAREN LT MINUS MULTIPLY NE NOT OR PLUS RBRACE RETURN RPAREN SEMICOLON STRING VOID WHILEprogram : declarationsdeclarations : declarations declaration\n                    | declarationdeclaration : var_decl SEMICOLON\n                   | function_decldeclaration : error SEMICOLON\n                   | error RBRACEstatement : error SEMICOLONvar_decl : type IDENTIFIER\n                | type IDENTIFIER ASSIGN expressiontype : INT\n            | FLOAT\n            | CHAR_TYPE\n            | VOIDfunction_decl : type IDENTIFIER LPAREN params RPAREN blockparams : param_list\n               | emptyparam_list : param_list COMMA param\n                   | paramparam : type IDENTIFIERblock : LBRACE statements RBRACEstatements : statements statement\n                  | emptystatement : expression_statement\n                 | var_decl SEMICOLON\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | return_statement\n                 | blockexpression_statement : expression SEMICOLON\n                            | SEMICOLONif_statement : IF LPAREN expression RPAREN statement\n                    | IF LPAREN expression RPAREN statement ELSE statementwhile_statement : WHILE LPAREN expression RPAREN statementfor_statement : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_update RPAREN statementfor_init : var_decl\n                | expression\n                | emptyfor_cond : expression\n                | emptyfor_update : expression\n                  | emptyreturn_statement : RETURN expression SEMICOLON\n                        | RETURN SEMICOLONexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression MULTIPLY expression\n                  | expression DIVIDE expression\n                  | expression EQ expression\n                  | expression NE expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression LE expression\n                  | expression GE expression\n                  | expression AND expression\n                  | expression OR expressionexpression : NOT expression\n                  | MINUS expression %prec UMINUSexpression : LPAREN expression RPARENexpression : IDENTIFIER ASSIGN expressionexpression : primaryprimary : INTEGERprimary : FLOAT_NUMBERprimary : STRINGprimary : CHARprimary : IDENTIFIERprimary : function_callfunction_call : IDENTIFIER LPAREN args RPARENargs : arg_list\n            | emptyarg_list : arg_list COMMA expression\n                 | expressionempty :'
     
-_lr_action_items = {'INT':([0,2,3,5,11,12,15,51,70,71,75,76,78,79,80,82,83,84,85,86,87,94,95,99,101,108,109,110,112,113,117,119,123,124,],[7,7,-3,-5,-2,-4,7,7,-12,-71,7,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,7,-42,-41,7,7,-30,-32,7,-31,7,-33,]),'FLOAT':([0,2,3,5,11,12,15,51,70,71,75,76,78,79,80,82,83,84,85,86,87,94,95,99,101,108,109,110,112,113,117,119,123,124,],[8,8,-3,-5,-2,-4,8,8,-12,-71,8,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,8,-42,-41,8,8,-30,-32,8,-31,8,-33,]),'CHAR_TYPE':([0,2,3,5,11,12,15,51,70,71,75,76,78,79,80,82,83,84,85,86,87,94,95,99,101,108,109,110,112,113,117,119,123,124,],[9,9,-3,-5,-2,-4,9,9,-12,-71,9,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,9,-42,-41,9,9,-30,-32,9,-31,9,-33,]),'VOID':([0,2,3,5,11,12,15,51,70,71,75,76,78,79,80,82,83,84,85,86,87,94,95,99,101,108,109,110,112,113,117,119,123,124,],[10,10,-3,-5,-2,-4,10,10,-12,-71,10,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,10,-42,-41,10,10,-30,-32,10,-31,10,-33,]),'$end':([1,2,3,5,11,12,70,78,],[0,-1,-3,-5,-2,-4,-12,-18,]),'SEMICOLON':([4,13,16,17,21,22,23,24,25,26,46,47,52,57,58,59,60,61,62,63,64,65,66,67,68,69,71,73,75,76,78,79,80,81,82,83,84,85,86,87,88,93,94,95,96,99,100,101,104,105,106,107,108,109,110,111,112,113,114,115,116,117,119,123,124,],[12,-6,-64,-7,-59,-60,-61,-62,-63,-65,-56,-55,-58,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-57,-71,-66,82,-20,-18,-19,-21,94,-29,-23,-24,-25,-26,-27,95,101,-22,-28,-6,-71,108,-42,111,-34,-35,-36,-41,82,82,-71,-30,-32,118,-37,-38,82,-31,82,-33,]),'IDENTIFIER':([6,7,8,9,10,14,18,19,20,27,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,89,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[13,-8,-9,-10,-11,16,16,16,16,49,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-71,16,16,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,96,16,-22,-28,16,16,16,-42,-41,16,16,16,-30,-32,16,16,-31,16,-33,]),'ASSIGN':([13,16,96,],[14,32,14,]),'LPAREN':([13,14,16,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,90,91,92,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[15,20,33,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-71,20,20,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,97,98,99,20,-22,-28,20,20,20,-42,-41,20,20,20,-30,-32,20,20,-31,20,-33,]),'NOT':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-71,19,19,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,19,-22,-28,19,19,19,-42,-41,19,19,19,-30,-32,19,19,-31,19,-33,]),'MINUS':([14,16,17,18,19,20,21,22,23,24,25,26,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,71,73,74,75,76,77,78,79,80,82,83,84,85,86,87,88,93,94,95,97,98,99,100,101,102,103,106,108,109,110,111,112,113,115,117,118,119,121,123,124,],[18,-64,35,18,18,18,-59,-60,-61,-62,-63,-65,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-56,-55,35,35,35,-43,-44,-45,-46,35,35,35,35,35,35,35,35,-57,-71,-66,18,18,-20,35,-18,-19,-21,-29,-23,-24,-25,-26,-27,35,18,-22,-28,18,18,18,35,-42,35,35,35,-41,18,18,18,-30,-32,35,18,18,-31,35,18,-33,]),'INTEGER':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-71,22,22,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,22,-22,-28,22,22,22,-42,-41,22,22,22,-30,-32,22,22,-31,22,-33,]),'FLOAT_NUMBER':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-71,23,23,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,23,-22,-28,23,23,23,-42,-41,23,23,23,-30,-32,23,23,-31,23,-33,]),'STRING':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-71,24,24,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,24,-22,-28,24,24,24,-42,-41,24,24,24,-30,-32,24,24,-31,24,-33,]),'CHAR':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,71,74,75,76,78,79,80,82,83,84,85,86,87,93,94,95,97,98,99,101,108,109,110,111,112,113,117,118,119,123,124,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-71,25,25,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,25,-22,-28,25,25,25,-42,-41,25,25,25,-30,-32,25,25,-31,25,-33,]),'RPAREN':([15,16,21,22,23,24,25,26,28,29,30,31,33,46,47,48,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,72,73,77,102,103,118,120,121,122,],[-71,-64,-59,-60,-61,-62,-63,-65,50,-13,-14,-16,-71,-56,-55,69,-17,-58,73,-67,-68,-70,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-57,-15,-66,-69,109,110,-71,123,-39,-40,]),'PLUS':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,34,-59,-60,-61,-62,-63,-65,-56,-55,34,34,34,-43,-44,-45,-46,34,34,34,34,34,34,34,34,-57,-66,34,34,34,34,34,34,34,34,]),'MULTIPLY':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,36,-59,-60,-61,-62,-63,-65,-56,-55,36,36,36,36,36,-45,-46,36,36,36,36,36,36,36,36,-57,-66,36,36,36,36,36,36,36,36,]),'DIVIDE':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,37,-59,-60,-61,-62,-63,-65,-56,-55,37,37,37,37,37,-45,-46,37,37,37,37,37,37,37,37,-57,-66,37,37,37,37,37,37,37,37,]),'EQ':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,38,-59,-60,-61,-62,-63,-65,-56,-55,38,38,38,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,38,38,-57,-66,38,38,38,38,38,38,38,38,]),'NE':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,39,-59,-60,-61,-62,-63,-65,-56,-55,39,39,39,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,39,39,-57,-66,39,39,39,39,39,39,39,39,]),'LT':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,40,-59,-60,-61,-62,-63,-65,-56,-55,40,40,40,-43,-44,-45,-46,40,40,-49,-50,-51,-52,40,40,-57,-66,40,40,40,40,40,40,40,40,]),'GT':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,41,-59,-60,-61,-62,-63,-65,-56,-55,41,41,41,-43,-44,-45,-46,41,41,-49,-50,-51,-52,41,41,-57,-66,41,41,41,41,41,41,41,41,]),'LE':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,42,-59,-60,-61,-62,-63,-65,-56,-55,42,42,42,-43,-44,-45,-46,42,42,-49,-50,-51,-52,42,42,-57,-66,42,42,42,42,42,42,42,42,]),'GE':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,43,-59,-60,-61,-62,-63,-65,-56,-55,43,43,43,-43,-44,-45,-46,43,43,-49,-50,-51,-52,43,43,-57,-66,43,43,43,43,43,43,43,43,]),'AND':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,44,-59,-60,-61,-62,-63,-65,-56,-55,44,44,44,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,44,-57,-66,44,44,44,44,44,44,44,44,]),'OR':([16,17,21,22,23,24,25,26,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,88,100,102,103,106,115,121,],[-64,45,-59,-60,-61,-62,-63,-65,-56,-55,45,45,45,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-57,-66,45,45,45,45,45,45,45,45,]),'COMMA':([16,21,22,23,24,25,26,29,31,46,47,49,52,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,72,73,77,],[-64,-59,-60,-61,-62,-63,-65,51,-16,-56,-55,-17,-58,74,-70,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-57,-15,-66,-69,]),'LBRACE':([50,71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,109,110,112,113,117,119,123,124,],[71,-71,71,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,71,71,-30,-32,71,-31,71,-33,]),'RBRACE':([71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,112,113,119,124,],[-71,78,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,-30,-32,-31,-33,]),'IF':([71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,109,110,112,113,117,119,123,124,],[-71,90,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,90,90,-30,-32,90,-31,90,-33,]),'WHILE':([71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,109,110,112,113,117,119,123,124,],[-71,91,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,91,91,-30,-32,91,-31,91,-33,]),'FOR':([71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,109,110,112,113,117,119,123,124,],[-71,92,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,92,92,-30,-32,92,-31,92,-33,]),'RETURN':([71,75,76,78,79,80,82,83,84,85,86,87,94,95,101,108,109,110,112,113,117,119,123,124,],[-71,93,-20,-18,-19,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,93,93,-30,-32,93,-31,93,-33,]),'ELSE':([78,80,82,83,84,85,86,87,94,95,101,108,112,113,119,124,],[-18,-21,-29,-23,-24,-25,-26,-27,-22,-28,-42,-41,117,-32,-31,-33,]),}
+_lr_action_items = {'error':([0,2,3,5,12,13,14,15,73,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[6,6,-3,-5,-2,-4,-6,-7,-15,-74,83,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,83,83,-33,-35,83,-34,83,-36,]),'INT':([0,2,3,5,12,13,14,15,18,54,73,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,104,106,113,114,115,117,118,122,124,128,129,],[8,8,-3,-5,-2,-4,-6,-7,8,8,-15,-74,8,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,8,-45,-44,8,8,-33,-35,8,-34,8,-36,]),'FLOAT':([0,2,3,5,12,13,14,15,18,54,73,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,104,106,113,114,115,117,118,122,124,128,129,],[9,9,-3,-5,-2,-4,-6,-7,9,9,-15,-74,9,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,9,-45,-44,9,9,-33,-35,9,-34,9,-36,]),'CHAR_TYPE':([0,2,3,5,12,13,14,15,18,54,73,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,104,106,113,114,115,117,118,122,124,128,129,],[10,10,-3,-5,-2,-4,-6,-7,10,10,-15,-74,10,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,10,-45,-44,10,10,-33,-35,10,-34,10,-36,]),'VOID':([0,2,3,5,12,13,14,15,18,54,73,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,104,106,113,114,115,117,118,122,124,128,129,],[11,11,-3,-5,-2,-4,-6,-7,11,11,-15,-74,11,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,11,-45,-44,11,11,-33,-35,11,-34,11,-36,]),'$end':([1,2,3,5,12,13,14,15,73,81,],[0,-1,-3,-5,-2,-4,-6,-7,-15,-21,]),'SEMICOLON':([4,6,16,19,20,24,25,26,27,28,29,49,50,55,60,61,62,63,64,65,66,67,68,69,70,71,72,74,76,78,79,81,82,83,84,85,86,87,88,89,90,91,92,97,98,99,100,101,104,105,106,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,128,129,],[13,14,-9,-67,-10,-62,-63,-64,-65,-66,-68,-59,-58,-61,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-60,-74,-69,84,-23,-21,-22,98,-32,-24,99,-26,-27,-28,-29,-30,100,106,-8,-25,-31,-9,-74,113,-45,116,-37,-38,-39,-44,84,84,-74,-33,-35,123,-40,-41,84,-34,84,-36,]),'RBRACE':([6,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,117,118,124,129,],[15,-74,81,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,-33,-35,-34,-36,]),'IDENTIFIER':([7,8,9,10,11,17,21,22,23,30,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,93,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[16,-11,-12,-13,-14,19,19,19,19,52,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-74,19,19,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,101,19,-8,-25,-31,19,19,19,-45,-44,19,19,19,-33,-35,19,19,-34,19,-36,]),'ASSIGN':([16,19,101,],[17,35,17,]),'LPAREN':([16,17,19,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,94,95,96,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[18,23,36,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-74,23,23,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,102,103,104,23,-8,-25,-31,23,23,23,-45,-44,23,23,23,-33,-35,23,23,-34,23,-36,]),'NOT':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-74,22,22,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,22,-8,-25,-31,22,22,22,-45,-44,22,22,22,-33,-35,22,22,-34,22,-36,]),'MINUS':([17,19,20,21,22,23,24,25,26,27,28,29,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,74,76,77,78,79,80,81,82,84,85,87,88,89,90,91,92,97,98,99,100,102,103,104,105,106,107,108,111,113,114,115,116,117,118,120,122,123,124,126,128,129,],[21,-67,38,21,21,21,-62,-63,-64,-65,-66,-68,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-59,-58,38,38,38,-46,-47,-48,-49,38,38,38,38,38,38,38,38,-60,-74,-69,21,21,-23,38,-21,-22,-32,-24,-26,-27,-28,-29,-30,38,21,-8,-25,-31,21,21,21,38,-45,38,38,38,-44,21,21,21,-33,-35,38,21,21,-34,38,21,-36,]),'INTEGER':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-74,25,25,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,25,-8,-25,-31,25,25,25,-45,-44,25,25,25,-33,-35,25,25,-34,25,-36,]),'FLOAT_NUMBER':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-74,26,26,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,26,-8,-25,-31,26,26,26,-45,-44,26,26,26,-33,-35,26,26,-34,26,-36,]),'STRING':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-74,27,27,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,27,-8,-25,-31,27,27,27,-45,-44,27,27,27,-33,-35,27,27,-34,27,-36,]),'CHAR':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,74,77,78,79,81,82,84,85,87,88,89,90,91,97,98,99,100,102,103,104,106,113,114,115,116,117,118,122,123,124,128,129,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-74,28,28,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,28,-8,-25,-31,28,28,28,-45,-44,28,28,28,-33,-35,28,28,-34,28,-36,]),'RPAREN':([18,19,24,25,26,27,28,29,31,32,33,34,36,49,50,51,52,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,75,76,80,107,108,123,125,126,127,],[-74,-67,-62,-63,-64,-65,-66,-68,53,-16,-17,-19,-74,-59,-58,72,-20,-61,76,-70,-71,-73,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-60,-18,-69,-72,114,115,-74,128,-42,-43,]),'PLUS':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,37,-62,-63,-64,-65,-66,-68,-59,-58,37,37,37,-46,-47,-48,-49,37,37,37,37,37,37,37,37,-60,-69,37,37,37,37,37,37,37,37,]),'MULTIPLY':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,39,-62,-63,-64,-65,-66,-68,-59,-58,39,39,39,39,39,-48,-49,39,39,39,39,39,39,39,39,-60,-69,39,39,39,39,39,39,39,39,]),'DIVIDE':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,40,-62,-63,-64,-65,-66,-68,-59,-58,40,40,40,40,40,-48,-49,40,40,40,40,40,40,40,40,-60,-69,40,40,40,40,40,40,40,40,]),'EQ':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,41,-62,-63,-64,-65,-66,-68,-59,-58,41,41,41,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,41,41,-60,-69,41,41,41,41,41,41,41,41,]),'NE':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,42,-62,-63,-64,-65,-66,-68,-59,-58,42,42,42,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,42,42,-60,-69,42,42,42,42,42,42,42,42,]),'LT':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,43,-62,-63,-64,-65,-66,-68,-59,-58,43,43,43,-46,-47,-48,-49,43,43,-52,-53,-54,-55,43,43,-60,-69,43,43,43,43,43,43,43,43,]),'GT':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,44,-62,-63,-64,-65,-66,-68,-59,-58,44,44,44,-46,-47,-48,-49,44,44,-52,-53,-54,-55,44,44,-60,-69,44,44,44,44,44,44,44,44,]),'LE':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,45,-62,-63,-64,-65,-66,-68,-59,-58,45,45,45,-46,-47,-48,-49,45,45,-52,-53,-54,-55,45,45,-60,-69,45,45,45,45,45,45,45,45,]),'GE':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,46,-62,-63,-64,-65,-66,-68,-59,-58,46,46,46,-46,-47,-48,-49,46,46,-52,-53,-54,-55,46,46,-60,-69,46,46,46,46,46,46,46,46,]),'AND':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,47,-62,-63,-64,-65,-66,-68,-59,-58,47,47,47,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,47,-60,-69,47,47,47,47,47,47,47,47,]),'OR':([19,20,24,25,26,27,28,29,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,72,76,80,92,105,107,108,111,120,126,],[-67,48,-62,-63,-64,-65,-66,-68,-59,-58,48,48,48,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-60,-69,48,48,48,48,48,48,48,48,]),'COMMA':([19,24,25,26,27,28,29,32,34,49,50,52,55,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,75,76,80,],[-67,-62,-63,-64,-65,-66,-68,54,-19,-59,-58,-20,-61,77,-73,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-60,-18,-69,-72,]),'LBRACE':([53,74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[74,-74,74,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,74,74,-33,-35,74,-34,74,-36,]),'IF':([74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[-74,94,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,94,94,-33,-35,94,-34,94,-36,]),'WHILE':([74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[-74,95,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,95,95,-33,-35,95,-34,95,-36,]),'FOR':([74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[-74,96,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,96,96,-33,-35,96,-34,96,-36,]),'RETURN':([74,78,79,81,82,84,85,87,88,89,90,91,98,99,100,106,113,114,115,117,118,122,124,128,129,],[-74,97,-23,-21,-22,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,97,97,-33,-35,97,-34,97,-36,]),'ELSE':([81,84,85,87,88,89,90,91,98,99,100,106,113,117,118,124,129,],[-21,-32,-24,-26,-27,-28,-29,-30,-8,-25,-31,-45,-44,122,-35,-34,-36,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'declarations':([0,],[2,]),'declaration':([0,2,],[3,11,]),'var_decl':([0,2,75,99,109,110,117,123,],[4,4,81,105,81,81,81,81,]),'function_decl':([0,2,],[5,5,]),'type':([0,2,15,51,75,99,109,110,117,123,],[6,6,27,27,89,89,89,89,89,89,]),'expression':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,74,75,93,97,98,99,109,110,111,117,118,123,],[17,46,47,48,52,56,57,58,59,60,61,62,63,64,65,66,67,68,77,88,100,102,103,106,88,88,115,88,121,88,]),'primary':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,74,75,93,97,98,99,109,110,111,117,118,123,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'function_call':([14,18,19,20,32,33,34,35,36,37,38,39,40,41,42,43,44,45,74,75,93,97,98,99,109,110,111,117,118,123,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'params':([15,],[28,]),'param_list':([15,],[29,]),'empty':([15,33,71,99,111,118,],[30,55,76,107,116,122,]),'param':([15,51,],[31,72,]),'args':([33,],[53,]),'arg_list':([33,],[54,]),'block':([50,75,109,110,117,123,],[70,87,87,87,87,87,]),'statements':([71,],[75,]),'statement':([75,109,110,117,123,],[79,112,113,119,124,]),'expression_statement':([75,109,110,117,123,],[80,80,80,80,80,]),'if_statement':([75,109,110,117,123,],[83,83,83,83,83,]),'while_statement':([75,109,110,117,123,],[84,84,84,84,84,]),'for_statement':([75,109,110,117,123,],[85,85,85,85,85,]),'return_statement':([75,109,110,117,123,],[86,86,86,86,86,]),'for_init':([99,],[104,]),'for_cond':([111,],[114,]),'for_update':([118,],[120,]),}
+_lr_goto_items = {'program':([0,],[1,]),'declarations':([0,],[2,]),'declaration':([0,2,],[3,12,]),'var_decl':([0,2,78,104,114,115,122,128,],[4,4,86,110,86,86,86,86,]),'function_decl':([0,2,],[5,5,]),'type':([0,2,18,54,78,104,114,115,122,128,],[7,7,30,30,93,93,93,93,93,93,]),'expression':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,77,78,97,102,103,104,114,115,116,122,123,128,],[20,49,50,51,55,59,60,61,62,63,64,65,66,67,68,69,70,71,80,92,105,107,108,111,92,92,120,92,126,92,]),'primary':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,77,78,97,102,103,104,114,115,116,122,123,128,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'function_call':([17,21,22,23,35,36,37,38,39,40,41,42,43,44,45,46,47,48,77,78,97,102,103,104,114,115,116,122,123,128,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'params':([18,],[31,]),'param_list':([18,],[32,]),'empty':([18,36,74,104,116,123,],[33,58,79,112,121,127,]),'param':([18,54,],[34,75,]),'args':([36,],[56,]),'arg_list':([36,],[57,]),'block':([53,78,114,115,122,128,],[73,91,91,91,91,91,]),'statements':([74,],[78,]),'statement':([78,114,115,122,128,],[82,117,118,124,129,]),'expression_statement':([78,114,115,122,128,],[85,85,85,85,85,]),'if_statement':([78,114,115,122,128,],[87,87,87,87,87,]),'while_statement':([78,114,115,122,128,],[88,88,88,88,88,]),'for_statement':([78,114,115,122,128,],[89,89,89,89,89,]),'return_statement':([78,114,115,122,128,],[90,90,90,90,90,]),'for_init':([104,],[109,]),'for_cond':([116,],[119,]),'for_update':([123,],[125,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,75 +27,78 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> declarations','program',1,'p_program','parser.py',29),
-  ('declarations -> declarations declaration','declarations',2,'p_declarations','parser.py',34),
-  ('declarations -> declaration','declarations',1,'p_declarations','parser.py',35),
-  ('declaration -> var_decl SEMICOLON','declaration',2,'p_declaration','parser.py',51),
-  ('declaration -> function_decl','declaration',1,'p_declaration','parser.py',52),
-  ('var_decl -> type IDENTIFIER','var_decl',2,'p_var_decl','parser.py',64),
-  ('var_decl -> type IDENTIFIER ASSIGN expression','var_decl',4,'p_var_decl','parser.py',65),
-  ('type -> INT','type',1,'p_type','parser.py',76),
-  ('type -> FLOAT','type',1,'p_type','parser.py',77),
-  ('type -> CHAR_TYPE','type',1,'p_type','parser.py',78),
-  ('type -> VOID','type',1,'p_type','parser.py',79),
-  ('function_decl -> type IDENTIFIER LPAREN params RPAREN block','function_decl',6,'p_function_decl','parser.py',84),
-  ('params -> param_list','params',1,'p_params','parser.py',89),
-  ('params -> empty','params',1,'p_params','parser.py',90),
-  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','parser.py',98),
-  ('param_list -> param','param_list',1,'p_param_list','parser.py',99),
-  ('param -> type IDENTIFIER','param',2,'p_param','parser.py',107),
-  ('block -> LBRACE statements RBRACE','block',3,'p_block','parser.py',112),
-  ('statements -> statements statement','statements',2,'p_statements','parser.py',117),
-  ('statements -> empty','statements',1,'p_statements','parser.py',118),
-  ('statement -> expression_statement','statement',1,'p_statement','parser.py',132),
-  ('statement -> var_decl SEMICOLON','statement',2,'p_statement','parser.py',133),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',134),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',135),
-  ('statement -> for_statement','statement',1,'p_statement','parser.py',136),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',137),
-  ('statement -> block','statement',1,'p_statement','parser.py',138),
-  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',143),
-  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser.py',144),
-  ('if_statement -> IF LPAREN expression RPAREN statement','if_statement',5,'p_if_statement','parser.py',152),
-  ('if_statement -> IF LPAREN expression RPAREN statement ELSE statement','if_statement',7,'p_if_statement','parser.py',153),
-  ('while_statement -> WHILE LPAREN expression RPAREN statement','while_statement',5,'p_while_statement','parser.py',161),
-  ('for_statement -> FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_update RPAREN statement','for_statement',9,'p_for_statement','parser.py',166),
-  ('for_init -> var_decl','for_init',1,'p_for_init','parser.py',171),
-  ('for_init -> expression','for_init',1,'p_for_init','parser.py',172),
-  ('for_init -> empty','for_init',1,'p_for_init','parser.py',173),
-  ('for_cond -> expression','for_cond',1,'p_for_cond','parser.py',178),
-  ('for_cond -> empty','for_cond',1,'p_for_cond','parser.py',179),
-  ('for_update -> expression','for_update',1,'p_for_update','parser.py',184),
-  ('for_update -> empty','for_update',1,'p_for_update','parser.py',185),
-  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',190),
-  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',191),
-  ('expression -> expression PLUS expression','expression',3,'p_expression','parser.py',199),
-  ('expression -> expression MINUS expression','expression',3,'p_expression','parser.py',200),
-  ('expression -> expression MULTIPLY expression','expression',3,'p_expression','parser.py',201),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression','parser.py',202),
-  ('expression -> expression EQ expression','expression',3,'p_expression','parser.py',203),
-  ('expression -> expression NE expression','expression',3,'p_expression','parser.py',204),
-  ('expression -> expression LT expression','expression',3,'p_expression','parser.py',205),
-  ('expression -> expression GT expression','expression',3,'p_expression','parser.py',206),
-  ('expression -> expression LE expression','expression',3,'p_expression','parser.py',207),
-  ('expression -> expression GE expression','expression',3,'p_expression','parser.py',208),
-  ('expression -> expression AND expression','expression',3,'p_expression','parser.py',209),
-  ('expression -> expression OR expression','expression',3,'p_expression','parser.py',210),
-  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',215),
-  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',216),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',221),
-  ('expression -> IDENTIFIER ASSIGN expression','expression',3,'p_expression_assign','parser.py',226),
-  ('expression -> primary','expression',1,'p_expression_primary','parser.py',231),
-  ('primary -> INTEGER','primary',1,'p_primary_integer','parser.py',236),
-  ('primary -> FLOAT_NUMBER','primary',1,'p_primary_float','parser.py',241),
-  ('primary -> STRING','primary',1,'p_primary_string','parser.py',246),
-  ('primary -> CHAR','primary',1,'p_primary_char','parser.py',251),
-  ('primary -> IDENTIFIER','primary',1,'p_primary_identifier','parser.py',256),
-  ('primary -> function_call','primary',1,'p_primary_function_call','parser.py',261),
-  ('function_call -> IDENTIFIER LPAREN args RPAREN','function_call',4,'p_function_call','parser.py',266),
-  ('args -> arg_list','args',1,'p_args','parser.py',271),
-  ('args -> empty','args',1,'p_args','parser.py',272),
-  ('arg_list -> arg_list COMMA expression','arg_list',3,'p_arg_list','parser.py',280),
-  ('arg_list -> expression','arg_list',1,'p_arg_list','parser.py',281),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',289),
+  ('program -> declarations','program',1,'p_program','parser.py',65),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations','parser.py',70),
+  ('declarations -> declaration','declarations',1,'p_declarations','parser.py',71),
+  ('declaration -> var_decl SEMICOLON','declaration',2,'p_declaration','parser.py',91),
+  ('declaration -> function_decl','declaration',1,'p_declaration','parser.py',92),
+  ('declaration -> error SEMICOLON','declaration',2,'p_declaration_error','parser.py',105),
+  ('declaration -> error RBRACE','declaration',2,'p_declaration_error','parser.py',106),
+  ('statement -> error SEMICOLON','statement',2,'p_statement_error','parser.py',111),
+  ('var_decl -> type IDENTIFIER','var_decl',2,'p_var_decl','parser.py',117),
+  ('var_decl -> type IDENTIFIER ASSIGN expression','var_decl',4,'p_var_decl','parser.py',118),
+  ('type -> INT','type',1,'p_type','parser.py',130),
+  ('type -> FLOAT','type',1,'p_type','parser.py',131),
+  ('type -> CHAR_TYPE','type',1,'p_type','parser.py',132),
+  ('type -> VOID','type',1,'p_type','parser.py',133),
+  ('function_decl -> type IDENTIFIER LPAREN params RPAREN block','function_decl',6,'p_function_decl','parser.py',139),
+  ('params -> param_list','params',1,'p_params','parser.py',144),
+  ('params -> empty','params',1,'p_params','parser.py',145),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','parser.py',153),
+  ('param_list -> param','param_list',1,'p_param_list','parser.py',154),
+  ('param -> type IDENTIFIER','param',2,'p_param','parser.py',163),
+  ('block -> LBRACE statements RBRACE','block',3,'p_block','parser.py',168),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',173),
+  ('statements -> empty','statements',1,'p_statements','parser.py',174),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',186),
+  ('statement -> var_decl SEMICOLON','statement',2,'p_statement','parser.py',187),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',188),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',189),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',190),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',191),
+  ('statement -> block','statement',1,'p_statement','parser.py',192),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',200),
+  ('expression_statement -> SEMICOLON','expression_statement',1,'p_expression_statement','parser.py',201),
+  ('if_statement -> IF LPAREN expression RPAREN statement','if_statement',5,'p_if_statement','parser.py',209),
+  ('if_statement -> IF LPAREN expression RPAREN statement ELSE statement','if_statement',7,'p_if_statement','parser.py',210),
+  ('while_statement -> WHILE LPAREN expression RPAREN statement','while_statement',5,'p_while_statement','parser.py',218),
+  ('for_statement -> FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_update RPAREN statement','for_statement',9,'p_for_statement','parser.py',223),
+  ('for_init -> var_decl','for_init',1,'p_for_init','parser.py',228),
+  ('for_init -> expression','for_init',1,'p_for_init','parser.py',229),
+  ('for_init -> empty','for_init',1,'p_for_init','parser.py',230),
+  ('for_cond -> expression','for_cond',1,'p_for_cond','parser.py',235),
+  ('for_cond -> empty','for_cond',1,'p_for_cond','parser.py',236),
+  ('for_update -> expression','for_update',1,'p_for_update','parser.py',241),
+  ('for_update -> empty','for_update',1,'p_for_update','parser.py',242),
+  ('return_statement -> RETURN expression SEMICOLON','return_statement',3,'p_return_statement','parser.py',247),
+  ('return_statement -> RETURN SEMICOLON','return_statement',2,'p_return_statement','parser.py',248),
+  ('expression -> expression PLUS expression','expression',3,'p_expression','parser.py',256),
+  ('expression -> expression MINUS expression','expression',3,'p_expression','parser.py',257),
+  ('expression -> expression MULTIPLY expression','expression',3,'p_expression','parser.py',258),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression','parser.py',259),
+  ('expression -> expression EQ expression','expression',3,'p_expression','parser.py',260),
+  ('expression -> expression NE expression','expression',3,'p_expression','parser.py',261),
+  ('expression -> expression LT expression','expression',3,'p_expression','parser.py',262),
+  ('expression -> expression GT expression','expression',3,'p_expression','parser.py',263),
+  ('expression -> expression LE expression','expression',3,'p_expression','parser.py',264),
+  ('expression -> expression GE expression','expression',3,'p_expression','parser.py',265),
+  ('expression -> expression AND expression','expression',3,'p_expression','parser.py',266),
+  ('expression -> expression OR expression','expression',3,'p_expression','parser.py',267),
+  ('expression -> NOT expression','expression',2,'p_expression_unary','parser.py',272),
+  ('expression -> MINUS expression','expression',2,'p_expression_unary','parser.py',273),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','parser.py',278),
+  ('expression -> IDENTIFIER ASSIGN expression','expression',3,'p_expression_assign','parser.py',283),
+  ('expression -> primary','expression',1,'p_expression_primary','parser.py',289),
+  ('primary -> INTEGER','primary',1,'p_primary_integer','parser.py',294),
+  ('primary -> FLOAT_NUMBER','primary',1,'p_primary_float','parser.py',299),
+  ('primary -> STRING','primary',1,'p_primary_string','parser.py',304),
+  ('primary -> CHAR','primary',1,'p_primary_char','parser.py',309),
+  ('primary -> IDENTIFIER','primary',1,'p_primary_identifier','parser.py',314),
+  ('primary -> function_call','primary',1,'p_primary_function_call','parser.py',319),
+  ('function_call -> IDENTIFIER LPAREN args RPAREN','function_call',4,'p_function_call','parser.py',324),
+  ('args -> arg_list','args',1,'p_args','parser.py',329),
+  ('args -> empty','args',1,'p_args','parser.py',330),
+  ('arg_list -> arg_list COMMA expression','arg_list',3,'p_arg_list','parser.py',338),
+  ('arg_list -> expression','arg_list',1,'p_arg_list','parser.py',339),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',348),
 ]
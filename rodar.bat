@@ -39,7 +39,7 @@ echo.
 echo Executando analise do arquivo: %~1
 echo ========================================
 echo.
-python main.py %~1
+python main.py %*
 
 REM Verificar se houve erro
 if errorlevel 1 (
@@ -0,0 +1,502 @@
+"""
+Módulo de análise semântica.
+
+Depois da análise sintática, resolve cada nome do programa para a sua
+declaração e verifica os tipos (int, float, char e void), com as mesmas
+regras do compilador para bytecode (vm.py):
+
+- escopos: o global, o dos parâmetros de cada função (compartilhado com
+  o corpo dela), o de cada Block e o da inicialização de um for. Como em
+  compile_program, as funções e as variáveis globais podem ser usadas
+  antes de sua declaração;
+- cada Identifier e FunctionCall é associado ao Symbol da declaração
+  (VarDecl ou FunctionDecl) e cada expressão recebe o seu tipo, em
+  dicionários indexados pelo id do nó, de modo que as etapas seguintes
+  não precisam percorrer a árvore novamente para encontrá-los;
+- os erros (nomes não declarados ou declarados duas vezes no mesmo
+  escopo, operandos, conversões, argumentos e retornos inválidos) são
+  registrados como diagnósticos SEMANTIC e a análise continua. Um nó
+  cujo tipo não pôde ser determinado não gera novos erros.
+
+A tabela de símbolos guarda, em um único dicionário, a cadeia de
+declarações visíveis de cada nome (a mais interna por último): a busca
+custa uma consulta ao dicionário, qualquer que seja a profundidade dos
+escopos. Os nomes são internados pelo lexer (sys.intern), de modo que as
+comparações de chaves se resolvem pela identidade das strings.
+"""
+
+from bisect import bisect_right
+
+from ast_nodes import (Assignment, BinOp, Block, Char, ExpressionStatement, ForStatement,
+                       FunctionCall, FunctionDecl, Identifier, IfStatement, Number,
+                       ReturnStatement, String, UnaryOp, VarDecl, WhileStatement)
+from diagnostics import semantic_error
+from vm import VALUE_TYPES, char_code
+
+
+# Tipos de símbolo
+VARIABLE = 'variável'
+PARAMETER = 'parâmetro'
+FUNCTION = 'função'
+
+# Operadores cujo resultado tem o tipo dos operandos (os demais dão int)
+_ARITHMETIC_OPS = frozenset(('+', '-', '*', '/'))
+
+# Tarefas do percurso dos comandos
+_STATEMENT = 0
+_EXPRESSION = 1
+_CONDITION = 2
+_EXIT_SCOPE = 3
+
+
+class Symbol:
+    """
+    Uma declaração visível em um escopo.
+    
+    Attributes:
+        name: Nome declarado
+        kind: Tipo do símbolo (VARIABLE, PARAMETER ou FUNCTION)
+        type: Tipo da variável ou tipo de retorno da função (None se a
+            declaração for inválida)
+        decl: Nó da declaração (VarDecl ou FunctionDecl; None para
+            funções externas)
+        params: Tipos dos parâmetros de uma função (None se não forem
+            verificados, como nas funções externas)
+        depth: Profundidade do escopo da declaração (0 é o global)
+    """
+    
+    __slots__ = ('name', 'kind', 'type', 'decl', 'params', 'depth')
+    
+    def __init__(self, name, kind, type, decl=None, params=None):
+        self.name = name
+        self.kind = kind
+        self.type = type
+        self.decl = decl
+        self.params = params
+        self.depth = 0
+    
+    def __repr__(self):
+        return f"Symbol({self.name!r}, {self.kind!r}, {self.type!r}, depth={self.depth})"
+
+
+class SymbolTable:
+    """
+    Tabela de símbolos com escopos aninhados.
+    
+    Cada nome tem uma cadeia com as suas declarações visíveis, da mais
+    externa para a mais interna, em um único dicionário; cada escopo
+    aberto guarda os nomes que declarou, que são retirados das cadeias
+    quando ele é fechado. Assim, lookup e declare custam O(1),
+    independentemente da profundidade.
+    """
+    
+    def __init__(self):
+        self._chains = {}
+        self._scopes = [[]]
+    
+    @property
+    def depth(self):
+        """Profundidade do escopo atual (0 é o global)."""
+        return len(self._scopes) - 1
+    
+    def enter(self):
+        """Abre um escopo aninhado ao atual."""
+        self._scopes.append([])
+    
+    def exit(self):
+        """Fecha o escopo atual, descartando as suas declarações."""
+        chains = self._chains
+        for name in self._scopes.pop():
+            chain = chains[name]
+            chain.pop()
+            if not chain:
+                del chains[name]
+    
+    def declare(self, symbol):
+        """
+        Declara um símbolo no escopo atual.
+        
+        Returns:
+            None, ou o símbolo de mesmo nome já declarado neste escopo (e
+            nesse caso o novo símbolo não é declarado)
+        """
+        name = symbol.name
+        depth = len(self._scopes) - 1
+        chain = self._chains.get(name)
+        if chain is None:
+            self._chains[name] = [symbol]
+        elif chain[-1].depth == depth:
+            return chain[-1]
+        else:
+            chain.append(symbol)
+        symbol.depth = depth
+        self._scopes[-1].append(name)
+        return None
+    
+    def lookup(self, name):
+        """Símbolo visível com o nome informado, ou None."""
+        chain = self._chains.get(name)
+        return chain[-1] if chain else None
+    
+    def symbols(self):
+        """Dicionário nome -> Symbol das declarações do escopo atual."""
+        chains = self._chains
+        return {name: chains[name][-1] for name in self._scopes[-1]}
+
+
+class Analysis:
+    """
+    Resultado da análise semântica.
+    
+    Os dicionários são indexados pelo id dos nós, que permanecem válidos
+    enquanto a AST (guardada em ast) existir.
+    
+    Attributes:
+        ast: AST analisada
+        globals: Dicionário nome -> Symbol das declarações globais
+        resolutions: Dicionário id(Identifier ou FunctionCall) -> Symbol
+        types: Dicionário id(expressão) -> tipo (None se desconhecido)
+        errors: Quantidade de erros semânticos
+    """
+    
+    def __init__(self, ast, globals, resolutions, types, errors):
+        self.ast = ast
+        self.globals = globals
+        self.resolutions = resolutions
+        self.types = types
+        self.errors = errors
+    
+    @property
+    def ok(self):
+        """True se não houve erros semânticos."""
+        return not self.errors
+    
+    def symbol(self, node):
+        """Symbol a que um Identifier ou FunctionCall se refere (ou None)."""
+        return self.resolutions.get(id(node))
+    
+    def declaration(self, node):
+        """Nó da declaração a que um Identifier ou FunctionCall se refere (ou None)."""
+        symbol = self.resolutions.get(id(node))
+        return None if symbol is None else symbol.decl
+    
+    def type_of(self, node):
+        """Tipo de uma expressão (None se desconhecido)."""
+        return self.types.get(id(node))
+
+
+class _Analyzer:
+    """Estado de uma análise semântica (veja analyze)."""
+    
+    def __init__(self, diagnostics, source):
+        self.diagnostics = diagnostics
+        self.source = source
+        self.line_starts = None
+        self.table = SymbolTable()
+        self.resolutions = {}
+        self.types = {}
+        self.errors = 0
+        self.function = None
+    
+    def _error(self, message, node):
+        """Registra um erro semântico na posição do nó."""
+        self.errors += 1
+        pos = node.start if node is not None else None
+        line = None
+        if pos is not None and self.source is not None:
+            if self.line_starts is None:
+                # Início de cada linha, calculado no primeiro erro
+                source = self.source
+                starts = [0]
+                index = source.find('\n')
+                while index >= 0:
+                    starts.append(index + 1)
+                    index = source.find('\n', index + 1)
+                self.line_starts = starts
+            line = bisect_right(self.line_starts, pos)
+        semantic_error(self.diagnostics, line, pos, message)
+    
+    # Declarações
+    
+    def _variable(self, decl, kind):
+        """Declara uma variável ou parâmetro no escopo atual."""
+        var_type = decl.var_type
+        if var_type not in VALUE_TYPES:
+            self._error(f"Tipo inválido para a variável '{decl.name}': {var_type}", decl)
+            var_type = None
+        if self.table.declare(Symbol(decl.name, kind, var_type, decl)) is not None:
+            self._error(f"'{decl.name}' já foi declarado neste escopo", decl)
+    
+    def declare_globals(self, ast, builtins):
+        """
+        Declara as funções externas, as funções e as variáveis globais.
+        
+        Returns:
+            Tupla (dicionário nome -> Symbol das declarações globais, lista
+            de pares (FunctionDecl, Symbol) das funções declaradas)
+        """
+        table = self.table
+        for name, return_type in builtins.items():
+            table.declare(Symbol(name, FUNCTION, return_type))
+        
+        functions = []
+        for decl in ast:
+            if isinstance(decl, FunctionDecl):
+                # Parâmetros com tipo inválido não são verificados nas chamadas
+                params = tuple(param.var_type if param.var_type in VALUE_TYPES else None
+                               for param in decl.params)
+                symbol = Symbol(decl.name, FUNCTION, decl.return_type, decl, params)
+                previous = table.declare(symbol)
+                if previous is None:
+                    functions.append((decl, symbol))
+                elif previous.kind == FUNCTION:
+                    self._error(f"Função declarada mais de uma vez: '{decl.name}'", decl)
+                else:
+                    self._error(f"'{decl.name}' já foi declarado neste escopo", decl)
+            elif isinstance(decl, VarDecl):
+                previous = table.lookup(decl.name)
+                # Como em C, uma variável global pode ser declarada de novo
+                # com o mesmo tipo
+                if (previous is not None and previous.kind == VARIABLE
+                        and previous.decl.var_type == decl.var_type):
+                    continue
+                self._variable(decl, VARIABLE)
+        return table.symbols(), functions
+    
+    def function_body(self, decl, symbol):
+        """Analisa o corpo de uma função."""
+        # O corpo da função compartilha o escopo dos parâmetros
+        self.table.enter()
+        for param in decl.params:
+            self._variable(param, PARAMETER)
+        self.statements(decl.body.statements, symbol)
+        self.table.exit()
+    
+    # Comandos
+    
+    def statements(self, node, function=None):
+        """
+        Analisa um comando (ou uma lista ou tupla de comandos), sem recursão.
+        
+        Args:
+            node: Comando, lista ou tupla de comandos
+            function: Symbol da função que contém os comandos (None para
+                a inicialização das variáveis globais)
+        """
+        self.function = function
+        table = self.table
+        stack = [(_STATEMENT, node)]
+        while stack:
+            action, node = stack.pop()
+            if node is None:
+                continue
+            if action == _EXPRESSION:
+                self.expression(node)
+                continue
+            if action == _CONDITION:
+                self._condition(node)
+                continue
+            if action == _EXIT_SCOPE:
+                table.exit()
+                continue
+            
+            node_type = type(node)
+            if node_type is list or node_type is tuple:
+                stack.extend((_STATEMENT, item) for item in reversed(node))
+            elif node_type is ExpressionStatement:
+                if node.expr is not None:
+                    self.expression(node.expr)
+            elif node_type is Assignment:
+                self.expression(node)
+            elif node_type is VarDecl:
+                self._variable(node, VARIABLE)
+            elif node_type is Block:
+                table.enter()
+                stack.append((_EXIT_SCOPE, node))
+                stack.append((_STATEMENT, node.statements))
+            elif node_type is IfStatement:
+                self._condition(node.condition)
+                stack.append((_STATEMENT, node.else_block))
+                stack.append((_STATEMENT, node.then_block))
+            elif node_type is WhileStatement:
+                self._condition(node.condition)
+                stack.append((_STATEMENT, node.body))
+            elif node_type is ForStatement:
+                # As variáveis declaradas na inicialização pertencem ao for
+                table.enter()
+                stack.append((_EXIT_SCOPE, node))
+                stack.append((_STATEMENT, node.body))
+                stack.append((_EXPRESSION, node.update))
+                stack.append((_CONDITION, node.condition))
+                if isinstance(node.init, (VarDecl, tuple)):
+                    stack.append((_STATEMENT, node.init))
+                else:
+                    stack.append((_EXPRESSION, node.init))
+            elif node_type is ReturnStatement:
+                self._return(node)
+            else:
+                self._error(f"Comando não suportado: {node_type.__name__}", node)
+    
+    def _condition(self, expr):
+        value_type = self.expression(expr)
+        if value_type is not None and value_type not in VALUE_TYPES:
+            self._error(f"Condição inválida do tipo {value_type}", expr)
+    
+    def _return(self, node):
+        function = self.function
+        if function is None:
+            return
+        if node.value is None:
+            return
+        value_type = self.expression(node.value)
+        if function.type == 'void':
+            self._error("Função void não pode retornar um valor", node)
+        else:
+            self._conversion(value_type, function.type, node.value)
+    
+    # Expressões
+    
+    def _conversion(self, source, target, node):
+        """Verifica se um valor do tipo source pode ser convertido para target."""
+        if source is None or target is None or source == target:
+            return
+        if source not in VALUE_TYPES or target not in VALUE_TYPES:
+            self._error(f"Conversão inválida de {source} para {target}", node)
+    
+    def _arithmetic(self, value_type, op, node):
+        """Tipo de um operando em uma operação aritmética, relacional ou lógica."""
+        if value_type == 'float':
+            return 'float'
+        if value_type == 'int' or value_type == 'char':
+            return 'int'
+        if value_type is not None:
+            self._error(f"Operando inválido do tipo {value_type} para '{op}'", node)
+        return None
+    
+    def _variable_symbol(self, node):
+        """Resolve o Identifier de uma variável e devolve o seu tipo."""
+        symbol = self.table.lookup(node.name)
+        if symbol is None:
+            self._error(f"Variável não declarada: '{node.name}'", node)
+            return None
+        self.resolutions[id(node)] = symbol
+        if symbol.kind == FUNCTION:
+            self._error(f"'{node.name}' é uma função e não pode ser usado como variável", node)
+            return None
+        return symbol.type
+    
+    def _call(self, node, types):
+        """Resolve uma chamada de função, verifica os argumentos e devolve o tipo de retorno."""
+        symbol = self.table.lookup(node.name)
+        if symbol is None:
+            self._error(f"Função não declarada: '{node.name}'", node)
+            return None
+        self.resolutions[id(node)] = symbol
+        if symbol.kind != FUNCTION:
+            self._error(f"'{node.name}' não é uma função", node)
+            return None
+        params = symbol.params
+        if params is None:
+            for arg in node.args:
+                if types[id(arg)] == 'void':
+                    self._error("Argumento do tipo void", arg)
+        elif len(node.args) != len(params):
+            self._error(f"A função '{node.name}' espera {len(params)} "
+                        f"argumento(s), recebeu {len(node.args)}", node)
+        else:
+            for arg, param_type in zip(node.args, params):
+                self._conversion(types[id(arg)], param_type, arg)
+        return symbol.type
+    
+    def expression(self, expr):
+        """
+        Resolve os nomes e calcula, sem recursão, o tipo de cada nó de
+        uma expressão.
+        
+        Returns:
+            Tipo da expressão (None se desconhecido)
+        """
+        if expr is None:
+            return None
+        types = self.types
+        stack = [(expr, False)]
+        while stack:
+            node, done = stack.pop()
+            if not done:
+                stack.append((node, True))
+                node_type = type(node)
+                if node_type is BinOp:
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                elif node_type is UnaryOp:
+                    stack.append((node.operand, False))
+                elif node_type is Assignment:
+                    stack.append((node.right, False))
+                elif node_type is FunctionCall:
+                    stack.extend((arg, False) for arg in reversed(node.args))
+                continue
+            
+            node_type = type(node)
+            if node_type is Identifier:
+                result = self._variable_symbol(node)
+            elif node_type is BinOp:
+                op = node.op
+                left = self._arithmetic(types[id(node.left)], op, node)
+                right = self._arithmetic(types[id(node.right)], op, node)
+                if op not in _ARITHMETIC_OPS:
+                    result = 'int'
+                elif left is None or right is None:
+                    result = None
+                else:
+                    result = 'float' if left == 'float' or right == 'float' else 'int'
+            elif node_type is Number:
+                result = 'float' if isinstance(node.value, float) else 'int'
+            elif node_type is Assignment:
+                target = node.left
+                result = self._variable_symbol(target)
+                types[id(target)] = result
+                self._conversion(types[id(node.right)], result, node.right)
+            elif node_type is FunctionCall:
+                result = self._call(node, types)
+            elif node_type is UnaryOp:
+                operand = self._arithmetic(types[id(node.operand)], node.op, node)
+                result = operand if node.op == '-' else 'int'
+            elif node_type is Char:
+                result = 'char'
+                if char_code(node.value) is None:
+                    self._error(f"Literal de caractere inválido: {node.value!r}", node)
+            elif node_type is String:
+                result = 'string'
+            else:
+                self._error(f"Expressão não suportada: {node_type.__name__}", node)
+                result = None
+            types[id(node)] = result
+        return types[id(expr)]
+
+
+def analyze(ast, diagnostics=None, source=None, builtins=None):
+    """
+    Executa a análise semântica de um programa.
+    
+    Args:
+        ast: Lista de declarações devolvida por parser.parse
+        diagnostics: Diagnostics em que os erros são registrados (None:
+            imprimir)
+        source: Código fonte analisado, usado para informar a linha dos
+            erros (sem ele, somente a posição)
+        builtins: Dicionário nome -> tipo de retorno das funções externas
+            que o programa pode chamar (como em vm.compile_program)
+            
+    Returns:
+        Analysis com as resoluções, os tipos e a quantidade de erros
+    """
+    analyzer = _Analyzer(diagnostics, source)
+    global_symbols, functions = analyzer.declare_globals(ast, builtins or {})
+    
+    # Inicialização das globais, na ordem do código fonte
+    analyzer.statements([decl for decl in ast if isinstance(decl, Assignment)])
+    
+    for decl, symbol in functions:
+        analyzer.function_body(decl, symbol)
+    
+    return Analysis(ast, global_symbols, analyzer.resolutions, analyzer.types, analyzer.errors)
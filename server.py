@@ -0,0 +1,420 @@
+"""
+Servidor de análise de longa duração (JSON-RPC).
+
+Mantém processos de trabalho com o lexer e o parser já carregados e
+atende requisições JSON-RPC 2.0 pela entrada e saída padrão ou por um
+socket Unix local, evitando o custo de iniciar o Python e importar o
+PLY a cada arquivo. Cada mensagem é precedida pelo cabeçalho
+Content-Length (como no Language Server Protocol):
+
+    Content-Length: 63\\r\\n
+    \\r\\n
+    {"jsonrpc": "2.0", "id": 1, "method": "parse", "params": {...}}
+    
+Métodos (params: "text" com o código fonte ou "path" com o caminho do
+arquivo, e "engine" opcional, 'ply' ou 'fast'):
+
+- parse: resumo da análise ({"ok", "tokens", "nodes", "errors"})
+- tokens: lista de tokens ([tipo, valor, linha])
+- ast: AST em JSON, como no formato jsonl ({"ok", "ast"})
+- diagnostics: mensagens de erro ({"ok", "messages"}); com "check"
+  verdadeiro, inclui a análise semântica
+- $/cancelRequest (notificação, params {"id"}): cancela uma requisição
+- shutdown: encerra o servidor após responder
+
+As requisições são atendidas ao mesmo tempo por um conjunto de processos
+de trabalho (ProcessPoolExecutor) e o resultado já vem serializado em
+JSON do processo. Uma requisição cancelada recebe o erro -32800; se
+ainda não começou, não é executada, e se já está em execução, o
+resultado é descartado. No fim da entrada (ou após um shutdown), as
+requisições em andamento são concluídas antes de a conexão ser encerrada.
+
+Uso: python server.py [--socket CAMINHO] [-j N] [--lexer ply|fast]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+
+
+# Códigos de erro do JSON-RPC (e o de cancelamento do LSP)
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_ERROR = -32000
+REQUEST_CANCELLED = -32800
+
+METHODS = ('parse', 'tokens', 'ast', 'diagnostics')
+
+
+class RequestError(Exception):
+    """Erro de uma requisição, enviado ao cliente com o código informado."""
+    
+    def __init__(self, code, message):
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
+
+
+def valid_id(value):
+    """Se value é um id de requisição aceito: string, inteiro ou null."""
+    return value is None or type(value) is str or type(value) is int
+
+
+# Enquadramento das mensagens
+
+def frame(body):
+    """Mensagem (bytes) com o cabeçalho Content-Length."""
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+async def read_message(reader):
+    """
+    Lê uma mensagem enquadrada de um asyncio.StreamReader.
+    
+    Returns:
+        Corpo da mensagem (bytes) ou None no fim da entrada
+        
+    Raises:
+        RequestError: Se o cabeçalho for inválido
+    """
+    length = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        line = line.rstrip(b"\r\n")
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    if length is None:
+        raise RequestError(INVALID_REQUEST, "Cabeçalho Content-Length ausente")
+    try:
+        return await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def response(request_id, result_json):
+    """Corpo de uma resposta com o resultado já serializado em JSON."""
+    return (f'{{"jsonrpc": "2.0", "id": {json.dumps(request_id)}, "result": '
+            f'{result_json}}}').encode('utf-8')
+
+
+def error_response(request_id, code, message):
+    """Corpo de uma resposta de erro."""
+    return json.dumps({"jsonrpc": "2.0", "id": request_id,
+                       "error": {"code": code, "message": message}},
+                      ensure_ascii=False).encode('utf-8')
+
+
+# Execução (nos processos de trabalho)
+
+# Sessões de análise do processo de trabalho, uma por motor léxico
+_sessions = {}
+_default_engine = 'ply'
+
+
+def _init_worker(engine='ply'):
+    """Carrega o lexer e o parser no processo de trabalho."""
+    global _default_engine
+    from diagnostics import Diagnostics
+    _default_engine = engine
+    _session(engine).parse("int x;", Diagnostics())
+
+
+def _session(engine):
+    from parser import LEXER_ENGINES, ParserSession
+    session = _sessions.get(engine)
+    if session is None:
+        if engine not in LEXER_ENGINES:
+            raise RequestError(INVALID_PARAMS, f"Motor léxico desconhecido: {engine}")
+        session = _sessions[engine] = ParserSession(engine=engine)
+    return session
+
+
+def _ping():
+    return os.getpid()
+
+
+def _source(params):
+    """Código fonte de uma requisição (params "text" ou "path")."""
+    from cache import decode_source
+    if isinstance(params.get('text'), str):
+        return params['text']
+    path = params.get('path')
+    if not isinstance(path, str):
+        raise RequestError(INVALID_PARAMS, "Informe 'text' ou 'path'")
+    try:
+        with open(path, 'rb') as f:
+            return decode_source(f.read())
+    except (OSError, UnicodeDecodeError) as e:
+        raise RequestError(SERVER_ERROR, f"Erro ao ler o arquivo: {e}")
+
+
+def execute(method, params):
+    """
+    Executa um método de análise.
+    
+    Args:
+        method: Um de METHODS
+        params: Dicionário de parâmetros da requisição
+        
+    Returns:
+        String com o resultado em JSON
+        
+    Raises:
+        RequestError: Se os parâmetros forem inválidos
+    """
+    from ast_nodes import iter_nodes
+    from diagnostics import Diagnostics
+    from output import iter_json
+    
+    if not isinstance(params, dict):
+        raise RequestError(INVALID_PARAMS, "Os parâmetros devem ser um objeto")
+    source = _source(params)
+    session = _session(params.get('engine', _default_engine))
+    diagnostics = Diagnostics()
+    tokens, ast = session.parse_with_tokens(source, columnar=method == 'parse',
+                                            diagnostics=diagnostics)
+    messages = diagnostics.messages()
+    ok = ast is not None and not messages
+    
+    if method == 'parse':
+        nodes = sum(1 for _ in iter_nodes(ast)) if ast is not None else 0
+        return json.dumps({"ok": ok, "tokens": len(tokens), "nodes": nodes,
+                           "errors": len(messages)})
+    if method == 'tokens':
+        return json.dumps({"ok": ok, "tokens": tokens}, ensure_ascii=False)
+    if method == 'ast':
+        ast_json = "".join(iter_json(ast)) if ast is not None else "null"
+        return f'{{"ok": {json.dumps(ok)}, "ast": {ast_json}}}'
+    if params.get('check') and ast is not None:
+        import semantic
+        diagnostics = Diagnostics()
+        ok = semantic.analyze(ast, diagnostics, source).ok and ok
+        messages = messages + diagnostics.messages()
+    return json.dumps({"ok": ok, "messages": messages}, ensure_ascii=False)
+
+
+# Servidor
+
+class ParseServer:
+    """
+    Servidor JSON-RPC com um conjunto de processos de trabalho.
+    
+    Attributes:
+        workers: Quantidade de processos de trabalho
+        engine: Motor léxico padrão das requisições
+    """
+    
+    def __init__(self, workers=None, engine='ply'):
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.executor = None
+        self.stopped = None
+    
+    async def start(self):
+        """Cria os processos de trabalho e aguarda que estejam prontos."""
+        from concurrent.futures import ProcessPoolExecutor
+        loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.engine,))
+        await asyncio.gather(*(loop.run_in_executor(self.executor, _ping)
+                               for _ in range(self.workers)))
+    
+    def close(self):
+        if self.executor is not None:
+            # As requisições na fila são descartadas; as em execução terminam
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+    
+    async def serve_connection(self, reader, send):
+        """
+        Atende as requisições de uma conexão até o fim da entrada ou até
+        um shutdown; as requisições em andamento são concluídas antes do
+        retorno.
+        
+        Args:
+            reader: asyncio.StreamReader com as mensagens do cliente
+            send: Corrotina que envia o corpo de uma mensagem (bytes)
+        """
+        loop = asyncio.get_running_loop()
+        # Execução de cada requisição em andamento (pelo id) e as tarefas
+        # que aguardam os resultados
+        pending = {}
+        tasks = set()
+        lock = asyncio.Lock()
+        
+        async def reply(body):
+            async with lock:
+                await send(frame(body))
+        
+        async def run(request_id, future):
+            try:
+                result = await future
+            except asyncio.CancelledError:
+                body = error_response(request_id, REQUEST_CANCELLED, "Requisição cancelada")
+            except RequestError as e:
+                body = error_response(request_id, e.code, e.message)
+            except Exception as e:
+                body = error_response(request_id, INTERNAL_ERROR, f"Erro durante a análise: {e}")
+            else:
+                body = response(request_id, result)
+            finally:
+                # Outra requisição pode ter reutilizado o mesmo id
+                if pending.get(request_id) is future:
+                    del pending[request_id]
+            if request_id is not None:
+                try:
+                    await reply(body)
+                except OSError:
+                    # Conexão encerrada pelo cliente
+                    pass
+        
+        try:
+            while not self.stopped.is_set():
+                try:
+                    message = await read_message(reader)
+                except (RequestError, ValueError):
+                    await reply(error_response(None, INVALID_REQUEST, "Cabeçalho inválido"))
+                    break
+                if message is None:
+                    break
+                try:
+                    request = json.loads(message)
+                except ValueError:
+                    await reply(error_response(None, PARSE_ERROR, "JSON inválido"))
+                    continue
+                if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                    await reply(error_response(None, INVALID_REQUEST, "Requisição inválida"))
+                    continue
+                
+                request_id = request.get('id')
+                if not valid_id(request_id):
+                    await reply(error_response(None, INVALID_REQUEST, "Id de requisição inválido"))
+                    continue
+                method = request['method']
+                params = request.get('params') or {}
+                if method == '$/cancelRequest':
+                    cancel_id = params.get('id') if isinstance(params, dict) else None
+                    if not valid_id(cancel_id):
+                        await reply(error_response(request_id, INVALID_REQUEST,
+                                                   "Id de requisição inválido"))
+                        continue
+                    future = pending.get(cancel_id)
+                    if future is not None:
+                        future.cancel()
+                elif method == 'shutdown':
+                    await reply(response(request_id, "null"))
+                    self.stopped.set()
+                elif method not in METHODS:
+                    await reply(error_response(request_id, METHOD_NOT_FOUND,
+                                               f"Método desconhecido: {method}"))
+                else:
+                    # A execução é criada antes da tarefa, para que um
+                    # cancelamento sempre chegue a ela
+                    future = loop.run_in_executor(self.executor, execute, method, params)
+                    if request_id is not None:
+                        pending[request_id] = future
+                    task = asyncio.ensure_future(run(request_id, future))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        finally:
+            # As requisições em andamento são concluídas (e respondidas,
+            # se a conexão ainda estiver aberta) antes de encerrar
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def serve_stdio(self):
+        """Atende uma única conexão pela entrada e saída padrão."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        
+        # A entrada padrão é lida em uma thread, o que funciona com pipes
+        # e terminais em qualquer sistema
+        def pump():
+            stream = sys.stdin.buffer
+            try:
+                while True:
+                    data = stream.read1(65536)
+                    if not data:
+                        break
+                    loop.call_soon_threadsafe(reader.feed_data, data)
+                loop.call_soon_threadsafe(reader.feed_eof)
+            except RuntimeError:
+                # O laço de eventos já terminou (após um shutdown)
+                pass
+        
+        threading.Thread(target=pump, daemon=True).start()
+        stdout = sys.stdout.buffer
+        
+        async def send(data):
+            stdout.write(data)
+            stdout.flush()
+        
+        await self.serve_connection(reader, send)
+    
+    async def serve_socket(self, path):
+        """Atende conexões em um socket Unix até receber um shutdown."""
+        async def connection(reader, writer):
+            async def send(data):
+                writer.write(data)
+                await writer.drain()
+            try:
+                await self.serve_connection(reader, send)
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+        
+        server = await asyncio.start_unix_server(connection, path)
+        try:
+            async with server:
+                await self.stopped.wait()
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+async def serve(socket_path=None, workers=None, engine='ply'):
+    """
+    Executa o servidor pela entrada e saída padrão ou, com socket_path,
+    em um socket Unix.
+    """
+    server = ParseServer(workers, engine)
+    await server.start()
+    try:
+        if socket_path is None:
+            await server.serve_stdio()
+        else:
+            await server.serve_socket(socket_path)
+    finally:
+        server.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Servidor de análise JSON-RPC.")
+    arg_parser.add_argument('--socket', metavar='CAMINHO', default=None,
+                            help="socket Unix em que o servidor escuta (padrão: entrada e "
+                                 "saída padrão)")
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help="processos de trabalho (padrão: número de CPUs)")
+    arg_parser.add_argument('--lexer', choices=('ply', 'fast'), default='ply',
+                            help="motor de análise léxica padrão (padrão: ply)")
+    args = arg_parser.parse_args()
+    try:
+        asyncio.run(serve(args.socket, args.workers, args.lexer))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
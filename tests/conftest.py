@@ -0,0 +1,12 @@
+"""
+Configuração dos testes (pytest): os módulos do analisador ficam na raiz
+do repositório, como nos benchmarks.
+
+Uso: python -m pytest tests
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,107 @@
+"""
+Testes do formato binário da AST (ast_binary.py): loads(dumps(ast)) e
+BinaryAST.open() de um arquivo gravado devem reproduzir a AST de
+parser.parse (representação e posições de cada nó).
+"""
+
+import glob
+import os
+
+import pytest
+
+import ast_binary
+from ast_nodes import (BinOp, Block, FunctionDecl, IfStatement, LazyBlock, Number,
+                       ReturnStatement, UnaryOp, VarDecl, iter_nodes)
+from conftest import ROOT
+from diagnostics import Diagnostics
+from parser import ParserSession
+
+
+SAMPLES = sorted(glob.glob(os.path.join(ROOT, '*.c')))
+
+LITERALS = [0, 1, 255, 2 ** 32 - 1, 2 ** 32, 2 ** 40, 2 ** 63 - 1, 2 ** 63, 2 ** 70, 10 ** 30,
+            -1, -255, -2 ** 31, -2 ** 63, -2 ** 63 - 1, -2 ** 70,
+            0.0, -0.0, 1.5, -2.25, 1e300, -1e-300, float('inf'), True, False]
+
+
+def spans(ast):
+    return [(node.start, node.size) for node in iter_nodes(ast)]
+
+
+def assert_same(result, expected):
+    assert repr(result) == repr(expected)
+    assert spans(result) == spans(expected)
+
+
+def parse(path):
+    with open(path, encoding='utf-8') as f:
+        return ParserSession().parse(f.read(), Diagnostics())
+
+
+def literals_ast():
+    """AST com literais de todos os tipos gravados e campos None."""
+    body = [ReturnStatement(Number(value, 10 + i, 12 + i)) for i, value in enumerate(LITERALS)]
+    body.append(ReturnStatement(None, 100, 107))
+    body.append(IfStatement(UnaryOp('-', Number(3)), Block([], 120, 122), None, 110, 122))
+    body.append(BinOp(Number(-7, 130, 132), '*', Number(2.5), 130, None))
+    return [VarDecl('int', 'x', 0, 5),
+            FunctionDecl('int', 'f', [VarDecl('float', 'y')], Block(body, 8, 140), 6, 140)]
+
+
+@pytest.mark.parametrize('path', SAMPLES, ids=os.path.basename)
+def test_loads_samples(path):
+    ast = parse(path)
+    assert_same(ast_binary.loads(ast_binary.dumps(ast)), ast)
+
+
+@pytest.mark.parametrize('path', SAMPLES, ids=os.path.basename)
+def test_open_samples(path, tmp_path):
+    ast = parse(path)
+    file = tmp_path / 'ast.bin'
+    ast_binary.dump(ast, file)
+    with ast_binary.BinaryAST.open(file) as ast_file:
+        nodes = list(iter_nodes(ast))
+        assert len(ast_file) == len(nodes)
+        for i, node in enumerate(nodes):
+            assert ast_file.node_class(i) is type(node)
+            assert ast_file.span(i) == (node.start, node.end)
+        assert_same(ast_file.root(), ast)
+
+
+def test_literals():
+    ast = literals_ast()
+    result = ast_binary.loads(ast_binary.dumps(ast))
+    assert_same(result, ast)
+    values = [statement.value.value for statement in result[1].body.statements[:len(LITERALS)]]
+    assert [(type(value), value) for value in values] == [(type(value), value) for value in LITERALS]
+    assert [repr(value) for value in values] == [repr(value) for value in LITERALS]
+
+
+def test_literals_file(tmp_path):
+    ast = literals_ast()
+    file = tmp_path / 'ast.bin'
+    ast_binary.dump(ast, file)
+    with ast_binary.load(file) as ast_file:
+        assert_same(ast_file.root(), ast)
+
+
+def test_shared_leaves():
+    with open(os.path.join(ROOT, 'test_code.c'), encoding='utf-8') as f:
+        ast = ParserSession(share_leaves=True).parse(f.read(), Diagnostics())
+    assert_same(ast_binary.loads(ast_binary.dumps(ast)), ast)
+
+
+def test_lazy_block(tmp_path):
+    with open(os.path.join(ROOT, 'test_code.c'), encoding='utf-8') as f:
+        source = f.read()
+    expected = ParserSession().parse(source, Diagnostics())
+    ast = ParserSession().skim(source, Diagnostics())
+    assert any(type(decl.body) is LazyBlock and not decl.body.loaded
+               for decl in ast if type(decl) is FunctionDecl)
+    assert_same(ast_binary.loads(ast_binary.dumps(ast)), expected)
+    
+    ast = ParserSession().skim(source, Diagnostics())
+    file = tmp_path / 'ast.bin'
+    ast_binary.dump(ast, file)
+    with ast_binary.BinaryAST.open(file) as ast_file:
+        assert_same(ast_file.root(), expected)
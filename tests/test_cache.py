@@ -0,0 +1,39 @@
+"""
+Testes do cache de análises (cache.py): a chave depende da gramática
+atual e das opções que alteram o resultado guardado.
+"""
+
+import os
+
+from cache import ASTCache, grammar_fingerprint, parse_cached
+from conftest import ROOT
+from parser import ParserSession
+from tokenstream import TokenStream
+
+
+def read_sample(name='test_code.c'):
+    with open(os.path.join(ROOT, name), 'rb') as f:
+        return f.read()
+
+
+def test_fingerprint_follows_grammar(monkeypatch):
+    import cache
+    expected = grammar_fingerprint()
+    monkeypatch.setattr(cache, 'grammar_signature', lambda: 'outra gramática')
+    assert grammar_fingerprint() != expected
+
+
+def test_options_in_key(tmp_path):
+    cache = ASTCache(str(tmp_path))
+    source = read_sample()
+    for engine in ('ply', 'fast'):
+        for columnar in (False, True):
+            session = ParserSession(engine=engine)
+            expected = parse_cached(source, None, session, columnar)
+            assert parse_cached(source, cache, session, columnar)[3] is False
+            tokens, ast, messages, hit = parse_cached(source, cache, session, columnar)
+            assert hit
+            assert isinstance(tokens, TokenStream) == columnar
+            assert list(tokens) == list(expected[0])
+            assert repr(ast) == repr(expected[1]) and messages == expected[2]
+    assert (cache.hits, cache.misses) == (4, 4)
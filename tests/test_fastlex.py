@@ -0,0 +1,88 @@
+"""
+Testes diferenciais do lexer rápido (fastlex.py) contra o lexer do PLY
+(lexer.py): os tokens (tipo, valor, linha e posição) e as mensagens de
+erro devem ser os mesmos nos arquivos de exemplo e em entradas geradas.
+"""
+
+import glob
+import os
+import random
+
+import pytest
+
+import fastlex
+from conftest import ROOT
+from diagnostics import Diagnostics
+from lexer import clone_lexer, reset_lexer
+
+
+SAMPLES = sorted(glob.glob(os.path.join(ROOT, '*.c')))
+
+# Trechos usados nas entradas geradas
+PIECES = [
+    'int', 'float', 'char', 'void', 'if', 'else', 'while', 'for', 'return', 'x', '_a1', 'Var',
+    '0', '42', '3.14', '1.', '.5', '"texto"', '"a\\"b"', "'c'", "'\\n'", "''", "'ab'",
+    '+', '-', '*', '/', '=', '==', '!=', '<=', '>=', '<', '>', '&&', '||', '!', '&', '|',
+    '(', ')', '{', '}', ';', ',', ' ', '\t', '\n', '\r\n', '// comentário', '/* bloco */',
+    '/* várias\nlinhas */', '@', '#', '$', '@@##', 'é', '\x00', '\\', '`', '~',
+]
+
+# Finais que deixam algo aberto até o fim da entrada
+UNTERMINATED = ['', '"string não fechada', '"quebra\nde linha', '/* comentário não fechado',
+                '/* não fechado\n com * e / ', "'x", '//']
+
+
+def ply_tokens(data):
+    diagnostics = Diagnostics()
+    lexer_obj = clone_lexer()
+    reset_lexer(lexer_obj, data)
+    lexer_obj.diagnostics = diagnostics
+    tokens = []
+    while True:
+        tok = lexer_obj.token()
+        if not tok:
+            break
+        tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+    return tokens, diagnostics.messages()
+
+
+def fast_tokens(data):
+    diagnostics = Diagnostics()
+    tokens = [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in fastlex.scan(data, diagnostics)]
+    return tokens, diagnostics.messages()
+
+
+def generated(seed):
+    rng = random.Random(seed)
+    text = "".join(rng.choice(PIECES) for _ in range(rng.randrange(1, 200)))
+    if rng.random() < 0.3:
+        text = text.replace('\n', '\r\n')
+    return text + rng.choice(UNTERMINATED)
+
+
+@pytest.mark.parametrize('path', SAMPLES, ids=os.path.basename)
+def test_samples(path):
+    with open(path, encoding='utf-8') as f:
+        data = f.read()
+    assert fast_tokens(data) == ply_tokens(data)
+
+
+@pytest.mark.parametrize('path', SAMPLES, ids=os.path.basename)
+def test_samples_crlf(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        data = f.read().replace('\r\n', '\n').replace('\n', '\r\n')
+    assert fast_tokens(data) == ply_tokens(data)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_generated(seed):
+    data = generated(seed)
+    assert fast_tokens(data) == ply_tokens(data)
+
+
+@pytest.mark.parametrize('data', [
+    '@#$ x', 'int x = 1 @@@ 2;', '"não fechada', '"não fechada\nint x;', '/* não fechado',
+    '/* não\nfechado', 'int x;\r\nint y;\r\n', '\r\n\r\n@\r\n', "'", "'ab' 'c'",
+])
+def test_edge_cases(data):
+    assert fast_tokens(data) == ply_tokens(data)
@@ -0,0 +1,128 @@
+"""
+Testes da análise incremental (incremental.py): após cada edição, a AST
+mantida pelo IncrementalParser deve ser idêntica (representação, início
+e tamanho de cada nó) à de uma análise completa do texto editado.
+"""
+
+import os
+import random
+
+import pytest
+
+from ast_nodes import iter_nodes
+from conftest import ROOT
+from diagnostics import Diagnostics
+from incremental import IncrementalParser
+from parser import ParserSession
+
+
+SAMPLES = ('test_code.c', 'exemplo_simples.c')
+
+# Texto inserido nas edições: trechos válidos (que costumam permitir a
+# reanálise só do trecho) e caracteres soltos (que costumam forçar a
+# reanálise completa)
+INSERTIONS = [' ', '\n', 'x', '1', '42', 'int novo;\n', 'int g() { return 1; }\n',
+              'a = a + 1;', ';', '{', '}', '(', '/*', '*/', '"', "'", '=', '@']
+
+
+def snapshot(ast):
+    if ast is None:
+        return None
+    return repr(ast), [(node.start, node.size) for node in iter_nodes(ast)]
+
+
+def random_edit(rng, source):
+    offset = rng.randrange(len(source) + 1)
+    removed = rng.choice((0, 0, 1, rng.randrange(8)))
+    removed = min(removed, len(source) - offset)
+    inserted = rng.choice(INSERTIONS) if rng.random() < 0.8 else ''
+    return offset, removed, inserted
+
+
+def load(name):
+    with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('share_leaves', [False, True])
+@pytest.mark.parametrize('name', SAMPLES)
+@pytest.mark.parametrize('seed', range(5))
+def test_random_edits(name, seed, share_leaves):
+    rng = random.Random(seed)
+    session = ParserSession(share_leaves=share_leaves)
+    doc = IncrementalParser(load(name), session=ParserSession(share_leaves=share_leaves))
+    paths = set()
+    for _ in range(40):
+        offset, removed, inserted = random_edit(rng, doc.source)
+        original = doc.source[offset:offset + removed]
+        # A edição e a que a desfaz (que volta a um documento válido)
+        for edit in ((offset, removed, inserted), (offset, len(inserted), original)):
+            doc.apply_edit(*edit)
+            paths.add(doc.last_incremental)
+            assert snapshot(doc.ast) == snapshot(session.parse(doc.source, Diagnostics()))
+    assert paths == {True, False}
+
+
+def test_incremental_path():
+    source = load('exemplo_simples.c')
+    doc = IncrementalParser(source, session=ParserSession())
+    offset = source.index('return total;')
+    assert doc.apply_edit(offset, 0, 'total = total * 2;\n    ')
+    assert doc.last_incremental
+    assert snapshot(doc.ast) == snapshot(ParserSession().parse(doc.source, Diagnostics()))
+
+
+def test_full_reparse_fallback():
+    source = load('exemplo_simples.c')
+    doc = IncrementalParser(source, session=ParserSession())
+    # Abrir um comentário muda a tokenização do restante do documento
+    assert not doc.apply_edit(source.index('int main'), 0, '/* ')
+    assert snapshot(doc.ast) == snapshot(ParserSession().parse(doc.source, Diagnostics()))
+    assert not doc.apply_edit(source.index('int main'), 3, '')
+    assert snapshot(doc.ast) == snapshot(ParserSession().parse(doc.source, Diagnostics()))
+
+
+@pytest.mark.parametrize('edit', ['middle', 'end'])
+def test_unclosed_comment(edit, capsys):
+    source = load('exemplo_simples.c')
+    doc = IncrementalParser(source, session=ParserSession())
+    offset = source.index('int main') if edit == 'middle' else len(source)
+    comment = '/*' if edit == 'middle' else ' /* x'
+    # Abrir um comentário sem fechá-lo e depois removê-lo
+    doc.apply_edit(offset, 0, comment)
+    assert snapshot(doc.ast) == snapshot(ParserSession().parse(doc.source, Diagnostics()))
+    doc.apply_edit(offset, len(comment), '')
+    assert snapshot(doc.ast) == snapshot(ParserSession().parse(source, Diagnostics()))
+    for text in ('int a;\nint b;\nint c;', 'int a;\nint b;\nint c;\n'):
+        doc = IncrementalParser(text, session=ParserSession())
+        for offset, inserted in ((7, '/*'), (len(text), ' /* x')):
+            doc.apply_edit(offset, 0, inserted)
+            assert snapshot(doc.ast) == snapshot(ParserSession().parse(doc.source, Diagnostics()))
+            doc.apply_edit(offset, len(inserted), '')
+            assert snapshot(doc.ast) == snapshot(ParserSession().parse(text, Diagnostics()))
+    assert capsys.readouterr().out == ''
+
+
+def test_fallback_messages(capsys):
+    doc = IncrementalParser("int x;\nint y;\n", session=ParserSession())
+    assert not doc.apply_edit(7, 0, '@')
+    assert doc.messages and capsys.readouterr().out == ''
+    assert not doc.apply_edit(7, 1, '')
+    assert doc.messages == []
+
+
+def test_shared_leaves():
+    # Com folhas compartilhadas, as inicializações terminadas em literais
+    # (e os próprios literais) não têm posição
+    source = "int x = 1;\nint y = 2 + 3;\nint f() { return 1 + x; }\nint z = 4;\n"
+    session = ParserSession(share_leaves=True)
+    doc = IncrementalParser(source, session=ParserSession(share_leaves=True))
+    for edit in ((0, 0, 'int w;\n'), (source.index('4') + 7, 1, '5'), (0, 7, '')):
+        assert doc.apply_edit(*edit)
+        assert snapshot(doc.ast) == snapshot(session.parse(doc.source, Diagnostics()))
+
+
+def test_edit_out_of_bounds():
+    doc = IncrementalParser("int x;", session=ParserSession())
+    with pytest.raises(ValueError):
+        doc.apply_edit(4, 5, '')
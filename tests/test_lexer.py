@@ -0,0 +1,44 @@
+"""
+Testes da tokenização em fluxo (lexer.iter_tokens): os tokens devem ser
+os mesmos da tokenização do arquivo inteiro lido em modo texto, inclusive
+com quebras de linha \\r\\n e blocos pequenos.
+"""
+
+import os
+
+import pytest
+
+from conftest import ROOT
+from diagnostics import Diagnostics
+from lexer import clone_lexer, iter_tokens, reset_lexer
+
+
+SAMPLES = ('test_code.c', 'exemplo_simples.c', 'test_errors.c', 'exemplo_erros.c')
+
+
+def whole_tokens(text):
+    diagnostics = Diagnostics()
+    lexer_obj = clone_lexer()
+    reset_lexer(lexer_obj, text)
+    lexer_obj.diagnostics = diagnostics
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer_obj], diagnostics.messages()
+
+
+def stream_tokens(path, chunk_size):
+    diagnostics = Diagnostics()
+    tokens = [(tok.type, tok.value, tok.lineno, tok.lexpos)
+              for tok in iter_tokens(path, chunk_size, diagnostics)]
+    return tokens, diagnostics.messages()
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+@pytest.mark.parametrize('name', SAMPLES)
+def test_stream_matches_text_mode(tmp_path, name, newline):
+    with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+        text = f.read()
+    path = tmp_path / name
+    path.write_bytes(text.replace('\n', newline).encode('utf-8'))
+    with open(path, encoding='utf-8') as f:
+        expected = whole_tokens(f.read())
+    for chunk_size in (16, 4096):
+        assert stream_tokens(str(path), chunk_size) == expected
@@ -0,0 +1,50 @@
+"""
+Testes do tratamento de requisições do servidor (server.py), com uma
+conexão simulada e a execução em threads em vez de processos.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from server import INVALID_REQUEST, ParseServer, frame
+
+
+def serve(*requests):
+    """Respostas do servidor a uma sequência de requisições."""
+    async def run():
+        server = ParseServer(workers=1)
+        server.stopped = asyncio.Event()
+        server.executor = ThreadPoolExecutor(max_workers=1)
+        reader = asyncio.StreamReader()
+        for request in requests:
+            reader.feed_data(frame(json.dumps(request).encode('utf-8')))
+        reader.feed_eof()
+        replies = []
+        
+        async def send(data):
+            replies.append(json.loads(data.partition(b"\r\n\r\n")[2]))
+        
+        try:
+            await server.serve_connection(reader, send)
+        finally:
+            server.close()
+        return replies
+    return asyncio.run(run())
+
+
+def request(request_id, method='parse', **params):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def test_invalid_ids():
+    replies = serve(request([1]), request({"a": 1}), request(True), request(1.5),
+                    request(None, '$/cancelRequest', id=[2]), request(3, text="int x;"))
+    assert [reply['error']['code'] for reply in replies[:5]] == [INVALID_REQUEST] * 5
+    assert replies[5]['id'] == 3 and 'result' in replies[5]
+
+
+def test_duplicate_ids():
+    replies = serve(request(1, text="int x;"), request(1, text="int y;"),
+                    request(None, '$/cancelRequest', id=1), request("a", text="int z;"))
+    assert sorted(str(reply['id']) for reply in replies) == ['1', '1', 'a']
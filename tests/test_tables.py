@@ -0,0 +1,20 @@
+"""
+Testes da validação das tabelas pré-geradas: o parsetab.py deve
+corresponder à gramática atual, e tabelas desatualizadas devem gerar um
+aviso em vez de serem reconstruídas silenciosamente.
+"""
+
+import pytest
+
+import parser
+
+
+def test_tables_up_to_date():
+    assert parser.tables_signature() == parser.grammar_signature()
+
+
+def test_stale_tables_warning(monkeypatch):
+    monkeypatch.setattr(parser, '_parser', None)
+    monkeypatch.setattr(parser, 'tables_signature', lambda: 'desatualizada')
+    with pytest.warns(parser.StaleTablesWarning, match='build_tables.py'):
+        assert parser.get_parser() is not None
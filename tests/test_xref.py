@@ -0,0 +1,66 @@
+"""
+Testes da atualização do índice de referências cruzadas (xref.py) para
+arquivos com erros de análise.
+"""
+
+import os
+
+from xref import CallIndex
+
+
+GOOD = "int somar(int a, int b) {\n    return a + b;\n}\nint main() {\n    return somar(1, 2);\n}\n"
+BROKEN = "int somar(int a, int b) {\n    return a + ;\n}\nint main() {\n    return somar(1, 2);\n}\n"
+
+
+def write(path, text, mtime_ns=None):
+    with open(path, 'w') as f:
+        f.write(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_errors_keep_definitions(tmp_path):
+    path = str(tmp_path / 'prog.c')
+    write(path, GOOD)
+    with CallIndex(str(tmp_path / 'indice.db')) as index:
+        assert index.update([path], workers=1).errors == 0
+        expected = (index.definitions('somar'), index.callers('somar'))
+        assert expected[0] and expected[1]
+        
+        write(path, BROKEN, 10 ** 18)
+        result = index.update([path], workers=1)
+        assert (result.indexed, result.errors) == (1, 1)
+        assert (index.definitions('somar'), index.callers('somar')) == expected
+        
+        # Mesmo conteúdo com outra data (hash inalterado) e sem alteração
+        write(path, BROKEN, 2 * 10 ** 18)
+        result = index.update([path], workers=1)
+        assert (result.touched, result.errors) == (1, 1)
+        result = index.update([path], workers=1)
+        assert (result.unchanged, result.errors) == (1, 1)
+        
+        write(path, GOOD.replace('somar(1, 2)', 'somar(1)'), 3 * 10 ** 18)
+        result = index.update([path], workers=1)
+        assert (result.indexed, result.errors) == (1, 0)
+        assert [call.args for call in index.callers('somar')] == [1]
+
+
+def test_new_file_with_errors(tmp_path):
+    path = str(tmp_path / 'prog.c')
+    write(path, BROKEN)
+    with CallIndex(str(tmp_path / 'indice.db')) as index:
+        result = index.update([path], workers=1)
+        assert (result.indexed, result.errors) == (1, 1)
+        write(path, GOOD, 10 ** 18)
+        assert index.update([path], workers=1).errors == 0
+        assert index.callers('somar')
+
+
+def test_error_count_over_limit(tmp_path):
+    from diagnostics import DEFAULT_LIMIT
+    path = str(tmp_path / 'prog.c')
+    write(path, "int x;\n" + "@\n" * (DEFAULT_LIMIT + 50))
+    with CallIndex(str(tmp_path / 'indice.db')) as index:
+        assert index.update([path], workers=1).errors == 1
+        stored = index.connection.execute("SELECT errors FROM files").fetchone()[0]
+    assert stored == DEFAULT_LIMIT + 50
@@ -0,0 +1,198 @@
+"""
+Módulo da representação colunar de tokens.
+
+Em vez de uma tupla (tipo, valor, linha) por token, TokenStream guarda
+os tokens em colunas compactas: o tipo em um array('B') (um byte por
+token) e as posições de início e fim e a linha em arrays('i'). O valor
+de cada token é obtido do código fonte somente quando solicitado,
+recortando o texto entre o início e o fim e convertendo-o como o lexer
+faria (números, strings e caracteres).
+
+As colunas podem ser vistas como arrays do NumPy, sem cópia, para
+estatísticas vetorizadas; o NumPy é opcional e só é importado quando
+usado.
+"""
+
+from array import array
+from collections import Counter
+
+import fastlex
+from lexer import tokens, string_value, char_value
+
+
+# Identificador numérico de cada tipo de token (índice em TYPE_NAMES)
+TYPE_NAMES = tokens
+TYPE_IDS = {name: i for i, name in enumerate(TYPE_NAMES)}
+
+# Conversão do texto reconhecido no valor do token, por tipo
+_CONVERTERS = {
+    TYPE_IDS['INTEGER']: int,
+    TYPE_IDS['FLOAT_NUMBER']: float,
+    TYPE_IDS['STRING']: string_value,
+    TYPE_IDS['CHAR']: char_value,
+}
+
+
+class TokenStream:
+    """
+    Sequência de tokens em colunas.
+    
+    Pode ser usada no lugar da lista de tuplas (tipo, valor, linha): a
+    iteração e a indexação produzem essas tuplas, com o valor calculado
+    sob demanda.
+    
+    Attributes:
+        source: Código fonte dos tokens
+        types: Identificadores dos tipos (array('B'), índices em TYPE_NAMES)
+        starts: Posições de início no código fonte (array('i'))
+        ends: Posições de fim, exclusivas (array('i'))
+        lines: Números de linha (array('i'))
+    """
+    
+    __slots__ = ('source', 'types', 'starts', 'ends', 'lines')
+    
+    def __init__(self, source, types=None, starts=None, ends=None, lines=None):
+        self.source = source
+        self.types = types if types is not None else array('B')
+        self.starts = starts if starts is not None else array('i')
+        self.ends = ends if ends is not None else array('i')
+        self.lines = lines if lines is not None else array('i')
+    
+    @classmethod
+    def from_source(cls, data):
+        """
+        Tokeniza o código fonte (com o lexer rápido) diretamente em colunas.
+        
+        Args:
+            data: String com o código fonte
+            
+        Returns:
+            TokenStream com os tokens do código fonte
+        """
+        stream = cls(data)
+        types, starts, ends, lines = stream.types, stream.starts, stream.ends, stream.lines
+        type_ids = TYPE_IDS
+        for tok in fastlex.scan(data):
+            types.append(type_ids[tok[0]])
+            lines.append(tok[2])
+            starts.append(tok[3])
+            ends.append(tok[4])
+        return stream
+    
+    def append(self, tok):
+        """
+        Acrescenta um token (LexToken ou FastToken) ao final da sequência.
+        
+        Args:
+            tok: Token com type, lineno e lexpos (e, se houver, endlexpos)
+        """
+        end = getattr(tok, 'endlexpos', None)
+        if end is None:
+            end = tok.lexpos + len(tok.value)
+        self.types.append(TYPE_IDS[tok.type])
+        self.starts.append(tok.lexpos)
+        self.ends.append(end)
+        self.lines.append(tok.lineno)
+    
+    def __len__(self):
+        return len(self.types)
+    
+    def __reduce__(self):
+        return (self.__class__, (self.source, self.types, self.starts, self.ends, self.lines))
+    
+    def type_name(self, i):
+        """Tipo do i-ésimo token."""
+        return TYPE_NAMES[self.types[i]]
+    
+    def text(self, i):
+        """Texto do i-ésimo token no código fonte."""
+        return self.source[self.starts[i]:self.ends[i]]
+    
+    def value(self, i):
+        """Valor do i-ésimo token, convertido como pelo lexer."""
+        text = self.source[self.starts[i]:self.ends[i]]
+        convert = _CONVERTERS.get(self.types[i])
+        return convert(text) if convert is not None else text
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return (TYPE_NAMES[self.types[i]], self.value(i), self.lines[i])
+    
+    def __iter__(self):
+        source = self.source
+        converters = _CONVERTERS
+        for type_id, start, end, line in zip(self.types, self.starts, self.ends, self.lines):
+            text = source[start:end]
+            convert = converters.get(type_id)
+            yield (TYPE_NAMES[type_id], convert(text) if convert is not None else text, line)
+    
+    def iter_tokens(self):
+        """
+        Gera os tokens no formato usado pelo parser (FastToken), para
+        alimentar a análise sintática (ParserSession.parse_tokens).
+        """
+        source = self.source
+        converters = _CONVERTERS
+        new_token = tuple.__new__
+        for type_id, start, end, line in zip(self.types, self.starts, self.ends, self.lines):
+            text = source[start:end]
+            convert = converters.get(type_id)
+            value = convert(text) if convert is not None else text
+            yield new_token(fastlex.FastToken, (TYPE_NAMES[type_id], value, line, start, end))
+    
+    def to_numpy(self):
+        """
+        Visões das colunas como arrays do NumPy, sem cópia dos dados.
+        
+        Returns:
+            Dicionário com as colunas types, starts, ends e lines
+            
+        Raises:
+            ImportError: Se o NumPy não estiver instalado
+        """
+        import numpy as np
+        return {
+            'types': np.frombuffer(self.types, dtype=np.uint8),
+            'starts': np.frombuffer(self.starts, dtype=np.intc),
+            'ends': np.frombuffer(self.ends, dtype=np.intc),
+            'lines': np.frombuffer(self.lines, dtype=np.intc),
+        }
+    
+    def histogram(self):
+        """
+        Quantidade de tokens de cada tipo (usa o NumPy, se disponível).
+        
+        Returns:
+            Dicionário tipo -> quantidade, somente com os tipos presentes
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            counts = Counter(self.types)
+            return {TYPE_NAMES[i]: counts[i] for i in sorted(counts)}
+        counts = np.bincount(np.frombuffer(self.types, dtype=np.uint8), minlength=len(TYPE_NAMES))
+        return {TYPE_NAMES[i]: int(n) for i, n in enumerate(counts) if n}
+    
+    def density(self, type_name='IDENTIFIER'):
+        """
+        Proporção de tokens de um tipo e sua quantidade média por linha.
+        
+        Args:
+            type_name: Tipo de token (por padrão, IDENTIFIER)
+            
+        Returns:
+            Tupla (fração dos tokens, tokens por linha com tokens)
+        """
+        if not len(self):
+            return 0.0, 0.0
+        type_id = TYPE_IDS[type_name]
+        try:
+            import numpy as np
+        except ImportError:
+            count = self.types.count(type_id)
+            line_count = len(set(self.lines))
+        else:
+            count = int(np.count_nonzero(np.frombuffer(self.types, dtype=np.uint8) == type_id))
+            line_count = len(np.unique(np.frombuffer(self.lines, dtype=np.intc)))
+        return count / len(self), count / line_count
@@ -0,0 +1,206 @@
+"""
+Percurso genérico da AST: visitantes e transformadores.
+
+NodeVisitor e NodeTransformer percorrem a árvore com uma pilha explícita
+(sem recursão), seguindo os campos declarados em _children de cada
+classe de nó (ast_nodes.py), e chamam os métodos definidos pela
+subclasse para cada tipo de nó:
+
+- visit_<Classe>(node), na entrada do nó (pré-ordem) em um NodeVisitor,
+  ou depois de transformados os seus filhos (pós-ordem) em um
+  NodeTransformer;
+- leave_<Classe>(node), na saída do nó (pós-ordem), em um NodeVisitor.
+
+O método de cada tipo de nó é procurado pela hierarquia da classe (por
+exemplo, visit_Block também atende LazyBlock e visit_ASTNode atende
+qualquer nó) uma única vez por classe de visitante, e o resultado fica
+guardado em um dicionário indexado pela classe do nó.
+
+Uso:
+    class Nomes(NodeVisitor):
+        def __init__(self):
+            self.names = set()
+
+        def visit_Identifier(self, node):
+            self.names.add(node.name)
+
+    visitor = Nomes()
+    visitor.visit(ast)
+"""
+
+from ast_nodes import ASTNode
+
+
+# Etapas do percurso
+_ENTER = 0
+_EXIT = 1
+_EXIT_LIST = 2
+_EXIT_TUPLE = 3
+
+# Marca, na pilha de um NodeVisitor, a saída do nó que está abaixo dela
+_LEAVE = object()
+
+
+class NodeVisitor:
+    """
+    Percorre a AST em pré-ordem, chamando visit_<Classe> na entrada e
+    leave_<Classe> na saída de cada nó que tiver esses métodos.
+    
+    Se visit_<Classe> devolver False, os filhos do nó não são percorridos
+    (e leave_<Classe> não é chamado para ele).
+    """
+    
+    _dispatch = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Cada classe de visitante tem a sua tabela de métodos
+        cls._dispatch = {}
+    
+    @classmethod
+    def _resolve(cls, node_type):
+        """
+        Métodos de um tipo de valor encontrado no percurso.
+        
+        Returns:
+            Tupla (visit, leave, campos filhos), com None para os métodos
+            não definidos, ou None se node_type não for um nó
+        """
+        entry = None
+        if issubclass(node_type, ASTNode):
+            visit = leave = None
+            for base in node_type.__mro__:
+                if visit is None:
+                    visit = getattr(cls, 'visit_' + base.__name__, None)
+                if leave is None:
+                    leave = getattr(cls, 'leave_' + base.__name__, None)
+            entry = (visit, leave, tuple(reversed(node_type._children)))
+        cls._dispatch[node_type] = entry
+        return entry
+    
+    def visit(self, tree):
+        """
+        Percorre a árvore.
+        
+        Args:
+            tree: Nó da AST, lista ou tupla de nós
+        """
+        dispatch = self._dispatch
+        resolve = self._resolve
+        stack = [tree]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            value = pop()
+            if value is _LEAVE:
+                node = pop()
+                dispatch[type(node)][1](self, node)
+                continue
+            value_type = type(value)
+            if value_type is list or value_type is tuple:
+                stack.extend(reversed(value))
+                continue
+            try:
+                entry = dispatch[value_type]
+            except KeyError:
+                entry = resolve(value_type)
+            if entry is None:
+                continue
+            visit, leave, children = entry
+            if visit is not None and visit(self, value) is False:
+                continue
+            if leave is not None:
+                push(value)
+                push(_LEAVE)
+            for name in children:
+                push(getattr(value, name))
+
+
+class NodeTransformer(NodeVisitor):
+    """
+    Transforma a AST no lugar, em pós-ordem.
+    
+    visit_<Classe>(node) é chamado depois de transformados os filhos do
+    nó, e o valor devolvido substitui o nó no campo ou na lista em que
+    ele está: o próprio nó o mantém, outro nó o substitui e, em uma
+    lista, None o remove e uma lista de nós é inserida no lugar dele (em
+    um campo, esses valores são atribuídos como estão). Os nós sem
+    visit_<Classe> são mantidos. As listas são alteradas no lugar, e as
+    tuplas (como a de uma declaração com inicialização) são refeitas.
+    """
+    
+    def visit(self, tree):
+        """
+        Transforma a árvore.
+        
+        Args:
+            tree: Nó da AST, lista ou tupla de nós
+            
+        Returns:
+            A árvore transformada (tree, alterada no lugar, ou o valor que
+            substituiu a raiz)
+        """
+        dispatch = self._dispatch
+        resolve = self._resolve
+        root = [tree]
+        # Listas com itens removidos ou substituídos por listas, a refazer
+        # na saída
+        spliced = set()
+        stack = [(_ENTER, root, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            step, parent, key = pop()
+            if step == _EXIT_LIST:
+                if id(parent) in spliced:
+                    spliced.discard(id(parent))
+                    items = []
+                    for item in parent:
+                        if type(item) is list:
+                            items.extend(item)
+                        elif item is not None:
+                            items.append(item)
+                    parent[:] = items
+                continue
+            
+            value = parent[key] if type(key) is int else getattr(parent, key)
+            if step == _ENTER:
+                value_type = type(value)
+                if value_type is tuple:
+                    # A tupla é substituída por uma lista durante o percurso
+                    # dos seus itens e refeita na saída
+                    push((_EXIT_TUPLE, parent, key))
+                    value = list(value)
+                    if type(key) is int:
+                        parent[key] = value
+                    else:
+                        setattr(parent, key, value)
+                    value_type = list
+                if value_type is list:
+                    push((_EXIT_LIST, value, None))
+                    stack.extend([(_ENTER, value, index) for index in range(len(value) - 1, -1, -1)])
+                    continue
+                try:
+                    entry = dispatch[value_type]
+                except KeyError:
+                    entry = resolve(value_type)
+                if entry is None:
+                    continue
+                if entry[0] is not None:
+                    push((_EXIT, parent, key))
+                stack.extend([(_ENTER, value, name) for name in entry[2]])
+                continue
+            
+            if step == _EXIT_TUPLE:
+                result = tuple(value)
+            else:
+                result = dispatch[type(value)][0](self, value)
+                if result is value:
+                    continue
+            if type(key) is int:
+                parent[key] = result
+                if result is None or type(result) is list:
+                    spliced.add(id(parent))
+            else:
+                setattr(parent, key, result)
+        return root[0]
@@ -0,0 +1,908 @@
+"""
+Módulo do compilador para bytecode e da máquina virtual de pilha.
+
+Permite executar programas do subconjunto de C reconhecido pelo parser
+(por exemplo, para avaliar vetores de teste), sem interpretar a AST nó a
+nó:
+
+- compile_program traduz a AST para um Program: um objeto Code por
+  função e um para a inicialização das variáveis globais. Cada Code tem
+  as instruções em um array de inteiros (pares opcode, argumento), uma
+  tabela de constantes e uma posição (slot) para cada parâmetro e
+  variável local, resolvida durante a compilação.
+- VM executa um Program em um único laço de despacho, com uma pilha de
+  operandos por chamada. As chamadas entre funções do programa não usam
+  a pilha do Python, de modo que a profundidade de recursão é limitada
+  apenas por max_depth.
+  
+Os tipos são verificados durante a compilação e as instruções são
+específicas de cada tipo, com a semântica de C:
+
+- int: inteiro de 32 bits com sinal; o resultado das operações é
+  reduzido a 32 bits (com complemento de dois) e a divisão trunca em
+  direção a zero
+- char: inteiro de 8 bits com sinal, promovido a int nas expressões
+- float: ponto flutuante de precisão simples; o resultado de cada
+  operação é arredondado para 32 bits (os literais de ponto flutuante
+  são tratados como float)
+  
+As conversões entre os tipos (na atribuição, na passagem de argumentos,
+no retorno e nas operações entre int e float) são explícitas no
+bytecode. Funções externas (por exemplo, de saída) podem ser declaradas
+na compilação e fornecidas à VM.
+"""
+
+import math
+import struct
+from array import array
+
+from ast_nodes import (ASTNode, Assignment, BinOp, Block, Char, ExpressionStatement,
+                       ForStatement, FunctionCall, FunctionDecl, Identifier, IfStatement,
+                       Number, ReturnStatement, String, UnaryOp, VarDecl, WhileStatement)
+
+
+# Opcodes (cada instrução ocupa dois inteiros: opcode e argumento)
+LOAD_LOCAL = 0
+STORE_LOCAL = 1
+LOAD_CONST = 2
+LOAD_GLOBAL = 3
+STORE_GLOBAL = 4
+JUMP_IF_FALSE = 5
+JUMP_IF_TRUE = 6
+JUMP = 7
+IADD = 8
+ISUB = 9
+IMUL = 10
+IDIV = 11
+LT = 12
+LE = 13
+GT = 14
+GE = 15
+EQ = 16
+NE = 17
+CALL = 18
+RETURN = 19
+POP = 20
+DUP = 21
+FADD = 22
+FSUB = 23
+FMUL = 24
+FDIV = 25
+INEG = 26
+FNEG = 27
+NOT = 28
+I2F = 29
+F2I = 30
+I2C = 31
+CALL_BUILTIN = 32
+# Instruções combinadas: soma e subtração de uma constante (o argumento é
+# o próprio valor) e comparação seguida de salto quando ela é falsa
+IADD_IMM = 33
+ISUB_IMM = 34
+JUMP_UNLESS_LT = 35
+JUMP_UNLESS_LE = 36
+JUMP_UNLESS_GT = 37
+JUMP_UNLESS_GE = 38
+JUMP_UNLESS_EQ = 39
+JUMP_UNLESS_NE = 40
+
+OPNAMES = (
+    'LOAD_LOCAL', 'STORE_LOCAL', 'LOAD_CONST', 'LOAD_GLOBAL', 'STORE_GLOBAL',
+    'JUMP_IF_FALSE', 'JUMP_IF_TRUE', 'JUMP', 'IADD', 'ISUB', 'IMUL', 'IDIV',
+    'LT', 'LE', 'GT', 'GE', 'EQ', 'NE', 'CALL', 'RETURN', 'POP', 'DUP',
+    'FADD', 'FSUB', 'FMUL', 'FDIV', 'INEG', 'FNEG', 'NOT', 'I2F', 'F2I', 'I2C',
+    'CALL_BUILTIN', 'IADD_IMM', 'ISUB_IMM', 'JUMP_UNLESS_LT', 'JUMP_UNLESS_LE',
+    'JUMP_UNLESS_GT', 'JUMP_UNLESS_GE', 'JUMP_UNLESS_EQ', 'JUMP_UNLESS_NE',
+)
+
+# Profundidade máxima de chamadas aninhadas
+MAX_DEPTH = 100000
+
+# Tipos da linguagem e valor inicial das variáveis de cada um
+VALUE_TYPES = ('int', 'float', 'char')
+_DEFAULTS = {'int': 0, 'float': 0.0, 'char': 0}
+
+_INT_MIN = -(1 << 31)
+_INT_MAX = (1 << 31) - 1
+
+_FLOAT32 = struct.Struct('<f')
+
+# Instruções dos operadores binários, por tipo dos operandos
+_INT_OPS = {'+': IADD, '-': ISUB, '*': IMUL, '/': IDIV}
+_FLOAT_OPS = {'+': FADD, '-': FSUB, '*': FMUL, '/': FDIV}
+_COMPARE_OPS = {'<': LT, '<=': LE, '>': GT, '>=': GE, '==': EQ, '!=': NE}
+_IMMEDIATE_OPS = {'+': IADD_IMM, '-': ISUB_IMM}
+_COMPARE_JUMPS = {LT: JUMP_UNLESS_LT, LE: JUMP_UNLESS_LE, GT: JUMP_UNLESS_GT,
+                  GE: JUMP_UNLESS_GE, EQ: JUMP_UNLESS_EQ, NE: JUMP_UNLESS_NE}
+
+# Pseudo-instrução do compilador: ajusta os saltos pendentes para a
+# posição atual
+_PATCH = -1
+
+
+class CompileError(Exception):
+    """Erro semântico que impede a compilação do programa."""
+
+
+class VMError(Exception):
+    """Erro durante a execução do bytecode."""
+
+
+def to_int(value):
+    """Converte um valor para int (32 bits com sinal), como em C."""
+    if isinstance(value, float):
+        if value != value or value in (math.inf, -math.inf):
+            # Comportamento indefinido em C; adota-se o menor int
+            return _INT_MIN
+        value = int(value)  # trunca em direção a zero
+    if _INT_MIN <= value <= _INT_MAX:
+        return value
+    return ((value - _INT_MIN) & 0xFFFFFFFF) + _INT_MIN
+
+
+def to_char(value):
+    """Converte um valor para char (8 bits com sinal), como em C."""
+    value = to_int(value)
+    if -128 <= value <= 127:
+        return value
+    return ((value + 128) & 0xFF) - 128
+
+
+def to_float(value):
+    """Converte um valor para float (precisão simples), como em C."""
+    try:
+        return _FLOAT32.unpack(_FLOAT32.pack(value))[0]
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+
+def convert(value, value_type):
+    """
+    Converte um valor do Python para um tipo da linguagem.
+    
+    Args:
+        value: int ou float
+        value_type: 'int', 'float' ou 'char'
+        
+    Returns:
+        Valor convertido
+    """
+    if value_type == 'float':
+        return to_float(value)
+    if value_type == 'char':
+        return to_char(value)
+    return to_int(value)
+
+
+def char_code(value):
+    """
+    Código de um literal de caractere (valor de um nó Char).
+    
+    Returns:
+        Código do caractere, ou None se o literal não for suportado
+    """
+    if value == '\\0':
+        return 0
+    if len(value) != 1:
+        return None
+    return ord(value)
+
+
+def int_div(a, b):
+    """Divisão inteira de C (trunca em direção a zero)."""
+    if b == 0:
+        raise VMError("Divisão inteira por zero")
+    q = abs(a) // abs(b)
+    return to_int(q if (a < 0) == (b < 0) else -q)
+
+
+def float_div(a, b):
+    """Divisão de ponto flutuante (IEEE 754, sem exceção para zero)."""
+    if b:
+        return to_float(a / b)
+    if a == 0 or a != a:
+        return math.nan
+    return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+class Code:
+    """
+    Bytecode de uma função.
+    
+    Attributes:
+        name: Nome da função
+        return_type: Tipo de retorno ('int', 'float', 'char' ou 'void')
+        param_types: Tipos dos parâmetros (slots 0 a n - 1)
+        local_types: Tipos de todos os slots (parâmetros e variáveis locais)
+        ops: Instruções, em pares (opcode, argumento)
+        consts: Tabela de constantes
+        initial: Valores iniciais dos slots que não são parâmetros
+    """
+    
+    __slots__ = ('name', 'return_type', 'param_types', 'local_types', 'ops', 'consts', 'initial')
+    
+    def __init__(self, name, return_type, param_types, local_types, ops, consts):
+        self.name = name
+        self.return_type = return_type
+        self.param_types = param_types
+        self.local_types = local_types
+        self.ops = ops
+        self.consts = consts
+        self.initial = [_DEFAULTS[t] for t in local_types[len(param_types):]]
+    
+    def __repr__(self):
+        return f"<Code {self.name} ({len(self.ops) // 2} instruções)>"
+
+
+class Program:
+    """
+    Programa compilado.
+    
+    Attributes:
+        codes: Code de cada função, na ordem de declaração (o argumento de
+            CALL é o índice nesta lista)
+        functions: Dicionário nome -> Code
+        global_names: Nomes das variáveis globais (o argumento de
+            LOAD_GLOBAL e STORE_GLOBAL é o índice nesta lista)
+        global_types: Tipos das variáveis globais
+        init: Code que inicializa as variáveis globais
+        builtins: Nome e quantidade de argumentos de cada chamada a uma
+            função externa (o argumento de CALL_BUILTIN é o índice nesta
+            lista)
+    """
+    
+    def __init__(self, codes, global_names, global_types, init, builtins):
+        self.codes = codes
+        self.functions = {code.name: code for code in codes}
+        self.global_names = global_names
+        self.global_types = global_types
+        self.init = init
+        self.builtins = builtins
+
+
+def disassemble(code):
+    """
+    Lista as instruções de um Code em forma legível.
+    
+    Returns:
+        Lista de strings, uma por instrução
+    """
+    lines = []
+    ops = code.ops
+    for pc in range(0, len(ops), 2):
+        op, arg = ops[pc], ops[pc + 1]
+        line = f"{pc:>6} {OPNAMES[op]:<14} {arg}"
+        if op == LOAD_CONST:
+            line += f" ({code.consts[arg]!r})"
+        lines.append(line)
+    return lines
+
+
+class _FunctionCompiler:
+    """Geração do bytecode de uma função (veja compile_program)."""
+    
+    def __init__(self, program, name, return_type, params=()):
+        self.program = program
+        self.name = name
+        self.return_type = return_type
+        self.ops = []
+        self.consts = []
+        self.const_ids = {}
+        self.local_types = []
+        self.scopes = [{}]
+        for param in params:
+            self._declare(param)
+        self.param_types = tuple(self.local_types)
+    
+    def _error(self, message, node):
+        if isinstance(node, ASTNode) and node.start is not None:
+            message = f"{message} (posição {node.start})"
+        raise CompileError(f"{message} em {self.name}")
+    
+    def _emit(self, op, arg=0):
+        self.ops.append(op)
+        self.ops.append(arg)
+        return len(self.ops) - 2
+    
+    def _const(self, value):
+        key = (type(value), value)
+        index = self.const_ids.get(key)
+        if index is None:
+            index = self.const_ids[key] = len(self.consts)
+            self.consts.append(value)
+        return index
+    
+    def _declare(self, decl):
+        if decl.var_type not in VALUE_TYPES:
+            self._error(f"Tipo inválido para a variável '{decl.name}': {decl.var_type}", decl)
+        slot = len(self.local_types)
+        self.local_types.append(decl.var_type)
+        self.scopes[-1][decl.name] = slot
+    
+    def _lookup(self, name, node):
+        """Obtém (opcode de leitura, opcode de escrita, slot, tipo) de uma variável."""
+        for scope in reversed(self.scopes):
+            slot = scope.get(name)
+            if slot is not None:
+                return LOAD_LOCAL, STORE_LOCAL, slot, self.local_types[slot]
+        index = self.program.global_ids.get(name)
+        if index is not None:
+            return LOAD_GLOBAL, STORE_GLOBAL, index, self.program.global_types[index]
+        self._error(f"Variável não declarada: '{name}'", node)
+    
+    def _signature(self, call):
+        """Obtém (tipo de retorno, tipos dos parâmetros ou None) de uma função."""
+        signature = self.program.signatures.get(call.name)
+        if signature is None:
+            self._error(f"Função não declarada: '{call.name}'", call)
+        return signature
+    
+    def _conversion(self, source, target, node):
+        """Instruções que convertem um valor do tipo source para target."""
+        if source == target or (source == 'char' and target == 'int'):
+            return ()
+        if source not in VALUE_TYPES or target not in VALUE_TYPES:
+            self._error(f"Conversão inválida de {source} para {target}", node)
+        if target == 'float':
+            return (I2F,)
+        if source == 'float':
+            return (F2I, I2C) if target == 'char' else (F2I,)
+        return (I2C,)
+    
+    def _arithmetic(self, value_type, node):
+        """Tipo de um operando em uma operação aritmética ou relacional."""
+        if value_type == 'float':
+            return 'float'
+        if value_type in ('int', 'char'):
+            return 'int'
+        self._error(f"Operando inválido do tipo {value_type}", node)
+    
+    # Expressões
+    
+    def _infer(self, expr):
+        """
+        Calcula, sem recursão, o tipo de cada nó de uma expressão.
+        
+        Returns:
+            Dicionário id(nó) -> tipo
+        """
+        types = {}
+        stack = [(expr, False)]
+        while stack:
+            node, done = stack.pop()
+            if not done:
+                stack.append((node, True))
+                if isinstance(node, BinOp):
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                elif isinstance(node, UnaryOp):
+                    stack.append((node.operand, False))
+                elif isinstance(node, Assignment):
+                    stack.append((node.right, False))
+                elif isinstance(node, FunctionCall):
+                    stack.extend((arg, False) for arg in reversed(node.args))
+                continue
+            
+            if isinstance(node, BinOp):
+                left = self._arithmetic(types[id(node.left)], node)
+                right = self._arithmetic(types[id(node.right)], node)
+                if node.op in _INT_OPS:
+                    result = 'float' if 'float' in (left, right) else 'int'
+                else:
+                    result = 'int'
+            elif isinstance(node, UnaryOp):
+                operand = self._arithmetic(types[id(node.operand)], node)
+                result = operand if node.op == '-' else 'int'
+            elif isinstance(node, Number):
+                result = 'float' if isinstance(node.value, float) else 'int'
+            elif isinstance(node, Char):
+                result = 'char'
+            elif isinstance(node, String):
+                result = 'string'
+            elif isinstance(node, Identifier):
+                result = self._lookup(node.name, node)[3]
+            elif isinstance(node, Assignment):
+                result = self._lookup(node.left.name, node.left)[3]
+            elif isinstance(node, FunctionCall):
+                result = self._signature(node)[0]
+            else:
+                self._error(f"Expressão não suportada: {type(node).__name__}", node)
+            types[id(node)] = result
+        return types
+    
+    def _expression(self, expr, keep=True):
+        """
+        Compila uma expressão sem recursão.
+        
+        O valor da expressão fica no topo da pilha; se keep for False e a
+        expressão for uma atribuição, o valor não é deixado na pilha.
+        
+        Returns:
+            Tipo da expressão
+        """
+        types = self._infer(expr)
+        emit = self._emit
+        # Tarefas: nós a compilar ou instruções (opcode, argumento) a
+        # emitir; um argumento lista recebe as posições dos saltos a
+        # ajustar pela pseudo-instrução _PATCH
+        tasks = [(expr, keep)]
+        while tasks:
+            task = tasks.pop()
+            node = task[0]
+            if type(node) is int:
+                op, arg = task
+                if op == _PATCH:
+                    target = len(self.ops)
+                    for pos in arg:
+                        self.ops[pos + 1] = target
+                elif type(arg) is list:
+                    arg.append(emit(op))
+                else:
+                    emit(op, arg)
+                continue
+            
+            if isinstance(node, BinOp):
+                if node.op in ('&&', '||'):
+                    # Avaliação em curto-circuito, com resultado 0 ou 1
+                    jump, short, other = ((JUMP_IF_FALSE, 0, 1) if node.op == '&&'
+                                          else (JUMP_IF_TRUE, 1, 0))
+                    shorted, end = [], []
+                    tasks.extend(reversed((
+                        (node.left, True), (jump, shorted),
+                        (node.right, True), (jump, shorted),
+                        (LOAD_CONST, self._const(other)), (JUMP, end),
+                        (_PATCH, shorted), (LOAD_CONST, self._const(short)),
+                        (_PATCH, end),
+                    )))
+                    continue
+                left = self._arithmetic(types[id(node.left)], node)
+                right = self._arithmetic(types[id(node.right)], node)
+                operand = 'float' if 'float' in (left, right) else 'int'
+                if (node.op in _IMMEDIATE_OPS and operand == 'int'
+                        and isinstance(node.right, Number)):
+                    # Soma ou subtração de uma constante inteira: o valor
+                    # vai no argumento da instrução
+                    tasks.append((_IMMEDIATE_OPS[node.op], to_int(node.right.value)))
+                    tasks.append((node.left, True))
+                    continue
+                if node.op in _COMPARE_OPS:
+                    op = _COMPARE_OPS[node.op]
+                else:
+                    op = (_FLOAT_OPS if operand == 'float' else _INT_OPS)[node.op]
+                tasks.append((op, 0))
+                tasks.extend((conv, 0) for conv in self._conversion(right, operand, node))
+                tasks.append((node.right, True))
+                tasks.extend((conv, 0) for conv in self._conversion(left, operand, node))
+                tasks.append((node.left, True))
+            elif isinstance(node, UnaryOp):
+                if node.op == '-':
+                    tasks.append((FNEG if types[id(node)] == 'float' else INEG, 0))
+                else:
+                    tasks.append((NOT, 0))
+                tasks.append((node.operand, True))
+            elif isinstance(node, Number):
+                value = to_float(node.value) if isinstance(node.value, float) else to_int(node.value)
+                emit(LOAD_CONST, self._const(value))
+            elif isinstance(node, Char):
+                code = char_code(node.value)
+                if code is None:
+                    self._error(f"Literal de caractere não suportado: {node.value!r}", node)
+                emit(LOAD_CONST, self._const(to_char(code)))
+            elif isinstance(node, String):
+                emit(LOAD_CONST, self._const(node.value))
+            elif isinstance(node, Identifier):
+                load, _, slot, _ = self._lookup(node.name, node)
+                emit(load, slot)
+            elif isinstance(node, Assignment):
+                _, store, slot, target = self._lookup(node.left.name, node.left)
+                tasks.append((store, slot))
+                if task[1]:
+                    tasks.append((DUP, 0))
+                tasks.extend((conv, 0) for conv in reversed(
+                    self._conversion(types[id(node.right)], target, node)))
+                tasks.append((node.right, True))
+            elif isinstance(node, FunctionCall):
+                return_type, param_types = self._signature(node)
+                if param_types is None:
+                    index = len(self.program.builtin_calls)
+                    self.program.builtin_calls.append((node.name, len(node.args)))
+                    tasks.append((CALL_BUILTIN, index))
+                    for arg in reversed(node.args):
+                        if types[id(arg)] == 'void':
+                            self._error("Argumento do tipo void", arg)
+                        tasks.append((arg, True))
+                else:
+                    if len(node.args) != len(param_types):
+                        self._error(f"A função '{node.name}' espera {len(param_types)} "
+                                    f"argumento(s), recebeu {len(node.args)}", node)
+                    tasks.append((CALL, self.program.function_ids[node.name]))
+                    for arg, param_type in reversed(list(zip(node.args, param_types))):
+                        tasks.extend((conv, 0) for conv in reversed(
+                            self._conversion(types[id(arg)], param_type, arg)))
+                        tasks.append((arg, True))
+        
+        if not keep and isinstance(expr, Assignment):
+            return 'void'
+        return types[id(expr)]
+    
+    def _condition(self, expr):
+        """
+        Compila a condição de um comando, seguida de um salto para quando
+        ela é falsa.
+        
+        Returns:
+            Posição da instrução de salto, cujo destino deve ser ajustado
+        """
+        self._arithmetic(self._expression(expr), expr)
+        # Uma comparação seguida do salto é combinada em uma só instrução
+        fused = _COMPARE_JUMPS.get(self.ops[-2])
+        if fused is not None:
+            self.ops[-2] = fused
+            return len(self.ops) - 2
+        return self._emit(JUMP_IF_FALSE)
+    
+    def _discard(self, expr):
+        """Compila uma expressão usada como comando, descartando o valor."""
+        self._expression(expr, keep=False)
+        if not isinstance(expr, Assignment):
+            self._emit(POP)
+    
+    # Comandos
+    
+    def statement(self, node):
+        """Compila um comando (ou uma lista ou tupla de comandos)."""
+        emit = self._emit
+        if node is None:
+            return
+        if isinstance(node, (list, tuple)):
+            for item in node:
+                self.statement(item)
+        elif isinstance(node, ExpressionStatement):
+            if node.expr is not None:
+                self._discard(node.expr)
+        elif isinstance(node, Assignment):
+            self._discard(node)
+        elif isinstance(node, VarDecl):
+            self._declare(node)
+        elif isinstance(node, Block):
+            self.scopes.append({})
+            self.statement(node.statements)
+            self.scopes.pop()
+        elif isinstance(node, IfStatement):
+            skip = self._condition(node.condition)
+            self.statement(node.then_block)
+            if node.else_block is not None:
+                end = emit(JUMP)
+                self.ops[skip + 1] = len(self.ops)
+                self.statement(node.else_block)
+                self.ops[end + 1] = len(self.ops)
+            else:
+                self.ops[skip + 1] = len(self.ops)
+        elif isinstance(node, WhileStatement):
+            top = len(self.ops)
+            exit_jump = self._condition(node.condition)
+            self.statement(node.body)
+            emit(JUMP, top)
+            self.ops[exit_jump + 1] = len(self.ops)
+        elif isinstance(node, ForStatement):
+            # As variáveis declaradas na inicialização pertencem ao for
+            self.scopes.append({})
+            if isinstance(node.init, (VarDecl, tuple)):
+                self.statement(node.init)
+            elif node.init is not None:
+                self._discard(node.init)
+            top = len(self.ops)
+            exit_jump = None
+            if node.condition is not None:
+                exit_jump = self._condition(node.condition)
+            self.statement(node.body)
+            if node.update is not None:
+                self._discard(node.update)
+            emit(JUMP, top)
+            if exit_jump is not None:
+                self.ops[exit_jump + 1] = len(self.ops)
+            self.scopes.pop()
+        elif isinstance(node, ReturnStatement):
+            if node.value is None:
+                self._return_default()
+            else:
+                if self.return_type == 'void':
+                    self._error("Função void não pode retornar um valor", node)
+                value_type = self._expression(node.value)
+                for conv in self._conversion(value_type, self.return_type, node):
+                    emit(conv)
+                emit(RETURN)
+        else:
+            self._error(f"Comando não suportado: {type(node).__name__}", node)
+    
+    def _return_default(self):
+        # Retorno sem valor (ou ao fim da função): None em funções void e
+        # zero nas demais
+        self._emit(LOAD_CONST, self._const(_DEFAULTS.get(self.return_type)))
+        self._emit(RETURN)
+    
+    def finish(self):
+        """Encerra a função e devolve seu Code."""
+        self._return_default()
+        return Code(self.name, self.return_type, self.param_types, tuple(self.local_types),
+                    array('i', self.ops), tuple(self.consts))
+
+
+class _ProgramCompiler:
+    """Estado compartilhado pela compilação das funções de um programa."""
+    
+    def __init__(self, builtins):
+        self.signatures = {name: (return_type, None) for name, return_type in builtins.items()}
+        self.function_ids = {}
+        self.global_ids = {}
+        self.global_names = []
+        self.global_types = []
+        self.builtin_calls = []
+
+
+def compile_program(ast, builtins=None):
+    """
+    Compila a AST de um programa para bytecode.
+    
+    Args:
+        ast: Lista de declarações devolvida por parser.parse
+        builtins: Dicionário nome -> tipo de retorno das funções externas
+            que o programa pode chamar (fornecidas à VM)
+            
+    Returns:
+        Program
+        
+    Raises:
+        CompileError: Se o programa usar uma variável ou função não
+            declarada, tipos incompatíveis ou construções não suportadas
+    """
+    program = _ProgramCompiler(builtins or {})
+    
+    # Primeira passagem: assinaturas das funções e variáveis globais, para
+    # que as funções possam ser chamadas antes de sua declaração
+    functions = []
+    for decl in ast:
+        if isinstance(decl, FunctionDecl):
+            if decl.name in program.function_ids:
+                raise CompileError(f"Função declarada mais de uma vez: '{decl.name}'")
+            program.function_ids[decl.name] = len(functions)
+            program.signatures[decl.name] = (decl.return_type,
+                                             tuple(param.var_type for param in decl.params))
+            functions.append(decl)
+        elif isinstance(decl, VarDecl):
+            if decl.var_type not in VALUE_TYPES:
+                raise CompileError(f"Tipo inválido para a variável '{decl.name}': {decl.var_type}")
+            if decl.name not in program.global_ids:
+                program.global_ids[decl.name] = len(program.global_names)
+                program.global_names.append(decl.name)
+                program.global_types.append(decl.var_type)
+    
+    # Inicialização das globais, na ordem do código fonte
+    init = _FunctionCompiler(program, '<globais>', 'void')
+    for decl in ast:
+        if isinstance(decl, Assignment):
+            init.statement(decl)
+    
+    codes = []
+    for decl in functions:
+        function = _FunctionCompiler(program, decl.name, decl.return_type, decl.params)
+        function.statement(decl.body.statements)
+        codes.append(function.finish())
+    
+    return Program(codes, program.global_names, program.global_types, init.finish(),
+                   program.builtin_calls)
+
+
+class VM:
+    """
+    Máquina virtual de pilha que executa um Program.
+    
+    As variáveis globais são inicializadas na criação da VM e mantêm seus
+    valores entre as chamadas.
+    
+    Attributes:
+        program: Program executado
+        globals: Valores das variáveis globais
+        max_depth: Profundidade máxima de chamadas aninhadas
+    """
+    
+    def __init__(self, program, builtins=None, max_depth=MAX_DEPTH):
+        self.program = program
+        self.max_depth = max_depth
+        builtins = builtins or {}
+        missing = sorted({name for name, _ in program.builtins if name not in builtins})
+        if missing:
+            raise VMError(f"Funções externas não fornecidas: {', '.join(missing)}")
+        self._builtins = [(builtins[name], argc) for name, argc in program.builtins]
+        self.globals = [_DEFAULTS[t] for t in program.global_types]
+        self._execute(program.init, [])
+    
+    def call(self, name, *args):
+        """
+        Executa uma função do programa.
+        
+        Args:
+            name: Nome da função
+            *args: Argumentos, convertidos para os tipos dos parâmetros
+            
+        Returns:
+            Valor de retorno (None para funções void)
+        """
+        code = self.program.functions.get(name)
+        if code is None:
+            raise VMError(f"Função não definida: '{name}'")
+        if len(args) != len(code.param_types):
+            raise VMError(f"A função '{name}' espera {len(code.param_types)} "
+                          f"argumento(s), recebeu {len(args)}")
+        return self._execute(code, [convert(a, t) for a, t in zip(args, code.param_types)])
+    
+    def run(self):
+        """Executa a função main e devolve seu valor de retorno."""
+        return self.call('main')
+    
+    def _execute(self, code, args):
+        """Laço de despacho: executa code até o retorno da chamada inicial."""
+        codes = self.program.codes
+        builtins = self._builtins
+        globals_ = self.globals
+        max_depth = self.max_depth
+        frames = []
+        
+        ops = code.ops
+        consts = code.consts
+        locals_ = args + code.initial
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        
+        while True:
+            op = ops[pc]
+            arg = ops[pc + 1]
+            pc += 2
+            
+            if op == LOAD_LOCAL:
+                push(locals_[arg])
+            elif op == STORE_LOCAL:
+                locals_[arg] = pop()
+            elif op == LOAD_CONST:
+                push(consts[arg])
+            elif op == LOAD_GLOBAL:
+                push(globals_[arg])
+            elif op == STORE_GLOBAL:
+                globals_[arg] = pop()
+            elif op == JUMP_UNLESS_LT:
+                b = pop()
+                if not pop() < b:
+                    pc = arg
+            elif op == IADD_IMM:
+                result = stack[-1] + arg
+                stack[-1] = result if _INT_MIN <= result <= _INT_MAX else to_int(result)
+            elif op == ISUB_IMM:
+                result = stack[-1] - arg
+                stack[-1] = result if _INT_MIN <= result <= _INT_MAX else to_int(result)
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+            elif op == JUMP:
+                pc = arg
+            elif op == IADD:
+                b = pop()
+                result = stack[-1] + b
+                stack[-1] = result if _INT_MIN <= result <= _INT_MAX else to_int(result)
+            elif op == ISUB:
+                b = pop()
+                result = stack[-1] - b
+                stack[-1] = result if _INT_MIN <= result <= _INT_MAX else to_int(result)
+            elif op == IMUL:
+                b = pop()
+                result = stack[-1] * b
+                stack[-1] = result if _INT_MIN <= result <= _INT_MAX else to_int(result)
+            elif op == IDIV:
+                b = pop()
+                stack[-1] = int_div(stack[-1], b)
+            elif op == LT:
+                b = pop()
+                stack[-1] = 1 if stack[-1] < b else 0
+            elif op == LE:
+                b = pop()
+                stack[-1] = 1 if stack[-1] <= b else 0
+            elif op == GT:
+                b = pop()
+                stack[-1] = 1 if stack[-1] > b else 0
+            elif op == GE:
+                b = pop()
+                stack[-1] = 1 if stack[-1] >= b else 0
+            elif op == EQ:
+                b = pop()
+                stack[-1] = 1 if stack[-1] == b else 0
+            elif op == NE:
+                b = pop()
+                stack[-1] = 1 if stack[-1] != b else 0
+            elif op == CALL:
+                callee = codes[arg]
+                count = len(callee.param_types)
+                if count:
+                    call_args = stack[-count:]
+                    del stack[-count:]
+                else:
+                    call_args = []
+                if len(frames) >= max_depth:
+                    raise VMError(f"Limite de {max_depth} chamadas aninhadas excedido")
+                frames.append((ops, consts, locals_, stack, pc))
+                ops = callee.ops
+                consts = callee.consts
+                locals_ = call_args + callee.initial
+                stack = []
+                push = stack.append
+                pop = stack.pop
+                pc = 0
+            elif op == RETURN:
+                value = pop()
+                if not frames:
+                    return value
+                ops, consts, locals_, stack, pc = frames.pop()
+                push = stack.append
+                pop = stack.pop
+                push(value)
+            elif op == POP:
+                pop()
+            elif op == DUP:
+                push(stack[-1])
+            elif op == FADD:
+                b = pop()
+                stack[-1] = to_float(stack[-1] + b)
+            elif op == FSUB:
+                b = pop()
+                stack[-1] = to_float(stack[-1] - b)
+            elif op == FMUL:
+                b = pop()
+                stack[-1] = to_float(stack[-1] * b)
+            elif op == FDIV:
+                b = pop()
+                stack[-1] = float_div(stack[-1], b)
+            elif op == INEG:
+                stack[-1] = to_int(-stack[-1])
+            elif op == FNEG:
+                stack[-1] = -stack[-1]
+            elif op == NOT:
+                stack[-1] = 0 if stack[-1] else 1
+            elif op == I2F:
+                stack[-1] = to_float(stack[-1])
+            elif op == F2I:
+                stack[-1] = to_int(stack[-1])
+            elif op == I2C:
+                stack[-1] = to_char(stack[-1])
+            elif op == JUMP_UNLESS_LE:
+                b = pop()
+                if not pop() <= b:
+                    pc = arg
+            elif op == JUMP_UNLESS_GT:
+                b = pop()
+                if not pop() > b:
+                    pc = arg
+            elif op == JUMP_UNLESS_GE:
+                b = pop()
+                if not pop() >= b:
+                    pc = arg
+            elif op == JUMP_UNLESS_EQ:
+                b = pop()
+                if not pop() == b:
+                    pc = arg
+            elif op == JUMP_UNLESS_NE:
+                b = pop()
+                if not pop() != b:
+                    pc = arg
+            elif op == CALL_BUILTIN:
+                func, count = builtins[arg]
+                if count:
+                    call_args = stack[-count:]
+                    del stack[-count:]
+                else:
+                    call_args = ()
+                push(func(*call_args))
+            else:
+                raise VMError(f"Opcode inválido: {op}")
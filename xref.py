@@ -0,0 +1,492 @@
+"""
+Índice de referências cruzadas entre arquivos.
+
+Registra em um banco SQLite (sqlite3) as definições de função
+(FunctionDecl: nome, tipo de retorno, parâmetros e posição) e as
+chamadas (FunctionCall: função chamada, quantidade de argumentos,
+função em que a chamada está e posição) de um conjunto de arquivos .c,
+permitindo consultar sem analisar os arquivos novamente:
+
+- callers: onde uma função é chamada
+- callees: quais funções uma função chama
+- mismatches: chamadas com quantidade de argumentos diferente de todas
+  as definições da função chamada
+
+A atualização é incremental: um arquivo com a mesma data de modificação
+e o mesmo tamanho registrados não é lido; um arquivo alterado só é
+analisado novamente se o hash do conteúdo (SHA-256) mudou. As análises
+são distribuídas entre processos de trabalho, como no modo em lote
+(batch.py), e o banco é gravado somente pelo processo principal, em uma
+única transação. Uma mudança na gramática ou no formato do índice
+descarta o conteúdo anterior.
+
+Um arquivo já registrado que passa a ter erros de análise mantém as
+definições e chamadas da última versão registrada (a última sem erros,
+se houver), para que uma edição incompleta não as remova do índice; um
+arquivo novo com erros é registrado com o que foi possível extrair.
+
+Uso: python xref.py INDICE.db update [arquivo.c | diretório | padrão ...] [-j N]
+     python xref.py INDICE.db callers NOME
+     python xref.py INDICE.db callees NOME
+     python xref.py INDICE.db defs NOME
+     python xref.py INDICE.db mismatches
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from bisect import bisect_right
+from collections import namedtuple
+
+from ast_nodes import FunctionCall, FunctionDecl, iter_nodes
+
+
+# Versão do formato do índice; deve ser incrementada sempre que as
+# tabelas ou o conteúdo registrado mudarem
+INDEX_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS functions (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    return_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    arity INTEGER NOT NULL,
+    line INTEGER,
+    col INTEGER
+);
+CREATE TABLE IF NOT EXISTS calls (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    callee TEXT NOT NULL,
+    args INTEGER NOT NULL,
+    caller TEXT,
+    line INTEGER,
+    col INTEGER
+);
+CREATE INDEX IF NOT EXISTS functions_name ON functions (name);
+CREATE INDEX IF NOT EXISTS functions_file ON functions (file_id);
+CREATE INDEX IF NOT EXISTS calls_callee ON calls (callee);
+CREATE INDEX IF NOT EXISTS calls_caller ON calls (caller);
+CREATE INDEX IF NOT EXISTS calls_file ON calls (file_id);
+"""
+
+
+class Definition(namedtuple('Definition', 'name return_type params arity path line col')):
+    """
+    Definição de função registrada no índice.
+    
+    Attributes:
+        name: Nome da função
+        return_type: Tipo de retorno
+        params: Parâmetros como no código (por exemplo, 'int a, float b')
+        arity: Quantidade de parâmetros
+        path: Arquivo da definição
+        line: Linha da definição (ou None se a posição não é conhecida)
+        col: Coluna da definição, a partir de 1 (ou None)
+    """
+    
+    __slots__ = ()
+
+
+class CallSite(namedtuple('CallSite', 'callee args caller path line col')):
+    """
+    Chamada de função registrada no índice.
+    
+    Attributes:
+        callee: Nome da função chamada
+        args: Quantidade de argumentos
+        caller: Função em que a chamada está (None fora de funções)
+        path: Arquivo da chamada
+        line: Linha da chamada (ou None se a posição não é conhecida)
+        col: Coluna da chamada, a partir de 1 (ou None)
+    """
+    
+    __slots__ = ()
+
+
+class Mismatch(namedtuple('Mismatch', 'call arities')):
+    """
+    Chamada com quantidade de argumentos incompatível.
+    
+    Attributes:
+        call: CallSite da chamada
+        arities: Quantidades de parâmetros das definições da função
+            chamada (em ordem crescente)
+    """
+    
+    __slots__ = ()
+
+
+class UpdateResult(namedtuple('UpdateResult', 'files unchanged touched indexed removed errors elapsed')):
+    """
+    Resumo de uma atualização do índice.
+    
+    Attributes:
+        files: Quantidade de arquivos informados
+        unchanged: Arquivos com a mesma data de modificação e tamanho
+        touched: Arquivos alterados com o mesmo conteúdo (hash)
+        indexed: Arquivos analisados e registrados novamente
+        removed: Arquivos que deixaram de existir, removidos do índice
+        errors: Arquivos que não puderam ser lidos ou têm erros de análise,
+            incluindo os não analisados novamente cujo registro tem erros
+            (os arquivos com erros já registrados mantêm as definições e
+            chamadas anteriores; os novos são registrados com o que foi
+            possível extrair)
+        elapsed: Tempo total da atualização em segundos
+    """
+    
+    __slots__ = ()
+
+
+# Extração (nos processos de trabalho)
+
+class _Locator:
+    """Converte deslocamentos do código fonte em (linha, coluna)."""
+    
+    def __init__(self, source):
+        starts = [0]
+        index = source.find('\n')
+        while index >= 0:
+            starts.append(index + 1)
+            index = source.find('\n', index + 1)
+        self.starts = starts
+    
+    def __call__(self, node):
+        if node.start is None:
+            return None, None
+        line = bisect_right(self.starts, node.start)
+        return line, node.start - self.starts[line - 1] + 1
+
+
+def extract(ast, source):
+    """
+    Extrai as definições e chamadas de função de uma AST.
+    
+    Args:
+        ast: Lista de declarações do programa
+        source: String com o código fonte (para calcular as posições)
+        
+    Returns:
+        Tupla (definições, chamadas): listas de tuplas (nome, tipo de
+        retorno, parâmetros, aridade, linha, coluna) e (função chamada,
+        argumentos, função em que está, linha, coluna)
+    """
+    locate = _Locator(source)
+    functions = []
+    calls = []
+    for decl in ast:
+        caller = None
+        if isinstance(decl, FunctionDecl):
+            caller = decl.name
+            params = ", ".join(f"{param.var_type} {param.name}" for param in decl.params)
+            functions.append((decl.name, decl.return_type, params, len(decl.params))
+                             + locate(decl))
+        for node in iter_nodes(decl):
+            if isinstance(node, FunctionCall):
+                calls.append((node.name, len(node.args), caller) + locate(node))
+    return functions, calls
+
+
+# Sessão de análise do processo de trabalho, criada pelo inicializador
+_session = None
+
+
+def _init_worker(engine='ply'):
+    """Cria a sessão de análise reutilizada pelo processo de trabalho."""
+    global _session
+    from parser import ParserSession
+    _session = ParserSession(engine=engine)
+
+
+def index_file(path, known_hash=None, known_errors=0):
+    """
+    Lê e analisa um arquivo para o índice.
+    
+    Args:
+        path: Caminho do arquivo .c
+        known_hash: Hash registrado no índice; se o conteúdo tiver o mesmo
+            hash, o arquivo não é analisado
+        known_errors: Quantidade de erros registrada no índice, devolvida
+            quando o arquivo não é analisado
+            
+    Returns:
+        Tupla (path, mtime_ns, tamanho, hash, erros, definições, chamadas),
+        com definições e chamadas None se o hash não mudou (veja extract),
+        ou (path, None, ...) se o arquivo não pôde ser lido
+    """
+    from cache import decode_source
+    from diagnostics import Diagnostics
+    if _session is None:
+        _init_worker()
+    
+    try:
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == known_hash:
+            return path, stat.st_mtime_ns, stat.st_size, digest, known_errors, None, None
+        source = decode_source(data)
+    except (OSError, UnicodeDecodeError):
+        return path, None, None, None, 1, None, None
+    
+    diagnostics = Diagnostics()
+    ast = _session.parse(source, diagnostics)
+    errors = sum(diagnostics.counts.values())
+    functions, calls = extract(ast, source) if ast is not None else ([], [])
+    return path, stat.st_mtime_ns, stat.st_size, digest, errors, functions, calls
+
+
+# Índice
+
+def index_fingerprint():
+    """Impressão digital da gramática e do formato do índice."""
+    from cache import grammar_fingerprint
+    return f"{INDEX_VERSION}:{grammar_fingerprint().hex()}"
+
+
+class CallIndex:
+    """
+    Índice de definições e chamadas de função em um banco SQLite.
+    
+    Attributes:
+        path: Arquivo do banco
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+        fingerprint = index_fingerprint()
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            # Índice novo ou de outra gramática: descartar o conteúdo
+            with self.connection:
+                self.connection.execute("DELETE FROM files")
+                self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)",
+                                        (fingerprint,))
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def update(self, paths, workers=None, engine='ply'):
+        """
+        Atualiza o índice com os arquivos informados.
+        
+        Os arquivos registrados que não existem mais são removidos; os
+        demais arquivos registrados e não informados são mantidos.
+        
+        Args:
+            paths: Lista de caminhos de arquivos .c
+            workers: Número de processos (por padrão, o número de CPUs)
+            engine: Motor de análise léxica ('ply' ou 'fast')
+            
+        Returns:
+            UpdateResult com o resumo da atualização
+        """
+        start = time.perf_counter()
+        connection = self.connection
+        known = {row[1]: (row[0],) + row[2:] for row in connection.execute(
+            "SELECT id, path, mtime_ns, size, hash, errors FROM files")}
+        
+        # Arquivos com a mesma data de modificação e tamanho não são lidos
+        paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+        pending = []
+        unchanged = 0
+        errors = 0
+        for path in paths:
+            entry = known.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                errors += 1
+                continue
+            if entry is not None and entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+                unchanged += 1
+                errors += bool(entry[4])
+            elif entry is not None:
+                pending.append((path, entry[3], entry[4]))
+            else:
+                pending.append((path, None, 0))
+        
+        touched = indexed = 0
+        with connection:
+            removed = [(file_id,) for path, (file_id, *_) in known.items() if not os.path.exists(path)]
+            connection.executemany("DELETE FROM files WHERE id = ?", removed)
+            for path, mtime_ns, size, digest, file_errors, functions, calls in \
+                    _index_files(pending, workers, engine):
+                if mtime_ns is None:
+                    errors += 1
+                    continue
+                errors += bool(file_errors)
+                if functions is None:
+                    touched += 1
+                    connection.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                                       (mtime_ns, size, path))
+                    continue
+                indexed += 1
+                if file_errors and path in known:
+                    # Manter as definições e chamadas da versão registrada
+                    connection.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ?, hash = ?, errors = ? WHERE path = ?",
+                        (mtime_ns, size, digest, file_errors, path))
+                    continue
+                connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                file_id = connection.execute(
+                    "INSERT INTO files (path, mtime_ns, size, hash, errors) VALUES (?, ?, ?, ?, ?)",
+                    (path, mtime_ns, size, digest, file_errors)).lastrowid
+                connection.executemany("INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                       [(file_id,) + row for row in functions])
+                connection.executemany("INSERT INTO calls VALUES (?, ?, ?, ?, ?, ?)",
+                                       [(file_id,) + row for row in calls])
+        return UpdateResult(len(paths), unchanged, touched, indexed, len(removed),
+                            errors, time.perf_counter() - start)
+    
+    # Consultas
+    
+    def definitions(self, name):
+        """Definições da função name (lista de Definition)."""
+        return [Definition(*row) for row in self.connection.execute(
+            "SELECT name, return_type, params, arity, path, line, col FROM functions "
+            "JOIN files ON files.id = file_id WHERE name = ? ORDER BY path, line", (name,))]
+    
+    def callers(self, name):
+        """Chamadas da função name (lista de CallSite)."""
+        return self._calls("callee = ?", (name,))
+    
+    def callees(self, name):
+        """Chamadas feitas no corpo da função name (lista de CallSite)."""
+        return self._calls("caller = ?", (name,))
+    
+    def _calls(self, condition, args):
+        return [CallSite(*row) for row in self.connection.execute(
+            "SELECT callee, args, caller, path, line, col FROM calls "
+            f"JOIN files ON files.id = file_id WHERE {condition} ORDER BY path, line, col", args)]
+    
+    def mismatches(self):
+        """
+        Chamadas cuja quantidade de argumentos difere da de todas as
+        definições da função chamada (as chamadas de funções sem definição
+        no índice não são incluídas).
+        
+        Returns:
+            Lista de Mismatch
+        """
+        rows = self.connection.execute(
+            "SELECT callee, args, caller, path, line, col, "
+            "(SELECT group_concat(DISTINCT arity) FROM functions WHERE name = callee) "
+            "FROM calls JOIN files ON files.id = file_id "
+            "WHERE EXISTS (SELECT 1 FROM functions WHERE name = callee) "
+            "AND NOT EXISTS (SELECT 1 FROM functions WHERE name = callee AND arity = args) "
+            "ORDER BY path, line, col")
+        return [Mismatch(CallSite(*row[:6]), tuple(sorted(int(n) for n in row[6].split(','))))
+                for row in rows]
+    
+    def counts(self):
+        """Tupla (arquivos, definições, chamadas) registrados no índice."""
+        return tuple(self.connection.execute(
+            "SELECT (SELECT count(*) FROM files), (SELECT count(*) FROM functions), "
+            "(SELECT count(*) FROM calls)").fetchone())
+
+
+def _index_files(pending, workers, engine):
+    """
+    Analisa os arquivos pendentes (lista de (path, hash registrado,
+    erros registrados)) em processos de trabalho, produzindo os
+    resultados de index_file.
+    """
+    if not pending:
+        return
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(pending)))
+    paths, hashes, known_errors = zip(*pending)
+    
+    # Com um único processo, evitar o custo de criar processos de trabalho
+    if workers == 1:
+        _init_worker(engine)
+        yield from map(index_file, paths, hashes, known_errors)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine,)) as executor:
+        yield from executor.map(index_file, paths, hashes, known_errors, chunksize=chunksize)
+
+
+def _location(path, line, col):
+    if line is None:
+        return path
+    return f"{path}:{line}:{col}"
+
+
+def main():
+    from batch import expand_paths
+    arg_parser = argparse.ArgumentParser(
+        description="Índice de definições e chamadas de função entre arquivos.")
+    arg_parser.add_argument('index', metavar='INDICE.db', help="arquivo do índice (SQLite)")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    update = commands.add_parser('update', help="atualiza o índice com arquivos .c")
+    update.add_argument('paths', nargs='+', metavar='arquivo.c',
+                        help="arquivos, diretórios ou padrões glob a indexar")
+    update.add_argument('-j', '--workers', type=int, default=None,
+                        help="processos usados na análise (padrão: número de CPUs)")
+    update.add_argument('--lexer', choices=('ply', 'fast'), default='ply',
+                        help="motor de análise léxica (padrão: ply)")
+    for name, help_text in (('callers', "chamadas de uma função"),
+                            ('callees', "chamadas feitas no corpo de uma função"),
+                            ('defs', "definições de uma função")):
+        commands.add_parser(name, help=help_text).add_argument('name', metavar='NOME')
+    commands.add_parser('mismatches', help="chamadas com quantidade de argumentos incompatível")
+    args = arg_parser.parse_args()
+    
+    with CallIndex(args.index) as index:
+        if args.command == 'update':
+            paths = expand_paths(args.paths)
+            if not paths:
+                print("Erro: nenhum arquivo .c encontrado.")
+                sys.exit(1)
+            result = index.update(paths, args.workers, args.lexer)
+            files, functions, calls = index.counts()
+            print(f"{result.files} arquivo(s): {result.indexed} analisado(s), "
+                  f"{result.touched} com o mesmo conteúdo, {result.unchanged} inalterado(s), "
+                  f"{result.removed} removido(s), {result.errors} com erros "
+                  f"({result.elapsed:.3f}s)")
+            print(f"Índice: {files} arquivo(s), {functions} definição(ões), {calls} chamada(s)")
+        elif args.command == 'defs':
+            for d in index.definitions(args.name):
+                print(f"{_location(d.path, d.line, d.col)}: {d.return_type} {d.name}({d.params})")
+        elif args.command == 'mismatches':
+            for call, arities in index.mismatches():
+                expected = " ou ".join(str(n) for n in arities)
+                print(f"{_location(call.path, call.line, call.col)}: {call.callee} chamada com "
+                      f"{call.args} argumento(s), espera {expected} (em {call.caller or '-'})")
+        else:
+            calls = index.callers(args.name) if args.command == 'callers' else index.callees(args.name)
+            for call in calls:
+                print(f"{_location(call.path, call.line, call.col)}: "
+                      f"{call.caller or '-'} -> {call.callee} ({call.args} argumento(s))")
+
+
+if __name__ == "__main__":
+    main()